@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Backfill embeddings for research_docs rows stored without one.
+Resumes from the last checkpoint unless --reset is given; --reset is also required
+after switching embedders.
+"""
+import argparse
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+import logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.absolute()
+sys.path.append(str(project_root))
+
+# Load environment variables
+load_dotenv()
+
+# Import the backfill after setting up the path
+from src.lib.embedding_backfill import EmbeddingBackfill
+
+def main(max_documents: int, reset: bool):
+    """Run the embedding backfill."""
+    backfill = EmbeddingBackfill()
+    if reset:
+        backfill.checkpoint.reset()
+
+    try:
+        metrics = backfill.run(max_documents=max_documents)
+    except Exception as e:
+        logger.error(f"Error running embedding backfill: {e}")
+        return 1
+
+    logger.info(f"Embedded {metrics.documents} documents in {metrics.elapsed_seconds:.1f}s")
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-documents", type=int, default=None, help="Stop after about this many documents")
+    parser.add_argument("--reset", action="store_true", help="Ignore the checkpoint and start from the first row")
+    args = parser.parse_args()
+    sys.exit(main(args.max_documents, args.reset))
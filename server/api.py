@@ -1,11 +1,15 @@
 # server/api.py
+import asyncio
 import sys
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, Header
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 # Ensure project root is on the Python path (so imports like src.flows... work)
@@ -18,14 +22,29 @@ load_dotenv()
 
 # Import after sys.path setup
 from src.flows.research_flow import main_research_flow  # noqa: E402
-from src.lib.supabase_job_tracker import get_job_tracker, JobStatus  # noqa: E402
-from src.lib.alpha_vantage_api import call_alpha_vantage_symbol_search  # noqa: E402
+from src.tasks.common.job_status_task import release_subjobs_task  # noqa: E402
+from src.lib.supabase_job_tracker import get_async_job_tracker, JobStatus  # noqa: E402
+from src.lib.supabase_client import close_async_supabase_client  # noqa: E402
+from src.lib.ticker_search_index import get_ticker_search  # noqa: E402
+from src.lib.report_snapshot_store import get_report_snapshot_store  # noqa: E402
+from src.lib.cached_stage import get_stage_metrics  # noqa: E402
+from src.research.forward_pe.forward_pe_sanity_check_rules import get_sanity_check_metrics  # noqa: E402
+from src.lib.report_stream import REPORT_STREAMING, DONE_EVENT, ERROR_EVENT, get_report_stream_broker, sse_stream  # noqa: E402
+from src.tasks.comprehensive_report.comprehensive_report_stream_task import fail_report_stream_task  # noqa: E402
 
 logging.basicConfig(level=logging.INFO)
 logging.getLogger("LiteLLM").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Veratheon Research API", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the ticker search index, downloading a listing snapshot in the background if needed
+    get_ticker_search().refresh_if_stale()
+    yield
+    # Release the pooled async Supabase connections on shutdown
+    await close_async_supabase_client()
+
+app = FastAPI(title="Veratheon Research API", version="0.1.0", lifespan=lifespan)
 
 class ResearchRequest(BaseModel):
     symbol: str
@@ -39,28 +58,71 @@ class JobResponse(BaseModel):
 
 async def run_research_background(main_job_id: str, symbol: str, force_recompute: bool, model: str):
     """Background task to run research and update job status."""
-    job_tracker = get_job_tracker()
+    job_tracker = get_async_job_tracker()
 
     try:
         # Update status to running (using main_job_id)
-        job_tracker.update_job_status(main_job_id, JobStatus.RUNNING, step="Starting research flow", use_main_job_id=True)
+        await job_tracker.update_job_status(main_job_id, JobStatus.RUNNING, step="Starting research flow", use_main_job_id=True)
 
         # Run the research flow with main_job_id and model
         result = await main_research_flow(symbol=symbol, force_recompute=force_recompute, job_id=main_job_id, model=model)
 
         # Mark as completed with result (using main_job_id)
-        job_tracker.update_job_status(main_job_id, JobStatus.COMPLETED, step="Research completed", result=result, use_main_job_id=True)
+        await job_tracker.update_job_status(main_job_id, JobStatus.COMPLETED, step="Research completed", result=result, use_main_job_id=True)
+
+        # Publish the finished result as the symbol's latest report in a single swap
+        await asyncio.to_thread(get_report_snapshot_store().swap_latest, symbol, main_job_id, result)
 
         logger.info(f"Research completed for {symbol} (main_job_id {main_job_id})")
 
     except Exception as e:
         logger.exception(f"Error running research for {symbol} (main_job_id {main_job_id})")
-        job_tracker.update_job_status(main_job_id, JobStatus.FAILED, step="Research failed", error=str(e), use_main_job_id=True)
+        await job_tracker.update_job_status(main_job_id, JobStatus.FAILED, step="Research failed", error=str(e), use_main_job_id=True)
+        await fail_report_stream_task(main_job_id, str(e))
+
+    finally:
+        await release_subjobs_task(main_job_id)
+
+async def refresh_report_background(main_job_id: str, symbol: str, model: str):
+    """Background stale-while-revalidate refresh; cached stage results are reused where still valid."""
+    try:
+        await run_research_background(main_job_id, symbol, force_recompute=False, model=model)
+    finally:
+        get_report_snapshot_store().release_refresh(symbol)
+
+async def create_research_job(symbol: str, force_recompute: bool, model: str, **metadata) -> str:
+    """Create a main research job row and return its main_job_id."""
+    job_result = await get_async_job_tracker().create_job(
+        job_type="research",
+        symbol=symbol.upper(),
+        metadata={
+            "force_recompute": force_recompute,
+            "model": model,
+            "requested_at": datetime.now().isoformat(),
+            **metadata
+        },
+        is_sub_job=False,  # This is the main job
+        job_name="main_flow"  # Main flow identifier
+    )
+    if REPORT_STREAMING:
+        # The job runs in this process; open its stream so clients can subscribe before it starts
+        get_report_stream_broker().open(job_result["main_job_id"])
+    return job_result["main_job_id"]
 
 @app.get("/health")
 async def health():
     return {"status": "ok"}
 
+@app.get("/cache-metrics")
+async def cache_metrics():
+    """Per-stage research cache hit rates and timings for this process."""
+    return get_stage_metrics()
+
+@app.get("/sanity-check-metrics")
+async def sanity_check_metrics():
+    """Forward P/E sanity checks decided by rules versus escalated to the agent in this process."""
+    return get_sanity_check_metrics()
+
 @app.post("/research")
 async def start_research(req: ResearchRequest, background_tasks: BackgroundTasks) -> JobResponse:
     """Start a research job and return main_job_id for tracking."""
@@ -68,22 +130,8 @@ async def start_research(req: ResearchRequest, background_tasks: BackgroundTasks
         symbol_upper = req.symbol.upper()
         logger.info(f"Starting market research job for symbol={symbol_upper}")
 
-        job_tracker = get_job_tracker()
-
         # Create new job (main job)
-        job_result = job_tracker.create_job(
-            job_type="research",
-            symbol=symbol_upper,
-            metadata={
-                "force_recompute": req.force_recompute,
-                "model": req.model,
-                "requested_at": datetime.now().isoformat()
-            },
-            is_sub_job=False,  # This is the main job
-            job_name="main_flow"  # Main flow identifier
-        )
-
-        main_job_id = job_result["main_job_id"]
+        main_job_id = await create_research_job(symbol_upper, req.force_recompute, req.model)
 
         # Start background task with main_job_id and model
         background_tasks.add_task(run_research_background, main_job_id, req.symbol, req.force_recompute, req.model)
@@ -98,21 +146,67 @@ async def start_research(req: ResearchRequest, background_tasks: BackgroundTasks
         logger.exception("Error starting research job")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/research/{job_id}/report-stream")
+async def stream_report(job_id: str, last_event_id: Optional[int] = Header(None)):
+    """Stream a job's comprehensive report as server-sent events.
+
+    Emits a 'section' event (index, title, markdown) for each report section as soon as it
+    is generated, then 'done' with the validated comprehensive report, or 'error' if the
+    job fails. Reconnecting clients send Last-Event-ID to resume.
+    """
+    if not REPORT_STREAMING:
+        raise HTTPException(status_code=404, detail="Report streaming is disabled")
+
+    broker = get_report_stream_broker()
+    if not broker.has_stream(job_id):
+        job = await get_async_job_tracker().get_job_status(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        # The job finished before this client connected and its stream has expired
+        if job["status"] == JobStatus.COMPLETED.value:
+            broker.close(job_id, DONE_EVENT, {"comprehensive_report": (job.get("result") or {}).get("comprehensive_report")})
+        elif job["status"] in (JobStatus.FAILED.value, JobStatus.CANCELLED.value):
+            broker.close(job_id, ERROR_EVENT, {"message": job.get("error") or job["status"]})
+        else:
+            # Events are published in the process running the job, which is not this one
+            raise HTTPException(
+                status_code=409,
+                detail=f"Job is {job['status']} but not streaming on this server; poll its status instead"
+            )
+
+    return StreamingResponse(
+        sse_stream(job_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/report-status/{symbol}")
-async def check_report_status(symbol: str):
-    """Check if a comprehensive report has been run for a stock today."""
+async def check_report_status(
+    symbol: str,
+    background_tasks: BackgroundTasks,
+    serve_stale: bool = Query(False, description="Return the latest report of any age and refresh it in the background"),
+    model: str = Query("o4_mini", description="Model for the background refresh")
+):
+    """
+    Check if a comprehensive report has been run for a stock today.
+
+    With serve_stale, the most recent report is returned regardless of age (see serve_latest_report).
+    """
     try:
         symbol_upper = symbol.upper()
-        job_tracker = get_job_tracker()
+        if serve_stale:
+            return await serve_latest_report(symbol_upper, background_tasks, model)
+
+        job_tracker = get_async_job_tracker()
 
         # Get the most recent job for this symbol (returns main_job_id)
-        main_job_id = job_tracker.get_job_by_symbol(symbol_upper, return_main_job_id=True)
+        main_job_id = await job_tracker.get_job_by_symbol(symbol_upper, return_main_job_id=True)
 
         if not main_job_id:
             return {"has_report": False, "message": f"No report found for {symbol_upper}"}
 
         # Get job details by main_job_id
-        job_data = job_tracker.get_job_status(main_job_id, use_main_job_id=True)
+        job_data = await job_tracker.get_job_status(main_job_id, use_main_job_id=True)
 
         if not job_data:
             return {"has_report": False, "message": f"No job data found for {symbol_upper}"}
@@ -147,16 +241,63 @@ async def check_report_status(symbol: str):
         logger.exception(f"Error checking report status for {symbol}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def serve_latest_report(symbol: str, background_tasks: BackgroundTasks, model: str) -> dict:
+    """
+    Stale-while-revalidate: return the latest comprehensive report immediately with its age,
+    and start a background refresh (at most one per symbol) if it predates the current session.
+    """
+    store = get_report_snapshot_store()
+    snapshot = await asyncio.to_thread(store.get_latest, symbol)
+
+    if snapshot is None:
+        # Reports completed before snapshots existed are still in research_jobs
+        job_data = await get_async_job_tracker().get_latest_completed_job(symbol)
+        comprehensive_analysis = ((job_data or {}).get("result") or {}).get("comprehensive_report", {}).get("comprehensive_analysis")
+        if job_data and comprehensive_analysis and job_data.get("completed_at"):
+            snapshot = {
+                "main_job_id": job_data["main_job_id"],
+                "completed_at": job_data["completed_at"],
+                "result": job_data["result"]
+            }
+
+    if snapshot is None:
+        return {"has_report": False, "symbol": symbol, "message": f"No report found for {symbol}"}
+
+    is_stale = store.is_stale(snapshot)
+    refresh_job_id = None
+    if is_stale and store.claim_refresh(symbol):
+        try:
+            refresh_job_id = await create_research_job(symbol, False, model, refresh_of=snapshot["main_job_id"])
+            background_tasks.add_task(refresh_report_background, refresh_job_id, symbol, model)
+            logger.info(f"Serving stale report for {symbol} from job {snapshot['main_job_id']}; refreshing as {refresh_job_id}")
+        except Exception:
+            store.release_refresh(symbol)
+            logger.exception(f"Failed to start background refresh for {symbol}")
+
+    return {
+        "has_report": True,
+        "symbol": symbol,
+        "job_id": snapshot["main_job_id"],
+        "completed_at": snapshot["completed_at"],
+        "age_seconds": store.age_seconds(snapshot),
+        "is_stale": is_stale,
+        "refreshing": store.is_refreshing(symbol),
+        "refresh_job_id": refresh_job_id,
+        "result": snapshot["result"]
+    }
+
 @app.get("/ticker-search")
 async def search_ticker(query: str = Query(..., description="Search query for ticker symbol or company name")):
     """Search for stock symbols based on keywords.
     
     This endpoint searches for stock symbols and company names that match the provided query.
-    It returns a list of matching stocks with relevant information.
+    It returns a list of matching stocks with relevant information. Queries are answered from
+    a local index of listed symbols, falling back to Alpha Vantage when nothing matches.
     """
     try:
         logger.info(f"Searching for ticker with query: {query}")
-        results = call_alpha_vantage_symbol_search(query)
+        # Index loading and the Alpha Vantage fallback are blocking
+        results = await asyncio.to_thread(get_ticker_search().search, query)
         
         # Return the best matches directly
         return results
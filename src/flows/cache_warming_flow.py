@@ -0,0 +1,144 @@
+from src.lib.llm_model import set_model_context
+from src.lib.supabase_cache import get_supabase_cache
+from src.lib.supabase_job_tracker import get_job_tracker
+from src.lib.cache_warming import WarmingBudget, rank_hot_tickers, lookback_start
+from src.flows.subflows.company_overview_flow import company_overview_flow
+from src.flows.subflows.historical_earnings_flow import historical_earnings_flow
+from src.flows.subflows.financial_statements_flow import financial_statements_flow
+from src.flows.subflows.earnings_projections_flow import earnings_projections_flow
+from src.flows.subflows.management_guidance_flow import management_guidance_flow
+from src.flows.subflows.forward_pe_flow import forward_pe_sanity_check_flow
+from src.tasks.cache_retrieval.company_overview_cache_retrieval_task import company_overview_cache_retrieval_task
+from src.tasks.common.reporting_directory_setup_task import ensure_reporting_directory_exists
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from datetime import datetime
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_stage(
+    stage: str,
+    symbol: str,
+    budget: WarmingBudget,
+    cached: Callable[[], Awaitable[Optional[Any]]],
+    run: Callable[[], Awaitable[Any]]
+) -> Optional[Any]:
+    """Return a stage's cached result, or run it if the budget allows; None when out of budget."""
+    result = await cached()
+    if result is not None:
+        logger.info(f"Cache already warm for {stage} of {symbol}")
+        return result
+    if not budget.try_reserve(stage):
+        logger.info(f"Cache warming budget exhausted before {stage} of {symbol}")
+        return None
+    logger.info(f"Warming {stage} for {symbol}")
+    return await run()
+
+
+async def warm_symbol_cache_flow(symbol: str, budget: WarmingBudget) -> bool:
+    """
+    Pre-run the raw fetches and upstream analyses of the research flow for one symbol.
+
+    Stages already cached are reused for free; uncached stages are charged to the budget.
+    Only stages whose cache keys survive until the next request are warmed: the earnings
+    calendar and the fundamental analyses keyed by earnings report date. Price and news
+    dependent stages are left to the request itself.
+
+    Args:
+        symbol: Stock symbol to warm
+        budget: Shared budget for the warming run
+
+    Returns:
+        True if every stage is warm, False if the budget ran out part way
+    """
+    # A stored calendar is free; only fetching it from Alpha Vantage is charged to the budget
+    ttl_policy = get_supabase_cache().ttl_policy
+    if await asyncio.to_thread(ttl_policy.get_earnings_dates, symbol, fetch=False) is None:
+        if not budget.try_reserve("earnings_calendar"):
+            return False
+        await asyncio.to_thread(ttl_policy.get_earnings_dates, symbol)
+
+    company_overview = await _warm_stage(
+        "company_overview", symbol, budget,
+        lambda: company_overview_cache_retrieval_task(symbol),
+        lambda: company_overview_flow(symbol)
+    )
+    historical_earnings = await _warm_stage(
+        "historical_earnings", symbol, budget,
+        lambda: historical_earnings_flow.get_cached(symbol),
+        lambda: historical_earnings_flow(symbol)
+    )
+    financial_statements = await _warm_stage(
+        "financial_statements", symbol, budget,
+        lambda: financial_statements_flow.get_cached(symbol),
+        lambda: financial_statements_flow(symbol)
+    )
+    if company_overview is None or historical_earnings is None or financial_statements is None:
+        return False
+
+    earnings_projections = await _warm_stage(
+        "earnings_projections", symbol, budget,
+        lambda: earnings_projections_flow.get_cached(symbol, historical_earnings.model_dump(), financial_statements.model_dump()),
+        lambda: earnings_projections_flow(symbol, historical_earnings.model_dump(), financial_statements.model_dump())
+    )
+    management_guidance = await _warm_stage(
+        "management_guidance", symbol, budget,
+        lambda: management_guidance_flow.get_cached(symbol, historical_earnings, financial_statements),
+        lambda: management_guidance_flow(symbol, historical_earnings, financial_statements)
+    )
+    forward_pe_sanity_check = await _warm_stage(
+        "forward_pe_sanity_check", symbol, budget,
+        lambda: forward_pe_sanity_check_flow.get_cached(symbol),
+        lambda: forward_pe_sanity_check_flow(symbol)
+    )
+    return None not in (earnings_projections, management_guidance, forward_pe_sanity_check)
+
+
+async def cache_warming_flow(
+    budget: Optional[WarmingBudget] = None,
+    model: str = "o4_mini",
+    now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Warm the research cache for the most requested tickers within a call budget.
+
+    Args:
+        budget: Alpha Vantage / LLM call budget (defaults to the configured budget)
+        model: Model used for any analyses that need to run
+        now: Reference time for ranking (defaults to now)
+
+    Returns:
+        Summary with the ranked symbols, the fully warmed symbols and the budget spent
+    """
+    start_time = time.time()
+    budget = budget or WarmingBudget()
+    set_model_context(model)
+    await ensure_reporting_directory_exists()
+
+    requests = get_job_tracker().get_recent_symbol_requests(lookback_start(now))
+    symbols = rank_hot_tickers(requests, now)
+    logger.info(f"Cache warming flow started for {len(symbols)} hot tickers: {', '.join(symbols)}")
+
+    warmed: List[str] = []
+    for symbol in symbols:
+        try:
+            if await warm_symbol_cache_flow(symbol, budget):
+                warmed.append(symbol)
+            else:
+                break
+        except Exception as e:
+            logger.error(f"Cache warming failed for {symbol}: {e}")
+
+    logger.info(
+        f"Cache warming flow completed in {int(time.time() - start_time)} seconds: warmed {len(warmed)}/{len(symbols)} "
+        f"tickers using {budget.spent_alpha_vantage_calls} Alpha Vantage and {budget.spent_llm_calls} LLM calls"
+    )
+    return {
+        "symbols": symbols,
+        "warmed": warmed,
+        "alpha_vantage_calls": budget.spent_alpha_vantage_calls,
+        "llm_calls": budget.spent_llm_calls
+    }
@@ -1,6 +1,6 @@
 from dotenv import load_dotenv
 from src.lib.llm_model import set_model_context
-from src.lib.supabase_logger import log_info
+from src.lib.supabase_logger import get_async_supabase_logger
 from src.flows.subflows.forward_pe_flow import forward_pe_flow, forward_pe_sanity_check_flow
 from src.flows.subflows.trade_ideas_flow import trade_ideas_flow
 from src.flows.subflows.news_sentiment_flow import news_sentiment_flow
@@ -13,9 +13,12 @@ from src.flows.subflows.comprehensive_report_flow import comprehensive_report_fl
 from src.flows.subflows.key_insights_flow import key_insights_flow
 from src.flows.subflows.company_overview_flow import company_overview_flow
 from src.flows.subflows.global_quote_flow import global_quote_flow
-from src.tasks.common.job_status_task import update_job_status_task
+from src.flows.subflows.peer_group_flow import peer_group_flow
+from src.tasks.common.job_status_task import update_job_status_task, create_subjobs_task
+from src.tasks.common.earnings_calendar_task import earnings_calendar_task
+from src.tasks.comprehensive_report.comprehensive_report_stream_task import finish_report_stream_task
+from src.lib.report_stream import REPORT_STREAMING
 from src.lib.supabase_job_tracker import JobStatus
-from src.tasks.common.peer_group_reporting_task import peer_group_reporting_task
 from src.tasks.common.reporting_directory_setup_task import ensure_reporting_directory_exists
 from src.research.forward_pe.forward_pe_models import ForwardPeValuation, ForwardPeSanityCheck
 from src.research.trade_ideas.trade_idea_models import TradeIdea
@@ -24,7 +27,6 @@ from src.research.historical_earnings.historical_earnings_models import Historic
 from src.research.financial_statements.financial_statements_models import FinancialStatementsAnalysis
 from src.research.earnings_projections.earnings_projections_models import EarningsProjectionAnalysis
 from src.research.management_guidance.management_guidance_models import ManagementGuidanceAnalysis
-from src.research.common.peer_group_agent import peer_group_agent
 from src.research.common.models.peer_group import PeerGroup
 from src.research.cross_reference.cross_reference_models import CrossReferencedAnalysisCompletion
 from src.research.comprehensive_report.comprehensive_report_models import ComprehensiveReport, KeyInsights
@@ -40,6 +42,24 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+# Flows tracked as subjobs of a research job, in the order they run
+RESEARCH_SUBFLOWS = [
+    "company_overview_flow",
+    "global_quote_flow",
+    "historical_earnings_flow",
+    "financial_statements_flow",
+    "earnings_projections_flow",
+    "management_guidance_flow",
+    "peer_group_analysis",
+    "forward_pe_sanity_check_flow",
+    "forward_pe_flow",
+    "news_sentiment_flow",
+    "cross_reference_flow",
+    "trade_ideas_flow",
+    "comprehensive_report_flow",
+    "key_insights_flow",
+]
+
 def get_current_date() -> str:
     """
     Get today's current date in YYYY-MM-DD format.
@@ -63,7 +83,7 @@ async def main_research_flow(
     set_model_context(model)
 
     # Log model selection to system logs
-    log_info(
+    await get_async_supabase_logger().info(
         component="main_research_flow",
         message=f"Research flow initialized with model: {model}",
         job_id=job_id,
@@ -74,6 +94,10 @@ async def main_research_flow(
     await ensure_reporting_directory_exists()
 
     await update_job_status_task(job_id, JobStatus.RUNNING, "Starting main research flow", "main_research_flow", symbol)
+    await create_subjobs_task(job_id, symbol, RESEARCH_SUBFLOWS)
+
+    # Fundamental stages are cached per earnings report, so their cache keys need the calendar
+    await earnings_calendar_task(symbol)
 
     # Company overview provides foundational business context
     await update_job_status_task(job_id, JobStatus.RUNNING, "Analyzing company overview", "company_overview_flow", symbol)
@@ -112,11 +136,9 @@ async def main_research_flow(
     await update_job_status_task(job_id, JobStatus.COMPLETED, "Management guidance analysis complete", "management_guidance_flow", symbol)
 
     await update_job_status_task(job_id, JobStatus.RUNNING, "Identifying peer group", "peer_group_analysis", symbol)
-    peer_group: PeerGroup = await peer_group_agent(symbol, financial_statements_analysis)
+    peer_group: PeerGroup = await peer_group_flow(symbol, financial_statements_analysis, force_recompute=force_recompute)
     await update_job_status_task(job_id, JobStatus.COMPLETED, "Peer group identification complete", "peer_group_analysis", symbol)
 
-    await peer_group_reporting_task(symbol, peer_group)
-
     await update_job_status_task(job_id, JobStatus.RUNNING, "Performing forward PE sanity check", "forward_pe_sanity_check_flow", symbol)
     forward_pe_sanity_check: ForwardPeSanityCheck = await forward_pe_sanity_check_flow(symbol, force_recompute=force_recompute)
     await update_job_status_task(job_id, JobStatus.COMPLETED, "Forward PE sanity check complete", "forward_pe_sanity_check_flow", symbol)
@@ -188,11 +210,15 @@ async def main_research_flow(
 
     # Generate comprehensive report
     await update_job_status_task(job_id, JobStatus.RUNNING, "Generating comprehensive report", "comprehensive_report_flow", symbol)
+    stream_id = job_id if REPORT_STREAMING else None
     comprehensive_report: ComprehensiveReport = await comprehensive_report_flow(
         symbol,
         all_analyses,
-        force_recompute=force_recompute
+        force_recompute=force_recompute,
+        stream_id=stream_id
     )
+    if stream_id:
+        await finish_report_stream_task(stream_id, comprehensive_report)
     logger.info(f"Comprehensive report generated for {symbol}")
     await update_job_status_task(job_id, JobStatus.COMPLETED, "Comprehensive report generation complete", "comprehensive_report_flow", symbol)
 
@@ -1,27 +1,33 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import time
 from src.tasks.comprehensive_report.comprehensive_report_task import comprehensive_report_task
 from src.tasks.comprehensive_report.comprehensive_report_reporting_task import comprehensive_report_reporting_task
-from src.tasks.cache_retrieval.comprehensive_report_cache_retrieval_task import comprehensive_report_cache_retrieval_task
+from src.tasks.comprehensive_report.incremental_comprehensive_report_task import incremental_comprehensive_report_task
+from src.lib.cached_stage import cached_stage
 from src.research.comprehensive_report.comprehensive_report_models import ComprehensiveReport
+from src.research.comprehensive_report.incremental_report import COMPREHENSIVE_REPORT_INCREMENTAL, analysis_fingerprints
 
 logger = logging.getLogger(__name__)
 
 
+@cached_stage("comprehensive_report", ComprehensiveReport, key_inputs=("all_analyses",))
 async def comprehensive_report_flow(
     symbol: str,
     all_analyses: Dict[str, Any],
-    force_recompute: bool = False
+    force_recompute: bool = False,
+    stream_id: Optional[str] = None
 ) -> ComprehensiveReport:
     """
     Generate comprehensive report from all analysis results.
-    This subflow synthesizes all research into a single readable report.
+    This subflow synthesizes all research into a single readable report. When a previous
+    report is stored, only the sections whose analyses changed are rewritten.
     
     Args:
         symbol: Stock symbol
         all_analyses: Dictionary containing all analysis results
         force_recompute: Whether to bypass cache and regenerate
+        stream_id: Job ID to stream a fully generated report's sections to (optional)
         
     Returns:
         ComprehensiveReport: Synthesized report ready for UI consumption
@@ -29,19 +35,16 @@ async def comprehensive_report_flow(
     
     start_time = time.time()
     logger.info(f"Comprehensive report flow started for {symbol}")
-    
-    # Try to get cached report first
-    cached_result = await comprehensive_report_cache_retrieval_task(symbol, all_analyses, force_recompute)
-    if cached_result is not None:
-        logger.info(f"Returning cached comprehensive report for {symbol}")
-        return cached_result
-    
-    logger.info(f"No cached data found, running fresh comprehensive report analysis for {symbol}")
-    
-    comprehensive_report = await comprehensive_report_task(symbol, all_analyses)
+
+    fingerprints = analysis_fingerprints(all_analyses)
+    comprehensive_report = None
+    if COMPREHENSIVE_REPORT_INCREMENTAL and not force_recompute:
+        comprehensive_report = await incremental_comprehensive_report_task(symbol, all_analyses, fingerprints)
+    if comprehensive_report is None:
+        comprehensive_report = await comprehensive_report_task(symbol, all_analyses, stream_id=stream_id)
     
     # Generate reporting output
-    await comprehensive_report_reporting_task(symbol, comprehensive_report)
+    await comprehensive_report_reporting_task(symbol, comprehensive_report, fingerprints)
     
     logger.info(f"Comprehensive report flow completed for {symbol} in {int(time.time() - start_time)} seconds")
     
@@ -18,7 +18,7 @@ from src.research.management_guidance.management_guidance_models import (
 import logging
 import time
 from typing import List
-from src.tasks.cache_retrieval.cross_reference_cache_retrieval_task import cross_reference_cache_retrieval_task
+from src.lib.cached_stage import cached_stage
 from src.tasks.cross_reference.cross_reference_task import cross_reference_task
 from src.tasks.cross_reference.cross_reference_reporting_task import (
     cross_reference_reporting_task,
@@ -39,6 +39,18 @@ class CrossReferenceContext:
     management_guidance_analysis: ManagementGuidanceAnalysis
 
 
+@cached_stage(
+    "cross_reference",
+    List[CrossReferencedAnalysisCompletion],
+    key_inputs=(
+        "forward_pe_flow_result",
+        "news_sentiment_flow_result",
+        "historical_earnings_analysis",
+        "financial_statements_analysis",
+        "earnings_projections_analysis",
+        "management_guidance_analysis",
+    ),
+)
 async def cross_reference_flow(
     symbol: str,
     forward_pe_flow_result: ForwardPeValuation,
@@ -63,14 +75,6 @@ async def cross_reference_flow(
     start_time = time.time()
     logger.info(f"Cross Reference flow started for {context.symbol}")
 
-    # Try to get cached report first
-    cached_result = await cross_reference_cache_retrieval_task(context.symbol, forward_pe_flow_result, news_sentiment_flow_result, historical_earnings_analysis, financial_statements_analysis, earnings_projections_analysis, management_guidance_analysis, force_recompute)
-    if cached_result is not None:
-        logger.info(f"Returning cached cross reference analysis for {context.symbol}")
-        return cached_result
-    
-    logger.info(f"No cached data found, running fresh cross reference analysis for {context.symbol}")
-
     cross_reference_forward_pe_completion = await forward_pe_cross_reference(context)
 
     cross_reference_news_sentiment_completion = await news_sentiment_cross_reference(
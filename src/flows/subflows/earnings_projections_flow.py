@@ -2,7 +2,7 @@ from typing import Optional, Dict, Any
 from src.tasks.earnings_projections.earnings_projections_fetch_task import earnings_projections_fetch_task
 from src.tasks.earnings_projections.earnings_projections_analysis_task import earnings_projections_analysis_task
 from src.tasks.earnings_projections.earnings_projections_reporting_task import earnings_projections_reporting_task
-from src.tasks.cache_retrieval.earnings_projections_cache_retrieval_task import earnings_projections_cache_retrieval_task
+from src.lib.cached_stage import cached_stage
 from src.research.earnings_projections.earnings_projections_models import EarningsProjectionData, EarningsProjectionAnalysis
 import logging
 import time
@@ -10,6 +10,11 @@ import time
 logger = logging.getLogger(__name__)
 
 
+@cached_stage(
+    "earnings_projections",
+    EarningsProjectionAnalysis,
+    key_inputs=("historical_earnings_analysis", "financial_statements_analysis")
+)
 async def earnings_projections_flow(
     symbol: str,
     historical_earnings_analysis: Optional[Dict[str, Any]] = None,
@@ -31,15 +36,7 @@ async def earnings_projections_flow(
     """
     start_time = time.time()
     logger.info(f"Independent Earnings Projections flow started for {symbol}")
-    
-    # Try to get cached report first
-    cached_result = await earnings_projections_cache_retrieval_task(symbol, historical_earnings_analysis, financial_statements_analysis, force_recompute)
-    if cached_result is not None:
-        logger.info(f"Returning cached earnings projections analysis for {symbol}")
-        return cached_result
-    
-    logger.info(f"No cached data found, running fresh earnings projections analysis for {symbol}")
-    
+
     # Fetch comprehensive data for earnings projections
     projection_data: EarningsProjectionData = await earnings_projections_fetch_task(
         symbol, historical_earnings_analysis, financial_statements_analysis
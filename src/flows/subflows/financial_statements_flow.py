@@ -1,13 +1,14 @@
 from src.tasks.financial_statements.financial_statements_fetch_task import financial_statements_fetch_task
 from src.tasks.financial_statements.financial_statements_analysis_task import financial_statements_analysis_task
 from src.tasks.financial_statements.financial_statements_reporting_task import financial_statements_reporting_task
-from src.tasks.cache_retrieval.financial_statements_cache_retrieval_task import financial_statements_cache_retrieval_task
+from src.lib.cached_stage import cached_stage
 from src.research.financial_statements.financial_statements_models import FinancialStatementsData, FinancialStatementsAnalysis
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
+@cached_stage("financial_statements", FinancialStatementsAnalysis)
 async def financial_statements_flow(symbol: str, force_recompute: bool = False) -> FinancialStatementsAnalysis:
     """
     Main flow for analyzing recent financial statements for changes in revenue drivers, cost structures, and working capital.
@@ -22,15 +23,7 @@ async def financial_statements_flow(symbol: str, force_recompute: bool = False)
     """
     start_time = time.time()
     logger.info(f"Financial statements flow started for {symbol}")
-    
-    # Try to get cached report first
-    cached_result = await financial_statements_cache_retrieval_task(symbol, force_recompute)
-    if cached_result is not None:
-        logger.info(f"Returning cached financial statements analysis for {symbol}")
-        return cached_result
-    
-    logger.info(f"No cached data found, running fresh financial statements analysis for {symbol}")
-    
+
     # Fetch financial statements data from Alpha Vantage
     financial_data: FinancialStatementsData = await financial_statements_fetch_task(symbol)
 
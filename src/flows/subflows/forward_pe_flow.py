@@ -2,7 +2,8 @@ from src.tasks.forward_pe.forward_pe_fetch_earnings_task import forward_pe_fetch
 from src.tasks.forward_pe.forward_pe_analysis_task import forward_pe_analysis_task
 from src.tasks.forward_pe.forward_pe_sanity_check_task import forward_pe_sanity_check_task
 from src.tasks.forward_pe.forward_pe_reporting_task import forward_pe_valuation_reporting_task, forward_pe_sanity_check_reporting_task
-from src.tasks.cache_retrieval.forward_pe_cache_retrieval_task import forward_pe_valuation_cache_retrieval_task, forward_pe_sanity_check_cache_retrieval_task
+from src.lib.cached_stage import cached_stage
+from src.flows.subflows.peer_group_flow import peer_group_symbols
 from src.research.forward_pe.forward_pe_models import ForwardPeValuation, ForwardPEEarningsSummary, ForwardPeSanityCheck
 from src.research.common.models.peer_group import PeerGroup
 from typing import Optional, Any
@@ -11,6 +12,12 @@ import time
 
 logger = logging.getLogger(__name__)
 
+@cached_stage(
+    "forward_pe_valuation",
+    ForwardPeValuation,
+    key_inputs=("peer_group", "earnings_projections_analysis", "management_guidance_analysis", "forward_pe_sanity_check"),
+    key_projections={"peer_group": peer_group_symbols}
+)
 async def forward_pe_flow(
     symbol: str,
     peer_group: PeerGroup,
@@ -34,15 +41,7 @@ async def forward_pe_flow(
     
     start_time = time.time()
     logger.info(f"Forward PE flow started for {symbol}")
-    
-    # Try to get cached report first
-    cached_result = await forward_pe_valuation_cache_retrieval_task(symbol, peer_group, earnings_projections_analysis, management_guidance_analysis, forward_pe_sanity_check, force_recompute)
-    if cached_result is not None:
-        logger.info(f"Returning cached forward PE valuation analysis for {symbol}")
-        return cached_result
-    
-    logger.info(f"No cached data found, running fresh forward PE valuation analysis for {symbol}")
-    
+
     # Get the earnings data for the user's symbol and its peer group
     earnings_summary: ForwardPEEarningsSummary = await forward_pe_fetch_earnings_for_symbols_task(peer_group.original_symbol, peer_group.peer_group)
 
@@ -65,6 +64,7 @@ async def forward_pe_flow(
     return forward_pe_valuation
 
 
+@cached_stage("forward_pe_sanity_check", ForwardPeSanityCheck)
 async def forward_pe_sanity_check_flow(
     symbol: str,
     force_recompute: bool = False,
@@ -80,15 +80,7 @@ async def forward_pe_sanity_check_flow(
     
     start_time = time.time()
     logger.info(f"Forward PE sanity check flow started for {symbol}")
-    
-    # Try to get cached report first
-    cached_result = await forward_pe_sanity_check_cache_retrieval_task(symbol, force_recompute)
-    if cached_result is not None:
-        logger.info(f"Returning cached forward PE sanity check analysis for {symbol}")
-        return cached_result
-    
-    logger.info(f"No cached data found, running fresh forward PE sanity check analysis for {symbol}")
-    
+
     # Get the earnings data for the user's symbol and its peer group
     earnings_summary: ForwardPEEarningsSummary = await forward_pe_fetch_single_earnings_task(symbol)
 
@@ -1,13 +1,14 @@
 from src.tasks.historical_earnings.historical_earnings_fetch_task import historical_earnings_fetch_task
 from src.tasks.historical_earnings.historical_earnings_analysis_task import historical_earnings_analysis_task
 from src.tasks.historical_earnings.historical_earnings_reporting_task import historical_earnings_reporting_task
-from src.tasks.cache_retrieval.historical_earnings_cache_retrieval_task import historical_earnings_cache_retrieval_task
+from src.lib.cached_stage import cached_stage
 from src.research.historical_earnings.historical_earnings_models import HistoricalEarningsData, HistoricalEarningsAnalysis
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
+@cached_stage("historical_earnings", HistoricalEarningsAnalysis)
 async def historical_earnings_flow(symbol: str, force_recompute: bool = False) -> HistoricalEarningsAnalysis:
     """
     Main flow for running historical earnings analysis.
@@ -23,15 +24,7 @@ async def historical_earnings_flow(symbol: str, force_recompute: bool = False) -
     
     start_time = time.time()
     logger.info(f"Historical Earnings flow started for {symbol}")
-    
-    # Try to get cached report first
-    cached_result = await historical_earnings_cache_retrieval_task(symbol, force_recompute)
-    if cached_result is not None:
-        logger.info(f"Returning cached historical earnings analysis for {symbol}")
-        return cached_result
-    
-    logger.info(f"No cached data found, running fresh historical earnings analysis for {symbol}")
-    
+
     # Fetch historical earnings data from Alpha Vantage
     historical_data: HistoricalEarningsData = await historical_earnings_fetch_task(symbol)
 
@@ -1,13 +1,13 @@
 import logging
 import time
 from src.tasks.comprehensive_report.key_insights_task import key_insights_task
-from src.tasks.comprehensive_report.key_insights_reporting_task import key_insights_reporting_task
-from src.tasks.cache_retrieval.key_insights_cache_retrieval_task import key_insights_cache_retrieval_task
+from src.lib.cached_stage import cached_stage
 from src.research.comprehensive_report.comprehensive_report_models import KeyInsights, ComprehensiveReport
 
 logger = logging.getLogger(__name__)
 
 
+@cached_stage("key_insights", KeyInsights, key_inputs=("comprehensive_report",))
 async def key_insights_flow(
     symbol: str,
     comprehensive_report: ComprehensiveReport,
@@ -28,20 +28,9 @@ async def key_insights_flow(
     
     start_time = time.time()
     logger.info(f"Key insights flow started for {symbol}")
-    
-    # Try to get cached insights first
-    cached_result = await key_insights_cache_retrieval_task(symbol, comprehensive_report, force_recompute)
-    if cached_result is not None:
-        logger.info(f"Returning cached key insights for {symbol}")
-        return cached_result
-    
-    logger.info(f"No cached data found, running fresh key insights analysis for {symbol}")
-    
+
     key_insights = await key_insights_task(symbol, comprehensive_report)
     
-    # Generate reporting output
-    await key_insights_reporting_task(symbol, key_insights)
-    
     logger.info(f"Key insights flow completed for {symbol} in {int(time.time() - start_time)} seconds")
     
     return key_insights
\ No newline at end of file
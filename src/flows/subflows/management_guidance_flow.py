@@ -1,7 +1,7 @@
 from src.tasks.management_guidance.management_guidance_fetch_task import management_guidance_fetch_task
 from src.tasks.management_guidance.management_guidance_analysis_task import management_guidance_analysis_task
 from src.tasks.management_guidance.management_guidance_reporting_task import management_guidance_reporting_task
-from src.tasks.cache_retrieval.management_guidance_cache_retrieval_task import management_guidance_cache_retrieval_task
+from src.lib.cached_stage import cached_stage
 from src.research.management_guidance.management_guidance_models import ManagementGuidanceData, ManagementGuidanceAnalysis
 from typing import Optional, Any
 import logging
@@ -9,6 +9,11 @@ import time
 
 logger = logging.getLogger(__name__)
 
+@cached_stage(
+    "management_guidance",
+    ManagementGuidanceAnalysis,
+    key_inputs=("historical_earnings_analysis", "financial_statements_analysis")
+)
 async def management_guidance_flow(
     symbol: str,
     historical_earnings_analysis: Optional[Any] = None,
@@ -33,15 +38,7 @@ async def management_guidance_flow(
     
     start_time = time.time()
     logger.info(f"Management Guidance flow started for {symbol}")
-    
-    # Try to get cached report first
-    cached_result = await management_guidance_cache_retrieval_task(symbol, historical_earnings_analysis, financial_statements_analysis, force_recompute)
-    if cached_result is not None:
-        logger.info(f"Returning cached management guidance analysis for {symbol}")
-        return cached_result
-    
-    logger.info(f"No cached data found, running fresh management guidance analysis for {symbol}")
-    
+
     # Fetch management guidance data (earnings estimates + transcripts)
     guidance_data: ManagementGuidanceData = await management_guidance_fetch_task(symbol)
 
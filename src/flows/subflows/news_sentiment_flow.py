@@ -2,7 +2,8 @@ from src.research.news_sentiment.news_sentiment_models import NewsSentimentSumma
 from src.tasks.news_sentiment.news_sentiment_analysis_task import news_sentiment_analysis_task
 from src.tasks.news_sentiment.news_sentiment_fetch_summaries_task import news_sentiment_fetch_summaries_task
 from src.tasks.news_sentiment.news_sentiment_reporting_task import news_sentiment_reporting_task
-from src.tasks.cache_retrieval.news_sentiment_cache_retrieval_task import news_sentiment_cache_retrieval_task
+from src.lib.cached_stage import cached_stage
+from src.flows.subflows.peer_group_flow import peer_group_symbols
 from src.research.common.models.peer_group import PeerGroup
 from typing import List, Optional, Any
 import logging
@@ -11,6 +12,12 @@ import time
 logger = logging.getLogger(__name__)
 
 
+@cached_stage(
+    "news_sentiment",
+    NewsSentimentSummary,
+    key_inputs=("peer_group", "earnings_projections_analysis", "management_guidance_analysis"),
+    key_projections={"peer_group": peer_group_symbols}
+)
 async def news_sentiment_flow(
     symbol: str,
     peer_group: PeerGroup,
@@ -21,14 +28,6 @@ async def news_sentiment_flow(
     
     start_time = time.time()
     logger.info(f"News Sentiment flow started for {symbol}")
-    
-    # Try to get cached report first
-    cached_result = await news_sentiment_cache_retrieval_task(symbol, peer_group, earnings_projections_analysis, management_guidance_analysis, force_recompute)
-    if cached_result is not None:
-        logger.info(f"Returning cached news sentiment analysis for {symbol}")
-        return cached_result
-    
-    logger.info(f"No cached data found, running fresh news sentiment analysis for {symbol}")
 
     peer_group_summaries: List[RawNewsSentimentSummary] = await news_sentiment_fetch_summaries_task(symbol, peer_group.peer_group)
 
@@ -0,0 +1,54 @@
+from src.research.common.peer_group_agent import peer_group_agent
+from src.research.common.models.peer_group import PeerGroup
+from src.tasks.common.peer_group_reporting_task import peer_group_reporting_task
+from src.lib.cached_stage import cached_stage
+from typing import Any, List, Optional
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def peer_group_symbols(peer_group: PeerGroup) -> List[str]:
+    """
+    Stable projection of a peer group for cache keys of the stages that use it.
+
+    Args:
+        peer_group: Peer group of a symbol
+    Returns:
+        The peer symbols, upper-cased and sorted
+    """
+    return sorted(symbol.strip().upper() for symbol in peer_group.peer_group)
+
+
+@cached_stage("peer_group", PeerGroup)
+async def peer_group_flow(
+    symbol: str,
+    financial_statements_analysis: Optional[Any] = None,
+    force_recompute: bool = False,
+) -> PeerGroup:
+    """
+    Main flow for identifying the peer group of a symbol.
+
+    The peer group is cached per earnings report like the other fundamental stages, so the
+    stages keyed on it see the same peers until the next report.
+
+    Args:
+        symbol: Stock symbol to research
+        financial_statements_analysis: Optional financial statements analysis for context
+        force_recompute: If True, skip cache and ask the agent again
+    Returns:
+        PeerGroup of the symbol
+    """
+
+    start_time = time.time()
+    logger.info(f"Peer group flow started for {symbol}")
+
+    peer_group: PeerGroup = await peer_group_agent(symbol, financial_statements_analysis)
+
+    # Generate reporting output
+    await peer_group_reporting_task(symbol, peer_group)
+
+    logger.info(f"Peer group flow completed for {symbol} in {int(time.time() - start_time)} seconds")
+
+    return peer_group
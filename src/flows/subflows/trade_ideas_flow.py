@@ -1,6 +1,7 @@
 from src.tasks.trade_ideas.trade_ideas_task import trade_ideas_task
 from src.tasks.trade_ideas.trade_ideas_reporting_task import trade_ideas_reporting_task
-from src.tasks.cache_retrieval.trade_ideas_cache_retrieval_task import trade_ideas_cache_retrieval_task
+from src.tasks.technicals.technical_indicators_task import technical_indicators_task
+from src.lib.cached_stage import cached_stage
 from src.research.forward_pe.forward_pe_models import ForwardPeValuation
 from src.research.trade_ideas.trade_idea_models import TradeIdea
 from src.research.news_sentiment.news_sentiment_models import NewsSentimentSummary
@@ -10,6 +11,18 @@ import time
 
 logger = logging.getLogger(__name__)
 
+@cached_stage(
+    "trade_ideas",
+    TradeIdea,
+    key_inputs=(
+        "forward_pe_valuation",
+        "news_sentiment_summary",
+        "historical_earnings_analysis",
+        "financial_statements_analysis",
+        "earnings_projections_analysis",
+        "management_guidance_analysis",
+    )
+)
 async def trade_ideas_flow(
     symbol: str,
     forward_pe_valuation: ForwardPeValuation,
@@ -23,15 +36,10 @@ async def trade_ideas_flow(
     
     start_time = time.time()
     logger.info(f"Trade Ideas flow started for {symbol}")
-    
-    # Try to get cached report first
-    cached_result = await trade_ideas_cache_retrieval_task(symbol, forward_pe_valuation, news_sentiment_summary, historical_earnings_analysis, financial_statements_analysis, earnings_projections_analysis, management_guidance_analysis, force_recompute)
-    if cached_result is not None:
-        logger.info(f"Returning cached trade ideas analysis for {symbol}")
-        return cached_result
-    
-    logger.info(f"No cached data found, running fresh trade ideas analysis for {symbol}")
-    
+
+    # Computed from cached daily prices, so technicals cost no extra indicator API calls
+    technical_indicators = await technical_indicators_task(symbol)
+
     trade_idea = await trade_ideas_task(
         symbol, 
         forward_pe_valuation, 
@@ -39,7 +47,8 @@ async def trade_ideas_flow(
         historical_earnings_analysis,
         financial_statements_analysis,
         earnings_projections_analysis,
-        management_guidance_analysis
+        management_guidance_analysis,
+        technical_indicators=technical_indicators
     )
     
     # Generate reporting output
@@ -220,7 +220,7 @@ def call_alpha_vantage_earnings(symbol: str) -> Dict[str, Any]:
     return client.run_query(f"EARNINGS&symbol={symbol}")
 
 
-def call_alpha_vantage_time_series_daily_adjusted(symbol: str) -> Dict[str, Any]:
+def call_alpha_vantage_time_series_daily_adjusted(symbol: str, outputsize: str = "compact") -> Dict[str, Any]:
     """Retrieve daily time series (date, daily open, high, low, close, and volume) of the equity specified.
     
     This endpoint provides 20+ years of historical daily price and volume data.
@@ -228,6 +228,7 @@ def call_alpha_vantage_time_series_daily_adjusted(symbol: str) -> Dict[str, Any]
 
     Args:
         symbol: The stock symbol (e.g., 'TSLA' for Tesla Inc.)
+        outputsize: 'compact' for the latest 100 data points or 'full' for the whole history
 
     Returns:
         Dict containing:
@@ -249,6 +250,8 @@ def call_alpha_vantage_time_series_daily_adjusted(symbol: str) -> Dict[str, Any]
         - Data is returned in JSON format
         - Default outputsize is 'compact' (last 100 data points)
     """
+    if outputsize != "compact":
+        return client.run_query(f"TIME_SERIES_DAILY_ADJUSTED&symbol={symbol}&outputsize={outputsize}")
     return client.run_query(f"TIME_SERIES_DAILY_ADJUSTED&symbol={symbol}")
 
 def call_alpha_vantage_news_sentiment(tickers: str, topics: str = "", time_from: str = "", time_to: str = "") -> Dict[str, Any]:
@@ -578,3 +581,32 @@ def call_alpha_vantage_symbol_search(keywords: str) -> Dict[str, Any]:
     """
     query = f"SYMBOL_SEARCH&keywords={keywords}"
     return client.run_query(query)
+
+
+def call_alpha_vantage_listing_status(state: str = "active") -> str:
+    """Retrieve the listing status of US stocks and ETFs.
+
+    This endpoint provides every listed (or delisted) symbol on the US exchanges as a
+    CSV snapshot, suitable for building a local symbol search index.
+
+    Args:
+        state: 'active' for currently listed symbols or 'delisted' for delisted ones
+
+    Returns:
+        CSV text with the columns:
+            - symbol: Stock ticker symbol
+            - name: Company or fund name
+            - exchange: Listing exchange (e.g., NASDAQ, NYSE)
+            - assetType: Stock or ETF
+            - ipoDate: IPO date (YYYY-MM-DD)
+            - delistingDate: Delisting date, or 'null'
+            - status: Active or Delisted
+
+    Example:
+        >>> call_alpha_vantage_listing_status()
+
+    Note:
+        - The snapshot is updated daily by Alpha Vantage
+        - Unlike the other endpoints, the response is CSV rather than JSON
+    """
+    return client.run_query(f"LISTING_STATUS&state={state}")
@@ -0,0 +1,156 @@
+"""Alpha Vantage payloads parsed once into typed columns, and compacted for agent prompts."""
+import json
+import math
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Placeholders Alpha Vantage uses for values it does not have
+MISSING_MARKERS = frozenset({"", "None", "none", "-", "N/A", "NaN", "nan"})
+
+# Report fields that hold text rather than numbers
+TEXT_FIELDS = frozenset({"reportedCurrency", "reportTime"})
+
+# Scalar types a compacted payload is made of
+CompactScalar = Union[None, int, float, str]
+
+# Instructions for agents whose input is written by to_compact_json
+COMPACT_JSON_INSTRUCTIONS = """
+            DATA FORMAT:
+            - JSON inputs are compacted: a list of periods or quarters is written column-wise as one list
+              per field, e.g. {"fiscalDateEnding": ["2024-09-30", "2024-06-30"], "netIncome": [14736000000, 21448000000]}
+            - The i-th entry of every column belongs to the same period, in source order (newest first)
+            - null marks a value Alpha Vantage does not have for that period; fields missing in every
+              period, and empty fields elsewhere, are omitted
+            - Numbers are plain JSON numbers in the reported units; percentages keep their "%" suffix
+        """
+
+
+def parse_number(value: Any) -> float:
+    """
+    Parse an Alpha Vantage number, which usually arrives as a string.
+
+    Args:
+        value: Raw value
+
+    Returns:
+        The value, or NaN when it is missing, a placeholder such as "None" or "-", or not numeric
+    """
+    if isinstance(value, str):
+        value = value.strip().rstrip("%")
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return np.nan
+    return number if math.isfinite(number) else np.nan
+
+
+def parse_date(value: Any) -> np.datetime64:
+    """
+    Parse an Alpha Vantage date (YYYY-MM-DD).
+
+    Returns:
+        The day, or NaT when the value is missing or not a date
+    """
+    try:
+        return np.datetime64(value, "D")
+    except (TypeError, ValueError):
+        return np.datetime64("NaT", "D")
+
+
+def _is_date_field(name: str) -> bool:
+    return name.endswith("Date") or name.endswith("DateEnding") or name == "date"
+
+
+def parse_reports(reports: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """
+    Parse a list of reports (statement periods, earnings quarters) into a structured array.
+
+    Date fields become datetime64[D] (NaT when missing), TEXT_FIELDS are dropped and every
+    other field becomes float64 (NaN when missing). Each value is parsed once here, so callers
+    can work on whole columns.
+
+    Args:
+        reports: Report dicts as returned by Alpha Vantage, in any order
+
+    Returns:
+        Structured array with one row per report, in input order, and one field per key seen
+        in any report
+    """
+    names = [name for name in dict.fromkeys(key for report in reports for key in report) if name not in TEXT_FIELDS]
+    dtype = np.dtype([(name, "datetime64[D]" if _is_date_field(name) else np.float64) for name in names])
+    records = np.empty(len(reports), dtype=dtype)
+    for name in names:
+        values = [report.get(name) for report in reports]
+        if _is_date_field(name):
+            records[name] = [parse_date(value) for value in values]
+        else:
+            records[name] = [parse_number(value) for value in values]
+    return records
+
+
+def compact_scalar(value: Any) -> CompactScalar:
+    """
+    Normalize one raw value: numbers become int or float, placeholders become None and any
+    other text is kept.
+    """
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip() in MISSING_MARKERS:
+        return None
+    if isinstance(value, str) and value.endswith("%"):
+        return value
+    number = parse_number(value)
+    if math.isnan(number):
+        return value if isinstance(value, str) else None
+    if number.is_integer() and abs(number) < 2 ** 53 and not (isinstance(value, str) and "." in value):
+        return int(number)
+    return number
+
+
+def compact_payload(value: Any) -> Any:
+    """
+    Convert a payload into its compact form for prompts.
+
+    Lists of dicts (statement periods, earnings quarters) become one list per field instead of
+    repeating every key in every row, fields that are missing throughout are dropped, and
+    numeric strings become numbers.
+
+    Args:
+        value: Parsed JSON payload or part of one, or a pydantic model holding one
+
+    Returns:
+        The compact equivalent, built from dicts, lists and scalars
+    """
+    if hasattr(value, "model_dump"):
+        value = value.model_dump(mode="json")
+    if isinstance(value, dict):
+        compact = {key: compact_payload(item) for key, item in value.items()}
+        return {key: item for key, item in compact.items() if item is not None}
+    if isinstance(value, (list, tuple)):
+        if value and all(isinstance(item, dict) for item in value):
+            return _compact_rows(value)
+        return [compact_payload(item) for item in value]
+    return compact_scalar(value)
+
+
+def _compact_rows(rows: Sequence[Dict[str, Any]]) -> Optional[Dict[str, List[Any]]]:
+    columns = {}
+    for name in dict.fromkeys(key for row in rows for key in row):
+        values = [compact_payload(row.get(name)) for row in rows]
+        if any(value is not None for value in values):
+            columns[name] = values
+    return columns or None
+
+
+def to_compact_json(value: Any) -> str:
+    """
+    Serialize a payload compactly for an agent prompt.
+
+    Args:
+        value: Anything compact_payload accepts
+
+    Returns:
+        Minified JSON of compact_payload(value)
+    """
+    return json.dumps(compact_payload(value), separators=(",", ":"))
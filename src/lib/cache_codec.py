@@ -0,0 +1,146 @@
+"""Compressed, schema-versioned encoding of research_cache payloads."""
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import pydantic_core
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+CACHE_CODEC_VERSION = 1
+# Smaller payloads are stored as plain JSON text; gzip+base64 would not pay for itself
+CACHE_COMPRESSION_MIN_BYTES = int(os.getenv("CACHE_COMPRESSION_MIN_BYTES", "1024"))
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+@lru_cache(maxsize=None)
+def schema_version(schema: Any) -> str:
+    """
+    Version of a payload schema: a hash of its JSON schema.
+
+    Any change to field names, types, defaults or nested models yields a new version, so
+    entries written by an older model are recognised without attempting to validate them.
+
+    Args:
+        schema: Pydantic model class or type understood by TypeAdapter (e.g. List[Model])
+
+    Returns:
+        16 hex character schema version
+    """
+    json_schema = json.dumps(_type_adapter(schema).json_schema(), sort_keys=True)
+    return hashlib.sha256(json_schema.encode("utf-8")).hexdigest()[:16]
+
+
+def schema_name(schema: Any) -> str:
+    """Readable name of a payload schema, stored for debugging."""
+    return getattr(schema, "__qualname__", None) or repr(schema)
+
+
+def encode_payload(data: Any, schema: Optional[Any] = None) -> Dict[str, Any]:
+    """
+    Encode data for the research_cache data column.
+
+    Args:
+        data: Pydantic model, list of models, or JSON-serializable data
+        schema: Type of data (defaults to the model class when data is a pydantic model)
+
+    Returns:
+        Envelope with the codec version, schema name and version, encoding and payload
+    """
+    if schema is None and isinstance(data, BaseModel):
+        schema = type(data)
+    elif schema is None and hasattr(data, "model_dump"):
+        data = data.model_dump()
+
+    if schema is not None:
+        raw = _type_adapter(schema).dump_json(data)
+    else:
+        raw = pydantic_core.to_json(data)
+
+    envelope: Dict[str, Any] = {
+        "_codec": CACHE_CODEC_VERSION,
+        "schema": schema_name(schema) if schema is not None else None,
+        "schema_version": schema_version(schema) if schema is not None else None,
+        "raw_bytes": len(raw),
+    }
+    if len(raw) >= CACHE_COMPRESSION_MIN_BYTES:
+        envelope["encoding"] = "gzip+base64"
+        envelope["payload"] = base64.b64encode(gzip.compress(raw, compresslevel=6)).decode("ascii")
+    else:
+        envelope["encoding"] = "json"
+        envelope["payload"] = raw.decode("utf-8")
+    return envelope
+
+
+def is_encoded(data: Any) -> bool:
+    """Whether a stored value is a codec envelope (as opposed to a legacy verbatim dump)."""
+    return isinstance(data, dict) and "_codec" in data and "payload" in data
+
+
+def _payload_bytes(envelope: Dict[str, Any]) -> bytes:
+    if envelope.get("encoding") == "gzip+base64":
+        return gzip.decompress(base64.b64decode(envelope["payload"]))
+    return envelope["payload"].encode("utf-8")
+
+
+def _legacy_payload(data: Any) -> Any:
+    """Legacy entries carry injected _cache_ keys, and non-dict data was wrapped in {'data': ...}."""
+    if not isinstance(data, dict):
+        return data
+    clean = {k: v for k, v in data.items() if not k.startswith("_cache_")}
+    if set(clean) == {"data"}:
+        return clean["data"]
+    return clean
+
+
+def decode_payload(data: Any) -> Any:
+    """
+    Decode a stored value to plain JSON data.
+
+    Args:
+        data: Value of the research_cache data column
+
+    Returns:
+        Decoded data; legacy entries are returned unchanged
+    """
+    if not is_encoded(data):
+        return data
+    return pydantic_core.from_json(_payload_bytes(data))
+
+
+def decode_model(data: Any, schema: Any) -> Optional[Any]:
+    """
+    Decode a stored value straight into a model.
+
+    Entries written with a different schema version are misses without being decompressed
+    or validated. Legacy entries (written before payloads were versioned) are migrated in
+    memory when they still validate against the current schema.
+
+    Args:
+        data: Value of the research_cache data column
+        schema: Pydantic model class or type understood by TypeAdapter
+
+    Returns:
+        Validated instance, or None if the entry does not match the current schema
+    """
+    adapter = _type_adapter(schema)
+    try:
+        if is_encoded(data):
+            if data.get("schema_version") != schema_version(schema):
+                logger.info(f"Ignoring cached {schema_name(schema)} written with schema {data.get('schema_version')}")
+                return None
+            return adapter.validate_json(_payload_bytes(data))
+        return adapter.validate_python(_legacy_payload(data))
+    except ValidationError as e:
+        logger.warning(f"Cached {schema_name(schema)} does not match the current schema: {e.error_count()} errors")
+        return None
@@ -0,0 +1,347 @@
+"""Market-calendar-aware TTLs and cache keys for cached research reports."""
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from src.lib.alpha_vantage_api import call_alpha_vantage_earnings, call_alpha_vantage_earnings_estimates
+from src.lib.market_calendar import (
+    MARKET_CLOSE,
+    MARKET_OPEN,
+    MARKET_TIMEZONE,
+    market_date,
+    market_time,
+    next_market_open,
+    previous_trading_day,
+)
+
+logger = logging.getLogger(__name__)
+
+# Reports that only change when a company reports earnings
+FUNDAMENTAL_REPORT_TYPES = frozenset({
+    "historical_earnings",
+    "financial_statements",
+    "earnings_projections",
+    "management_guidance",
+    "forward_pe_sanity_check",
+    "peer_group",
+})
+
+# Reports that depend on prices or news and are refreshed every trading session
+MARKET_REPORT_TYPES = frozenset({
+    "forward_pe_valuation",
+    "news_sentiment",
+    "trade_ideas",
+    "cross_reference",
+    "comprehensive_report",
+    "key_insights",
+})
+
+FUNDAMENTAL_MAX_TTL = timedelta(days=float(os.getenv("CACHE_FUNDAMENTAL_MAX_TTL_DAYS", "7")))
+MIN_TTL_SECONDS = 300
+# Reports land before the open or after the close; re-check shortly after each (market time)
+EARNINGS_RELEASE_CHECKPOINTS = (MARKET_OPEN, time(MARKET_CLOSE.hour, 30))
+
+EARNINGS_CALENDAR_CACHE_TYPE = "earnings_calendar"
+# A failed calendar fetch is retried after this long rather than remembered for the session
+EARNINGS_CALENDAR_RETRY_SECONDS = MIN_TTL_SECONDS
+
+
+@dataclass
+class EarningsDates:
+    """Most recent and next expected earnings report dates for a symbol."""
+
+    symbol: str
+    last_report_date: Optional[date]
+    next_report_date: Optional[date]
+    # Alpha Vantage reportTime of the last report ('pre-market' or 'post-market'), if known
+    last_report_time: Optional[str] = None
+
+    def last_release_moment(self) -> Optional[datetime]:
+        """
+        Time from which the last report is public, as the release checkpoint after it.
+
+        Returns:
+            The market open for pre-market reports, else the post-close checkpoint (a report
+            of unknown time is assumed to be out by then); None without a last report date
+        """
+        if not self.last_report_date:
+            return None
+        checkpoint = EARNINGS_RELEASE_CHECKPOINTS[0] if self.last_report_time == "pre-market" else EARNINGS_RELEASE_CHECKPOINTS[-1]
+        return datetime.combine(self.last_report_date, checkpoint, tzinfo=MARKET_TIMEZONE)
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except (TypeError, ValueError):
+        return None
+
+
+def estimate_earnings_dates(symbol: str, earnings: Dict[str, Any], estimates: Dict[str, Any], today: Optional[date] = None) -> EarningsDates:
+    """
+    Derive the last and next earnings report dates from EARNINGS and EARNINGS_ESTIMATES.
+
+    The next date is the expected reportedDate of an upcoming estimate when available;
+    otherwise it is the next fiscal quarter end plus the company's last reporting lag.
+
+    Args:
+        symbol: Stock symbol
+        earnings: EARNINGS response
+        estimates: EARNINGS_ESTIMATES response
+        today: Reference date (defaults to the current date in market time)
+
+    Returns:
+        EarningsDates with either date set to None when it cannot be determined
+    """
+    today = today or market_time().date()
+    quarterly = [q for q in (earnings or {}).get("quarterlyEarnings") or [] if _parse_date(q.get("reportedDate"))]
+    last_report_date = max((_parse_date(q["reportedDate"]) for q in quarterly), default=None)
+    last_report_time = next(
+        (q.get("reportTime") for q in quarterly if _parse_date(q["reportedDate"]) == last_report_date), None
+    )
+
+    estimate_rows = (estimates or {}).get("estimates") or []
+    upcoming = sorted(
+        reported for reported in (_parse_date(row.get("reportedDate")) for row in estimate_rows)
+        if reported and reported >= today
+    )
+    next_report_date = upcoming[0] if upcoming else None
+
+    if next_report_date is None and quarterly:
+        latest = max(quarterly, key=lambda q: _parse_date(q["reportedDate"]))
+        fiscal_end = _parse_date(latest.get("fiscalDateEnding"))
+        lag = (last_report_date - fiscal_end) if fiscal_end else timedelta(days=30)
+        lag = min(max(lag, timedelta(0)), timedelta(days=90))
+
+        next_fiscal_end = next(
+            (_parse_date(row.get("date") or row.get("fiscalDateEnding")) for row in estimate_rows
+             if row.get("horizon") == "next fiscal quarter"),
+            None
+        ) or ((fiscal_end + timedelta(days=91)) if fiscal_end else None)
+        if next_fiscal_end:
+            next_report_date = next_fiscal_end + lag
+        if next_report_date is None or next_report_date <= last_report_date:
+            next_report_date = last_report_date + timedelta(days=91)
+
+    return EarningsDates(
+        symbol=symbol,
+        last_report_date=last_report_date,
+        next_report_date=next_report_date,
+        last_report_time=last_report_time
+    )
+
+
+class CacheTTLPolicy:
+    """
+    Decides cache key dates and TTLs for cached reports.
+
+    - Market reports are keyed by trading session and expire at the next market open, so a
+      Friday report serves the whole weekend and holidays.
+    - Fundamental reports are keyed by the symbol's last earnings report date and live until
+      the next expected report (capped at FUNDAMENTAL_MAX_TTL).
+    - Every known report type expires at the next earnings release checkpoint on a report day.
+    - When a new earnings report is detected the symbol's reports cached before its release
+      are invalidated.
+
+    Lookups only read earnings calendars that are already known (in memory or stored); they
+    are fetched from Alpha Vantage by get_earnings_dates or recorded by fetches that already
+    download EARNINGS (record_earnings). Unknown report types, and fundamental reports of a
+    symbol without a known calendar, keep the cache's default TTL and a session-date key.
+    """
+
+    def __init__(self, cache):
+        """
+        Initialize the TTL policy.
+
+        Args:
+            cache: SupabaseCache used to persist earnings calendars and invalidate reports
+        """
+        self.cache = cache
+        self._calendar_memo: Dict[Tuple[str, date], EarningsDates] = {}
+        # Symbol to the time its last calendar fetch failed
+        self._failed_fetches: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+
+    def cache_key_date(self, report_type: str, symbol: str, now: Optional[datetime] = None) -> str:
+        """
+        Date component for a report's cache key.
+
+        Args:
+            report_type: Report type
+            symbol: Stock symbol
+            now: Reference time (defaults to now)
+
+        Returns:
+            YYYYMMDD of the last earnings report for fundamental reports, else of the market session
+        """
+        if report_type in FUNDAMENTAL_REPORT_TYPES:
+            dates = self.get_earnings_dates(symbol, now, fetch=False)
+            if dates and dates.last_report_date:
+                return dates.last_report_date.strftime("%Y%m%d")
+        return market_date(now).strftime("%Y%m%d")
+
+    def report_ttl(self, report_type: str, symbol: str, now: Optional[datetime] = None) -> Optional[int]:
+        """
+        TTL in seconds for a report written now.
+
+        Args:
+            report_type: Report type
+            symbol: Stock symbol
+            now: Reference time (defaults to now)
+
+        Returns:
+            TTL in seconds, or None for report types the policy does not manage
+        """
+        if report_type not in FUNDAMENTAL_REPORT_TYPES and report_type not in MARKET_REPORT_TYPES:
+            return None
+        now = market_time(now)
+
+        if report_type in FUNDAMENTAL_REPORT_TYPES:
+            expires_at = now + FUNDAMENTAL_MAX_TTL
+        else:
+            expires_at = next_market_open(now)
+
+        dates = self.get_earnings_dates(symbol, now, fetch=False)
+        if dates and dates.next_report_date:
+            checkpoint = self._next_release_checkpoint(dates.next_report_date, now)
+            if checkpoint:
+                expires_at = min(expires_at, checkpoint)
+
+        return max(MIN_TTL_SECONDS, int(expires_at.timestamp() - now.timestamp()))
+
+    @staticmethod
+    def _next_release_checkpoint(report_date: date, now: datetime) -> Optional[datetime]:
+        """First earnings release checkpoint on the report date that is still ahead of now (in market time)."""
+        if report_date < now.date():
+            return None
+        for checkpoint in EARNINGS_RELEASE_CHECKPOINTS:
+            moment = datetime.combine(report_date, checkpoint, tzinfo=MARKET_TIMEZONE)
+            if moment > now:
+                return moment
+        return None
+
+    def get_earnings_dates(self, symbol: str, now: Optional[datetime] = None, fetch: bool = True) -> Optional[EarningsDates]:
+        """
+        Earnings report dates for a symbol, kept in memory for the market session.
+
+        Args:
+            symbol: Stock symbol
+            now: Reference time (defaults to now)
+            fetch: Fetch the calendar from Alpha Vantage when none is stored (not retried for
+                EARNINGS_CALENDAR_RETRY_SECONDS after a failure)
+
+        Returns:
+            EarningsDates, or None if they are not known
+        """
+        now = market_time(now)
+        symbol = symbol.upper()
+        key = (symbol, market_date(now))
+        with self._lock:
+            if key in self._calendar_memo:
+                return self._calendar_memo[key]
+            failed_at = self._failed_fetches.get(symbol)
+
+        dates = self._load_earnings_dates(symbol)
+        if dates is not None:
+            self._remember(dates, now)
+            return dates
+        if not fetch or (failed_at and now.timestamp() - failed_at.timestamp() < EARNINGS_CALENDAR_RETRY_SECONDS):
+            return None
+
+        try:
+            dates = estimate_earnings_dates(
+                symbol, call_alpha_vantage_earnings(symbol), call_alpha_vantage_earnings_estimates(symbol), today=now.date()
+            )
+        except Exception as e:
+            logger.warning(f"Could not determine earnings calendar for {symbol}: {e}")
+            with self._lock:
+                self._failed_fetches[symbol] = now
+            return None
+        self._store(dates, now)
+        return dates
+
+    def record_earnings(
+        self,
+        symbol: str,
+        earnings: Dict[str, Any],
+        estimates: Dict[str, Any],
+        now: Optional[datetime] = None
+    ) -> EarningsDates:
+        """
+        Update a symbol's earnings calendar from EARNINGS and EARNINGS_ESTIMATES responses
+        fetched for another purpose, so no calls are spent on the calendar itself.
+
+        Args:
+            symbol: Stock symbol
+            earnings: EARNINGS response
+            estimates: EARNINGS_ESTIMATES response
+            now: Reference time (defaults to now)
+
+        Returns:
+            The symbol's earnings dates
+        """
+        now = market_time(now)
+        dates = estimate_earnings_dates(symbol.upper(), earnings, estimates, today=now.date())
+        with self._lock:
+            unchanged = self._calendar_memo.get((dates.symbol, market_date(now))) == dates
+        if not unchanged:
+            self._store(dates, now)
+        return dates
+
+    def _remember(self, dates: EarningsDates, now: datetime) -> None:
+        session = market_date(now)
+        with self._lock:
+            # Only the current session's calendars can be hit again
+            for stale_key in [k for k in self._calendar_memo if k[1] != session]:
+                del self._calendar_memo[stale_key]
+            self._calendar_memo[(dates.symbol, session)] = dates
+            self._failed_fetches.pop(dates.symbol, None)
+
+    def _calendar_ttl(self, dates: EarningsDates, now: datetime) -> int:
+        """Stored calendars last until the next release checkpoint, or the next open when that date is unknown or past."""
+        checkpoint = self._next_release_checkpoint(dates.next_report_date, now) if dates.next_report_date else None
+        expires_at = min(now + FUNDAMENTAL_MAX_TTL, checkpoint) if checkpoint else next_market_open(now)
+        return max(MIN_TTL_SECONDS, int(expires_at.timestamp() - now.timestamp()))
+
+    def _load_earnings_dates(self, symbol: str) -> Optional[EarningsDates]:
+        cached = self.cache.get_cached_analysis(EARNINGS_CALENDAR_CACHE_TYPE, symbol)
+        if not cached:
+            return None
+        return EarningsDates(
+            symbol=symbol.upper(),
+            last_report_date=_parse_date(cached.get("last_report_date")),
+            next_report_date=_parse_date(cached.get("next_report_date")),
+            last_report_time=cached.get("last_report_time")
+        )
+
+    def _store(self, dates: EarningsDates, now: datetime) -> None:
+        self.cache.cache_analysis(
+            EARNINGS_CALENDAR_CACHE_TYPE,
+            dates.symbol,
+            {
+                "last_report_date": dates.last_report_date.isoformat() if dates.last_report_date else None,
+                "next_report_date": dates.next_report_date.isoformat() if dates.next_report_date else None,
+                "last_report_time": dates.last_report_time,
+            },
+            ttl=self._calendar_ttl(dates, now)
+        )
+        self._remember(dates, now)
+        self._invalidate_if_new_earnings(dates, now)
+        logger.info(f"Earnings calendar for {dates.symbol}: last {dates.last_report_date}, next {dates.next_report_date}")
+
+    def _invalidate_if_new_earnings(self, dates: EarningsDates, now: datetime) -> None:
+        """
+        Drop the symbol's reports cached before a report that landed since the previous session.
+
+        Reports cached after the release already reflect it and are kept, so recording the
+        same calendar again later in the session deletes nothing new.
+        """
+        session = market_date(now)
+        if not dates.last_report_date or dates.last_report_date < previous_trading_day(session):
+            return
+        deleted = self.cache.invalidate_cache(f"report:*:{dates.symbol}:*", cached_before=dates.last_release_moment())
+        if deleted:
+            logger.info(f"New earnings for {dates.symbol} on {dates.last_report_date}: invalidated {deleted} cached reports")
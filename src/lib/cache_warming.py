@@ -0,0 +1,131 @@
+"""Hot-ticker ranking, budgets and scheduling for the off-peak cache warmer."""
+import logging
+import os
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+from src.lib.market_calendar import MARKET_OPEN, MARKET_TIMEZONE, is_trading_day, market_time, next_trading_day
+
+logger = logging.getLogger(__name__)
+
+CACHE_WARMER_MAX_SYMBOLS = int(os.getenv("CACHE_WARMER_MAX_SYMBOLS", "20"))
+CACHE_WARMER_LOOKBACK_DAYS = int(os.getenv("CACHE_WARMER_LOOKBACK_DAYS", "14"))
+CACHE_WARMER_HALF_LIFE_DAYS = float(os.getenv("CACHE_WARMER_HALF_LIFE_DAYS", "3"))
+CACHE_WARMER_AV_BUDGET = int(os.getenv("CACHE_WARMER_AV_BUDGET", "300"))
+CACHE_WARMER_LLM_BUDGET = int(os.getenv("CACHE_WARMER_LLM_BUDGET", "100"))
+# Market (US Eastern) time the warmer runs on each trading day; must be before the open so
+# market-session cache keys match the requests that follow
+CACHE_WARMER_RUN_AT = time(int(os.getenv("CACHE_WARMER_HOUR", "5")))
+
+
+@dataclass(frozen=True)
+class StageCost:
+    """Estimated upstream calls made by one uncached run of a stage."""
+
+    alpha_vantage_calls: int
+    llm_calls: int
+
+
+# Estimated from each stage's fetch and agent calls; cache hits cost nothing
+STAGE_COSTS: Dict[str, StageCost] = {
+    "earnings_calendar": StageCost(alpha_vantage_calls=2, llm_calls=0),
+    "company_overview": StageCost(alpha_vantage_calls=1, llm_calls=1),
+    "historical_earnings": StageCost(alpha_vantage_calls=2, llm_calls=1),
+    "financial_statements": StageCost(alpha_vantage_calls=3, llm_calls=1),
+    "earnings_projections": StageCost(alpha_vantage_calls=3, llm_calls=1),
+    "management_guidance": StageCost(alpha_vantage_calls=3, llm_calls=3),
+    "forward_pe_sanity_check": StageCost(alpha_vantage_calls=4, llm_calls=1),
+}
+
+
+@dataclass
+class WarmingBudget:
+    """Alpha Vantage and LLM call allowance for one warming run."""
+
+    alpha_vantage_calls: int = CACHE_WARMER_AV_BUDGET
+    llm_calls: int = CACHE_WARMER_LLM_BUDGET
+    spent_alpha_vantage_calls: int = 0
+    spent_llm_calls: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def try_reserve(self, stage: str) -> bool:
+        """
+        Reserve the estimated cost of running a stage.
+
+        Args:
+            stage: Stage name in STAGE_COSTS
+
+        Returns:
+            True if the stage fits in the remaining budget (and was charged), False otherwise
+        """
+        cost = STAGE_COSTS[stage]
+        with self._lock:
+            if (self.spent_alpha_vantage_calls + cost.alpha_vantage_calls > self.alpha_vantage_calls
+                    or self.spent_llm_calls + cost.llm_calls > self.llm_calls):
+                return False
+            self.spent_alpha_vantage_calls += cost.alpha_vantage_calls
+            self.spent_llm_calls += cost.llm_calls
+            return True
+
+
+def rank_hot_tickers(
+    requests: Iterable[Dict[str, Any]],
+    now: Optional[datetime] = None,
+    limit: int = CACHE_WARMER_MAX_SYMBOLS,
+    half_life_days: float = CACHE_WARMER_HALF_LIFE_DAYS
+) -> List[str]:
+    """
+    Rank symbols by recency-weighted request frequency.
+
+    Each request contributes 0.5 ** (age_days / half_life_days), so a ticker requested daily
+    outranks one requested many times a week ago.
+
+    Args:
+        requests: Rows with 'symbol' and ISO 'created_at' (research_jobs / user_research_history)
+        now: Reference time (defaults to now)
+        limit: Maximum number of symbols to return
+        half_life_days: Age at which a request counts half as much
+
+    Returns:
+        Symbols ordered from hottest to coldest
+    """
+    now = now or datetime.now()
+    scores: Dict[str, float] = defaultdict(float)
+    for row in requests:
+        symbol = (row.get("symbol") or "").upper()
+        if not symbol or not row.get("created_at"):
+            continue
+        created_at = datetime.fromisoformat(row["created_at"])
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone().replace(tzinfo=None)
+        age_days = max(0.0, (now - created_at).total_seconds() / 86400)
+        scores[symbol] += 0.5 ** (age_days / half_life_days)
+
+    return [symbol for symbol, _ in sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]]
+
+
+def next_warming_run(now: Optional[datetime] = None, run_at: time = CACHE_WARMER_RUN_AT) -> datetime:
+    """
+    Next scheduled warming run: run_at on the next trading day that has not passed it yet.
+
+    Args:
+        now: Reference time (defaults to now)
+        run_at: Market time of day to run (before the market open)
+
+    Returns:
+        Datetime of the next run, in MARKET_TIMEZONE
+    """
+    if run_at >= MARKET_OPEN:
+        logger.warning(f"Cache warmer scheduled at {run_at}, after the market open")
+    now = market_time(now)
+    today = now.date()
+    if is_trading_day(today) and now.time() < run_at:
+        return datetime.combine(today, run_at, tzinfo=MARKET_TIMEZONE)
+    return datetime.combine(next_trading_day(today), run_at, tzinfo=MARKET_TIMEZONE)
+
+
+def lookback_start(now: Optional[datetime] = None, lookback_days: int = CACHE_WARMER_LOOKBACK_DAYS) -> datetime:
+    """Earliest request time considered when ranking hot tickers."""
+    return (now or datetime.now()) - timedelta(days=lookback_days)
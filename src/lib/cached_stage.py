@@ -0,0 +1,181 @@
+"""Declarative research_cache caching for research flow stages."""
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+import pydantic_core
+
+from src.lib.supabase_cache import get_async_supabase_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StageMetrics:
+    """Cache counters and timings for one cached stage."""
+
+    hits: int = 0
+    misses: int = 0
+    forced: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    lookup_seconds: float = 0.0
+    compute_seconds: float = 0.0
+
+
+_metrics: Dict[str, StageMetrics] = {}
+_metrics_lock = threading.Lock()
+
+
+def _record(report_type: str, **increments: float) -> None:
+    with _metrics_lock:
+        metrics = _metrics.setdefault(report_type, StageMetrics())
+        for name, value in increments.items():
+            setattr(metrics, name, getattr(metrics, name) + value)
+
+
+def get_stage_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Snapshot of cache metrics for every cached stage in this process.
+
+    Returns:
+        Dict mapping report type to its counters, timings and hit rate
+    """
+    with _metrics_lock:
+        snapshot = {report_type: asdict(metrics) for report_type, metrics in _metrics.items()}
+    for metrics in snapshot.values():
+        lookups = metrics["hits"] + metrics["misses"]
+        metrics["hit_rate"] = round(metrics["hits"] / lookups, 4) if lookups else None
+    return snapshot
+
+
+def reset_stage_metrics() -> None:
+    """Clear all cached stage metrics."""
+    with _metrics_lock:
+        _metrics.clear()
+
+
+def input_fingerprint(inputs: Dict[str, Any]) -> str:
+    """
+    Stable fingerprint of a stage's inputs.
+
+    Args:
+        inputs: Argument name to value (pydantic models, dicts, lists or scalars)
+
+    Returns:
+        16 hex character digest of the inputs' JSON form
+    """
+    return hashlib.sha256(pydantic_core.to_json(inputs, fallback=repr)).hexdigest()[:16]
+
+
+def cached_stage(
+    report_type: str,
+    model: Any,
+    ttl: Optional[int] = None,
+    key_inputs: Sequence[str] = (),
+    key_projections: Optional[Mapping[str, Callable[[Any], Any]]] = None
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Cache an async research stage's result in research_cache.
+
+    The decorated function must take a `symbol` argument and may take `force_recompute`.
+    A lookup hit returns the cached model without running the stage; force_recompute skips
+    the lookup but still caches the fresh result. Concurrent calls for the same cache key
+    share a single run. Database calls go through the async cache so they do not block
+    the event loop.
+
+    Args:
+        report_type: Report type used for the cache key and TTL policy
+        model: Pydantic model class (or type such as List[Model]) returned by the stage
+        ttl: TTL in seconds (defaults to the cache's TTL policy)
+        key_inputs: Argument names whose values are fingerprinted into the cache key, so a
+            result is only reused for the same upstream inputs
+        key_projections: Functions applied to key inputs before fingerprinting, for inputs
+            whose other parts vary from run to run without changing the result
+
+    Returns:
+        Decorator; the wrapped function also exposes `get_cached(*args, **kwargs)` to look
+        up the cached result without running the stage
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(fn)
+        in_flight: Dict[str, asyncio.Future] = {}
+        projections = dict(key_projections or {})
+
+        def _resolve(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[str, bool, Dict[str, str]]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key_kwargs = {}
+            if key_inputs:
+                key_kwargs["input_fingerprint"] = input_fingerprint({
+                    name: projections[name](bound.arguments[name]) if name in projections else bound.arguments[name]
+                    for name in key_inputs
+                })
+            return bound.arguments["symbol"], bool(bound.arguments.get("force_recompute", False)), key_kwargs
+
+        async def _lookup(symbol: str, key_kwargs: Dict[str, str]) -> Optional[Any]:
+            start = time.perf_counter()
+            cached = await get_async_supabase_cache().get_cached_model(report_type, symbol, model, **key_kwargs)
+            _record(report_type, lookup_seconds=time.perf_counter() - start)
+            return cached
+
+        async def get_cached(*args: Any, **kwargs: Any) -> Optional[Any]:
+            symbol, _, key_kwargs = _resolve(args, kwargs)
+            return await _lookup(symbol, key_kwargs)
+
+        @wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            symbol, force_recompute, key_kwargs = _resolve(args, kwargs)
+
+            if force_recompute:
+                logger.info(f"Skipping cache lookup for {report_type}: {symbol} (force_recompute=True)")
+                _record(report_type, forced=1)
+            else:
+                cached = await _lookup(symbol, key_kwargs)
+                if cached is not None:
+                    logger.info(f"Returning cached {report_type} for {symbol}")
+                    _record(report_type, hits=1)
+                    return cached
+                _record(report_type, misses=1)
+
+            flight_key = f"{symbol.upper()}:{json.dumps(key_kwargs, sort_keys=True)}"
+            if flight_key in in_flight:
+                logger.info(f"Joining in-flight {report_type} run for {symbol}")
+                _record(report_type, coalesced=1)
+                return await asyncio.shield(in_flight[flight_key])
+
+            future = asyncio.get_running_loop().create_future()
+            in_flight[flight_key] = future
+            start = time.perf_counter()
+            try:
+                result = await fn(*args, **kwargs)
+                _record(report_type, compute_seconds=time.perf_counter() - start)
+                await get_async_supabase_cache().cache_report(
+                    report_type, symbol, result, ttl=ttl, schema=model, **key_kwargs
+                )
+                future.set_result(result)
+                return result
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                _record(report_type, errors=1)
+                future.set_exception(e)
+                # Mark the exception as retrieved when no other caller joined this run
+                future.exception()
+                raise
+            finally:
+                in_flight.pop(flight_key, None)
+
+        wrapper.get_cached = get_cached
+        wrapper.report_type = report_type
+        return wrapper
+
+    return decorator
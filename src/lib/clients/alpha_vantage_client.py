@@ -1,9 +1,10 @@
 import os
+import threading
 import requests
 from dotenv import load_dotenv
 from typing import Dict, Any
 
-class AlphaVantageClient: 
+class AlphaVantageClient:
     def __init__(self) -> None:
         load_dotenv()  # Load environment variables
         api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
@@ -12,24 +13,26 @@ class AlphaVantageClient:
         self.api_key = api_key
         self.base_url = "https://www.alphavantage.co/query?function="
         self.session = requests.Session()
+        # Cap in-flight requests so concurrent fetchers stay within the API rate limit
+        self.max_concurrent_requests = int(os.getenv("ALPHA_VANTAGE_MAX_CONCURRENT_REQUESTS", "8"))
+        self._request_slots = threading.BoundedSemaphore(self.max_concurrent_requests)
 
     def run_query(self, query: str) -> Dict[str, Any]:
         """Execute an Alpha Vantage API query with automatic API key insertion.
-        
+
+        Safe to call from multiple threads; at most ``max_concurrent_requests``
+        requests are in flight at once.
+
         Returns:
-            Union[Dict[str, Any], str]: Parsed JSON response as dict if content is JSON, 
+            Union[Dict[str, Any], str]: Parsed JSON response as dict if content is JSON,
                                       otherwise returns raw response text (e.g., for CSV)
         """
-        response = self.session.get(self.base_url + query + f"&apikey={self.api_key}")
+        with self._request_slots:
+            response = self.session.get(self.base_url + query + f"&apikey={self.api_key}")
         response.raise_for_status()
-        
+
         # Check if response is JSON
         content_type = response.headers.get('Content-Type', '')
         if 'application/json' in content_type:
             return response.json()
         return response.text
-
-
-
-
-
@@ -0,0 +1,67 @@
+"""Columnar parsing of Alpha Vantage TIME_SERIES_DAILY_ADJUSTED responses."""
+from typing import Any, Dict
+
+import numpy as np
+
+TIME_SERIES_KEY = "Time Series (Daily)"
+
+# Column name -> field of a daily bar
+DAILY_FIELDS = {
+    "open": "1. open",
+    "high": "2. high",
+    "low": "3. low",
+    "close": "4. close",
+    "adjusted_close": "5. adjusted close",
+    "volume": "6. volume",
+    "dividend": "7. dividend amount",
+    "split": "8. split coefficient",
+}
+
+
+def parse_daily_adjusted(data: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    Convert a TIME_SERIES_DAILY_ADJUSTED response into columns in date order.
+
+    Args:
+        data: Response of call_alpha_vantage_time_series_daily_adjusted
+
+    Returns:
+        Dict with 'date' (datetime64[D]) and a float64 array per DAILY_FIELDS column, oldest first
+
+    Raises:
+        ValueError: If the response has no daily time series (e.g. a rate limit message)
+    """
+    series = data.get(TIME_SERIES_KEY) if isinstance(data, dict) else None
+    if not series:
+        raise ValueError(f"No daily time series in response: {str(data)[:200]}")
+
+    dates = sorted(series)
+    columns = {"date": np.array(dates, dtype="datetime64[D]")}
+    for column, field in DAILY_FIELDS.items():
+        columns[column] = np.array([float(series[day].get(field) or "nan") for day in dates], dtype=np.float64)
+    return columns
+
+
+def adjusted_prices(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Split- and dividend-adjusted high, low and close.
+
+    High and low are scaled by each day's adjusted/raw close ratio so ranges stay comparable
+    across corporate actions.
+
+    Args:
+        columns: Columns from parse_daily_adjusted
+
+    Returns:
+        Dict with 'date', 'high', 'low' and 'close' arrays
+    """
+    factor = np.divide(
+        columns["adjusted_close"], columns["close"],
+        out=np.ones_like(columns["close"]), where=columns["close"] > 0
+    )
+    return {
+        "date": columns["date"],
+        "high": columns["high"] * factor,
+        "low": columns["low"] * factor,
+        "close": columns["adjusted_close"],
+    }
@@ -0,0 +1,230 @@
+"""Batch backfill of embeddings for research_docs rows stored without one."""
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.lib.embeddings import Embedder, chunk_text, get_embedder, pool_embeddings
+from src.lib.supabase_rag import SupabaseRAG, get_supabase_rag
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BACKFILL_CHECKPOINT = os.getenv("EMBEDDING_BACKFILL_CHECKPOINT", "output/embedding_backfill/checkpoint.json")
+# research_docs rows read per page; their embeddings are written back with one upsert
+EMBEDDING_BACKFILL_PAGE_SIZE = int(os.getenv("EMBEDDING_BACKFILL_PAGE_SIZE", "100"))
+# Chunks sent per embedding request
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+
+
+@dataclass
+class BackfillMetrics:
+    """Counters and timings of a backfill run."""
+
+    pages: int = 0
+    documents: int = 0
+    skipped: int = 0
+    chunks: int = 0
+    characters: int = 0
+    embed_requests: int = 0
+    embed_seconds: float = 0.0
+    write_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.documents / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks / self.embed_seconds if self.embed_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Counters, timings and throughput as a dict."""
+        return {
+            **asdict(self),
+            "documents_per_second": round(self.documents_per_second, 3),
+            "chunks_per_second": round(self.chunks_per_second, 3),
+        }
+
+
+class BackfillCheckpoint:
+    """
+    Last research_docs ID a backfill has finished, persisted in a JSON file.
+
+    Rows are processed in ID order and the checkpoint only advances once a page's
+    embeddings are written, so an interrupted run resumes after the last written page and
+    rows that were skipped (e.g. empty content) are not read again.
+    """
+
+    def __init__(self, path: Union[str, Path] = EMBEDDING_BACKFILL_CHECKPOINT):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            path: Checkpoint file path
+        """
+        self.path = Path(path)
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Read the checkpoint.
+
+        Returns:
+            Dict with last_id, embedder and total_documents (last_id 0 when missing)
+        """
+        if not self.path.exists():
+            return {"last_id": 0, "embedder": None, "total_documents": 0}
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable embedding backfill checkpoint {self.path}: {e}")
+            return {"last_id": 0, "embedder": None, "total_documents": 0}
+
+    def save(self, last_id: int, embedder: str, total_documents: int) -> None:
+        """
+        Write the checkpoint atomically.
+
+        Args:
+            last_id: Highest research_docs ID processed
+            embedder: Name of the embedder used
+            total_documents: Documents embedded across all runs
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({
+            "last_id": last_id,
+            "embedder": embedder,
+            "total_documents": total_documents,
+            "updated_at": datetime.now().isoformat()
+        }))
+        os.replace(tmp_path, self.path)
+
+    def reset(self) -> None:
+        """Start the next run from the first row."""
+        self.path.unlink(missing_ok=True)
+
+
+class EmbeddingBackfill:
+    """
+    Embeds research_docs rows whose embedding is NULL.
+
+    Each page of rows is split into chunks, the chunks of the whole page are embedded in
+    batches, each document's chunk vectors are pooled into one vector, and the page is
+    written back with a single upsert before the checkpoint advances.
+    """
+
+    def __init__(
+        self,
+        rag: Optional[SupabaseRAG] = None,
+        embedder: Optional[Embedder] = None,
+        checkpoint: Optional[BackfillCheckpoint] = None,
+        page_size: int = EMBEDDING_BACKFILL_PAGE_SIZE,
+        batch_size: int = EMBEDDING_BATCH_SIZE
+    ):
+        """
+        Initialize the backfill.
+
+        Args:
+            rag: RAG client (defaults to the global instance)
+            embedder: Embedder (defaults to EMBEDDING_BACKEND)
+            checkpoint: Checkpoint (defaults to EMBEDDING_BACKFILL_CHECKPOINT)
+            page_size: Rows read and written per page
+            batch_size: Chunks per embedding request
+        """
+        self.rag = rag or get_supabase_rag()
+        self.embedder = embedder or get_embedder()
+        self.checkpoint = checkpoint or BackfillCheckpoint()
+        self.page_size = page_size
+        self.batch_size = batch_size
+
+    def _embed_page(self, rows: List[Dict[str, Any]], metrics: BackfillMetrics) -> Dict[int, List[float]]:
+        """Embed a page of rows, returning document ID to pooled embedding."""
+        # (doc_id, chunk) for every chunk of every row, embedded in batches across rows
+        chunks: List[Tuple[int, str]] = []
+        for row in rows:
+            content = (row.get("content") or "").strip()
+            if not content:
+                metrics.skipped += 1
+                continue
+            chunks.extend((row["id"], chunk) for chunk in chunk_text(content))
+
+        vectors: List[List[float]] = []
+        for start in range(0, len(chunks), self.batch_size):
+            batch = [chunk for _, chunk in chunks[start:start + self.batch_size]]
+            embed_start = time.perf_counter()
+            vectors.extend(self.embedder.embed(batch))
+            metrics.embed_seconds += time.perf_counter() - embed_start
+            metrics.embed_requests += 1
+
+        chunk_vectors: Dict[int, List[List[float]]] = {}
+        chunk_weights: Dict[int, List[float]] = {}
+        for (doc_id, chunk), vector in zip(chunks, vectors):
+            chunk_vectors.setdefault(doc_id, []).append(vector)
+            chunk_weights.setdefault(doc_id, []).append(len(chunk))
+        metrics.chunks += len(chunks)
+        metrics.characters += sum(len(chunk) for _, chunk in chunks)
+
+        return {
+            doc_id: pool_embeddings(doc_vectors, chunk_weights[doc_id])
+            for doc_id, doc_vectors in chunk_vectors.items()
+        }
+
+    def run(self, max_documents: Optional[int] = None) -> BackfillMetrics:
+        """
+        Embed unembedded rows from the checkpoint onwards.
+
+        Embedding or write failures stop the run without advancing the checkpoint, so the
+        failed page is retried by the next run.
+
+        Args:
+            max_documents: Stop after about this many documents (default: all)
+
+        Returns:
+            Metrics of this run
+
+        Raises:
+            ValueError: If the checkpoint was written with a different embedder
+        """
+        metrics = BackfillMetrics()
+        state = self.checkpoint.load()
+        if state.get("embedder") not in (None, self.embedder.name):
+            # Mixing embedders leaves research_docs with vectors from incompatible spaces
+            raise ValueError(
+                f"Embedding backfill checkpoint {self.checkpoint.path} was written with {state['embedder']}, "
+                f"not {self.embedder.name}; reset the checkpoint (--reset) to start over with this embedder"
+            )
+        last_id = state.get("last_id", 0)
+        total_documents = state.get("total_documents", 0)
+        start = time.perf_counter()
+
+        while max_documents is None or metrics.documents + metrics.skipped < max_documents:
+            rows = self.rag.get_unembedded_documents(after_id=last_id, limit=self.page_size)
+            if not rows:
+                break
+
+            embeddings = self._embed_page(rows, metrics)
+            write_start = time.perf_counter()
+            self.rag.update_embeddings(embeddings)
+            metrics.write_seconds += time.perf_counter() - write_start
+
+            last_id = max(row["id"] for row in rows)
+            metrics.pages += 1
+            metrics.documents += len(embeddings)
+            total_documents += len(embeddings)
+            self.checkpoint.save(last_id, self.embedder.name, total_documents)
+            metrics.elapsed_seconds = time.perf_counter() - start
+            logger.info(
+                f"Embedded {metrics.documents} documents through id {last_id} "
+                f"({metrics.documents_per_second:.1f} docs/s, {metrics.chunks_per_second:.1f} chunks/s)"
+            )
+
+            if len(rows) < self.page_size:
+                break
+
+        metrics.elapsed_seconds = time.perf_counter() - start
+        logger.info(f"Embedding backfill finished: {metrics.to_dict()}")
+        return metrics
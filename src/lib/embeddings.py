@@ -0,0 +1,156 @@
+"""Text embedding backends and chunking for research_docs embeddings."""
+import hashlib
+import logging
+import os
+import re
+from typing import List, Optional, Protocol
+
+import numpy as np
+import openai
+
+logger = logging.getLogger(__name__)
+
+# "openai" calls the embeddings API; "local" uses a deterministic hashing embedder that
+# needs no network access (for offline runs and tests; its vectors are not comparable)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "openai").lower()
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "1536"))
+# Characters per chunk; ~1,500 tokens keeps each input well inside model limits
+EMBEDDING_CHUNK_CHARS = int(os.getenv("EMBEDDING_CHUNK_CHARS", "6000"))
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[.'][a-z0-9]+)*")
+
+
+class Embedder(Protocol):
+    """Embeds batches of texts into fixed-size vectors."""
+
+    name: str
+    dim: int
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, returning one vector per text in order."""
+        ...
+
+
+class HashingEmbedder:
+    """
+    Deterministic bag-of-words embedder using signed feature hashing.
+
+    Unigrams and bigrams are hashed into `dim` buckets, weighted by sublinear term
+    frequency, and L2-normalized, so texts sharing vocabulary have a high cosine similarity.
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        """
+        Initialize the embedder.
+
+        Args:
+            dim: Vector dimension
+        """
+        self.name = f"local-hashing-{dim}"
+        self.dim = dim
+
+    def _embed_one(self, text: str) -> List[float]:
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        vector = np.zeros(self.dim, dtype=np.float32)
+        if not features:
+            return vector.tolist()
+
+        buckets = np.empty(len(features), dtype=np.int64)
+        signs = np.empty(len(features), dtype=np.float32)
+        for i, feature in enumerate(features):
+            digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+            buckets[i] = digest % self.dim
+            signs[i] = 1.0 if digest >> 63 else -1.0
+        np.add.at(vector, buckets, signs)
+        vector = np.sign(vector) * np.log1p(np.abs(vector))
+
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, returning one vector per text in order."""
+        return [self._embed_one(text) for text in texts]
+
+
+class OpenAIEmbedder:
+    """Embeddings from the OpenAI embeddings API."""
+
+    def __init__(self, model: str = EMBEDDING_MODEL, dim: int = EMBEDDING_DIM):
+        """
+        Initialize the embedder.
+
+        Args:
+            model: Embedding model name
+            dim: Vector dimension requested from the model
+        """
+        self.name = model
+        self.dim = dim
+        self._client = openai.OpenAI()
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with one API request, returning one vector per text in order."""
+        response = self._client.embeddings.create(model=self.name, input=texts, dimensions=self.dim)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
+def chunk_text(text: str, max_chars: int = EMBEDDING_CHUNK_CHARS) -> List[str]:
+    """
+    Split text into chunks of at most max_chars, breaking between paragraphs where possible.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk
+
+    Returns:
+        Non-empty chunks in order
+    """
+    chunks: List[str] = []
+    current = ""
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        # Paragraphs longer than a chunk are split at the character limit
+        pieces = [paragraph[i:i + max_chars] for i in range(0, len(paragraph), max_chars)]
+        for piece in pieces:
+            if current and len(current) + 2 + len(piece) > max_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def pool_embeddings(vectors: List[List[float]], weights: Optional[List[float]] = None) -> List[float]:
+    """
+    Combine chunk embeddings into one document embedding.
+
+    Args:
+        vectors: Chunk embeddings
+        weights: Optional per-chunk weights (e.g. chunk lengths)
+
+    Returns:
+        L2-normalized weighted mean of the vectors
+    """
+    pooled = np.average(np.asarray(vectors, dtype=np.float32), axis=0, weights=weights)
+    norm = np.linalg.norm(pooled)
+    return (pooled / norm if norm else pooled).tolist()
+
+
+# Global embedder instance
+_embedder_instance: Optional[Embedder] = None
+
+def get_embedder() -> Embedder:
+    """Get or create global embedder instance for EMBEDDING_BACKEND."""
+    global _embedder_instance
+    if _embedder_instance is None:
+        if EMBEDDING_BACKEND == "local":
+            _embedder_instance = HashingEmbedder()
+        elif EMBEDDING_BACKEND == "openai":
+            _embedder_instance = OpenAIEmbedder()
+        else:
+            raise ValueError(f"Unknown EMBEDDING_BACKEND: {EMBEDDING_BACKEND}")
+    return _embedder_instance
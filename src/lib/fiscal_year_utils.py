@@ -6,11 +6,13 @@ based on a company's fiscal year timing.
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import Tuple, Optional
-from dataclasses import dataclass
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Set, Tuple, Optional
+from dataclasses import asdict, dataclass
 
 from src.lib.alpha_vantage_api import call_alpha_vantage_overview
+from src.lib.supabase_cache import get_supabase_cache
 
 logger = logging.getLogger(__name__)
 
@@ -83,68 +85,193 @@ def parse_fiscal_year_end(fiscal_year_end_str: str, current_year: Optional[int]
         return datetime(next_year, month, day)
 
 
-def get_fiscal_year_info(symbol: str, threshold_days: int = 90) -> FiscalYearInfo:
+# Day-scoped memo of fiscal decisions keyed by (symbol, threshold_days, date). The shared
+# Supabase cache extends it across jobs and workers; the local dict avoids a round trip per call.
+_fiscal_info_memo: Dict[Tuple[str, int, date], FiscalYearInfo] = {}
+# Seeded decisions not yet written to the shared cache; written on their first lookup
+_fiscal_info_unpersisted: Set[Tuple[str, int, date]] = set()
+_fiscal_info_memo_lock = threading.Lock()
+
+FISCAL_YEAR_INFO_CACHE_TYPE = "fiscal_year_info"
+
+
+def _seconds_until_midnight(now: datetime) -> int:
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return max(1, int((midnight - now).total_seconds()))
+
+
+def _fiscal_info_to_dict(fiscal_info: FiscalYearInfo) -> Dict[str, Any]:
+    data = asdict(fiscal_info)
+    if fiscal_info.fiscal_year_end_date is not None:
+        data["fiscal_year_end_date"] = fiscal_info.fiscal_year_end_date.isoformat()
+    return data
+
+
+def _fiscal_info_from_dict(data: Dict[str, Any]) -> FiscalYearInfo:
+    fields = {key: value for key, value in data.items() if not key.startswith("_cache_")}
+    if fields.get("fiscal_year_end_date"):
+        fields["fiscal_year_end_date"] = datetime.fromisoformat(fields["fiscal_year_end_date"])
+    return FiscalYearInfo(**fields)
+
+
+def _remember_fiscal_info(key: Tuple[str, int, date], fiscal_info: FiscalYearInfo, persisted: bool = True) -> None:
+    with _fiscal_info_memo_lock:
+        # Entries from previous days can never be hit again
+        for stale_key in [k for k in _fiscal_info_memo if k[2] != key[2]]:
+            del _fiscal_info_memo[stale_key]
+        _fiscal_info_unpersisted.intersection_update(_fiscal_info_memo)
+        _fiscal_info_memo[key] = fiscal_info
+        if persisted:
+            _fiscal_info_unpersisted.discard(key)
+        else:
+            _fiscal_info_unpersisted.add(key)
+
+
+def _persist_fiscal_info(symbol: str, threshold_days: int, fiscal_info: FiscalYearInfo) -> None:
+    get_supabase_cache().cache_analysis(
+        FISCAL_YEAR_INFO_CACHE_TYPE,
+        symbol,
+        _fiscal_info_to_dict(fiscal_info),
+        ttl=_seconds_until_midnight(datetime.now()),
+        threshold_days=threshold_days
+    )
+
+
+def clear_fiscal_year_info_memo() -> None:
+    """Clear the in-process fiscal year decision memo."""
+    with _fiscal_info_memo_lock:
+        _fiscal_info_memo.clear()
+        _fiscal_info_unpersisted.clear()
+
+
+def seed_fiscal_year_info(symbol: str, overview: Dict[str, Any], threshold_days: int = 90) -> None:
     """
-    Get fiscal year information and determine whether to use annual vs quarterly data.
+    Seed the in-process memo from an already-fetched OVERVIEW, without any cache round trip.
+
+    Meant for bulk fetches (e.g. every peer of a symbol) where most decisions are never looked
+    up. A seeded decision is written to the shared cache on its first get_fiscal_year_info call.
 
     Args:
         symbol: Stock symbol
-        threshold_days: Number of days from fiscal year end to switch to annual data (default: 90)
-
-    Returns:
-        FiscalYearInfo object with decision and reasoning
+        overview: OVERVIEW response, still holding FiscalYearEnd
+        threshold_days: Number of days from fiscal year end to switch to annual data
     """
+    key = (symbol.upper(), threshold_days, date.today())
+    with _fiscal_info_memo_lock:
+        if key in _fiscal_info_memo:
+            return
     try:
-        # Get company overview data
-        overview = call_alpha_vantage_overview(symbol)
-        fiscal_year_end_str = overview.get('FiscalYearEnd')
-
-        if not fiscal_year_end_str:
-            logger.warning(f"No fiscal year end data available for {symbol}")
-            return FiscalYearInfo(
-                symbol=symbol,
-                fiscal_year_end_month="Unknown",
-                fiscal_year_end_date=None,
-                use_annual_data=False,
-                days_to_fiscal_end=None,
-                decision_reason="No fiscal year end data available - defaulting to quarterly"
-            )
-
-        # Parse fiscal year end
-        fiscal_year_end = parse_fiscal_year_end(fiscal_year_end_str)
-        today = datetime.now()
-
-        # Calculate days until fiscal year end
-        days_to_fiscal_end = (fiscal_year_end - today).days
-
-        # If within threshold days of fiscal year end, use annual data
-        use_annual = abs(days_to_fiscal_end) <= threshold_days
-
-        if use_annual:
-            decision_reason = (
-                f"Within {threshold_days} days of fiscal year end "
-                f"({fiscal_year_end.strftime('%Y-%m-%d')}) - using annual data for "
-                f"more stable year-end projections"
-            )
-        else:
-            decision_reason = (
-                f"More than {threshold_days} days from fiscal year end "
-                f"({fiscal_year_end.strftime('%Y-%m-%d')}) - using quarterly data for "
-                f"more timely analysis"
-            )
+        fiscal_info = compute_fiscal_year_info(symbol, overview.get('FiscalYearEnd'), threshold_days)
+    except Exception as e:
+        logger.warning(f"Could not seed fiscal year info for {symbol}: {e}")
+        return
+    _remember_fiscal_info(key, fiscal_info, persisted=False)
 
-        logger.info(f"Fiscal year decision for {symbol}: {'ANNUAL' if use_annual else 'QUARTERLY'} - {decision_reason}")
 
+def compute_fiscal_year_info(symbol: str, fiscal_year_end_str: Optional[str], threshold_days: int = 90) -> FiscalYearInfo:
+    """
+    Determine whether to use annual vs quarterly data from a FiscalYearEnd value.
+
+    Args:
+        symbol: Stock symbol
+        fiscal_year_end_str: OVERVIEW FiscalYearEnd value (e.g. "September")
+        threshold_days: Number of days from fiscal year end to switch to annual data
+
+    Returns:
+        FiscalYearInfo object with decision and reasoning
+
+    Raises:
+        ValueError: If the fiscal year end string cannot be parsed
+    """
+    if not fiscal_year_end_str:
+        logger.warning(f"No fiscal year end data available for {symbol}")
         return FiscalYearInfo(
             symbol=symbol,
-            fiscal_year_end_month=fiscal_year_end_str,
-            fiscal_year_end_date=fiscal_year_end,
-            use_annual_data=use_annual,
-            days_to_fiscal_end=days_to_fiscal_end,
-            decision_reason=decision_reason
+            fiscal_year_end_month="Unknown",
+            fiscal_year_end_date=None,
+            use_annual_data=False,
+            days_to_fiscal_end=None,
+            decision_reason="No fiscal year end data available - defaulting to quarterly"
         )
 
+    # Parse fiscal year end
+    fiscal_year_end = parse_fiscal_year_end(fiscal_year_end_str)
+    today = datetime.now()
+
+    # Calculate days until fiscal year end
+    days_to_fiscal_end = (fiscal_year_end - today).days
+
+    # If within threshold days of fiscal year end, use annual data
+    use_annual = abs(days_to_fiscal_end) <= threshold_days
+
+    if use_annual:
+        decision_reason = (
+            f"Within {threshold_days} days of fiscal year end "
+            f"({fiscal_year_end.strftime('%Y-%m-%d')}) - using annual data for "
+            f"more stable year-end projections"
+        )
+    else:
+        decision_reason = (
+            f"More than {threshold_days} days from fiscal year end "
+            f"({fiscal_year_end.strftime('%Y-%m-%d')}) - using quarterly data for "
+            f"more timely analysis"
+        )
+
+    logger.info(f"Fiscal year decision for {symbol}: {'ANNUAL' if use_annual else 'QUARTERLY'} - {decision_reason}")
+
+    return FiscalYearInfo(
+        symbol=symbol,
+        fiscal_year_end_month=fiscal_year_end_str,
+        fiscal_year_end_date=fiscal_year_end,
+        use_annual_data=use_annual,
+        days_to_fiscal_end=days_to_fiscal_end,
+        decision_reason=decision_reason
+    )
+
+
+def get_fiscal_year_info(symbol: str, threshold_days: int = 90, overview: Optional[Dict[str, Any]] = None) -> FiscalYearInfo:
+    """
+    Get fiscal year information and determine whether to use annual vs quarterly data.
+
+    The decision only changes with the date, so it is memoized per (symbol, threshold_days, day)
+    in-process and in the shared Supabase cache. OVERVIEW is only fetched on a miss, and not at
+    all when the caller passes an overview it already has.
+
+    Args:
+        symbol: Stock symbol
+        threshold_days: Number of days from fiscal year end to switch to annual data (default: 90)
+        overview: Already-fetched OVERVIEW response to seed the decision from
+
+    Returns:
+        FiscalYearInfo object with decision and reasoning
+    """
+    key = (symbol.upper(), threshold_days, date.today())
+    with _fiscal_info_memo_lock:
+        memoized = _fiscal_info_memo.get(key)
+        unpersisted = key in _fiscal_info_unpersisted
+        _fiscal_info_unpersisted.discard(key)
+    if memoized is not None:
+        if unpersisted:
+            _persist_fiscal_info(symbol, threshold_days, memoized)
+        return memoized
+
+    cache = get_supabase_cache()
+    cached = cache.get_cached_analysis(FISCAL_YEAR_INFO_CACHE_TYPE, symbol, threshold_days=threshold_days)
+    if cached:
+        try:
+            fiscal_info = _fiscal_info_from_dict(cached)
+            _remember_fiscal_info(key, fiscal_info)
+            return fiscal_info
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cached fiscal year info for {symbol}: {e}")
+
+    try:
+        if overview is None or 'FiscalYearEnd' not in overview:
+            overview = call_alpha_vantage_overview(symbol)
+        fiscal_info = compute_fiscal_year_info(symbol, overview.get('FiscalYearEnd'), threshold_days)
+
     except Exception as e:
+        # Errors are not memoized so the next call retries
         logger.error(f"Error determining fiscal timing for {symbol}: {e}")
         return FiscalYearInfo(
             symbol=symbol,
@@ -155,6 +282,10 @@ def get_fiscal_year_info(symbol: str, threshold_days: int = 90) -> FiscalYearInf
             decision_reason=f"Error determining fiscal timing: {e} - defaulting to quarterly"
         )
 
+    _remember_fiscal_info(key, fiscal_info)
+    _persist_fiscal_info(symbol, threshold_days, fiscal_info)
+    return fiscal_info
+
 
 def should_use_annual_data(symbol: str, threshold_days: int = 90) -> bool:
     """
@@ -202,18 +333,19 @@ def get_data_period_label(use_annual: bool) -> str:
     return "annual" if use_annual else "quarterly"
 
 
-def log_fiscal_decision(symbol: str, threshold_days: int = 90) -> FiscalYearInfo:
+def log_fiscal_decision(symbol: str, threshold_days: int = 90, overview: Optional[Dict[str, Any]] = None) -> FiscalYearInfo:
     """
     Log the fiscal year decision for debugging and transparency.
 
     Args:
         symbol: Stock symbol
         threshold_days: Number of days threshold
+        overview: Already-fetched OVERVIEW response to seed the decision from
 
     Returns:
         FiscalYearInfo object with decision details
     """
-    fiscal_info = get_fiscal_year_info(symbol, threshold_days)
+    fiscal_info = get_fiscal_year_info(symbol, threshold_days, overview=overview)
 
     logger.info(f"=== FISCAL YEAR DECISION FOR {symbol} ===")
     logger.info(f"Fiscal Year End: {fiscal_info.fiscal_year_end_month}")
@@ -0,0 +1,146 @@
+"""US equity market (NYSE) trading calendar."""
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import FrozenSet, Optional
+from zoneinfo import ZoneInfo
+
+# Session times are wall-clock times on the exchange, whatever the host's timezone
+MARKET_TIMEZONE = ZoneInfo("America/New_York")
+MARKET_OPEN = time(9, 30)
+MARKET_CLOSE = time(16, 0)
+
+
+def _observed(holiday: date) -> date:
+    """Weekend holidays are observed on the nearest weekday."""
+    if holiday.weekday() == 5:
+        return holiday - timedelta(days=1)
+    if holiday.weekday() == 6:
+        return holiday + timedelta(days=1)
+    return holiday
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    last = (date(year, month + 1, 1) if month < 12 else date(year + 1, 1, 1)) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+@lru_cache(maxsize=32)
+def market_holidays(year: int) -> FrozenSet[date]:
+    """
+    Full-day NYSE holidays for a year.
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        Set of dates the market is closed on (excluding weekends)
+    """
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),           # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),           # Washington's Birthday
+        _easter(year) - timedelta(days=2),     # Good Friday
+        _last_weekday(year, 5, 0),             # Memorial Day
+        _observed(date(year, 7, 4)),           # Independence Day
+        _nth_weekday(year, 9, 0, 1),           # Labor Day
+        _nth_weekday(year, 11, 3, 4),          # Thanksgiving
+        _observed(date(year, 12, 25)),         # Christmas
+    }
+    # New Year's Day is not observed on the preceding Friday when it falls on a Saturday
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return frozenset(holidays)
+
+
+def is_trading_day(day: date) -> bool:
+    """Whether the market is open on a date."""
+    return day.weekday() < 5 and day not in market_holidays(day.year)
+
+
+def next_trading_day(day: date) -> date:
+    """First trading day strictly after a date."""
+    day += timedelta(days=1)
+    while not is_trading_day(day):
+        day += timedelta(days=1)
+    return day
+
+
+def previous_trading_day(day: date) -> date:
+    """Last trading day strictly before a date."""
+    day -= timedelta(days=1)
+    while not is_trading_day(day):
+        day -= timedelta(days=1)
+    return day
+
+
+def market_time(moment: Optional[datetime] = None) -> datetime:
+    """
+    A moment as a timezone-aware datetime in the market's timezone.
+
+    Args:
+        moment: Reference time (defaults to now); naive datetimes are taken as market wall-clock time
+
+    Returns:
+        The moment in MARKET_TIMEZONE
+    """
+    if moment is None:
+        return datetime.now(MARKET_TIMEZONE)
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=MARKET_TIMEZONE)
+    return moment.astimezone(MARKET_TIMEZONE)
+
+
+def market_date(now: Optional[datetime] = None) -> date:
+    """
+    Trading session a moment belongs to: today on trading days, otherwise the last trading day.
+
+    Weekends and holidays map to the preceding session, so data keyed by market date stays
+    valid until the market next opens.
+
+    Args:
+        now: Reference time (defaults to now)
+
+    Returns:
+        Date of the current or most recent trading session
+    """
+    today = market_time(now).date()
+    return today if is_trading_day(today) else previous_trading_day(today)
+
+
+def next_market_open(now: Optional[datetime] = None) -> datetime:
+    """
+    Next time the market opens after a moment.
+
+    Args:
+        now: Reference time (defaults to now)
+
+    Returns:
+        Opening datetime of the next session, in MARKET_TIMEZONE
+    """
+    now = market_time(now)
+    today = now.date()
+    if is_trading_day(today) and now.time() < MARKET_OPEN:
+        return datetime.combine(today, MARKET_OPEN, tzinfo=MARKET_TIMEZONE)
+    return datetime.combine(next_trading_day(today), MARKET_OPEN, tzinfo=MARKET_TIMEZONE)
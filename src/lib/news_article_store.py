@@ -0,0 +1,253 @@
+"""Local per-ticker store of NEWS_SENTIMENT articles with rolling sentiment aggregates."""
+import copy
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Rolling windows maintained for every ticker; the longest one also bounds retention
+ROLLING_WINDOWS: Dict[str, timedelta] = {
+    "1d": timedelta(days=1),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+}
+
+PUBLISHED_FORMAT = "%Y%m%dT%H%M%S"
+TIME_FROM_FORMAT = "%Y%m%dT%H%M"
+
+
+def _parse_published(time_published: str) -> datetime:
+    """Parse an Alpha Vantage time_published value (YYYYMMDDTHHMMSS or YYYYMMDDTHHMM)."""
+    fmt = PUBLISHED_FORMAT if len(time_published) > 13 else TIME_FROM_FORMAT
+    return datetime.strptime(time_published, fmt)
+
+
+def _article_key(article: Dict[str, Any]) -> str:
+    return article.get("url") or f"{article.get('title', '')}|{article.get('time_published', '')}"
+
+
+def _ticker_score_and_label(article: Dict[str, Any], ticker: str) -> tuple:
+    """Sentiment score and label of an article for one ticker, falling back to the overall values."""
+    for entry in article.get("ticker_sentiment", []):
+        if entry.get("ticker") == ticker:
+            try:
+                return float(entry.get("ticker_sentiment_score")), entry.get("ticker_sentiment_label", "Unknown")
+            except (TypeError, ValueError):
+                break
+    try:
+        score = float(article.get("overall_sentiment_score", 0.0))
+    except (TypeError, ValueError):
+        score = 0.0
+    return score, article.get("overall_sentiment_label", "Unknown")
+
+
+def _empty_aggregate() -> Dict[str, Any]:
+    # start/end are indices into the ticker's time-ordered article list
+    return {"start": 0, "end": 0, "count": 0, "score_sum": 0.0, "labels": {}}
+
+
+class NewsArticleStore:
+    """
+    File-backed article store keyed by ticker.
+
+    Articles are kept in publish order so each refresh only needs to request articles newer
+    than the last one seen, and rolling window aggregates are updated by adding new articles
+    and evicting expired ones instead of rescanning the history.
+    """
+
+    def __init__(self, base_dir: Optional[str] = None, feed_limit: int = 50, max_articles: int = 2000):
+        """
+        Initialize the article store.
+
+        Args:
+            base_dir: Root directory for per-ticker files (defaults to NEWS_ARTICLE_STORE_DIR or 'output')
+            feed_limit: Number of most recent articles returned as a ticker's feed
+            max_articles: Hard cap on retained articles per ticker
+        """
+        self.base_dir = Path(base_dir or os.getenv("NEWS_ARTICLE_STORE_DIR", "output"))
+        self.feed_limit = feed_limit
+        self.max_articles = max_articles
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, ticker: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(ticker, threading.Lock())
+
+    def _path(self, ticker: str) -> Path:
+        return self.base_dir / ticker.upper() / "news_articles.json"
+
+    def _load(self, ticker: str) -> Dict[str, Any]:
+        path = self._path(ticker)
+        if path.exists():
+            try:
+                with open(path, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Discarding unreadable news article store for {ticker}: {e}")
+        return {
+            "ticker": ticker.upper(),
+            "last_published": None,
+            "articles": [],
+            "aggregates": {window: _empty_aggregate() for window in ROLLING_WINDOWS},
+        }
+
+    def _save(self, ticker: str, state: Dict[str, Any]) -> None:
+        path = self._path(ticker)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+    def next_time_from(self, ticker: str) -> str:
+        """
+        Get the time_from value for the next NEWS_SENTIMENT request for a ticker.
+
+        Returns:
+            YYYYMMDDTHHMM of the newest stored article, or "" when nothing is stored yet
+        """
+        with self._lock_for(ticker):
+            last_published = self._load(ticker)["last_published"]
+        if not last_published:
+            return ""
+        return _parse_published(last_published).strftime(TIME_FROM_FORMAT)
+
+    def update(self, ticker: str, feed: List[Dict[str, Any]], now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Merge newly fetched articles into the store and roll the aggregates forward.
+
+        Args:
+            ticker: Ticker the feed was requested for
+            feed: Raw NEWS_SENTIMENT feed items (may overlap with stored articles)
+            now: Reference time for window eviction (defaults to now)
+
+        Returns:
+            Copies of the ticker's most recent articles, newest first, up to feed_limit
+        """
+        now = now or datetime.now()
+        with self._lock_for(ticker):
+            state = self._load(ticker)
+            added = self._append_articles(state, feed)
+            self._roll_aggregates(state, ticker, now)
+            self._prune(state, ticker)
+            self._save(ticker, state)
+
+        logger.info(f"News article store for {ticker}: {added} new, {len(state['articles'])} retained")
+        latest = state["articles"][-self.feed_limit:]
+        return copy.deepcopy(latest[::-1])
+
+    def get_rolling_sentiment(self, ticker: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the rolling sentiment aggregates for a ticker.
+
+        Returns:
+            Dict keyed by window ('1d', '7d', '30d') with count, mean_score and label_distribution
+        """
+        with self._lock_for(ticker):
+            aggregates = self._load(ticker)["aggregates"]
+
+        rolling = {}
+        for window in ROLLING_WINDOWS:
+            aggregate = aggregates[window]
+            count = aggregate["count"]
+            rolling[window] = {
+                "count": count,
+                "mean_score": round(aggregate["score_sum"] / count, 4) if count else None,
+                "label_distribution": {label: n for label, n in aggregate["labels"].items() if n},
+            }
+        return rolling
+
+    def _append_articles(self, state: Dict[str, Any], feed: List[Dict[str, Any]]) -> int:
+        known = {_article_key(article) for article in state["articles"]}
+        new_articles = []
+        for article in feed:
+            key = _article_key(article)
+            if key in known or not article.get("time_published"):
+                continue
+            known.add(key)
+            new_articles.append(article)
+
+        new_articles.sort(key=lambda article: _parse_published(article["time_published"]))
+        articles = state["articles"]
+        if new_articles and articles and (
+            _parse_published(new_articles[0]["time_published"]) < _parse_published(articles[-1]["time_published"])
+        ):
+            # A late article belongs inside the history; merge by time (a stable sort of two
+            # sorted runs) and recount the windows, whose bounds are indices into the list
+            articles.extend(new_articles)
+            articles.sort(key=lambda article: _parse_published(article["time_published"]))
+            state["aggregates"] = {window: _empty_aggregate() for window in ROLLING_WINDOWS}
+        else:
+            articles.extend(new_articles)
+        if state["articles"]:
+            state["last_published"] = max(
+                (article["time_published"] for article in state["articles"]),
+                key=_parse_published
+            )
+        return len(new_articles)
+
+    def _roll_aggregates(self, state: Dict[str, Any], ticker: str, now: datetime) -> None:
+        articles = state["articles"]
+        for window, length in ROLLING_WINDOWS.items():
+            aggregate = state["aggregates"][window]
+            labels = aggregate["labels"]
+
+            # Add articles appended since the last update
+            for article in articles[aggregate["end"]:]:
+                score, label = _ticker_score_and_label(article, ticker)
+                aggregate["count"] += 1
+                aggregate["score_sum"] += score
+                labels[label] = labels.get(label, 0) + 1
+            aggregate["end"] = len(articles)
+
+            # Evict articles that fell out of the window
+            cutoff = now - length
+            while aggregate["start"] < aggregate["end"] and _parse_published(articles[aggregate["start"]]["time_published"]) < cutoff:
+                score, label = _ticker_score_and_label(articles[aggregate["start"]], ticker)
+                aggregate["count"] -= 1
+                aggregate["score_sum"] -= score
+                labels[label] -= 1
+                aggregate["start"] += 1
+
+            if aggregate["count"] == 0:
+                aggregate["score_sum"] = 0.0
+
+    def _prune(self, state: Dict[str, Any], ticker: str) -> None:
+        # Everything before the longest window's start has been evicted from every window,
+        # but the latest feed_limit articles are kept regardless of age for the feed itself
+        longest = max(ROLLING_WINDOWS, key=ROLLING_WINDOWS.get)
+        articles = state["articles"]
+        expired = min(state["aggregates"][longest]["start"], max(0, len(articles) - self.feed_limit))
+        expired += max(0, len(articles) - expired - self.max_articles)
+        if not expired:
+            return
+
+        for aggregate in state["aggregates"].values():
+            # Only reachable when over max_articles: drop capped articles from the windows too
+            while aggregate["start"] < expired:
+                score, label = _ticker_score_and_label(articles[aggregate["start"]], ticker)
+                aggregate["count"] -= 1
+                aggregate["score_sum"] -= score
+                aggregate["labels"][label] -= 1
+                aggregate["start"] += 1
+            aggregate["start"] -= expired
+            aggregate["end"] -= expired
+
+        state["articles"] = articles[expired:]
+
+
+# Global store instance
+_store_instance: Optional[NewsArticleStore] = None
+
+def get_news_article_store() -> NewsArticleStore:
+    """Get or create global news article store instance."""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = NewsArticleStore()
+    return _store_instance
@@ -0,0 +1,238 @@
+"""Per-symbol columnar store of daily price history, memory-mapped for zero-copy reads."""
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from src.lib.alpha_vantage_api import call_alpha_vantage_time_series_daily_adjusted
+from src.lib.daily_prices import DAILY_FIELDS, parse_daily_adjusted
+from src.lib.market_calendar import MARKET_CLOSE, MARKET_TIMEZONE, market_date, market_time
+
+logger = logging.getLogger(__name__)
+
+PRICE_STORE_DIR = os.getenv("PRICE_STORE_DIR", "output/prices")
+
+# Column name -> stored dtype; dates are datetime64[D] (int64 days since the epoch)
+COLUMN_DTYPES = {"date": np.dtype("datetime64[D]"), **{column: np.dtype(np.float64) for column in DAILY_FIELDS}}
+
+
+class PriceHistoryStore:
+    """
+    Daily OHLCV, adjusted close, dividends and split coefficients, one file per column.
+
+    Each symbol's columns are flat binary files that are memory-mapped on read, so a date range
+    is a slice of the maps and nothing is parsed or copied. The full history is downloaded once;
+    afterwards each refresh fetches the compact (100 day) series and appends the new bars. A
+    meta.json file holds the committed row count, so a crash mid-append leaves the extra bytes
+    unread until they are overwritten. When a dividend or split re-adjusts past closes, the
+    history is downloaded again.
+    """
+
+    def __init__(self, directory: Union[str, Path] = PRICE_STORE_DIR):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Root directory holding one subdirectory per symbol
+        """
+        self.directory = Path(directory)
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, symbol: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(symbol, threading.Lock())
+
+    def _symbol_dir(self, symbol: str) -> Path:
+        return self.directory / symbol.upper()
+
+    def _column_path(self, symbol: str, column: str) -> Path:
+        return self._symbol_dir(symbol) / f"{column}.bin"
+
+    def meta(self, symbol: str) -> Optional[Dict[str, str]]:
+        """
+        Stored metadata of a symbol.
+
+        Returns:
+            Dict with 'rows' and 'refreshed_at' (ISO datetime), or None if nothing is stored
+        """
+        try:
+            return json.loads((self._symbol_dir(symbol) / "meta.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _save_meta(self, symbol: str, rows: int, refreshed_at: datetime) -> None:
+        path = self._symbol_dir(symbol) / "meta.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"rows": rows, "refreshed_at": refreshed_at.isoformat()}))
+        tmp_path.replace(path)
+
+    def load(
+        self,
+        symbol: str,
+        start: Optional[Union[str, date]] = None,
+        end: Optional[Union[str, date]] = None
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Read a symbol's history between two dates, inclusive.
+
+        Args:
+            symbol: Stock symbol
+            start: First date (defaults to the oldest bar)
+            end: Last date (defaults to the latest bar)
+
+        Returns:
+            Dict of column name to a read-only memory-mapped array, oldest first, or None if
+            the symbol is not stored
+        """
+        meta = self.meta(symbol)
+        if not meta or not meta["rows"]:
+            return None
+        columns = {
+            column: np.memmap(self._column_path(symbol, column), dtype=dtype, mode="r", shape=(meta["rows"],))
+            for column, dtype in COLUMN_DTYPES.items()
+        }
+        dates = columns["date"]
+        first = 0 if start is None else int(np.searchsorted(dates, np.datetime64(str(start), "D"), side="left"))
+        last = len(dates) if end is None else int(np.searchsorted(dates, np.datetime64(str(end), "D"), side="right"))
+        return {column: values[first:last] for column, values in columns.items()}
+
+    def _write(self, symbol: str, columns: Dict[str, np.ndarray], from_row: int, refreshed_at: datetime) -> int:
+        """
+        Write columns starting at a row, replacing any stored rows from there on. Caller holds the lock.
+
+        Files never shrink in place, since readers may have them mapped: rows are overwritten
+        and appended, and a full rewrite goes to new files that replace the old ones.
+        """
+        self._symbol_dir(symbol).mkdir(parents=True, exist_ok=True)
+        for column, dtype in COLUMN_DTYPES.items():
+            path = self._column_path(symbol, column)
+            data = np.ascontiguousarray(columns[column], dtype=dtype).tobytes()
+            if from_row == 0:
+                tmp_path = path.with_suffix(".tmp")
+                tmp_path.write_bytes(data)
+                tmp_path.replace(path)
+                continue
+            with open(path, "r+b") as f:
+                f.seek(from_row * dtype.itemsize)
+                f.write(data)
+        rows = from_row + len(columns["date"])
+        self._save_meta(symbol, rows, refreshed_at)
+        return rows
+
+    def _fetch(self, symbol: str, outputsize: str) -> Dict[str, np.ndarray]:
+        return parse_daily_adjusted(call_alpha_vantage_time_series_daily_adjusted(symbol, outputsize=outputsize))
+
+    def _merge_row(self, stored: Dict[str, np.ndarray], latest: Dict[str, np.ndarray]) -> Optional[int]:
+        """
+        Row from which the compact series replaces the stored history.
+
+        Returns:
+            Row index, or None if the compact series does not extend the stored history
+            consistently (a gap, or past adjusted closes that changed)
+        """
+        first = int(np.searchsorted(stored["date"], latest["date"][0]))
+        overlap = len(stored["date"]) - first
+        if overlap <= 0 or overlap > len(latest["date"]):
+            return None
+        if not np.array_equal(stored["date"][first:], latest["date"][:overlap]):
+            return None
+        # The latest stored bar may have been taken intraday and be revised; earlier bars are final
+        if not np.allclose(stored["adjusted_close"][first:-1], latest["adjusted_close"][:overlap - 1], rtol=1e-9):
+            return None
+        last_matches = all(
+            np.allclose(stored[column][-1], latest[column][overlap - 1], rtol=1e-9, equal_nan=True)
+            for column in DAILY_FIELDS
+        )
+        return len(stored["date"]) if last_matches else len(stored["date"]) - 1
+
+    def is_stale(self, symbol: str, now: Optional[datetime] = None) -> bool:
+        """
+        Whether a symbol needs a refresh: it is not stored, was refreshed in an earlier
+        session, or was refreshed before the close of the current one.
+        """
+        meta = self.meta(symbol)
+        if not meta:
+            return True
+        now = market_time(now)
+        refreshed_at = datetime.fromisoformat(meta["refreshed_at"])
+        # Metadata written before refresh times were timezone-aware holds naive host-local time
+        refreshed_at = market_time(refreshed_at if refreshed_at.tzinfo else refreshed_at.astimezone())
+        session = market_date(now)
+        if market_date(refreshed_at) != session:
+            return True
+        session_close = datetime.combine(session, MARKET_CLOSE, tzinfo=MARKET_TIMEZONE)
+        return refreshed_at < session_close <= now
+
+    def refresh(self, symbol: str, now: Optional[datetime] = None) -> int:
+        """
+        Bring a symbol's history up to date.
+
+        Args:
+            symbol: Stock symbol
+            now: Reference time (defaults to now)
+
+        Returns:
+            Number of rows written
+        """
+        now = market_time(now)
+        with self._lock_for(symbol.upper()):
+            stored = self.load(symbol)
+            if stored is not None:
+                latest = self._fetch(symbol, "compact")
+                from_row = self._merge_row(stored, latest)
+                if from_row is not None:
+                    new_rows = latest["date"] > stored["date"][from_row - 1] if from_row else slice(None)
+                    appended = {column: values[new_rows] for column, values in latest.items()}
+                    self._write(symbol, appended, from_row, now)
+                    logger.info(f"Appended {len(appended['date'])} daily bars for {symbol}")
+                    return len(appended["date"])
+                logger.info(f"Stored price history of {symbol} no longer matches, downloading it again")
+
+            history = self._fetch(symbol, "full")
+            rows = self._write(symbol, history, 0, now)
+            logger.info(f"Stored {rows} daily bars for {symbol}")
+            return rows
+
+    def history(
+        self,
+        symbol: str,
+        start: Optional[Union[str, date]] = None,
+        end: Optional[Union[str, date]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Read a symbol's history, refreshing it first if it is stale.
+
+        Args:
+            symbol: Stock symbol
+            start: First date (defaults to the oldest bar)
+            end: Last date (defaults to the latest bar)
+
+        Returns:
+            Dict of column name to memory-mapped array, oldest first
+
+        Raises:
+            ValueError: If no price history is available for the symbol
+        """
+        if self.is_stale(symbol):
+            self.refresh(symbol)
+        columns = self.load(symbol, start, end)
+        if columns is None:
+            raise ValueError(f"No price history stored for {symbol}")
+        return columns
+
+
+# Global price history store instance
+_price_history_store_instance: Optional[PriceHistoryStore] = None
+
+def get_price_history_store() -> PriceHistoryStore:
+    """Get or create global price history store instance."""
+    global _price_history_store_instance
+    if _price_history_store_instance is None:
+        _price_history_store_instance = PriceHistoryStore()
+    return _price_history_store_instance
@@ -0,0 +1,229 @@
+"""Section-chunked, content-deduplicated ingestion of reports into research_docs."""
+import asyncio
+import hashlib
+import logging
+import os
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from litellm import token_counter
+
+from src.lib.embeddings import chunk_text
+from src.lib.supabase_rag import AsyncSupabaseRAG, SupabaseRAG, get_async_supabase_rag
+
+logger = logging.getLogger(__name__)
+
+# Sections longer than this are split between paragraphs
+RAG_CHUNK_MAX_TOKENS = int(os.getenv("RAG_CHUNK_MAX_TOKENS", "800"))
+# Model whose tokenizer is used for token counts
+RAG_TOKENIZER_MODEL = os.getenv("RAG_TOKENIZER_MODEL", "o4-mini")
+
+_HEADING_PATTERN = re.compile(r"^(#{1,3})\s+(.+?)\s*#*\s*$", re.MULTILINE)
+
+
+def count_tokens(text: str, model: str = RAG_TOKENIZER_MODEL) -> int:
+    """
+    Count the tokens of text with the model's tokenizer.
+
+    Args:
+        text: Text to count
+        model: Model name understood by litellm
+
+    Returns:
+        Token count (a 4-characters-per-token estimate if the tokenizer is unavailable)
+    """
+    try:
+        return token_counter(model=model, text=text)
+    except Exception as e:
+        logger.warning(f"Tokenizer for {model} unavailable, estimating token count: {e}")
+        return len(text) // 4
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of text with whitespace normalized, so reflowed text hashes the same."""
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ReportChunk:
+    """One section (or part of a long section) of a markdown report."""
+
+    section: str
+    content: str
+    token_count: int
+    content_hash: str
+
+
+def split_report(text: str, max_tokens: int = RAG_CHUNK_MAX_TOKENS) -> List[ReportChunk]:
+    """
+    Split a markdown report into section chunks.
+
+    Sections start at level 1-3 headings and are named by their heading path
+    (e.g. "Valuation > Forward P/E"). Text before the first heading forms an "Overview"
+    section. Sections over max_tokens are split between paragraphs.
+
+    Args:
+        text: Markdown report
+        max_tokens: Maximum tokens per chunk
+
+    Returns:
+        Chunks in report order
+    """
+    headings = list(_HEADING_PATTERN.finditer(text))
+    sections = []
+    preamble = text[:headings[0].start()] if headings else text
+    if preamble.strip():
+        sections.append(("Overview", preamble.strip()))
+
+    path: List[str] = []
+    # Headings without a body of their own (e.g. the report title) open the next section
+    pending_headings: List[str] = []
+    for i, heading in enumerate(headings):
+        level = len(heading.group(1))
+        path = path[:level - 1] + [heading.group(2)]
+        pending_headings.append(heading.group(0).strip())
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(text)
+        body = text[heading.end():end].strip()
+        if body:
+            sections.append((" > ".join(path), "\n\n".join(pending_headings + [body])))
+            pending_headings = []
+
+    chunks = []
+    for section, content in sections:
+        tokens = count_tokens(content)
+        if tokens <= max_tokens:
+            chunks.append(ReportChunk(section, content, tokens, content_hash(content)))
+            continue
+        # Character budget from this section's own characters-per-token ratio
+        max_chars = max(1, len(content) * max_tokens // tokens)
+        for i, part in enumerate(chunk_text(content, max_chars=max_chars)):
+            chunks.append(ReportChunk(f"{section} ({i + 1})", part, count_tokens(part), content_hash(part)))
+    return chunks
+
+
+@dataclass
+class IngestionResult:
+    """Outcome of ingesting one report."""
+
+    report_id: str
+    chunks: int
+    inserted: int
+    unchanged: int
+    # Distinct chunks (a repeated section is stored once); inserted + unchanged when complete
+    distinct: int
+
+
+class RagIngestor:
+    """
+    Stores reports in research_docs as one row per section chunk.
+
+    Chunks are identified by a hash of their content: a chunk already stored for the
+    symbol and report type is not inserted again, it is only marked as part of the new
+    report. Every chunk's metadata records the latest report it appeared in
+    (last_report_id), its positions there (a chunk repeated within a report is stored once
+    with every position) and the report's chunk count, so the latest report can be
+    reassembled and checked for completeness.
+    """
+
+    def __init__(self, rag: Optional[AsyncSupabaseRAG] = None, max_tokens: int = RAG_CHUNK_MAX_TOKENS):
+        """
+        Initialize the ingestor.
+
+        Args:
+            rag: Async RAG client (defaults to the global instance)
+            max_tokens: Maximum tokens per chunk
+        """
+        self.rag = rag or get_async_supabase_rag()
+        self.max_tokens = max_tokens
+
+    async def ingest_report(
+        self,
+        symbol: str,
+        report_type: str,
+        title: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        report_metadata: Optional[Dict[str, Any]] = None
+    ) -> IngestionResult:
+        """
+        Ingest a markdown report.
+
+        Args:
+            symbol: Stock symbol
+            report_type: Type of report (e.g., 'comprehensive_report')
+            title: Report title; chunk titles append the section name
+            content: Markdown report
+            metadata: Extra metadata stored on new chunks
+            report_metadata: Metadata describing this report, stored on every chunk of it
+                (new and unchanged), replacing that of the chunk's previous report
+
+        Returns:
+            Counts of chunks, inserted chunks and unchanged chunks
+
+        Raises:
+            RuntimeError: If new chunks could not be inserted or unchanged chunks re-stamped;
+                unchanged chunks are only re-stamped once the new ones are stored, so a
+                failed ingestion leaves the previous report as the latest complete one
+        """
+        report_id = datetime.now().isoformat()
+        # Token counting is CPU-bound; keep it off the event loop
+        chunks = await asyncio.to_thread(split_report, content, self.max_tokens)
+        # A chunk repeated within the report is stored once, with all of its positions
+        occurrences: Dict[str, List[int]] = {}
+        for index, chunk in enumerate(chunks):
+            occurrences.setdefault(chunk.content_hash, []).append(index)
+
+        existing = await self.rag.get_documents_by_hash(symbol, report_type, list(occurrences))
+        existing_by_hash = {doc["metadata"]["content_hash"]: doc for doc in existing}
+
+        new_rows = []
+        unchanged_metadata = {}
+        for content_hash, indexes in occurrences.items():
+            chunk = chunks[indexes[0]]
+            position = {
+                **(report_metadata or {}),
+                "section": chunk.section,
+                "section_index": indexes[0],
+                "section_positions": [[index, chunks[index].section] for index in indexes],
+                "section_count": len(chunks),
+                "last_report_id": report_id
+            }
+            doc = existing_by_hash.get(content_hash)
+            if doc is not None:
+                unchanged_metadata[doc["id"]] = {**doc["metadata"], **position}
+                continue
+            chunk_metadata = {
+                **(metadata or {}),
+                **position,
+                "content_hash": content_hash,
+                "report_title": title,
+                "first_report_id": report_id
+            }
+            new_rows.append(SupabaseRAG._document_row(
+                chunk.content, f"{title} - {chunk.section}", symbol, report_type,
+                None, chunk_metadata, chunk.token_count
+            ))
+
+        inserted = await self.rag.add_documents(new_rows)
+        if not await self.rag.update_documents_metadata(unchanged_metadata):
+            raise RuntimeError(f"Failed to mark {len(unchanged_metadata)} unchanged chunks as part of report {report_id}")
+
+        result = IngestionResult(report_id, len(chunks), len(inserted), len(unchanged_metadata), len(occurrences))
+        logger.info(
+            f"Ingested {report_type} for {symbol}: {result.chunks} chunks, "
+            f"{result.inserted} new, {result.unchanged} unchanged"
+        )
+        return result
+
+
+# Global ingestor instance
+_ingestor_instance: Optional[RagIngestor] = None
+
+def get_rag_ingestor() -> RagIngestor:
+    """Get or create global RAG ingestor instance."""
+    global _ingestor_instance
+    if _ingestor_instance is None:
+        _ingestor_instance = RagIngestor()
+    return _ingestor_instance
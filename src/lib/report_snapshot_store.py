@@ -0,0 +1,163 @@
+"""Latest completed research result per symbol, for stale-while-revalidate serving."""
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+from src.lib.market_calendar import market_date
+from src.lib.supabase_client import get_supabase_client
+
+logger = logging.getLogger(__name__)
+
+
+class ReportSnapshotStore:
+    """
+    Pointer to the most recent completed research result for each symbol.
+
+    Each symbol has a single research_cache row that never expires and is replaced with one
+    upsert only after a research run has completed, so readers always see either the previous
+    or the new complete result. A snapshot is stale once a newer market session has started
+    than the one it was generated in. The store also tracks which symbols have a background
+    refresh in flight so a burst of requests triggers at most one refresh per symbol.
+    """
+
+    def __init__(self):
+        """Initialize the snapshot store."""
+        self._client = None
+        self._lock = threading.Lock()
+        self._refreshing: Set[str] = set()
+
+    @property
+    def client(self):
+        """Get Supabase client connection."""
+        if self._client is None:
+            self._client = get_supabase_client()
+        return self._client
+
+    @staticmethod
+    def _cache_key(symbol: str) -> str:
+        return f"report_latest:{symbol.upper()}"
+
+    def get_latest(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest completed research result for a symbol.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Dict with 'main_job_id', 'completed_at' and 'result', or None if no snapshot exists
+        """
+        try:
+            response = self.client.table("research_cache")\
+                .select("data")\
+                .eq("cache_key", self._cache_key(symbol))\
+                .execute()
+            if response.data:
+                return response.data[0]["data"]
+        except Exception as e:
+            logger.error(f"Failed to get latest report snapshot for {symbol}: {str(e)}")
+        return None
+
+    def swap_latest(self, symbol: str, main_job_id: str, result: Dict[str, Any], completed_at: Optional[datetime] = None) -> bool:
+        """
+        Replace a symbol's snapshot with a newly completed research result.
+
+        A result older than the current snapshot is ignored, so a slow refresh cannot
+        overwrite a newer report.
+
+        Args:
+            symbol: Stock symbol
+            main_job_id: main_job_id of the completed research job
+            result: Result returned by main_research_flow
+            completed_at: When the job completed (defaults to now)
+
+        Returns:
+            True if the snapshot was replaced, False otherwise
+        """
+        completed_at = completed_at or datetime.now()
+        current = self.get_latest(symbol)
+        if current and self._completed_at(current) > completed_at.astimezone():
+            logger.info(f"Keeping newer report snapshot for {symbol} from job {current.get('main_job_id')}")
+            return False
+
+        try:
+            self.client.table("research_cache").upsert({
+                "cache_key": self._cache_key(symbol),
+                "cache_type": "report_snapshot",
+                "report_type": "comprehensive_report",
+                "symbol": symbol.upper(),
+                "cache_date": completed_at.date().isoformat(),
+                "expires_at": None,
+                "data": {
+                    "main_job_id": main_job_id,
+                    "completed_at": completed_at.isoformat(),
+                    "result": result
+                },
+                "metadata": {"cached_at": datetime.now().isoformat()}
+            }, on_conflict="cache_key").execute()
+            logger.info(f"Swapped latest report snapshot for {symbol} to job {main_job_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to swap latest report snapshot for {symbol}: {str(e)}")
+            return False
+
+    @staticmethod
+    def is_stale(snapshot: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+        """
+        Whether a snapshot predates the current market session.
+
+        Args:
+            snapshot: Snapshot returned by get_latest
+            now: Reference time (defaults to now)
+
+        Returns:
+            True if a newer trading session has started since the snapshot was generated
+        """
+        return market_date(ReportSnapshotStore._completed_at(snapshot)) < market_date(now)
+
+    @staticmethod
+    def age_seconds(snapshot: Dict[str, Any], now: Optional[datetime] = None) -> int:
+        """Seconds since a snapshot's research job completed."""
+        return max(0, int(((now or datetime.now()).astimezone() - ReportSnapshotStore._completed_at(snapshot)).total_seconds()))
+
+    @staticmethod
+    def _completed_at(snapshot: Dict[str, Any]) -> datetime:
+        """A snapshot's completion time, timezone-aware; it is stored as naive host-local time."""
+        return datetime.fromisoformat(snapshot["completed_at"]).astimezone()
+
+    def claim_refresh(self, symbol: str) -> bool:
+        """
+        Claim the background refresh for a symbol.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            True if the caller should start a refresh, False if one is already in flight
+        """
+        with self._lock:
+            if symbol.upper() in self._refreshing:
+                return False
+            self._refreshing.add(symbol.upper())
+            return True
+
+    def release_refresh(self, symbol: str) -> None:
+        """Mark a symbol's background refresh as finished."""
+        with self._lock:
+            self._refreshing.discard(symbol.upper())
+
+    def is_refreshing(self, symbol: str) -> bool:
+        """Whether a background refresh is in flight for a symbol."""
+        with self._lock:
+            return symbol.upper() in self._refreshing
+
+
+# Global snapshot store instance
+_store_instance: Optional[ReportSnapshotStore] = None
+
+def get_report_snapshot_store() -> ReportSnapshotStore:
+    """Get or create global report snapshot store instance."""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = ReportSnapshotStore()
+    return _store_instance
@@ -0,0 +1,263 @@
+"""In-process publish/subscribe of report generation events for server-sent events."""
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Stream comprehensive reports section by section to subscribers of a job
+REPORT_STREAMING = os.getenv("REPORT_STREAMING", "true").lower() != "false"
+REPORT_STREAM_MAX_JOBS = int(os.getenv("REPORT_STREAM_MAX_JOBS", "200"))
+# How long a finished stream is kept for clients that (re)connect late
+REPORT_STREAM_TTL_SECONDS = int(os.getenv("REPORT_STREAM_TTL_SECONDS", "3600"))
+# Idle seconds between keep-alive comments, so proxies do not close quiet connections
+REPORT_STREAM_HEARTBEAT_SECONDS = 15.0
+# Seconds without an event after which a subscriber's stream is ended with an error
+REPORT_STREAM_IDLE_TIMEOUT_SECONDS = float(os.getenv("REPORT_STREAM_IDLE_TIMEOUT_SECONDS", "900"))
+
+# Event that ends a stream successfully; "error" ends it with a failure
+DONE_EVENT = "done"
+ERROR_EVENT = "error"
+
+
+@dataclass
+class StreamEvent:
+    """One event of a report stream."""
+
+    id: int
+    event: str
+    data: Dict[str, Any]
+
+    def to_sse(self) -> str:
+        """Encode the event in the server-sent events wire format."""
+        return f"id: {self.id}\nevent: {self.event}\ndata: {json.dumps(self.data, default=str)}\n\n"
+
+
+@dataclass
+class _Stream:
+    events: List[StreamEvent] = field(default_factory=list)
+    subscribers: Set[asyncio.Queue] = field(default_factory=set)
+    closed: bool = False
+    touched_at: float = 0.0
+
+
+class ReportStreamBroker:
+    """
+    Event streams of in-flight report generations, keyed by job ID.
+
+    Every event is kept with its stream so subscribers that connect late, or reconnect
+    with the last event ID they saw, replay what they missed before receiving live events.
+    Closed streams expire after the TTL, and the least recently used streams are dropped
+    once more than max_jobs are kept. Streams are created by open() or publish(), never by
+    subscribers, so a job that does not run in this process has no stream to wait on.
+    Publishers and subscribers must share one event loop (the API server's).
+    """
+
+    def __init__(
+        self,
+        max_jobs: int = REPORT_STREAM_MAX_JOBS,
+        ttl_seconds: int = REPORT_STREAM_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the broker.
+
+        Args:
+            max_jobs: Maximum number of streams kept
+            ttl_seconds: Seconds a closed stream is kept
+            clock: Monotonic clock (for tests)
+        """
+        self.max_jobs = max_jobs
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._streams: "OrderedDict[str, _Stream]" = OrderedDict()
+
+    def _stream(self, job_id: str) -> _Stream:
+        """Get or create a job's stream, expiring and evicting old ones. Caller holds the lock."""
+        now = self._clock()
+        for expired in [
+            key for key, stream in self._streams.items()
+            if stream.closed and now - stream.touched_at >= self.ttl_seconds
+        ]:
+            del self._streams[expired]
+
+        stream = self._streams.pop(job_id, None) or _Stream()
+        stream.touched_at = now
+        self._streams[job_id] = stream
+        while len(self._streams) > self.max_jobs:
+            evicted, _ = self._streams.popitem(last=False)
+            logger.warning(f"Report stream broker full, dropped stream of job {evicted}")
+        return stream
+
+    def open(self, job_id: str) -> None:
+        """
+        Create a job's stream before its first event, so clients can subscribe right away.
+
+        Args:
+            job_id: Job UUID of a job that runs in this process
+        """
+        with self._lock:
+            self._stream(job_id)
+
+    def has_stream(self, job_id: str) -> bool:
+        """Whether this process has a stream for a job (open, or closed and not yet expired)."""
+        with self._lock:
+            return job_id in self._streams
+
+    def publish(self, job_id: str, event: str, data: Dict[str, Any]) -> None:
+        """
+        Publish an event to a job's stream.
+
+        Args:
+            job_id: Job UUID
+            event: Event name (e.g. 'section')
+            data: JSON-serializable event payload
+        """
+        with self._lock:
+            stream = self._stream(job_id)
+            if stream.closed:
+                return
+            stream_event = StreamEvent(len(stream.events), event, data)
+            stream.events.append(stream_event)
+            if event in (DONE_EVENT, ERROR_EVENT):
+                stream.closed = True
+            subscribers = list(stream.subscribers)
+        for queue in subscribers:
+            queue.put_nowait(stream_event)
+
+    def close(self, job_id: str, event: str = DONE_EVENT, data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        End a job's stream, unless it has already ended.
+
+        Args:
+            job_id: Job UUID
+            event: DONE_EVENT or ERROR_EVENT
+            data: Final event payload
+        """
+        self.publish(job_id, event, data or {})
+
+    def events(self, job_id: str) -> List[StreamEvent]:
+        """Events published to a job's stream so far."""
+        with self._lock:
+            stream = self._streams.get(job_id)
+            return list(stream.events) if stream else []
+
+    def is_closed(self, job_id: str) -> bool:
+        """Whether a job's stream has ended."""
+        with self._lock:
+            stream = self._streams.get(job_id)
+            return stream is not None and stream.closed
+
+    async def subscribe(self, job_id: str, last_event_id: Optional[int] = None) -> AsyncIterator[StreamEvent]:
+        """
+        Iterate over a job's events until its stream ends.
+
+        Args:
+            job_id: Job UUID
+            last_event_id: ID of the last event already received, to resume after it
+
+        Yields:
+            Past events after last_event_id, then live events; nothing if the job has no stream
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            stream = self._streams.get(job_id)
+            if stream is None:
+                return
+            stream.touched_at = self._clock()
+            self._streams.move_to_end(job_id)
+            backlog = [event for event in stream.events if last_event_id is None or event.id > last_event_id]
+            closed = stream.closed
+            if not closed:
+                stream.subscribers.add(queue)
+
+        try:
+            for event in backlog:
+                yield event
+            if closed:
+                return
+            while True:
+                event = await queue.get()
+                if last_event_id is not None and event.id <= last_event_id:
+                    continue
+                yield event
+                if event.event in (DONE_EVENT, ERROR_EVENT):
+                    return
+        finally:
+            with self._lock:
+                stream.subscribers.discard(queue)
+
+
+async def sse_stream(
+    job_id: str,
+    last_event_id: Optional[int] = None,
+    broker: Optional[ReportStreamBroker] = None,
+    heartbeat_seconds: float = REPORT_STREAM_HEARTBEAT_SECONDS,
+    idle_timeout_seconds: float = REPORT_STREAM_IDLE_TIMEOUT_SECONDS
+) -> AsyncIterator[str]:
+    """
+    Server-sent events body for a job's report stream.
+
+    Args:
+        job_id: Job UUID
+        last_event_id: Last-Event-ID sent by a reconnecting client
+        broker: Broker to subscribe to (defaults to the global instance)
+        heartbeat_seconds: Idle seconds between keep-alive comments
+        idle_timeout_seconds: Seconds without an event after which the stream ends with an
+            error event, so a job that stopped publishing does not hold the connection forever
+
+    Yields:
+        Encoded events, and keep-alive comments while waiting
+    """
+    events = (broker or get_report_stream_broker()).subscribe(job_id, last_event_id)
+    pending: Optional[asyncio.Future] = None
+    loop = asyncio.get_running_loop()
+    last_event_at = loop.time()
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(events))
+            idle_left = idle_timeout_seconds - (loop.time() - last_event_at)
+            done, _ = await asyncio.wait({pending}, timeout=max(min(heartbeat_seconds, idle_left), 0))
+            if not done:
+                if loop.time() - last_event_at >= idle_timeout_seconds:
+                    logger.warning(f"Report stream of job {job_id} idle for {idle_timeout_seconds:g}s, ending it")
+                    message = {"message": "No report events received; check the job status"}
+                    yield f"event: {ERROR_EVENT}\ndata: {json.dumps(message)}\n\n"
+                    return
+                yield ": keep-alive\n\n"
+                continue
+            try:
+                event = pending.result()
+            except StopAsyncIteration:
+                pending = None
+                return
+            pending = None
+            last_event_at = loop.time()
+            yield event.to_sse()
+    finally:
+        # The client disconnected or the stream ended; stop waiting for events
+        if pending is not None:
+            pending.cancel()
+            with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+                await pending
+        await events.aclose()
+
+
+# Global broker instance
+_broker_instance: Optional[ReportStreamBroker] = None
+
+def get_report_stream_broker() -> ReportStreamBroker:
+    """Get or create global report stream broker instance."""
+    global _broker_instance
+    if _broker_instance is None:
+        _broker_instance = ReportStreamBroker()
+    return _broker_instance
@@ -0,0 +1,151 @@
+"""Bounded registry of research subjob IDs for in-flight main jobs."""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from src.lib.supabase_job_tracker import get_async_job_tracker
+
+logger = logging.getLogger(__name__)
+
+SUBJOB_REGISTRY_MAX_JOBS = int(os.getenv("SUBJOB_REGISTRY_MAX_JOBS", "1000"))
+# Longest a research job is expected to run; entries of abandoned jobs are dropped after this
+SUBJOB_REGISTRY_TTL_SECONDS = int(os.getenv("SUBJOB_REGISTRY_TTL_SECONDS", str(6 * 3600)))
+# Fall back to research_jobs on a local miss, so workers see subjobs created by other workers
+SUBJOB_REGISTRY_SHARED = os.getenv("SUBJOB_REGISTRY_SHARED", "true").lower() != "false"
+
+
+class SubjobRegistry:
+    """
+    sub_job_id of each flow of the main jobs this process is working on.
+
+    Entries are dropped when their job finishes, when they have not been used for the TTL,
+    and least recently used first once more than max_jobs jobs are tracked. With the shared
+    backend enabled, a local miss is resolved from the subjob rows in research_jobs, which
+    every worker can read.
+    """
+
+    def __init__(
+        self,
+        max_jobs: int = SUBJOB_REGISTRY_MAX_JOBS,
+        ttl_seconds: int = SUBJOB_REGISTRY_TTL_SECONDS,
+        shared: bool = SUBJOB_REGISTRY_SHARED,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            max_jobs: Maximum number of main jobs kept in memory
+            ttl_seconds: Seconds after its last use that a job's entry expires
+            shared: Whether to look up unknown subjobs in research_jobs
+            clock: Monotonic clock (for tests)
+        """
+        self.max_jobs = max_jobs
+        self.ttl_seconds = ttl_seconds
+        self.shared = shared
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Ordered from least to most recently used
+        self._jobs: "OrderedDict[str, Tuple[float, Dict[str, str]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def _purge_expired(self, now: float) -> int:
+        """Drop expired entries; they are all at the front. Caller holds the lock."""
+        purged = 0
+        while self._jobs:
+            main_job_id, (touched_at, _) = next(iter(self._jobs.items()))
+            if now - touched_at < self.ttl_seconds:
+                break
+            del self._jobs[main_job_id]
+            purged += 1
+        return purged
+
+    def register(self, main_job_id: str, sub_job_ids: Dict[str, str]) -> None:
+        """
+        Record subjob IDs of a main job.
+
+        Args:
+            main_job_id: Main job UUID
+            sub_job_ids: Flow name to sub_job_id
+        """
+        now = self._clock()
+        with self._lock:
+            self._purge_expired(now)
+            _, flows = self._jobs.pop(main_job_id, (now, {}))
+            flows.update(sub_job_ids)
+            self._jobs[main_job_id] = (now, flows)
+            while len(self._jobs) > self.max_jobs:
+                evicted, _ = self._jobs.popitem(last=False)
+                logger.warning(f"Subjob registry full, evicted job {evicted}")
+
+    def get(self, main_job_id: str, flow: str) -> Optional[str]:
+        """
+        Get a flow's sub_job_id from memory.
+
+        Args:
+            main_job_id: Main job UUID
+            flow: Flow name
+
+        Returns:
+            sub_job_id, or None if unknown
+        """
+        now = self._clock()
+        with self._lock:
+            self._purge_expired(now)
+            entry = self._jobs.get(main_job_id)
+            if entry is None or flow not in entry[1]:
+                return None
+            self._jobs[main_job_id] = (now, entry[1])
+            self._jobs.move_to_end(main_job_id)
+            return entry[1][flow]
+
+    async def lookup(self, main_job_id: str, flow: str) -> Optional[str]:
+        """
+        Get a flow's sub_job_id, from memory or (if shared) from research_jobs.
+
+        Args:
+            main_job_id: Main job UUID
+            flow: Flow name
+
+        Returns:
+            sub_job_id, or None if the subjob does not exist yet
+        """
+        sub_job_id = self.get(main_job_id, flow)
+        if sub_job_id is not None or not self.shared:
+            return sub_job_id
+
+        sub_job_ids = await get_async_job_tracker().get_sub_job_ids(main_job_id)
+        if sub_job_ids:
+            self.register(main_job_id, sub_job_ids)
+        return sub_job_ids.get(flow)
+
+    def evict(self, main_job_id: str) -> None:
+        """Forget a main job, e.g. once it has finished."""
+        with self._lock:
+            self._jobs.pop(main_job_id, None)
+
+    def cleanup(self) -> int:
+        """
+        Drop expired entries.
+
+        Returns:
+            Number of jobs dropped
+        """
+        with self._lock:
+            return self._purge_expired(self._clock())
+
+
+# Global registry instance
+_registry_instance: Optional[SubjobRegistry] = None
+
+def get_subjob_registry() -> SubjobRegistry:
+    """Get or create global subjob registry instance."""
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = SubjobRegistry()
+    return _registry_instance
@@ -1,10 +1,14 @@
 """Supabase caching utility for reporting tasks and analysis results."""
+import asyncio
 import json
 import logging
 import hashlib
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Union
-from src.lib.supabase_client import get_supabase_client
+from typing import Dict, Any, List, Optional, Union
+from src.lib.supabase_client import get_supabase_client, get_async_supabase_client
+from src.lib.cache_ttl_policy import CacheTTLPolicy
+from src.lib.market_calendar import market_date
+from src.lib.cache_codec import decode_model, decode_payload, encode_payload
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +24,7 @@ class SupabaseCache:
         """
         self.default_ttl = default_ttl
         self._client = None
+        self._ttl_policy: Optional[CacheTTLPolicy] = None
 
     @property
     def client(self):
@@ -28,24 +33,33 @@ class SupabaseCache:
             self._client = get_supabase_client()
         return self._client
 
+    @property
+    def ttl_policy(self) -> CacheTTLPolicy:
+        """Get the market-calendar-aware TTL policy for reports."""
+        if self._ttl_policy is None:
+            self._ttl_policy = CacheTTLPolicy(self)
+        return self._ttl_policy
+
     def close(self):
         """Close connection (no-op for Supabase compatibility with Redis interface)."""
         self._client = None
 
-    def _generate_cache_key(self, prefix: str, symbol: str, **kwargs) -> str:
+    def _generate_cache_key(self, prefix: str, symbol: str, key_date: Optional[str] = None, **kwargs) -> str:
         """
         Generate a cache key based on prefix, symbol, daily timestamp and optional parameters.
 
         Args:
             prefix: Cache key prefix (e.g., 'historical_earnings', 'financial_statements')
             symbol: Stock symbol
+            key_date: YYYYMMDD date component (defaults to the current market session, so
+                weekends and holidays share the previous trading day's keys)
             **kwargs: Additional parameters to include in key generation
 
         Returns:
             String cache key in format: prefix:symbol:YYYYMMDD[:kwargs_hash]
         """
         # Add daily timestamp in YYYYMMDD format
-        daily_timestamp = datetime.now().strftime("%Y%m%d")
+        daily_timestamp = key_date or market_date().strftime("%Y%m%d")
 
         # Create a consistent hash of kwargs for cache key stability
         kwargs_str = json.dumps(kwargs, sort_keys=True) if kwargs else ""
@@ -59,7 +73,98 @@ class SupabaseCache:
 
         return key_base
 
-    def get_cached_report(self, report_type: str, symbol: str, **kwargs) -> Optional[Dict[str, Any]]:
+    def _report_cache_key(self, report_type: str, symbol: str, **kwargs) -> str:
+        return self._generate_cache_key(
+            f"report:{report_type}", symbol, key_date=self.ttl_policy.cache_key_date(report_type, symbol), **kwargs
+        )
+
+    def _get_live_entry(self, cache_key: str, label: str, symbol: str) -> Optional[Any]:
+        """
+        Get the stored data column of an unexpired cache entry.
+
+        Args:
+            cache_key: Cache key
+            label: Description for log messages (e.g. 'historical_earnings report')
+            symbol: Stock symbol
+
+        Returns:
+            Stored (still encoded) data, or None if missing or expired
+        """
+        response = self.client.table("research_cache")\
+            .select("data, expires_at")\
+            .eq("cache_key", cache_key)\
+            .execute()
+
+        return self._live_data(response.data, label, symbol)
+
+    @staticmethod
+    def _live_data(rows: Optional[List[Dict[str, Any]]], label: str, symbol: str) -> Optional[Any]:
+        """Data column of the first row, or None if there is none or it has expired."""
+        if rows and len(rows) > 0:
+            cache_entry = rows[0]
+
+            # Check if expired
+            if cache_entry.get("expires_at"):
+                expires_at = datetime.fromisoformat(cache_entry["expires_at"])
+                if expires_at < datetime.now():
+                    logger.debug(f"Cache expired for {label}: {symbol}")
+                    return None
+
+            logger.info(f"Cache hit for {label}: {symbol}")
+            return cache_entry["data"]
+
+        logger.debug(f"Cache miss for {label}: {symbol}")
+        return None
+
+    def _upsert_entry(
+        self,
+        cache_key: str,
+        cache_type: str,
+        report_type: str,
+        symbol: str,
+        data: Any,
+        schema: Optional[Any],
+        ttl: int
+    ) -> None:
+        """Encode data and upsert it as a cache entry."""
+        self.client.table("research_cache").upsert(
+            self._entry_row(cache_key, cache_type, report_type, symbol, data, schema, ttl),
+            on_conflict="cache_key"
+        ).execute()
+
+    @staticmethod
+    def _entry_row(
+        cache_key: str,
+        cache_type: str,
+        report_type: str,
+        symbol: str,
+        data: Any,
+        schema: Optional[Any],
+        ttl: int
+    ) -> Dict[str, Any]:
+        """Build the research_cache row for encoded data."""
+        envelope = encode_payload(data, schema)
+        now = datetime.now()
+
+        return {
+            "cache_key": cache_key,
+            "cache_type": cache_type,
+            "report_type": report_type,
+            "symbol": symbol.upper(),
+            "cache_date": now.date().isoformat(),
+            "expires_at": (now + timedelta(seconds=ttl)).isoformat(),
+            "data": envelope,
+            "metadata": {
+                "ttl": ttl,
+                "cached_at": now.isoformat(),
+                "schema": envelope["schema"],
+                "schema_version": envelope["schema_version"],
+                "encoding": envelope["encoding"],
+                "raw_bytes": envelope["raw_bytes"]
+            }
+        }
+
+    def get_cached_report(self, report_type: str, symbol: str, **kwargs) -> Optional[Any]:
         """
         Get cached report data.
 
@@ -69,94 +174,69 @@ class SupabaseCache:
             **kwargs: Additional parameters for cache key generation
 
         Returns:
-            Cached data as dict or None if not found
+            Cached data decoded to plain JSON data, or None if not found
         """
         try:
-            cache_key = self._generate_cache_key(f"report:{report_type}", symbol, **kwargs)
+            cache_key = self._report_cache_key(report_type, symbol, **kwargs)
+            data = self._get_live_entry(cache_key, f"{report_type} report", symbol)
+            return decode_payload(data) if data is not None else None
 
-            # Query Supabase for cache entry
-            response = self.client.table("research_cache")\
-                .select("data, expires_at")\
-                .eq("cache_key", cache_key)\
-                .execute()
+        except Exception as e:
+            logger.error(f"Failed to get cached report for {symbol} ({report_type}): {str(e)}")
+            return None
 
-            if response.data and len(response.data) > 0:
-                cache_entry = response.data[0]
+    def get_cached_model(self, report_type: str, symbol: str, schema: Any, **kwargs) -> Optional[Any]:
+        """
+        Get a cached report decoded directly into its model.
 
-                # Check if expired
-                if cache_entry.get("expires_at"):
-                    expires_at = datetime.fromisoformat(cache_entry["expires_at"])
-                    if expires_at < datetime.now():
-                        logger.debug(f"Cache expired for {report_type} report: {symbol}")
-                        return None
+        Entries written with another version of the model's schema are cache misses.
 
-                logger.info(f"Cache hit for {report_type} report: {symbol}")
-                return cache_entry["data"]
+        Args:
+            report_type: Type of report (e.g., 'historical_earnings', 'financial_statements')
+            symbol: Stock symbol
+            schema: Pydantic model class (or type such as List[Model]) the report was cached as
+            **kwargs: Additional parameters for cache key generation
 
-            logger.debug(f"Cache miss for {report_type} report: {symbol}")
-            return None
+        Returns:
+            Validated model instance, or None if not found or written with a stale schema
+        """
+        try:
+            cache_key = self._report_cache_key(report_type, symbol, **kwargs)
+            data = self._get_live_entry(cache_key, f"{report_type} report", symbol)
+            return decode_model(data, schema) if data is not None else None
 
         except Exception as e:
             logger.error(f"Failed to get cached report for {symbol} ({report_type}): {str(e)}")
             return None
 
-    def cache_report(self, report_type: str, symbol: str, data: Union[Dict[str, Any], Any], ttl: Optional[int] = None, **kwargs) -> bool:
+    def cache_report(
+        self,
+        report_type: str,
+        symbol: str,
+        data: Union[Dict[str, Any], Any],
+        ttl: Optional[int] = None,
+        schema: Optional[Any] = None,
+        **kwargs
+    ) -> bool:
         """
         Cache report data.
 
         Args:
             report_type: Type of report (e.g., 'historical_earnings', 'financial_statements')
             symbol: Stock symbol
-            data: Data to cache (dict or pydantic model with model_dump method)
-            ttl: Time-to-live in seconds (uses default_ttl if None)
+            data: Data to cache (pydantic model, list of models, or JSON-serializable data)
+            ttl: Time-to-live in seconds (uses the TTL policy, then default_ttl, if None)
+            schema: Type of data for schema versioning (inferred for a single pydantic model)
             **kwargs: Additional parameters for cache key generation
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            cache_key = self._generate_cache_key(f"report:{report_type}", symbol, **kwargs)
-
-            # Handle both dict and pydantic model data
-            if hasattr(data, 'model_dump'):
-                cache_data = data.model_dump()
-            elif isinstance(data, dict):
-                cache_data = data
-            else:
-                cache_data = {"data": data}
-
-            # Add metadata
-            cache_data["_cache_metadata"] = {
-                "cached_at": datetime.now().isoformat(),
-                "cache_key": cache_key,
-                "report_type": report_type,
-                "symbol": symbol.upper()
-            }
+            cache_key = self._report_cache_key(report_type, symbol, **kwargs)
+            ttl = ttl or self.ttl_policy.report_ttl(report_type, symbol) or self.default_ttl
 
-            ttl = ttl or self.default_ttl
-            expires_at = datetime.now() + timedelta(seconds=ttl)
-            cache_date = datetime.now().date()
-
-            # Upsert into Supabase
-            cache_entry = {
-                "cache_key": cache_key,
-                "cache_type": "report",
-                "report_type": report_type,
-                "symbol": symbol.upper(),
-                "cache_date": cache_date.isoformat(),
-                "expires_at": expires_at.isoformat(),
-                "data": cache_data,
-                "metadata": {
-                    "ttl": ttl,
-                    "cached_at": datetime.now().isoformat()
-                }
-            }
-
-            # Use upsert to handle conflicts
-            self.client.table("research_cache").upsert(
-                cache_entry,
-                on_conflict="cache_key"
-            ).execute()
+            self._upsert_entry(cache_key, "report", report_type, symbol, data, schema, ttl)
 
             logger.info(f"Cached {report_type} report for {symbol} (TTL: {ttl}s)")
             return True
@@ -165,7 +245,7 @@ class SupabaseCache:
             logger.error(f"Failed to cache report for {symbol} ({report_type}): {str(e)}")
             return False
 
-    def get_cached_analysis(self, analysis_type: str, symbol: str, **kwargs) -> Optional[Dict[str, Any]]:
+    def get_cached_analysis(self, analysis_type: str, symbol: str, **kwargs) -> Optional[Any]:
         """
         Get cached analysis data (for intermediate analysis results).
 
@@ -175,38 +255,26 @@ class SupabaseCache:
             **kwargs: Additional parameters for cache key generation
 
         Returns:
-            Cached analysis data as dict or None if not found
+            Cached analysis data decoded to plain JSON data, or None if not found
         """
         try:
             cache_key = self._generate_cache_key(f"analysis:{analysis_type}", symbol, **kwargs)
-
-            # Query Supabase for cache entry
-            response = self.client.table("research_cache")\
-                .select("data, expires_at")\
-                .eq("cache_key", cache_key)\
-                .execute()
-
-            if response.data and len(response.data) > 0:
-                cache_entry = response.data[0]
-
-                # Check if expired
-                if cache_entry.get("expires_at"):
-                    expires_at = datetime.fromisoformat(cache_entry["expires_at"])
-                    if expires_at < datetime.now():
-                        logger.debug(f"Cache expired for {analysis_type} analysis: {symbol}")
-                        return None
-
-                logger.info(f"Cache hit for {analysis_type} analysis: {symbol}")
-                return cache_entry["data"]
-
-            logger.debug(f"Cache miss for {analysis_type} analysis: {symbol}")
-            return None
+            data = self._get_live_entry(cache_key, f"{analysis_type} analysis", symbol)
+            return decode_payload(data) if data is not None else None
 
         except Exception as e:
             logger.error(f"Failed to get cached analysis for {symbol} ({analysis_type}): {str(e)}")
             return None
 
-    def cache_analysis(self, analysis_type: str, symbol: str, data: Union[Dict[str, Any], Any], ttl: Optional[int] = None, **kwargs) -> bool:
+    def cache_analysis(
+        self,
+        analysis_type: str,
+        symbol: str,
+        data: Union[Dict[str, Any], Any],
+        ttl: Optional[int] = None,
+        schema: Optional[Any] = None,
+        **kwargs
+    ) -> bool:
         """
         Cache analysis data (for intermediate analysis results).
 
@@ -215,6 +283,7 @@ class SupabaseCache:
             symbol: Stock symbol
             data: Analysis data to cache
             ttl: Time-to-live in seconds (uses default_ttl if None)
+            schema: Type of data for schema versioning (inferred for a single pydantic model)
             **kwargs: Additional parameters for cache key generation
 
         Returns:
@@ -222,47 +291,9 @@ class SupabaseCache:
         """
         try:
             cache_key = self._generate_cache_key(f"analysis:{analysis_type}", symbol, **kwargs)
-
-            # Handle both dict and pydantic model data
-            if hasattr(data, 'model_dump'):
-                cache_data = data.model_dump()
-            elif isinstance(data, dict):
-                cache_data = data
-            else:
-                cache_data = {"data": data}
-
-            # Add metadata
-            cache_data["_cache_metadata"] = {
-                "cached_at": datetime.now().isoformat(),
-                "cache_key": cache_key,
-                "analysis_type": analysis_type,
-                "symbol": symbol.upper()
-            }
-
             ttl = ttl or self.default_ttl
-            expires_at = datetime.now() + timedelta(seconds=ttl)
-            cache_date = datetime.now().date()
-
-            # Upsert into Supabase
-            cache_entry = {
-                "cache_key": cache_key,
-                "cache_type": "analysis",
-                "report_type": analysis_type,
-                "symbol": symbol.upper(),
-                "cache_date": cache_date.isoformat(),
-                "expires_at": expires_at.isoformat(),
-                "data": cache_data,
-                "metadata": {
-                    "ttl": ttl,
-                    "cached_at": datetime.now().isoformat()
-                }
-            }
 
-            # Use upsert to handle conflicts
-            self.client.table("research_cache").upsert(
-                cache_entry,
-                on_conflict="cache_key"
-            ).execute()
+            self._upsert_entry(cache_key, "analysis", analysis_type, symbol, data, schema, ttl)
 
             logger.info(f"Cached {analysis_type} analysis for {symbol} (TTL: {ttl}s)")
             return True
@@ -271,12 +302,13 @@ class SupabaseCache:
             logger.error(f"Failed to cache analysis for {symbol} ({analysis_type}): {str(e)}")
             return False
 
-    def invalidate_cache(self, pattern: str) -> int:
+    def invalidate_cache(self, pattern: str, cached_before: Optional[datetime] = None) -> int:
         """
         Invalidate cache entries matching a pattern.
 
         Args:
             pattern: Cache key pattern (supports SQL LIKE wildcards: % and _)
+            cached_before: Only delete entries cached before this time
 
         Returns:
             Number of keys deleted
@@ -286,10 +318,14 @@ class SupabaseCache:
             sql_pattern = pattern.replace("*", "%")
 
             # Delete matching entries
-            response = self.client.table("research_cache")\
+            query = self.client.table("research_cache")\
                 .delete()\
-                .like("cache_key", sql_pattern)\
-                .execute()
+                .like("cache_key", sql_pattern)
+            if cached_before is not None:
+                # cached_at is stored as naive host-local time and compared as text
+                cutoff = cached_before.astimezone().replace(tzinfo=None) if cached_before.tzinfo else cached_before
+                query = query.lt("metadata->>cached_at", cutoff.isoformat())
+            response = query.execute()
 
             deleted_count = len(response.data) if response.data else 0
             logger.info(f"Invalidated {deleted_count} cache entries matching pattern: {pattern}")
@@ -334,6 +370,199 @@ class SupabaseCache:
             logger.error(f"Failed to get cache info: {str(e)}")
             return {"error": str(e)}
 
+class AsyncSupabaseCache:
+    """
+    Non-blocking research_cache access for code running on the event loop.
+
+    Shares cache keys, TTLs and payload encoding with SupabaseCache, but reads and writes
+    through the shared async client so other jobs keep running while a query is in flight.
+    """
+
+    def __init__(self, cache: Optional[SupabaseCache] = None):
+        """
+        Initialize async cache.
+
+        Args:
+            cache: Synchronous cache providing key generation and the TTL policy
+                (defaults to the global cache)
+        """
+        self.cache = cache or get_supabase_cache()
+        self._client = None
+
+    async def _get_client(self):
+        """Get the shared async Supabase client."""
+        if self._client is not None:
+            return self._client
+        return await get_async_supabase_client()
+
+    async def _report_cache_key(self, report_type: str, symbol: str, **kwargs) -> str:
+        # The TTL policy may fetch the earnings calendar on its first use for a symbol each session
+        return await asyncio.to_thread(self.cache._report_cache_key, report_type, symbol, **kwargs)
+
+    async def _get_live_entry(self, cache_key: str, label: str, symbol: str) -> Optional[Any]:
+        """Get the stored data column of an unexpired cache entry."""
+        client = await self._get_client()
+        response = await client.table("research_cache")\
+            .select("data, expires_at")\
+            .eq("cache_key", cache_key)\
+            .execute()
+
+        return SupabaseCache._live_data(response.data, label, symbol)
+
+    async def _upsert_entry(
+        self,
+        cache_key: str,
+        cache_type: str,
+        report_type: str,
+        symbol: str,
+        data: Any,
+        schema: Optional[Any],
+        ttl: int
+    ) -> None:
+        """Encode data and upsert it as a cache entry."""
+        client = await self._get_client()
+        await client.table("research_cache").upsert(
+            SupabaseCache._entry_row(cache_key, cache_type, report_type, symbol, data, schema, ttl),
+            on_conflict="cache_key"
+        ).execute()
+
+    async def get_cached_report(self, report_type: str, symbol: str, **kwargs) -> Optional[Any]:
+        """
+        Get cached report data.
+
+        Args:
+            report_type: Type of report (e.g., 'historical_earnings', 'financial_statements')
+            symbol: Stock symbol
+            **kwargs: Additional parameters for cache key generation
+
+        Returns:
+            Cached data decoded to plain JSON data, or None if not found
+        """
+        try:
+            cache_key = await self._report_cache_key(report_type, symbol, **kwargs)
+            data = await self._get_live_entry(cache_key, f"{report_type} report", symbol)
+            return decode_payload(data) if data is not None else None
+
+        except Exception as e:
+            logger.error(f"Failed to get cached report for {symbol} ({report_type}): {str(e)}")
+            return None
+
+    async def get_cached_model(self, report_type: str, symbol: str, schema: Any, **kwargs) -> Optional[Any]:
+        """
+        Get a cached report decoded directly into its model.
+
+        Args:
+            report_type: Type of report (e.g., 'historical_earnings', 'financial_statements')
+            symbol: Stock symbol
+            schema: Pydantic model class (or type such as List[Model]) the report was cached as
+            **kwargs: Additional parameters for cache key generation
+
+        Returns:
+            Validated model instance, or None if not found or written with a stale schema
+        """
+        try:
+            cache_key = await self._report_cache_key(report_type, symbol, **kwargs)
+            data = await self._get_live_entry(cache_key, f"{report_type} report", symbol)
+            return decode_model(data, schema) if data is not None else None
+
+        except Exception as e:
+            logger.error(f"Failed to get cached report for {symbol} ({report_type}): {str(e)}")
+            return None
+
+    async def cache_report(
+        self,
+        report_type: str,
+        symbol: str,
+        data: Union[Dict[str, Any], Any],
+        ttl: Optional[int] = None,
+        schema: Optional[Any] = None,
+        **kwargs
+    ) -> bool:
+        """
+        Cache report data.
+
+        Args:
+            report_type: Type of report (e.g., 'historical_earnings', 'financial_statements')
+            symbol: Stock symbol
+            data: Data to cache (pydantic model, list of models, or JSON-serializable data)
+            ttl: Time-to-live in seconds (uses the TTL policy, then default_ttl, if None)
+            schema: Type of data for schema versioning (inferred for a single pydantic model)
+            **kwargs: Additional parameters for cache key generation
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            cache_key = await self._report_cache_key(report_type, symbol, **kwargs)
+            if not ttl:
+                ttl = await asyncio.to_thread(self.cache.ttl_policy.report_ttl, report_type, symbol) or self.cache.default_ttl
+
+            await self._upsert_entry(cache_key, "report", report_type, symbol, data, schema, ttl)
+
+            logger.info(f"Cached {report_type} report for {symbol} (TTL: {ttl}s)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to cache report for {symbol} ({report_type}): {str(e)}")
+            return False
+
+    async def get_cached_analysis(self, analysis_type: str, symbol: str, **kwargs) -> Optional[Any]:
+        """
+        Get cached analysis data (for intermediate analysis results).
+
+        Args:
+            analysis_type: Type of analysis (e.g., 'historical_earnings_analysis', 'news_sentiment')
+            symbol: Stock symbol
+            **kwargs: Additional parameters for cache key generation
+
+        Returns:
+            Cached analysis data decoded to plain JSON data, or None if not found
+        """
+        try:
+            cache_key = self.cache._generate_cache_key(f"analysis:{analysis_type}", symbol, **kwargs)
+            data = await self._get_live_entry(cache_key, f"{analysis_type} analysis", symbol)
+            return decode_payload(data) if data is not None else None
+
+        except Exception as e:
+            logger.error(f"Failed to get cached analysis for {symbol} ({analysis_type}): {str(e)}")
+            return None
+
+    async def cache_analysis(
+        self,
+        analysis_type: str,
+        symbol: str,
+        data: Union[Dict[str, Any], Any],
+        ttl: Optional[int] = None,
+        schema: Optional[Any] = None,
+        **kwargs
+    ) -> bool:
+        """
+        Cache analysis data (for intermediate analysis results).
+
+        Args:
+            analysis_type: Type of analysis (e.g., 'historical_earnings_analysis', 'news_sentiment')
+            symbol: Stock symbol
+            data: Analysis data to cache
+            ttl: Time-to-live in seconds (uses default_ttl if None)
+            schema: Type of data for schema versioning (inferred for a single pydantic model)
+            **kwargs: Additional parameters for cache key generation
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            cache_key = self.cache._generate_cache_key(f"analysis:{analysis_type}", symbol, **kwargs)
+            ttl = ttl or self.cache.default_ttl
+
+            await self._upsert_entry(cache_key, "analysis", analysis_type, symbol, data, schema, ttl)
+
+            logger.info(f"Cached {analysis_type} analysis for {symbol} (TTL: {ttl}s)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to cache analysis for {symbol} ({analysis_type}): {str(e)}")
+            return False
+
 # Global cache instance
 _cache_instance = None
 
@@ -355,3 +584,13 @@ def close_supabase_cache():
     if _cache_instance:
         _cache_instance.close()
         _cache_instance = None
+
+# Global async cache instance
+_async_cache_instance = None
+
+def get_async_supabase_cache() -> AsyncSupabaseCache:
+    """Get or create global async Supabase cache instance."""
+    global _async_cache_instance
+    if _async_cache_instance is None:
+        _async_cache_instance = AsyncSupabaseCache()
+    return _async_cache_instance
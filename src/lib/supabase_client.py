@@ -1,11 +1,17 @@
 """Supabase client initialization and singleton management."""
+import asyncio
 import os
 import logging
 from typing import Optional
-from supabase import create_client, Client
+import httpx
+from supabase import create_client, Client, acreate_client, AsyncClient, AsyncClientOptions
 
 logger = logging.getLogger(__name__)
 
+# Connections kept open to PostgREST by the shared async client
+SUPABASE_POOL_SIZE = int(os.getenv("SUPABASE_POOL_SIZE", "20"))
+SUPABASE_TIMEOUT_SECONDS = float(os.getenv("SUPABASE_TIMEOUT_SECONDS", "30"))
+
 class SupabaseClient:
     """Supabase client wrapper with singleton pattern."""
 
@@ -58,3 +64,76 @@ def close_supabase_client():
     if _client_instance:
         _client_instance.close()
         _client_instance = None
+
+class AsyncSupabaseClient:
+    """Async Supabase client over one pooled keep-alive HTTP client."""
+
+    def __init__(self, url: Optional[str] = None, key: Optional[str] = None, pool_size: int = SUPABASE_POOL_SIZE):
+        """
+        Initialize async Supabase client settings.
+
+        Args:
+            url: Supabase URL (defaults to SUPABASE_URL env var)
+            key: Supabase service key (defaults to SUPABASE_SERVICE_KEY env var)
+            pool_size: Maximum number of open connections
+        """
+        self.url = url or os.getenv("SUPABASE_URL")
+        self.key = key or os.getenv("SUPABASE_SERVICE_KEY")
+
+        if not self.url:
+            raise ValueError("SUPABASE_URL environment variable is required")
+        if not self.key:
+            raise ValueError("SUPABASE_SERVICE_KEY environment variable is required")
+
+        self.pool_size = pool_size
+        self._client: Optional[AsyncClient] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get_client(self) -> AsyncClient:
+        """
+        Get or create the async client for the running event loop.
+
+        Pooled connections belong to the loop that opened them, so a new loop (e.g. a
+        later asyncio.run) gets its own client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+                timeout=SUPABASE_TIMEOUT_SECONDS
+            )
+            client = await acreate_client(self.url, self.key, AsyncClientOptions(httpx_client=http_client))
+            # Another coroutine may have created the client while this one awaited
+            if self._client is None or self._loop is not loop:
+                self._client, self._http_client, self._loop = client, http_client, loop
+                logger.info(f"Async Supabase client initialized: {self.url} (pool size {self.pool_size})")
+            else:
+                await http_client.aclose()
+        return self._client
+
+    async def close(self):
+        """Close pooled connections."""
+        if self._http_client is not None and self._loop is asyncio.get_running_loop():
+            await self._http_client.aclose()
+        self._client = None
+        self._http_client = None
+        self._loop = None
+        logger.debug("Async Supabase client connection closed")
+
+# Global async client instance
+_async_client_instance: Optional[AsyncSupabaseClient] = None
+
+async def get_async_supabase_client() -> AsyncClient:
+    """Get or create global async Supabase client instance."""
+    global _async_client_instance
+    if _async_client_instance is None:
+        _async_client_instance = AsyncSupabaseClient()
+    return await _async_client_instance.get_client()
+
+async def close_async_supabase_client():
+    """Close global async Supabase client connections."""
+    global _async_client_instance
+    if _async_client_instance:
+        await _async_client_instance.close()
+        _async_client_instance = None
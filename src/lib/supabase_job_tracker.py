@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from enum import Enum
-from src.lib.supabase_client import get_supabase_client
+from src.lib.supabase_client import get_supabase_client, get_async_supabase_client
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +46,125 @@ class JobTracker:
         """Close connection (no-op for Supabase compatibility with Redis interface)."""
         self._client = None
 
+    @staticmethod
+    def _new_job_row(job_type: str, symbol: str, metadata: Optional[Dict[str, Any]],
+                     main_job_id: Optional[str], is_sub_job: bool, job_name: Optional[str]) -> Dict[str, Any]:
+        """Build the research_jobs row for a new job."""
+        # Prepare metadata with job_type and other info
+        job_metadata = metadata or {}
+        job_metadata["job_type"] = job_type
+        job_metadata["steps"] = []
+        job_metadata["result"] = None
+
+        # Generate or use existing main_job_id
+        if main_job_id is None:
+            main_job_id = str(uuid.uuid4())
+
+        # Generate sub_job_id if this is a sub-job
+        sub_job_id = str(uuid.uuid4()) if is_sub_job else None
+
+        insert_data = {
+            "symbol": symbol.upper(),
+            "status": JobStatus.PENDING,
+            "metadata": job_metadata,
+            "main_job_id": main_job_id
+        }
+
+        if sub_job_id:
+            insert_data["sub_job_id"] = sub_job_id
+
+        if job_name:
+            insert_data["job_name"] = job_name
+
+        return insert_data
+
+    @staticmethod
+    def _created_job(rows: Optional[List[Dict[str, Any]]], job_type: str, symbol: str) -> Dict[str, str]:
+        """IDs of an inserted job row."""
+        if rows and len(rows) > 0:
+            row_id = str(rows[0]["id"])
+            returned_main_job_id = rows[0]["main_job_id"]
+            returned_sub_job_id = rows[0].get("sub_job_id")
+            returned_job_name = rows[0].get("job_name")
+
+            logger.info(f"Created job '{returned_job_name}' with main_job_id={returned_main_job_id}, sub_job_id={returned_sub_job_id}, row_id={row_id} for {job_type} of {symbol}")
+
+            return {
+                "main_job_id": returned_main_job_id,
+                "sub_job_id": returned_sub_job_id,
+                "id": row_id,
+                "job_name": returned_job_name
+            }
+        raise Exception("Failed to create job - no data returned")
+
+    @staticmethod
+    def _filter_job(query, job_id: str, use_main_job_id: bool = True, use_sub_job_id: bool = False):
+        """Restrict a research_jobs query to one job (works on sync and async query builders)."""
+        if use_sub_job_id:
+            return query.eq("sub_job_id", job_id)
+        if use_main_job_id:
+            # When using main_job_id, only match the main job row (where job_name='main_flow')
+            # This prevents accidentally reading or updating a subjob with the same main_job_id
+            return query.eq("main_job_id", job_id).eq("job_name", "main_flow")
+        return query.eq("id", job_id)
+
+    @staticmethod
+    def _status_update(current_metadata: Dict[str, Any], status: JobStatus, step: Optional[str],
+                       result: Optional[Dict[str, Any]], error: Optional[str]) -> Dict[str, Any]:
+        """Build the research_jobs update for a status change, preserving existing metadata."""
+        # Add step if provided
+        if step:
+            steps = current_metadata.get("steps", [])
+            steps.append({
+                "step": step,
+                "timestamp": datetime.now().isoformat(),
+                "status": status
+            })
+            current_metadata["steps"] = steps
+
+        # Set result for completed jobs
+        if result and status == JobStatus.COMPLETED:
+            current_metadata["result"] = result
+
+        # Prepare update data
+        update_data = {
+            "status": status,
+            "updated_at": datetime.now().isoformat(),
+            "metadata": current_metadata
+        }
+
+        # Set timestamps based on status
+        if status == JobStatus.COMPLETED:
+            update_data["completed_at"] = datetime.now().isoformat()
+        elif status == JobStatus.FAILED:
+            update_data["failed_at"] = datetime.now().isoformat()
+            update_data["error"] = error
+
+        return update_data
+
+    @staticmethod
+    def _format_job(job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a research_jobs row for API responses."""
+        metadata = job_data.get("metadata", {})
+
+        # Format response with both IDs
+        return {
+            "job_id": str(job_data["id"]),  # Row ID (for backward compatibility)
+            "main_job_id": job_data.get("main_job_id"),  # Main job UUID
+            "sub_job_id": job_data.get("sub_job_id"),  # Sub job UUID (if exists)
+            "job_type": metadata.get("job_type", "research"),
+            "symbol": job_data["symbol"],
+            "status": job_data["status"],
+            "created_at": job_data["created_at"],
+            "updated_at": job_data["updated_at"],
+            "completed_at": job_data.get("completed_at"),
+            "failed_at": job_data.get("failed_at"),
+            "metadata": metadata,
+            "steps": metadata.get("steps", []),
+            "result": metadata.get("result"),
+            "error": job_data.get("error")
+        }
+
     def create_job(self, job_type: str, symbol: str, metadata: Optional[Dict[str, Any]] = None,
                    main_job_id: Optional[str] = None, is_sub_job: bool = False,
                    job_name: Optional[str] = None) -> Dict[str, str]:
@@ -64,53 +183,13 @@ class JobTracker:
             Dict with 'main_job_id', 'sub_job_id', and 'id' (row ID)
         """
         try:
-            # Prepare metadata with job_type and other info
-            job_metadata = metadata or {}
-            job_metadata["job_type"] = job_type
-            job_metadata["steps"] = []
-            job_metadata["result"] = None
-
-            # Generate or use existing main_job_id
-            if main_job_id is None:
-                main_job_id = str(uuid.uuid4())
-
-            # Generate sub_job_id if this is a sub-job
-            sub_job_id = str(uuid.uuid4()) if is_sub_job else None
-
-            # Insert job into Supabase
-            insert_data = {
-                "symbol": symbol.upper(),
-                "status": JobStatus.PENDING,
-                "metadata": job_metadata,
-                "main_job_id": main_job_id
-            }
-
-            if sub_job_id:
-                insert_data["sub_job_id"] = sub_job_id
-
-            if job_name:
-                insert_data["job_name"] = job_name
+            insert_data = self._new_job_row(job_type, symbol, metadata, main_job_id, is_sub_job, job_name)
 
             print(f"🔵 DEBUG JobTracker.create_job: Inserting job with data: {insert_data}")
             response = self.client.table("research_jobs").insert(insert_data).execute()
             print(f"✅ DEBUG JobTracker.create_job: Insert response: {response.data}")
 
-            if response.data and len(response.data) > 0:
-                row_id = str(response.data[0]["id"])
-                returned_main_job_id = response.data[0]["main_job_id"]
-                returned_sub_job_id = response.data[0].get("sub_job_id")
-                returned_job_name = response.data[0].get("job_name")
-
-                logger.info(f"Created job '{returned_job_name}' with main_job_id={returned_main_job_id}, sub_job_id={returned_sub_job_id}, row_id={row_id} for {job_type} of {symbol}")
-
-                return {
-                    "main_job_id": returned_main_job_id,
-                    "sub_job_id": returned_sub_job_id,
-                    "id": row_id,
-                    "job_name": returned_job_name
-                }
-            else:
-                raise Exception("Failed to create job - no data returned")
+            return self._created_job(response.data, job_type, symbol)
 
         except Exception as e:
             logger.error(f"Failed to create job: {str(e)}")
@@ -136,58 +215,20 @@ class JobTracker:
         """
         try:
             # Get current job data to preserve metadata
-            if use_sub_job_id:
-                current_job = self.client.table("research_jobs").select("*").eq("sub_job_id", job_id).execute()
-            elif use_main_job_id:
-                # When using main_job_id, only get the main job row (where job_name='main_flow')
-                # This prevents accidentally getting a subjob's data
-                current_job = self.client.table("research_jobs").select("*").eq("main_job_id", job_id).eq("job_name", "main_flow").execute()
-            else:
-                current_job = self.client.table("research_jobs").select("*").eq("id", job_id).execute()
+            current_job = self._filter_job(
+                self.client.table("research_jobs").select("*"), job_id, use_main_job_id, use_sub_job_id
+            ).execute()
 
             if not current_job.data or len(current_job.data) == 0:
                 logger.error(f"Job {job_id} not found")
                 return False
 
-            current_metadata = current_job.data[0].get("metadata", {})
-
-            # Add step if provided
-            if step:
-                steps = current_metadata.get("steps", [])
-                steps.append({
-                    "step": step,
-                    "timestamp": datetime.now().isoformat(),
-                    "status": status
-                })
-                current_metadata["steps"] = steps
-
-            # Set result for completed jobs
-            if result and status == JobStatus.COMPLETED:
-                current_metadata["result"] = result
-
-            # Prepare update data
-            update_data = {
-                "status": status,
-                "updated_at": datetime.now().isoformat(),
-                "metadata": current_metadata
-            }
-
-            # Set timestamps based on status
-            if status == JobStatus.COMPLETED:
-                update_data["completed_at"] = datetime.now().isoformat()
-            elif status == JobStatus.FAILED:
-                update_data["failed_at"] = datetime.now().isoformat()
-                update_data["error"] = error
+            update_data = self._status_update(current_job.data[0].get("metadata", {}), status, step, result, error)
 
             # Update job in Supabase
-            if use_sub_job_id:
-                self.client.table("research_jobs").update(update_data).eq("sub_job_id", job_id).execute()
-            elif use_main_job_id:
-                # When using main_job_id, only update the main job row (where job_name='main_flow')
-                # This prevents accidentally updating all subjobs with the same main_job_id
-                self.client.table("research_jobs").update(update_data).eq("main_job_id", job_id).eq("job_name", "main_flow").execute()
-            else:
-                self.client.table("research_jobs").update(update_data).eq("id", job_id).execute()
+            self._filter_job(
+                self.client.table("research_jobs").update(update_data), job_id, use_main_job_id, use_sub_job_id
+            ).execute()
 
             logger.info(f"Updated job {job_id} status to {status}" + (f" with step: {step}" if step else ""))
             return True
@@ -208,36 +249,12 @@ class JobTracker:
             Job data dict or None if not found
         """
         try:
-            if use_main_job_id:
-                # When using main_job_id, only get the main job row (where job_name='main_flow')
-                # This prevents accidentally getting a subjob's data
-                response = self.client.table("research_jobs").select("*").eq("main_job_id", job_id).eq("job_name", "main_flow").execute()
-            else:
-                response = self.client.table("research_jobs").select("*").eq("id", job_id).execute()
+            response = self._filter_job(self.client.table("research_jobs").select("*"), job_id, use_main_job_id).execute()
 
             if not response.data or len(response.data) == 0:
                 return None
 
-            job_data = response.data[0]
-            metadata = job_data.get("metadata", {})
-
-            # Format response with both IDs
-            return {
-                "job_id": str(job_data["id"]),  # Row ID (for backward compatibility)
-                "main_job_id": job_data.get("main_job_id"),  # Main job UUID
-                "sub_job_id": job_data.get("sub_job_id"),  # Sub job UUID (if exists)
-                "job_type": metadata.get("job_type", "research"),
-                "symbol": job_data["symbol"],
-                "status": job_data["status"],
-                "created_at": job_data["created_at"],
-                "updated_at": job_data["updated_at"],
-                "completed_at": job_data.get("completed_at"),
-                "failed_at": job_data.get("failed_at"),
-                "metadata": metadata,
-                "steps": metadata.get("steps", []),
-                "result": metadata.get("result"),
-                "error": job_data.get("error")
-            }
+            return self._format_job(response.data[0])
 
         except Exception as e:
             logger.error(f"Failed to get job status for {job_id}: {str(e)}")
@@ -273,6 +290,34 @@ class JobTracker:
             logger.error(f"Failed to get job by symbol {symbol}: {str(e)}")
             return None
 
+    def get_latest_completed_job(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the most recent completed main research job for a symbol.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Job data dict (as returned by get_job_status) or None if not found
+        """
+        try:
+            response = self.client.table("research_jobs")\
+                .select("main_job_id")\
+                .eq("symbol", symbol.upper())\
+                .eq("job_name", "main_flow")\
+                .eq("status", JobStatus.COMPLETED)\
+                .order("completed_at", desc=True)\
+                .limit(1)\
+                .execute()
+
+            if response.data and len(response.data) > 0:
+                return self.get_job_status(response.data[0]["main_job_id"], use_main_job_id=True)
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to get latest completed job for {symbol}: {str(e)}")
+            return None
+
     def cancel_job(self, job_id: str, use_main_job_id: bool = True) -> bool:
         """
         Cancel a job.
@@ -314,6 +359,41 @@ class JobTracker:
             logger.error(f"Failed to add user research history: {str(e)}")
             return False
 
+    def get_recent_symbol_requests(self, since: datetime, limit: int = 5000) -> List[Dict[str, Any]]:
+        """
+        List symbol requests from research_jobs and user_research_history since a time.
+
+        Args:
+            since: Earliest created_at to include
+            limit: Maximum number of rows to read from each table
+
+        Returns:
+            List of dicts with 'symbol' and 'created_at'
+        """
+        requests: List[Dict[str, Any]] = []
+        try:
+            jobs = self.client.table("research_jobs")\
+                .select("symbol, created_at")\
+                .eq("job_name", "main_flow")\
+                .gte("created_at", since.isoformat())\
+                .limit(limit)\
+                .execute()
+            requests.extend(jobs.data or [])
+        except Exception as e:
+            logger.error(f"Failed to list recent research jobs: {str(e)}")
+
+        try:
+            history = self.client.table("user_research_history")\
+                .select("symbol, created_at")\
+                .gte("created_at", since.isoformat())\
+                .limit(limit)\
+                .execute()
+            requests.extend(history.data or [])
+        except Exception as e:
+            logger.error(f"Failed to list recent user research history: {str(e)}")
+
+        return requests
+
     def list_jobs(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
         List recent jobs.
@@ -331,25 +411,7 @@ class JobTracker:
                 .limit(limit)\
                 .execute()
 
-            jobs = []
-            for job_data in response.data:
-                metadata = job_data.get("metadata", {})
-                jobs.append({
-                    "job_id": str(job_data["id"]),  # Row ID (for backward compatibility)
-                    "main_job_id": job_data.get("main_job_id"),  # Main job UUID
-                    "sub_job_id": job_data.get("sub_job_id"),  # Sub job UUID (if exists)
-                    "job_type": metadata.get("job_type", "research"),
-                    "symbol": job_data["symbol"],
-                    "status": job_data["status"],
-                    "created_at": job_data["created_at"],
-                    "updated_at": job_data["updated_at"],
-                    "completed_at": job_data.get("completed_at"),
-                    "failed_at": job_data.get("failed_at"),
-                    "metadata": metadata,
-                    "steps": metadata.get("steps", []),
-                    "result": metadata.get("result"),
-                    "error": job_data.get("error")
-                })
+            jobs = [self._format_job(job_data) for job_data in response.data]
 
             return jobs
 
@@ -357,6 +419,280 @@ class JobTracker:
             logger.error(f"Failed to list jobs: {str(e)}")
             return []
 
+class AsyncJobTracker:
+    """Non-blocking job tracking for flows and request handlers running on the event loop."""
+
+    def __init__(self):
+        """Initialize async job tracker."""
+        self._client = None
+
+    async def _get_client(self):
+        """Get the shared async Supabase client."""
+        if self._client is not None:
+            return self._client
+        return await get_async_supabase_client()
+
+    async def create_job(self, job_type: str, symbol: str, metadata: Optional[Dict[str, Any]] = None,
+                         main_job_id: Optional[str] = None, is_sub_job: bool = False,
+                         job_name: Optional[str] = None) -> Dict[str, str]:
+        """
+        Create a new job and return its main_job_id and sub_job_id.
+
+        Args:
+            job_type: Type of job (e.g., 'research')
+            symbol: Stock symbol being analyzed
+            metadata: Optional additional metadata
+            main_job_id: Optional main_job_id for sub-jobs (if None, generates new UUID)
+            is_sub_job: Whether this is a sub-job (defaults to False)
+            job_name: Optional job name (e.g., 'main_flow', 'historical_earnings_flow', etc.)
+
+        Returns:
+            Dict with 'main_job_id', 'sub_job_id', and 'id' (row ID)
+        """
+        try:
+            insert_data = JobTracker._new_job_row(job_type, symbol, metadata, main_job_id, is_sub_job, job_name)
+            client = await self._get_client()
+            response = await client.table("research_jobs").insert(insert_data).execute()
+            return JobTracker._created_job(response.data, job_type, symbol)
+
+        except Exception as e:
+            logger.error(f"Failed to create job: {str(e)}")
+            raise
+
+    async def create_sub_jobs(self, main_job_id: str, symbol: str, job_names: List[str],
+                              metadata: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """
+        Create the subjobs of a main job with a single insert.
+
+        Args:
+            main_job_id: Main job UUID
+            symbol: Stock symbol being analyzed
+            job_names: Flow names, one subjob each
+            metadata: Optional additional metadata for every subjob
+
+        Returns:
+            Dict mapping job name to sub_job_id
+        """
+        rows = [
+            JobTracker._new_job_row("research_subflow", symbol, dict(metadata or {}), main_job_id, True, job_name)
+            for job_name in job_names
+        ]
+        try:
+            client = await self._get_client()
+            response = await client.table("research_jobs").insert(rows).execute()
+            sub_job_ids = {row["job_name"]: row["sub_job_id"] for row in response.data or []}
+            logger.info(f"Created {len(sub_job_ids)} subjobs for main_job_id={main_job_id} ({symbol})")
+            return sub_job_ids
+
+        except Exception as e:
+            logger.error(f"Failed to create subjobs for {main_job_id}: {str(e)}")
+            raise
+
+    async def get_sub_job_ids(self, main_job_id: str) -> Dict[str, str]:
+        """
+        Get the subjobs of a main job.
+
+        Args:
+            main_job_id: Main job UUID
+
+        Returns:
+            Dict mapping job name to sub_job_id (empty if none or on error)
+        """
+        try:
+            client = await self._get_client()
+            response = await client.table("research_jobs")\
+                .select("job_name, sub_job_id")\
+                .eq("main_job_id", main_job_id)\
+                .neq("job_name", "main_flow")\
+                .execute()
+
+            return {row["job_name"]: row["sub_job_id"] for row in response.data or [] if row.get("sub_job_id")}
+
+        except Exception as e:
+            logger.error(f"Failed to get subjobs for {main_job_id}: {str(e)}")
+            return {}
+
+    async def cancel_pending_sub_jobs(self, main_job_id: str) -> int:
+        """
+        Mark the subjobs of a main job that never started as cancelled, in one update.
+
+        Args:
+            main_job_id: Main job UUID
+
+        Returns:
+            Number of subjobs cancelled (0 on error)
+        """
+        try:
+            client = await self._get_client()
+            response = await client.table("research_jobs")\
+                .update({"status": JobStatus.CANCELLED, "updated_at": datetime.now().isoformat()})\
+                .eq("main_job_id", main_job_id)\
+                .neq("job_name", "main_flow")\
+                .eq("status", JobStatus.PENDING)\
+                .execute()
+
+            cancelled = len(response.data or [])
+            if cancelled:
+                logger.info(f"Cancelled {cancelled} pending subjobs of main_job_id={main_job_id}")
+            return cancelled
+
+        except Exception as e:
+            logger.error(f"Failed to cancel pending subjobs of {main_job_id}: {str(e)}")
+            return 0
+
+    async def update_job_status(self, job_id: str, status: JobStatus, step: Optional[str] = None,
+                                result: Optional[Dict[str, Any]] = None, error: Optional[str] = None,
+                                use_main_job_id: bool = True, use_sub_job_id: bool = False) -> bool:
+        """
+        Update job status and add step information.
+
+        Args:
+            job_id: Job ID (main_job_id by default, sub_job_id if use_sub_job_id=True, or row id if both False)
+            status: New job status
+            step: Optional step description
+            result: Optional result data (for completed jobs)
+            error: Optional error message (for failed jobs)
+            use_main_job_id: If True, treat job_id as main_job_id
+            use_sub_job_id: If True, treat job_id as sub_job_id (overrides use_main_job_id)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            client = await self._get_client()
+            current_job = await JobTracker._filter_job(
+                client.table("research_jobs").select("metadata"), job_id, use_main_job_id, use_sub_job_id
+            ).execute()
+
+            if not current_job.data or len(current_job.data) == 0:
+                logger.error(f"Job {job_id} not found")
+                return False
+
+            update_data = JobTracker._status_update(current_job.data[0].get("metadata", {}), status, step, result, error)
+            await JobTracker._filter_job(
+                client.table("research_jobs").update(update_data), job_id, use_main_job_id, use_sub_job_id
+            ).execute()
+
+            logger.info(f"Updated job {job_id} status to {status}" + (f" with step: {step}" if step else ""))
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to update job {job_id}: {str(e)}")
+            return False
+
+    async def get_job_status(self, job_id: str, use_main_job_id: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get job status and information.
+
+        Args:
+            job_id: Job ID (main_job_id by default, or row id if use_main_job_id=False)
+            use_main_job_id: If True, treat job_id as main_job_id; if False, treat as row id
+
+        Returns:
+            Job data dict or None if not found
+        """
+        try:
+            client = await self._get_client()
+            response = await JobTracker._filter_job(client.table("research_jobs").select("*"), job_id, use_main_job_id).execute()
+
+            if not response.data or len(response.data) == 0:
+                return None
+
+            return JobTracker._format_job(response.data[0])
+
+        except Exception as e:
+            logger.error(f"Failed to get job status for {job_id}: {str(e)}")
+            return None
+
+    async def get_job_by_symbol(self, symbol: str, return_main_job_id: bool = True) -> Optional[str]:
+        """
+        Get the most recent job ID for a symbol.
+
+        Args:
+            symbol: Stock symbol
+            return_main_job_id: If True, return main_job_id; if False, return row id
+
+        Returns:
+            Job ID (main_job_id or row id) or None if not found
+        """
+        try:
+            client = await self._get_client()
+            response = await client.table("research_jobs")\
+                .select("id, main_job_id")\
+                .eq("symbol", symbol.upper())\
+                .order("created_at", desc=True)\
+                .limit(1)\
+                .execute()
+
+            if response.data and len(response.data) > 0:
+                if return_main_job_id:
+                    return response.data[0]["main_job_id"]
+                else:
+                    return str(response.data[0]["id"])
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to get job by symbol {symbol}: {str(e)}")
+            return None
+
+    async def get_latest_completed_job(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the most recent completed main research job for a symbol.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Job data dict (as returned by get_job_status) or None if not found
+        """
+        try:
+            client = await self._get_client()
+            response = await client.table("research_jobs")\
+                .select("*")\
+                .eq("symbol", symbol.upper())\
+                .eq("job_name", "main_flow")\
+                .eq("status", JobStatus.COMPLETED)\
+                .order("completed_at", desc=True)\
+                .limit(1)\
+                .execute()
+
+            if response.data and len(response.data) > 0:
+                return JobTracker._format_job(response.data[0])
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to get latest completed job for {symbol}: {str(e)}")
+            return None
+
+    async def add_user_research_history(self, user_id: str, symbol: str, main_job_id: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Add an entry to user_research_history table.
+
+        Args:
+            user_id: User identifier
+            symbol: Stock symbol
+            main_job_id: Main job UUID
+            metadata: Optional additional metadata
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            client = await self._get_client()
+            await client.table("user_research_history").insert({
+                "user_id": user_id,
+                "symbol": symbol.upper(),
+                "job_id": main_job_id,  # Store main_job_id
+                "metadata": metadata or {}
+            }).execute()
+
+            logger.info(f"Added user research history for user {user_id}, symbol {symbol}, main_job_id {main_job_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to add user research history: {str(e)}")
+            return False
+
 # Global job tracker instance
 _job_tracker_instance = None
 
@@ -373,3 +709,13 @@ def close_job_tracker():
     if _job_tracker_instance:
         _job_tracker_instance.close()
         _job_tracker_instance = None
+
+# Global async job tracker instance
+_async_job_tracker_instance = None
+
+def get_async_job_tracker() -> AsyncJobTracker:
+    """Get or create global async job tracker instance."""
+    global _async_job_tracker_instance
+    if _async_job_tracker_instance is None:
+        _async_job_tracker_instance = AsyncJobTracker()
+    return _async_job_tracker_instance
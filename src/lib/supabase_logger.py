@@ -2,7 +2,7 @@
 import logging
 import traceback
 from typing import Optional, Dict, Any
-from src.lib.supabase_client import get_supabase_client
+from src.lib.supabase_client import get_supabase_client, get_async_supabase_client
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +20,34 @@ class SupabaseLogger:
             self._client = get_supabase_client()
         return self._client
 
+    @staticmethod
+    def _log_entry(
+        log_level: str,
+        component: str,
+        message: str,
+        job_id: Optional[str],
+        symbol: Optional[str],
+        stack_trace: Optional[str],
+        metadata: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build the system_logs row for a message."""
+        return {
+            "log_level": log_level,
+            "component": component,
+            "message": message,
+            "job_id": str(job_id) if job_id else None,
+            "symbol": symbol.upper() if symbol else None,
+            "stack_trace": stack_trace,
+            "metadata": metadata or {}
+        }
+
+    @staticmethod
+    def _stack_trace(exception: Optional[Exception]) -> Optional[str]:
+        """Formatted stack trace of an exception, if any."""
+        if not exception:
+            return None
+        return "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+
     def log(
         self,
         log_level: str,
@@ -46,16 +74,7 @@ class SupabaseLogger:
             True if successful, False otherwise
         """
         try:
-            log_entry = {
-                "log_level": log_level,
-                "component": component,
-                "message": message,
-                "job_id": str(job_id) if job_id else None,
-                "symbol": symbol.upper() if symbol else None,
-                "stack_trace": stack_trace,
-                "metadata": metadata or {}
-            }
-
+            log_entry = self._log_entry(log_level, component, message, job_id, symbol, stack_trace, metadata)
             self.client.table("system_logs").insert(log_entry).execute()
             return True
 
@@ -88,17 +107,13 @@ class SupabaseLogger:
         Returns:
             True if successful, False otherwise
         """
-        stack_trace = None
-        if exception:
-            stack_trace = "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
-
         return self.log(
             log_level="error",
             component=component,
             message=message,
             job_id=job_id,
             symbol=symbol,
-            stack_trace=stack_trace,
+            stack_trace=self._stack_trace(exception),
             metadata=metadata
         )
 
@@ -156,6 +171,83 @@ class SupabaseLogger:
             metadata=metadata
         )
 
+class AsyncSupabaseLogger:
+    """Non-blocking logging to the system_logs table for code running on the event loop."""
+
+    def __init__(self):
+        """Initialize async Supabase logger."""
+        self._client = None
+
+    async def _get_client(self):
+        """Get the shared async Supabase client."""
+        if self._client is not None:
+            return self._client
+        return await get_async_supabase_client()
+
+    async def log(
+        self,
+        log_level: str,
+        component: str,
+        message: str,
+        job_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+        stack_trace: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Log a message to Supabase system_logs table.
+
+        Args:
+            log_level: Log level ('error', 'warning', 'info', 'debug')
+            component: Component name (e.g., 'job_tracker', 'supabase_cache', 'historical_earnings_flow')
+            message: Log message
+            job_id: Optional job ID
+            symbol: Optional stock symbol
+            stack_trace: Optional stack trace (for errors)
+            metadata: Optional additional metadata
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            log_entry = SupabaseLogger._log_entry(log_level, component, message, job_id, symbol, stack_trace, metadata)
+            client = await self._get_client()
+            await client.table("system_logs").insert(log_entry).execute()
+            return True
+
+        except Exception as e:
+            # Fall back to standard logging if Supabase fails
+            logger.error(f"Failed to log to Supabase: {str(e)}")
+            logger.error(f"Original log: {log_level} - {component} - {message}")
+            return False
+
+    async def error(
+        self,
+        component: str,
+        message: str,
+        job_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+        exception: Optional[Exception] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Log an error to Supabase, with the exception's stack trace if given."""
+        return await self.log("error", component, message, job_id, symbol, SupabaseLogger._stack_trace(exception), metadata)
+
+    async def warning(self, component: str, message: str, job_id: Optional[str] = None,
+                      symbol: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Log a warning to Supabase."""
+        return await self.log("warning", component, message, job_id, symbol, metadata=metadata)
+
+    async def info(self, component: str, message: str, job_id: Optional[str] = None,
+                   symbol: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Log an info message to Supabase."""
+        return await self.log("info", component, message, job_id, symbol, metadata=metadata)
+
+    async def debug(self, component: str, message: str, job_id: Optional[str] = None,
+                    symbol: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Log a debug message to Supabase."""
+        return await self.log("debug", component, message, job_id, symbol, metadata=metadata)
+
 # Global logger instance
 _logger_instance = None
 
@@ -166,6 +258,16 @@ def get_supabase_logger() -> SupabaseLogger:
         _logger_instance = SupabaseLogger()
     return _logger_instance
 
+# Global async logger instance
+_async_logger_instance = None
+
+def get_async_supabase_logger() -> AsyncSupabaseLogger:
+    """Get or create global async Supabase logger instance."""
+    global _async_logger_instance
+    if _async_logger_instance is None:
+        _async_logger_instance = AsyncSupabaseLogger()
+    return _async_logger_instance
+
 def log_error(component: str, message: str, **kwargs):
     """Convenience function to log an error."""
     get_supabase_logger().error(component, message, **kwargs)
@@ -1,17 +1,31 @@
 """RAG operations for embeddings and research_docs integration."""
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+import os
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
-from src.lib.supabase_client import get_supabase_client
+from src.lib.supabase_client import get_supabase_client, get_async_supabase_client
+from src.lib.vector_index import get_local_vector_index
 
 logger = logging.getLogger(__name__)
 
+# "pgvector" searches with the match_research_docs RPC, "local" with the local vector index,
+# "auto" tries the RPC and falls back to the local index when the function is not installed
+RAG_SEARCH_BACKEND = os.getenv("RAG_SEARCH_BACKEND", "auto").lower()
+MATCH_DOCUMENTS_RPC = "match_research_docs"
+# research_docs rows fetched per request when rebuilding the local index
+RAG_REBUILD_PAGE_SIZE = 500
+# Error codes meaning the RPC function is not installed (PostgREST schema cache, Postgres)
+MISSING_FUNCTION_CODES = ("PGRST202", "42883")
+
 class SupabaseRAG:
     """RAG operations for research documents with vector embeddings."""
 
     def __init__(self):
         """Initialize Supabase RAG client."""
         self._client = None
+        # Unknown until the first search under RAG_SEARCH_BACKEND=auto
+        self._pgvector_available: Optional[bool] = None
 
     @property
     def client(self):
@@ -20,6 +34,104 @@ class SupabaseRAG:
             self._client = get_supabase_client()
         return self._client
 
+    @staticmethod
+    def _document_row(
+        content: str,
+        title: str,
+        symbol: str,
+        report_type: str,
+        embedding: Optional[List[float]],
+        metadata: Optional[Dict[str, Any]],
+        token_count: Optional[int]
+    ) -> Dict[str, Any]:
+        """Build the research_docs row for a document."""
+        doc_metadata = metadata or {}
+        doc_metadata["symbol"] = symbol.upper()
+        doc_metadata["report_type"] = report_type
+
+        return {
+            "content": content,
+            "title": title,
+            "embedding": embedding,  # Can be None initially
+            "metadata": doc_metadata,
+            "token_count": token_count
+        }
+
+    @staticmethod
+    def _match_params(
+        query_embedding: List[float],
+        limit: int,
+        symbol_filter: Optional[str],
+        report_type_filter: Optional[str]
+    ) -> Dict[str, Any]:
+        """Arguments of the match_research_docs RPC."""
+        return {
+            "query_embedding": query_embedding,
+            "match_count": limit,
+            "symbol_filter": symbol_filter.upper() if symbol_filter else None,
+            "report_type_filter": report_type_filter
+        }
+
+    @staticmethod
+    def _is_missing_function(error: Exception) -> bool:
+        """Whether an RPC error means the function is not installed, as opposed to a failed call."""
+        return getattr(error, "code", None) in MISSING_FUNCTION_CODES
+
+    @staticmethod
+    def _ranked_documents(rows: List[Dict[str, Any]], matches: List[Tuple[int, float]]) -> List[Dict[str, Any]]:
+        """Order fetched rows by local index score, attaching it as 'similarity'."""
+        rows_by_id = {row["id"]: row for row in rows}
+        # Rows deleted since they were indexed are skipped
+        return [
+            {**rows_by_id[doc_id], "similarity": score}
+            for doc_id, score in matches
+            if doc_id in rows_by_id
+        ]
+
+    @staticmethod
+    def _report_order(docs: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Order the chunks of one report by position, repeating chunks stored once for several.
+
+        Returns:
+            The chunks in report order, or None if positions are missing (a partially written report)
+        """
+        positioned = []
+        for doc in docs:
+            metadata = doc["metadata"]
+            positions = metadata.get("section_positions") or [[metadata.get("section_index", 0), metadata.get("section")]]
+            for index, section in positions:
+                positioned.append((index, {**doc, "metadata": {**metadata, "section": section, "section_index": index}}))
+        positioned.sort(key=lambda item: item[0])
+        expected = docs[0]["metadata"].get("section_count", len(positioned)) if docs else 0
+        if [index for index, _ in positioned] != list(range(expected)):
+            return None
+        return [doc for _, doc in positioned]
+
+    @staticmethod
+    def _index_document(
+        doc_id: int,
+        embedding: List[float],
+        symbol: Optional[str],
+        report_type: Optional[str]
+    ) -> None:
+        """Add a stored embedding to the local vector index, unless only pgvector is used."""
+        if RAG_SEARCH_BACKEND == "pgvector":
+            return
+        try:
+            get_local_vector_index().add(doc_id, embedding, symbol, report_type)
+        except Exception as e:
+            logger.warning(f"Failed to add document {doc_id} to local vector index: {str(e)}")
+
+    @staticmethod
+    def _embedded_docs_page(client, start: int):
+        """Query for one page of research_docs rows that have an embedding."""
+        return client.table("research_docs")\
+            .select("id, embedding, metadata")\
+            .not_.is_("embedding", "null")\
+            .order("id")\
+            .range(start, start + RAG_REBUILD_PAGE_SIZE - 1)
+
     def add_document(
         self,
         content: str,
@@ -46,19 +158,10 @@ class SupabaseRAG:
             True if successful, False otherwise
         """
         try:
-            doc_metadata = metadata or {}
-            doc_metadata["symbol"] = symbol.upper()
-            doc_metadata["report_type"] = report_type
-
-            doc_entry = {
-                "content": content,
-                "title": title,
-                "embedding": embedding,  # Can be None initially
-                "metadata": doc_metadata,
-                "token_count": token_count
-            }
-
-            self.client.table("research_docs").insert(doc_entry).execute()
+            doc_entry = self._document_row(content, title, symbol, report_type, embedding, metadata, token_count)
+            response = self.client.table("research_docs").insert(doc_entry).execute()
+            if embedding is not None and response.data:
+                self._index_document(response.data[0]["id"], embedding, symbol, report_type)
             logger.info(f"Added document to research_docs: {title} ({symbol})")
             return True
 
@@ -82,11 +185,13 @@ class SupabaseRAG:
             True if successful, False otherwise
         """
         try:
-            self.client.table("research_docs")\
+            response = self.client.table("research_docs")\
                 .update({"embedding": embedding})\
                 .eq("id", doc_id)\
                 .execute()
 
+            metadata = (response.data[0].get("metadata") if response.data else None) or {}
+            self._index_document(doc_id, embedding, metadata.get("symbol"), metadata.get("report_type"))
             logger.info(f"Updated embedding for document {doc_id}")
             return True
 
@@ -94,6 +199,60 @@ class SupabaseRAG:
             logger.error(f"Failed to update embedding for document {doc_id}: {str(e)}")
             return False
 
+    def update_embeddings(self, embeddings: Dict[int, List[float]]) -> int:
+        """
+        Update the embeddings of several documents with one upsert.
+
+        Args:
+            embeddings: Document ID to vector embedding
+
+        Returns:
+            Number of documents updated
+
+        Raises:
+            Exception: If the upsert fails, so callers can retry the batch
+        """
+        if not embeddings:
+            return 0
+        rows = [{"id": doc_id, "embedding": embedding} for doc_id, embedding in embeddings.items()]
+        response = self.client.table("research_docs")\
+            .upsert(rows, on_conflict="id", default_to_null=False)\
+            .execute()
+
+        if RAG_SEARCH_BACKEND != "pgvector":
+            entries = []
+            for row in response.data or []:
+                metadata = row.get("metadata") or {}
+                entries.append((row["id"], embeddings[row["id"]], metadata.get("symbol"), metadata.get("report_type")))
+            try:
+                get_local_vector_index().add_many(entries)
+            except Exception as e:
+                logger.warning(f"Failed to add {len(entries)} documents to local vector index: {str(e)}")
+
+        logger.info(f"Updated embeddings for {len(rows)} documents")
+        return len(rows)
+
+    def get_unembedded_documents(self, after_id: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get documents that have no embedding yet, in ID order.
+
+        Args:
+            after_id: Only documents with a greater ID (for paging)
+            limit: Maximum number of results
+
+        Returns:
+            List of documents with id, content and metadata
+        """
+        response = self.client.table("research_docs")\
+            .select("id, content, metadata")\
+            .is_("embedding", "null")\
+            .gt("id", after_id)\
+            .order("id")\
+            .limit(limit)\
+            .execute()
+
+        return response.data if response.data else []
+
     def search_documents(
         self,
         query_embedding: List[float],
@@ -102,9 +261,10 @@ class SupabaseRAG:
         report_type_filter: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
-        Search for similar documents using vector similarity.
+        Search for documents similar to a query embedding.
 
-        Note: This requires pgvector extension and similarity functions in Supabase.
+        Uses the match_research_docs pgvector function when it is installed, otherwise the
+        local vector index (see RAG_SEARCH_BACKEND).
 
         Args:
             query_embedding: Query vector embedding
@@ -113,30 +273,52 @@ class SupabaseRAG:
             report_type_filter: Optional report type to filter by
 
         Returns:
-            List of matching documents with similarity scores
+            List of matching documents with similarity scores, most similar first
         """
         try:
-            # Note: Vector similarity search requires RPC function in Supabase
-            # This is a placeholder - needs to be implemented with Supabase RPC
-            # For now, just return recent documents
-            query = self.client.table("research_docs")\
+            if RAG_SEARCH_BACKEND != "local" and self._pgvector_available is not False:
+                try:
+                    params = self._match_params(query_embedding, limit, symbol_filter, report_type_filter)
+                    response = self.client.rpc(MATCH_DOCUMENTS_RPC, params).execute()
+                    self._pgvector_available = True
+                    return response.data if response.data else []
+                except Exception as e:
+                    # Other errors are transient failures of an installed function, not a reason to stop using it
+                    if RAG_SEARCH_BACKEND == "pgvector" or not SupabaseRAG._is_missing_function(e):
+                        raise
+                    logger.info(f"pgvector search unavailable, using local vector index: {str(e)}")
+                    self._pgvector_available = False
+
+            matches = get_local_vector_index().search(query_embedding, limit, symbol_filter, report_type_filter)
+            if not matches:
+                return []
+            response = self.client.table("research_docs")\
                 .select("*")\
-                .order("created_at", desc=True)\
-                .limit(limit)
-
-            if symbol_filter:
-                query = query.filter("metadata->>symbol", "eq", symbol_filter.upper())
-
-            if report_type_filter:
-                query = query.filter("metadata->>report_type", "eq", report_type_filter)
-
-            response = query.execute()
-            return response.data if response.data else []
+                .in_("id", [doc_id for doc_id, _ in matches])\
+                .execute()
+            return self._ranked_documents(response.data or [], matches)
 
         except Exception as e:
             logger.error(f"Failed to search documents: {str(e)}")
             return []
 
+    def rebuild_local_index(self) -> int:
+        """
+        Rebuild the local vector index from every embedded research_docs row.
+
+        Returns:
+            Number of documents indexed
+        """
+        documents = []
+        start = 0
+        while True:
+            rows = self._embedded_docs_page(self.client, start).execute().data or []
+            documents.extend(rows)
+            if len(rows) < RAG_REBUILD_PAGE_SIZE:
+                break
+            start += RAG_REBUILD_PAGE_SIZE
+        return get_local_vector_index().rebuild(documents)
+
     def get_documents_by_symbol(
         self,
         symbol: str,
@@ -192,6 +374,308 @@ class SupabaseRAG:
             logger.error(f"Failed to delete old documents: {str(e)}")
             return 0
 
+class AsyncSupabaseRAG:
+    """Non-blocking research_docs operations for code running on the event loop."""
+
+    def __init__(self):
+        """Initialize async Supabase RAG client."""
+        self._client = None
+        # Unknown until the first search under RAG_SEARCH_BACKEND=auto
+        self._pgvector_available: Optional[bool] = None
+
+    async def _get_client(self):
+        """Get the shared async Supabase client."""
+        if self._client is not None:
+            return self._client
+        return await get_async_supabase_client()
+
+    async def add_document(
+        self,
+        content: str,
+        title: str,
+        symbol: str,
+        report_type: str,
+        embedding: Optional[List[float]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        token_count: Optional[int] = None
+    ) -> bool:
+        """
+        Add a document to the research_docs table with optional embedding.
+
+        Args:
+            content: Document content (markdown/text)
+            title: Document title
+            symbol: Stock symbol
+            report_type: Type of report (e.g., 'comprehensive_report')
+            embedding: Optional vector embedding (if None, will be generated later)
+            metadata: Optional metadata
+            token_count: Optional token count
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            doc_entry = SupabaseRAG._document_row(content, title, symbol, report_type, embedding, metadata, token_count)
+            client = await self._get_client()
+            response = await client.table("research_docs").insert(doc_entry).execute()
+            if embedding is not None and response.data:
+                await asyncio.to_thread(SupabaseRAG._index_document, response.data[0]["id"], embedding, symbol, report_type)
+            logger.info(f"Added document to research_docs: {title} ({symbol})")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to add document for {symbol}: {str(e)}")
+            return False
+
+    async def add_documents(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Insert several research_docs rows with one request.
+
+        Args:
+            rows: Rows built with SupabaseRAG._document_row
+
+        Returns:
+            Inserted rows with their IDs
+
+        Raises:
+            RuntimeError: If the rows could not all be inserted
+        """
+        if not rows:
+            return []
+        try:
+            client = await self._get_client()
+            response = await client.table("research_docs").insert(rows).execute()
+        except Exception as e:
+            raise RuntimeError(f"Failed to add {len(rows)} documents: {str(e)}") from e
+
+        inserted = response.data or []
+        if len(inserted) != len(rows):
+            raise RuntimeError(f"Added {len(inserted)} of {len(rows)} documents to research_docs")
+        logger.info(f"Added {len(rows)} documents to research_docs")
+        return inserted
+
+    async def get_documents_by_hash(self, symbol: str, report_type: str, content_hashes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get a symbol's documents whose metadata content_hash is one of the given hashes.
+
+        Args:
+            symbol: Stock symbol
+            report_type: Type of report
+            content_hashes: Content hashes to look up
+
+        Returns:
+            List of documents with id and metadata
+        """
+        if not content_hashes:
+            return []
+        try:
+            client = await self._get_client()
+            response = await client.table("research_docs")\
+                .select("id, metadata")\
+                .filter("metadata->>symbol", "eq", symbol.upper())\
+                .filter("metadata->>report_type", "eq", report_type)\
+                .in_("metadata->>content_hash", content_hashes)\
+                .execute()
+
+            return response.data if response.data else []
+
+        except Exception as e:
+            logger.error(f"Failed to look up documents by hash for {symbol}: {str(e)}")
+            return []
+
+    async def get_latest_report_chunks(self, symbol: str, report_type: str) -> List[Dict[str, Any]]:
+        """
+        Get the chunks of a symbol's latest ingested report, in report order.
+
+        Args:
+            symbol: Stock symbol
+            report_type: Type of report
+
+        Returns:
+            List of chunk documents (empty if no chunked report is stored, or if the latest
+            one was only partly written)
+        """
+        try:
+            client = await self._get_client()
+            latest = await client.table("research_docs")\
+                .select("metadata")\
+                .filter("metadata->>symbol", "eq", symbol.upper())\
+                .filter("metadata->>report_type", "eq", report_type)\
+                .not_.is_("metadata->>last_report_id", "null")\
+                .order("metadata->>last_report_id", desc=True)\
+                .limit(1)\
+                .execute()
+            if not latest.data:
+                return []
+
+            report_id = latest.data[0]["metadata"]["last_report_id"]
+            response = await client.table("research_docs")\
+                .select("id, title, content, metadata")\
+                .filter("metadata->>symbol", "eq", symbol.upper())\
+                .filter("metadata->>report_type", "eq", report_type)\
+                .filter("metadata->>last_report_id", "eq", report_id)\
+                .execute()
+
+            chunks = SupabaseRAG._report_order(response.data or [])
+            if chunks is None:
+                logger.warning(f"Latest {report_type} for {symbol} ({report_id}) is incomplete, not reusing it")
+                return []
+            return chunks
+
+        except Exception as e:
+            logger.error(f"Failed to get latest {report_type} chunks for {symbol}: {str(e)}")
+            return []
+
+    async def update_documents_metadata(self, metadata_by_id: Dict[int, Dict[str, Any]]) -> bool:
+        """
+        Replace the metadata of several documents with one upsert.
+
+        Args:
+            metadata_by_id: Document ID to its complete new metadata
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not metadata_by_id:
+            return True
+        try:
+            rows = [{"id": doc_id, "metadata": metadata} for doc_id, metadata in metadata_by_id.items()]
+            client = await self._get_client()
+            await client.table("research_docs")\
+                .upsert(rows, on_conflict="id", default_to_null=False)\
+                .execute()
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to update metadata of {len(metadata_by_id)} documents: {str(e)}")
+            return False
+
+    async def update_embedding(self, doc_id: int, embedding: List[float]) -> bool:
+        """
+        Update the embedding for an existing document.
+
+        Args:
+            doc_id: Document ID
+            embedding: Vector embedding
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            client = await self._get_client()
+            response = await client.table("research_docs")\
+                .update({"embedding": embedding})\
+                .eq("id", doc_id)\
+                .execute()
+
+            metadata = (response.data[0].get("metadata") if response.data else None) or {}
+            await asyncio.to_thread(
+                SupabaseRAG._index_document, doc_id, embedding, metadata.get("symbol"), metadata.get("report_type")
+            )
+            logger.info(f"Updated embedding for document {doc_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to update embedding for document {doc_id}: {str(e)}")
+            return False
+
+    async def search_documents(
+        self,
+        query_embedding: List[float],
+        limit: int = 10,
+        symbol_filter: Optional[str] = None,
+        report_type_filter: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for documents similar to a query embedding.
+
+        Uses the match_research_docs pgvector function when it is installed, otherwise the
+        local vector index (see RAG_SEARCH_BACKEND).
+
+        Args:
+            query_embedding: Query vector embedding
+            limit: Maximum number of results
+            symbol_filter: Optional symbol to filter by
+            report_type_filter: Optional report type to filter by
+
+        Returns:
+            List of matching documents with similarity scores, most similar first
+        """
+        try:
+            client = await self._get_client()
+            if RAG_SEARCH_BACKEND != "local" and self._pgvector_available is not False:
+                try:
+                    params = SupabaseRAG._match_params(query_embedding, limit, symbol_filter, report_type_filter)
+                    response = await client.rpc(MATCH_DOCUMENTS_RPC, params).execute()
+                    self._pgvector_available = True
+                    return response.data if response.data else []
+                except Exception as e:
+                    # Other errors are transient failures of an installed function, not a reason to stop using it
+                    if RAG_SEARCH_BACKEND == "pgvector" or not SupabaseRAG._is_missing_function(e):
+                        raise
+                    logger.info(f"pgvector search unavailable, using local vector index: {str(e)}")
+                    self._pgvector_available = False
+
+            matches = await asyncio.to_thread(
+                get_local_vector_index().search, query_embedding, limit, symbol_filter, report_type_filter
+            )
+            if not matches:
+                return []
+            response = await client.table("research_docs")\
+                .select("*")\
+                .in_("id", [doc_id for doc_id, _ in matches])\
+                .execute()
+            return SupabaseRAG._ranked_documents(response.data or [], matches)
+
+        except Exception as e:
+            logger.error(f"Failed to search documents: {str(e)}")
+            return []
+
+    async def rebuild_local_index(self) -> int:
+        """
+        Rebuild the local vector index from every embedded research_docs row.
+
+        Returns:
+            Number of documents indexed
+        """
+        client = await self._get_client()
+        documents = []
+        start = 0
+        while True:
+            response = await SupabaseRAG._embedded_docs_page(client, start).execute()
+            rows = response.data or []
+            documents.extend(rows)
+            if len(rows) < RAG_REBUILD_PAGE_SIZE:
+                break
+            start += RAG_REBUILD_PAGE_SIZE
+        return await asyncio.to_thread(get_local_vector_index().rebuild, documents)
+
+    async def get_documents_by_symbol(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get all research documents for a symbol.
+
+        Args:
+            symbol: Stock symbol
+            limit: Maximum number of results
+
+        Returns:
+            List of documents
+        """
+        try:
+            client = await self._get_client()
+            response = await client.table("research_docs")\
+                .select("*")\
+                .filter("metadata->>symbol", "eq", symbol.upper())\
+                .order("created_at", desc=True)\
+                .limit(limit)\
+                .execute()
+
+            return response.data if response.data else []
+
+        except Exception as e:
+            logger.error(f"Failed to get documents for {symbol}: {str(e)}")
+            return []
+
 # Global RAG instance
 _rag_instance = None
 
@@ -201,3 +685,13 @@ def get_supabase_rag() -> SupabaseRAG:
     if _rag_instance is None:
         _rag_instance = SupabaseRAG()
     return _rag_instance
+
+# Global async RAG instance
+_async_rag_instance = None
+
+def get_async_supabase_rag() -> AsyncSupabaseRAG:
+    """Get or create global async Supabase RAG instance."""
+    global _async_rag_instance
+    if _async_rag_instance is None:
+        _async_rag_instance = AsyncSupabaseRAG()
+    return _async_rag_instance
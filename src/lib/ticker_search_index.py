@@ -0,0 +1,333 @@
+"""In-process ticker search over a daily listing snapshot, with Alpha Vantage fallback on misses."""
+import csv
+import io
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+from src.lib.alpha_vantage_api import call_alpha_vantage_listing_status, call_alpha_vantage_symbol_search
+
+logger = logging.getLogger(__name__)
+
+TICKER_SEARCH_DIR = os.getenv("TICKER_SEARCH_DIR", os.path.join("output", "listings"))
+# LISTING_STATUS is regenerated daily by Alpha Vantage
+TICKER_LISTING_MAX_AGE_SECONDS = int(os.getenv("TICKER_LISTING_MAX_AGE_SECONDS", "86400"))
+TICKER_SEARCH_CACHE_SIZE = int(os.getenv("TICKER_SEARCH_CACHE_SIZE", "1000"))
+TICKER_SEARCH_MAX_RESULTS = 10
+# Lowest name similarity counted as a match; below it the query is a miss
+TICKER_NAME_MIN_SIMILARITY = 0.5
+# Seconds between attempts to download a missing or stale snapshot
+TICKER_LISTING_RETRY_SECONDS = 300
+
+LISTING_FILENAME = "listing_status.csv"
+
+# LISTING_STATUS only covers US exchanges, so the regional fields of SYMBOL_SEARCH are fixed
+_US_MARKET = {
+    "4. region": "United States",
+    "5. marketOpen": "09:30",
+    "6. marketClose": "16:00",
+    "7. timezone": "UTC-04",
+    "8. currency": "USD",
+}
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_symbol(symbol: str) -> str:
+    """Uppercase a symbol and write share classes with '-' as LISTING_STATUS does (BRK.B -> BRK-B)."""
+    return symbol.strip().upper().replace(".", "-")
+
+
+def name_words(name: str) -> List[str]:
+    """Lowercase alphanumeric words of a company name."""
+    return _NON_ALNUM.sub(" ", name.lower()).split()
+
+
+def trigrams(words: Iterable[str], prefix_last: bool = False) -> set:
+    """
+    Padded character trigrams of words, as in pg_trgm.
+
+    Args:
+        words: Lowercase words
+        prefix_last: Treat the last word as a prefix still being typed, so its end is not padded
+
+    Returns:
+        Set of trigrams
+    """
+    words = list(words)
+    grams = set()
+    for i, word in enumerate(words):
+        padded = f"  {word}" if prefix_last and i == len(words) - 1 else f"  {word} "
+        grams.update(padded[j:j + 3] for j in range(len(padded) - 2))
+    return grams
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Best listings below this node, so a prefix lookup never walks the subtree
+        self.ids: List[int] = []
+
+
+class TickerSearchIndex:
+    """
+    Search index over a listing snapshot.
+
+    Symbols are held in a prefix trie whose nodes keep their best completions, and company
+    names in a trigram inverted index scored by the share of query trigrams a name contains,
+    which tolerates typos and partially typed words.
+    """
+
+    def __init__(self, listings: List[Dict[str, str]], max_results: int = TICKER_SEARCH_MAX_RESULTS):
+        """
+        Build the index.
+
+        Args:
+            listings: LISTING_STATUS rows (symbol, name, exchange, assetType, ...)
+            max_results: Maximum number of matches returned by search
+        """
+        self.max_results = max_results
+        self.listings = [row for row in listings if row.get("symbol")]
+        self._symbols = [normalize_symbol(row["symbol"]) for row in self.listings]
+
+        self._trie = _TrieNode()
+        # Shorter symbols first: an exact or near-exact ticker is the likeliest intent
+        for i in sorted(range(len(self._symbols)), key=lambda i: (len(self._symbols[i]), self._symbols[i])):
+            node = self._trie
+            for char in self._symbols[i]:
+                node = node.children.setdefault(char, _TrieNode())
+                if len(node.ids) < max_results:
+                    node.ids.append(i)
+
+        postings: Dict[str, List[int]] = {}
+        gram_counts = []
+        for i, row in enumerate(self.listings):
+            grams = trigrams(name_words(row.get("name") or ""))
+            gram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(i)
+        # Arrays, so common trigrams (" in" of every "Inc") are counted without a Python loop
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._gram_counts = np.array(gram_counts, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.listings)
+
+    def _symbol_matches(self, query: str) -> Dict[int, float]:
+        node = self._trie
+        for char in normalize_symbol(query):
+            node = node.children.get(char)
+            if node is None:
+                return {}
+        length = len(normalize_symbol(query))
+        return {i: 1.0 if len(self._symbols[i]) == length else 0.5 + 0.45 * length / len(self._symbols[i]) for i in node.ids}
+
+    def _name_matches(self, query: str) -> Dict[int, float]:
+        words = name_words(query)
+        # One or two characters are too little to match names on; they are ticker prefixes
+        if len("".join(words)) < 3:
+            return {}
+        grams = trigrams(words, prefix_last=True)
+        hits = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not hits:
+            return {}
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.listings)).astype(np.float64)
+
+        # Mostly how much of the query the name contains, with a small preference for closer lengths
+        jaccard = shared / (len(grams) + self._gram_counts - shared)
+        scores = 0.85 * shared / len(grams) + 0.15 * jaccard
+        candidates = np.flatnonzero(shared >= TICKER_NAME_MIN_SIMILARITY * len(grams))
+        if len(candidates) > self.max_results:
+            candidates = candidates[np.argpartition(-scores[candidates], self.max_results - 1)[:self.max_results]]
+        return {int(i): float(scores[i]) for i in candidates}
+
+    def search(self, query: str) -> List[Dict[str, str]]:
+        """
+        Find listings matching a symbol prefix or a company name.
+
+        Args:
+            query: Ticker or company name, possibly partial or misspelled
+
+        Returns:
+            Best matches in the SYMBOL_SEARCH 'bestMatches' format, best first
+        """
+        scores = self._name_matches(query)
+        for i, score in self._symbol_matches(query).items():
+            scores[i] = max(score, scores.get(i, 0.0))
+
+        ranked = sorted(
+            scores,
+            key=lambda i: (-scores[i], self.listings[i].get("assetType") != "Stock", len(self._symbols[i]), self._symbols[i])
+        )
+        return [
+            {
+                "1. symbol": self.listings[i]["symbol"],
+                "2. name": self.listings[i].get("name", ""),
+                "3. type": "Equity" if self.listings[i].get("assetType") == "Stock" else self.listings[i].get("assetType", ""),
+                **_US_MARKET,
+                "9. matchScore": f"{scores[i]:.4f}",
+            }
+            for i in ranked[:self.max_results]
+        ]
+
+
+def parse_listings(csv_text: str) -> List[Dict[str, str]]:
+    """
+    Parse a LISTING_STATUS CSV response.
+
+    Raises:
+        ValueError: If the text is not a listing CSV (e.g. a JSON rate limit message)
+    """
+    if not isinstance(csv_text, str) or not csv_text.lstrip().lower().startswith("symbol,"):
+        raise ValueError(f"Unexpected LISTING_STATUS response: {str(csv_text)[:200]!r}")
+    return list(csv.DictReader(io.StringIO(csv_text)))
+
+
+class TickerSearch:
+    """
+    Ticker search served from a local listing snapshot.
+
+    The snapshot is stored on disk and refreshed in a background thread once it is older than
+    max_age_seconds, swapping in a new index when done. Queries the index cannot answer fall
+    back to Alpha Vantage SYMBOL_SEARCH, and those results are cached until the next refresh.
+    """
+
+    def __init__(
+        self,
+        base_dir: Optional[str] = None,
+        max_age_seconds: int = TICKER_LISTING_MAX_AGE_SECONDS,
+        cache_size: int = TICKER_SEARCH_CACHE_SIZE,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the ticker search.
+
+        Args:
+            base_dir: Directory of the listing snapshot (defaults to TICKER_SEARCH_DIR)
+            max_age_seconds: Snapshot age after which it is refreshed
+            cache_size: Maximum number of cached fallback results
+            clock: Wall clock, compared to the snapshot's modification time (for tests)
+        """
+        self.path = Path(base_dir or TICKER_SEARCH_DIR) / LISTING_FILENAME
+        self.max_age_seconds = max_age_seconds
+        self.cache_size = cache_size
+        self._clock = clock
+        self._index: Optional[TickerSearchIndex] = None
+        self._loaded = False
+        self._refresh_attempted_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._fallback_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def _snapshot_age(self) -> Optional[float]:
+        try:
+            return self._clock() - self.path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def _load(self) -> None:
+        """Build the index from the snapshot on disk, if there is one."""
+        self._loaded = True
+        try:
+            listings = parse_listings(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError) as e:
+            logger.warning(f"No usable listing snapshot at {self.path}: {str(e)}")
+            return
+        index = TickerSearchIndex(listings)
+        with self._lock:
+            self._index = index
+            self._fallback_cache.clear()
+        logger.info(f"Loaded ticker search index with {len(index)} listings")
+
+    def refresh(self) -> None:
+        """Download a new listing snapshot and rebuild the index from it."""
+        try:
+            csv_text = call_alpha_vantage_listing_status()
+            parse_listings(csv_text)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(csv_text, encoding="utf-8")
+            os.replace(tmp_path, self.path)
+            self._load()
+        except Exception as e:
+            logger.error(f"Failed to refresh listing snapshot: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def refresh_if_stale(self) -> bool:
+        """
+        Start a background refresh if the snapshot is missing or too old.
+
+        Returns:
+            True if a refresh was started
+        """
+        age = self._snapshot_age()
+        if not self._loaded and age is not None:
+            self._load()
+        if age is not None and age < self.max_age_seconds:
+            return False
+        with self._lock:
+            now = self._clock()
+            if self._refreshing or (
+                self._refresh_attempted_at is not None
+                and now - self._refresh_attempted_at < TICKER_LISTING_RETRY_SECONDS
+            ):
+                return False
+            self._refreshing = True
+            self._refresh_attempted_at = now
+        threading.Thread(target=self.refresh, name="ticker-listing-refresh", daemon=True).start()
+        return True
+
+    def _fallback(self, query: str) -> Dict[str, Any]:
+        key = " ".join(query.lower().split())
+        with self._lock:
+            if key in self._fallback_cache:
+                self._fallback_cache.move_to_end(key)
+                return self._fallback_cache[key]
+
+        results = call_alpha_vantage_symbol_search(query)
+        # Rate limit and error responses carry no bestMatches and are not cached
+        if isinstance(results, dict) and "bestMatches" in results:
+            with self._lock:
+                self._fallback_cache[key] = results
+                while len(self._fallback_cache) > self.cache_size:
+                    self._fallback_cache.popitem(last=False)
+        return results
+
+    def search(self, query: str) -> Dict[str, Any]:
+        """
+        Search for stock symbols by ticker or company name.
+
+        Args:
+            query: Search keywords
+
+        Returns:
+            Dict with 'bestMatches' in the SYMBOL_SEARCH format
+        """
+        self.refresh_if_stale()
+        index = self._index
+        if index is not None:
+            matches = index.search(query)
+            if matches:
+                return {"bestMatches": matches}
+        return self._fallback(query)
+
+
+# Global ticker search instance
+_ticker_search_instance: Optional[TickerSearch] = None
+
+def get_ticker_search() -> TickerSearch:
+    """Get or create global ticker search instance."""
+    global _ticker_search_instance
+    if _ticker_search_instance is None:
+        _ticker_search_instance = TickerSearch()
+    return _ticker_search_instance
@@ -0,0 +1,241 @@
+"""Permanent archive of earnings call transcripts keyed by symbol and quarter."""
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, Optional
+from src.lib.supabase_client import get_supabase_client
+
+logger = logging.getLogger(__name__)
+
+
+def _transcript_hash(transcript: Dict[str, Any]) -> str:
+    """SHA-256 of the canonical JSON form of a transcript response."""
+    return hashlib.sha256(json.dumps(transcript, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class TranscriptArchive:
+    """
+    Compressed, content-hashed transcript archive with a Supabase mirror.
+
+    Published transcripts are immutable, so archived entries never expire. Each entry is stored
+    as gzip-compressed JSON alongside its SHA-256 and is discarded if the hash no longer matches.
+    Quarters that were requested but not yet published are remembered for a short TTL so they
+    are not re-requested on every run.
+    """
+
+    def __init__(
+        self,
+        base_dir: Optional[str] = None,
+        negative_ttl: Optional[timedelta] = None,
+        use_supabase: Optional[bool] = None
+    ):
+        """
+        Initialize the transcript archive.
+
+        Args:
+            base_dir: Local archive directory (defaults to TRANSCRIPT_ARCHIVE_DIR or 'output/transcripts')
+            negative_ttl: How long a missing quarter is remembered (defaults to TRANSCRIPT_NEGATIVE_TTL_HOURS or 12h)
+            use_supabase: Mirror entries to the research_cache table (defaults to TRANSCRIPT_ARCHIVE_USE_SUPABASE or true)
+        """
+        self.base_dir = Path(base_dir or os.getenv("TRANSCRIPT_ARCHIVE_DIR", "output/transcripts"))
+        self.negative_ttl = negative_ttl or timedelta(hours=float(os.getenv("TRANSCRIPT_NEGATIVE_TTL_HOURS", "12")))
+        if use_supabase is None:
+            use_supabase = os.getenv("TRANSCRIPT_ARCHIVE_USE_SUPABASE", "true").lower() == "true"
+        self.use_supabase = use_supabase
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        """Get Supabase client connection."""
+        if self._client is None:
+            self._client = get_supabase_client()
+        return self._client
+
+    def _path(self, symbol: str, quarter: str) -> Path:
+        return self.base_dir / symbol.upper() / f"{quarter}.json.gz"
+
+    def _missing_path(self, symbol: str) -> Path:
+        return self.base_dir / symbol.upper() / "missing.json"
+
+    @staticmethod
+    def _cache_key(symbol: str, quarter: str) -> str:
+        return f"transcript:{symbol.upper()}:{quarter}"
+
+    @staticmethod
+    def _missing_cache_key(symbol: str, quarter: str) -> str:
+        return f"transcript_missing:{symbol.upper()}:{quarter}"
+
+    def get(self, symbol: str, quarter: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an archived transcript.
+
+        Args:
+            symbol: Stock symbol
+            quarter: Quarter in YYYYQM format
+
+        Returns:
+            The archived EARNINGS_CALL_TRANSCRIPT response, or None if not archived
+        """
+        entry = self._read_local(symbol, quarter)
+        if entry is None and self.use_supabase:
+            entry = self._read_supabase(symbol, quarter)
+            if entry is not None:
+                self._write_local(symbol, quarter, entry)
+
+        if entry is None:
+            return None
+        if _transcript_hash(entry["transcript"]) != entry["sha256"]:
+            logger.warning(f"Discarding archived transcript for {symbol} {quarter}: content hash mismatch")
+            return None
+
+        logger.info(f"Transcript archive hit for {symbol} {quarter}")
+        return entry["transcript"]
+
+    def put(self, symbol: str, quarter: str, transcript: Dict[str, Any]) -> str:
+        """
+        Archive a published transcript.
+
+        Args:
+            symbol: Stock symbol
+            quarter: Quarter in YYYYQM format
+            transcript: EARNINGS_CALL_TRANSCRIPT response
+
+        Returns:
+            SHA-256 of the archived transcript
+        """
+        entry = {"sha256": _transcript_hash(transcript), "transcript": transcript}
+        self._write_local(symbol, quarter, entry)
+        if self.use_supabase:
+            self._upsert_supabase(self._cache_key(symbol, quarter), symbol, quarter, {
+                "sha256": entry["sha256"],
+                "encoding": "gzip+base64",
+                "payload": base64.b64encode(gzip.compress(json.dumps(transcript).encode("utf-8"))).decode("ascii")
+            }, expires_at=None)
+        logger.info(f"Archived transcript for {symbol} {quarter} ({entry['sha256'][:12]})")
+        return entry["sha256"]
+
+    def is_known_missing(self, symbol: str, quarter: str) -> bool:
+        """
+        Check whether a quarter was recently found to have no published transcript.
+
+        Args:
+            symbol: Stock symbol
+            quarter: Quarter in YYYYQM format
+
+        Returns:
+            True if a negative lookup was recorded within the negative TTL
+        """
+        expires_at = self._load_missing(symbol).get(quarter)
+        if expires_at and datetime.fromisoformat(expires_at) > datetime.now():
+            return True
+
+        if self.use_supabase:
+            try:
+                response = self.client.table("research_cache")\
+                    .select("expires_at")\
+                    .eq("cache_key", self._missing_cache_key(symbol, quarter))\
+                    .execute()
+                if response.data and datetime.fromisoformat(response.data[0]["expires_at"]) > datetime.now():
+                    return True
+            except Exception as e:
+                logger.debug(f"Could not check missing transcript marker for {symbol} {quarter}: {e}")
+        return False
+
+    def record_missing(self, symbol: str, quarter: str) -> None:
+        """
+        Remember that a quarter has no published transcript yet.
+
+        Args:
+            symbol: Stock symbol
+            quarter: Quarter in YYYYQM format
+        """
+        expires_at = datetime.now() + self.negative_ttl
+        with self._lock:
+            missing = {
+                q: expiry for q, expiry in self._load_missing(symbol).items()
+                if datetime.fromisoformat(expiry) > datetime.now()
+            }
+            missing[quarter] = expires_at.isoformat()
+            self._atomic_write(self._missing_path(symbol), json.dumps(missing).encode("utf-8"))
+        if self.use_supabase:
+            self._upsert_supabase(self._missing_cache_key(symbol, quarter), symbol, quarter, {"missing": True}, expires_at=expires_at)
+        logger.info(f"No transcript published for {symbol} {quarter}; skipping until {expires_at.isoformat()}")
+
+    def _load_missing(self, symbol: str) -> Dict[str, str]:
+        path = self._missing_path(symbol)
+        if not path.exists():
+            return {}
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def _read_local(self, symbol: str, quarter: str) -> Optional[Dict[str, Any]]:
+        path = self._path(symbol, quarter)
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Discarding unreadable archived transcript {path}: {e}")
+            return None
+
+    def _write_local(self, symbol: str, quarter: str, entry: Dict[str, Any]) -> None:
+        self._atomic_write(self._path(symbol, quarter), gzip.compress(json.dumps(entry).encode("utf-8")))
+
+    def _atomic_write(self, path: Path, content: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def _read_supabase(self, symbol: str, quarter: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = self.client.table("research_cache")\
+                .select("data")\
+                .eq("cache_key", self._cache_key(symbol, quarter))\
+                .execute()
+            if not response.data:
+                return None
+            data = response.data[0]["data"]
+            transcript = json.loads(gzip.decompress(base64.b64decode(data["payload"])).decode("utf-8"))
+            return {"sha256": data["sha256"], "transcript": transcript}
+        except Exception as e:
+            logger.warning(f"Failed to read archived transcript for {symbol} {quarter} from Supabase: {e}")
+            return None
+
+    def _upsert_supabase(self, cache_key: str, symbol: str, quarter: str, data: Dict[str, Any], expires_at: Optional[datetime]) -> None:
+        try:
+            self.client.table("research_cache").upsert({
+                "cache_key": cache_key,
+                "cache_type": "transcript",
+                "report_type": "earnings_call_transcript",
+                "symbol": symbol.upper(),
+                "cache_date": datetime.now().date().isoformat(),
+                "expires_at": expires_at.isoformat() if expires_at else None,
+                "data": data,
+                "metadata": {"quarter": quarter, "cached_at": datetime.now().isoformat()}
+            }, on_conflict="cache_key").execute()
+        except Exception as e:
+            logger.warning(f"Failed to mirror {cache_key} to Supabase: {e}")
+
+
+# Global archive instance
+_archive_instance: Optional[TranscriptArchive] = None
+
+def get_transcript_archive() -> TranscriptArchive:
+    """Get or create global transcript archive instance."""
+    global _archive_instance
+    if _archive_instance is None:
+        _archive_instance = TranscriptArchive()
+    return _archive_instance
@@ -0,0 +1,89 @@
+"""Content-addressed cache of per-chunk transcript extraction results."""
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of a transcript or chunk."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class TranscriptChunkCache:
+    """
+    File-backed cache of chunk extraction results keyed by transcript hash.
+
+    A published transcript never changes, so entries have no TTL: each transcript gets one
+    JSON file mapping chunk hashes to their extracted result. The extraction version is part
+    of the chunk key so prompt or model changes do not serve stale results.
+    """
+
+    def __init__(self, base_dir: Optional[str] = None):
+        """
+        Initialize the chunk cache.
+
+        Args:
+            base_dir: Directory for cache files (defaults to TRANSCRIPT_CHUNK_CACHE_DIR or 'output/transcript_chunks')
+        """
+        self.base_dir = Path(base_dir or os.getenv("TRANSCRIPT_CHUNK_CACHE_DIR", "output/transcript_chunks"))
+        self._lock = threading.Lock()
+
+    def _path(self, transcript_hash: str) -> Path:
+        return self.base_dir / f"{transcript_hash}.json"
+
+    def get_chunks(self, transcript_hash: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all cached chunk results for a transcript.
+
+        Args:
+            transcript_hash: content_hash of the full transcript text
+
+        Returns:
+            Dict mapping chunk keys to cached results (empty on miss)
+        """
+        path = self._path(transcript_hash)
+        if not path.exists():
+            return {}
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Discarding unreadable transcript chunk cache {path}: {e}")
+            return {}
+
+    def put_chunks(self, transcript_hash: str, chunks: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Merge chunk results into a transcript's cache file.
+
+        Args:
+            transcript_hash: content_hash of the full transcript text
+            chunks: Dict mapping chunk keys to results to store
+        """
+        if not chunks:
+            return
+        with self._lock:
+            merged = {**self.get_chunks(transcript_hash), **chunks}
+            path = self._path(transcript_hash)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(merged, f)
+            os.replace(tmp_path, path)
+        logger.debug(f"Cached {len(chunks)} transcript chunk results for {transcript_hash[:12]}")
+
+
+# Global cache instance
+_cache_instance: Optional[TranscriptChunkCache] = None
+
+def get_transcript_chunk_cache() -> TranscriptChunkCache:
+    """Get or create global transcript chunk cache instance."""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = TranscriptChunkCache()
+    return _cache_instance
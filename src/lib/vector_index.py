@@ -0,0 +1,316 @@
+"""Local memory-mapped vector index over research_docs embeddings."""
+import fcntl
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+VECTOR_INDEX_DIR = os.getenv("VECTOR_INDEX_DIR", "output/vector_index")
+# Rows scored per matrix product, bounding the temporary score buffer
+VECTOR_INDEX_BATCH_ROWS = int(os.getenv("VECTOR_INDEX_BATCH_ROWS", "8192"))
+
+
+def parse_embedding(embedding: Union[str, Sequence[float], None]) -> Optional[List[float]]:
+    """PostgREST returns pgvector columns as '[0.1,0.2,...]' strings; accept either form."""
+    if embedding is None:
+        return None
+    if isinstance(embedding, str):
+        return json.loads(embedding)
+    return list(embedding)
+
+
+class LocalVectorIndex:
+    """
+    Cosine-similarity index of document embeddings stored as a normalized float32 matrix.
+
+    Vectors live in a row-major file that is memory-mapped for search and appended to as
+    documents are added, so the index grows incrementally and is shared by processes that
+    point at the same directory. Each row's document ID, symbol and report type are kept
+    alongside for filtering. Re-adding a document overwrites its row in place.
+
+    Writers hold an exclusive lock on index.lock and searches a shared one. Every operation
+    reloads the rows when rows.json was replaced since it was last read, so rows written by
+    another process (e.g. the embedding backfill) are visible to a running server.
+    """
+
+    def __init__(self, directory: Union[str, Path] = VECTOR_INDEX_DIR, batch_rows: int = VECTOR_INDEX_BATCH_ROWS):
+        """
+        Initialize the index, loading any existing rows.
+
+        Args:
+            directory: Directory holding vectors.f32 and rows.json
+            batch_rows: Rows scored per matrix product
+        """
+        self.directory = Path(directory)
+        self.batch_rows = batch_rows
+        self._lock = threading.Lock()
+        self.dim: Optional[int] = None
+        self._doc_ids: List[int] = []
+        self._symbols: List[Optional[str]] = []
+        self._report_types: List[Optional[str]] = []
+        self._row_of: Dict[int, int] = {}
+        self._matrix: Optional[np.memmap] = None
+        # (inode, mtime, size) of the rows.json that was loaded
+        self._rows_signature: Optional[Tuple[int, int, int]] = None
+        with self._file_lock(exclusive=False):
+            self._refresh()
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.directory / "vectors.f32"
+
+    @property
+    def _rows_path(self) -> Path:
+        return self.directory / "rows.json"
+
+    @property
+    def _lock_path(self) -> Path:
+        return self.directory / "index.lock"
+
+    def __len__(self) -> int:
+        with self._file_lock(exclusive=False):
+            self._refresh()
+            return len(self._doc_ids)
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        """Hold the in-process lock and a shared or exclusive lock on index.lock."""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self._lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _current_rows_signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = self._rows_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _refresh(self) -> None:
+        """Reload the rows if rows.json changed since they were loaded; call with the file lock held."""
+        signature = self._current_rows_signature()
+        if signature != self._rows_signature:
+            self._load()
+            self._rows_signature = signature
+            self._matrix = None
+
+    def _reset(self) -> None:
+        self.dim = None
+        self._doc_ids, self._symbols, self._report_types, self._row_of = [], [], [], {}
+        self._matrix = None
+
+    def _load(self) -> None:
+        self._reset()
+        if not self._rows_path.exists():
+            return
+        try:
+            rows = json.loads(self._rows_path.read_text())
+            self.dim = rows["dim"]
+            self._doc_ids = rows["doc_ids"]
+            self._symbols = rows["symbols"]
+            self._report_types = rows["report_types"]
+            self._row_of = {doc_id: row for row, doc_id in enumerate(self._doc_ids)}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable vector index at {self.directory}: {e}")
+            self._reset()
+
+    def _save_rows(self) -> None:
+        tmp_path = self._rows_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({
+            "dim": self.dim,
+            "doc_ids": self._doc_ids,
+            "symbols": self._symbols,
+            "report_types": self._report_types
+        }))
+        tmp_path.replace(self._rows_path)
+        self._rows_signature = self._current_rows_signature()
+
+    def _matrix_view(self) -> Optional[np.memmap]:
+        """Memory-mapped vectors, remapped when rows were appended since the last search."""
+        if not self._doc_ids:
+            return None
+        if self._matrix is None or self._matrix.shape[0] != len(self._doc_ids):
+            self._matrix = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(len(self._doc_ids), self.dim))
+        return self._matrix
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def add(self, doc_id: int, embedding: Sequence[float], symbol: Optional[str] = None, report_type: Optional[str] = None) -> None:
+        """
+        Add or replace a document's embedding.
+
+        Args:
+            doc_id: research_docs row ID
+            embedding: Embedding vector
+            symbol: Document symbol (for filtering)
+            report_type: Document report type (for filtering)
+        """
+        self.add_many([(doc_id, embedding, symbol, report_type)])
+
+    def add_many(self, documents: Iterable[Tuple[int, Sequence[float], Optional[str], Optional[str]]]) -> int:
+        """
+        Add or replace embeddings of several documents with one append.
+
+        Args:
+            documents: (doc_id, embedding, symbol, report_type) tuples
+
+        Returns:
+            Number of documents added or replaced
+        """
+        # The last embedding of a document repeated in the batch wins
+        documents = list({doc_id: (doc_id, embedding, symbol, report_type) for doc_id, embedding, symbol, report_type in documents}.values())
+        if not documents:
+            return 0
+        vectors = self._normalize(np.asarray([embedding for _, embedding, _, _ in documents], dtype=np.float32))
+
+        with self._file_lock(exclusive=True):
+            self._refresh()
+            self._append(documents, vectors)
+        return len(documents)
+
+    def _append(self, documents: List[Tuple[int, Sequence[float], Optional[str], Optional[str]]], vectors: np.ndarray) -> None:
+        """Write normalized vectors of distinct documents; call with the exclusive file lock held."""
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match index dimension {self.dim}")
+
+        appended = []
+        for (doc_id, _, symbol, report_type), vector in zip(documents, vectors):
+            symbol = symbol.upper() if symbol else None
+            row = self._row_of.get(doc_id)
+            if row is None:
+                self._row_of[doc_id] = len(self._doc_ids) + len(appended)
+                appended.append((doc_id, symbol, report_type, vector))
+                continue
+            matrix = np.memmap(self._vectors_path, dtype=np.float32, mode="r+", shape=(len(self._doc_ids), self.dim))
+            matrix[row] = vector
+            matrix.flush()
+            self._symbols[row] = symbol or self._symbols[row]
+            self._report_types[row] = report_type or self._report_types[row]
+
+        if appended:
+            # Drop vectors a writer appended without recording their rows before it failed
+            if self._vectors_path.exists():
+                os.truncate(self._vectors_path, len(self._doc_ids) * self.dim * 4)
+            with open(self._vectors_path, "ab") as f:
+                f.write(np.stack([vector for _, _, _, vector in appended]).tobytes())
+            for doc_id, symbol, report_type, _ in appended:
+                self._doc_ids.append(doc_id)
+                self._symbols.append(symbol)
+                self._report_types.append(report_type)
+        self._matrix = None
+        self._save_rows()
+
+    def search(
+        self,
+        query_embedding: Sequence[float],
+        limit: int = 10,
+        symbol_filter: Optional[str] = None,
+        report_type_filter: Optional[str] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the documents most similar to a query embedding.
+
+        Args:
+            query_embedding: Query vector
+            limit: Maximum number of results
+            symbol_filter: Only documents of this symbol
+            report_type_filter: Only documents of this report type
+
+        Returns:
+            (doc_id, cosine similarity) pairs, most similar first
+        """
+        with self._file_lock(exclusive=False):
+            self._refresh()
+            matrix = self._matrix_view()
+            if matrix is None or limit <= 0:
+                return []
+            query = self._normalize(np.asarray(query_embedding, dtype=np.float32))
+            if query.shape != (self.dim,):
+                raise ValueError(f"Query dimension {query.shape[-1]} does not match index dimension {self.dim}")
+
+            mask = None
+            if symbol_filter:
+                mask = np.asarray(self._symbols, dtype=object) == symbol_filter.upper()
+            if report_type_filter:
+                type_mask = np.asarray(self._report_types, dtype=object) == report_type_filter
+                mask = type_mask if mask is None else mask & type_mask
+            doc_ids = np.asarray(self._doc_ids, dtype=np.int64)
+
+            best_rows = np.empty(0, dtype=np.int64)
+            best_scores = np.empty(0, dtype=np.float32)
+            for start in range(0, matrix.shape[0], self.batch_rows):
+                scores = matrix[start:start + self.batch_rows] @ query
+                rows = np.arange(start, start + scores.shape[0])
+                if mask is not None:
+                    keep = mask[start:start + scores.shape[0]]
+                    scores, rows = scores[keep], rows[keep]
+                # Keep only the running top-k candidates between batches
+                scores = np.concatenate([best_scores, scores])
+                rows = np.concatenate([best_rows, rows])
+                if scores.shape[0] > limit:
+                    top = np.argpartition(-scores, limit - 1)[:limit]
+                    scores, rows = scores[top], rows[top]
+                best_scores, best_rows = scores, rows
+
+            order = np.argsort(-best_scores, kind="stable")
+            return [(int(doc_ids[row]), float(score)) for row, score in zip(best_rows[order], best_scores[order])]
+
+    def rebuild(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """
+        Replace the index with research_docs rows.
+
+        Args:
+            documents: research_docs rows with 'id', 'embedding' and 'metadata'
+
+        Returns:
+            Number of documents indexed
+        """
+        entries = {}
+        for doc in documents:
+            embedding = parse_embedding(doc.get("embedding"))
+            if embedding:
+                metadata = doc.get("metadata") or {}
+                entries[doc["id"]] = (doc["id"], embedding, metadata.get("symbol"), metadata.get("report_type"))
+        entries = list(entries.values())
+        vectors = self._normalize(np.asarray([embedding for _, embedding, _, _ in entries], dtype=np.float32))
+
+        # Readers in other processes see either the old index or the complete new one
+        with self._file_lock(exclusive=True):
+            for path in (self._vectors_path, self._rows_path):
+                path.unlink(missing_ok=True)
+            self._reset()
+            if entries:
+                self._append(entries, vectors)
+            else:
+                self._rows_signature = None
+        count = len(entries)
+        logger.info(f"Rebuilt local vector index with {count} documents")
+        return count
+
+
+# Global index instance
+_index_instance: Optional[LocalVectorIndex] = None
+
+def get_local_vector_index() -> LocalVectorIndex:
+    """Get or create global local vector index instance."""
+    global _index_instance
+    if _index_instance is None:
+        _index_instance = LocalVectorIndex()
+    return _index_instance
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 
 
@@ -17,4 +17,18 @@ class KeyInsights(BaseModel):
     report_date: str
     
     # Critical insights derived from the comprehensive report
-    critical_insights: str
\ No newline at end of file
+    critical_insights: str
+
+class ReportSectionUpdate(BaseModel):
+    # Title of the section exactly as requested
+    title: str
+
+    # Complete markdown of the section, starting with its heading
+    content: str
+
+
+class ComprehensiveReportUpdate(BaseModel):
+    symbol: str
+
+    # Regenerated sections, one per requested section
+    sections: List[ReportSectionUpdate]
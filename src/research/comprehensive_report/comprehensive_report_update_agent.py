@@ -0,0 +1,34 @@
+from agents import Agent
+from src.research.comprehensive_report.comprehensive_report_models import ComprehensiveReportUpdate
+from src.lib.llm_model import get_model
+
+SYSTEM_INSTRUCTIONS = """
+Update selected sections of an existing exhaustively detailed, technical investment research report after some of its underlying analyses changed.
+
+INPUT:
+- sections_to_update: Titles of the sections to rewrite
+- previous_sections: The current text of those sections
+- analyses: The latest results of every analysis those sections are based on
+- changed_analyses: Which of those analyses changed since the previous report
+
+OUTPUT:
+Return one entry in sections for each title in sections_to_update, with title set exactly to that title and content holding the complete rewritten section.
+
+WRITING STYLE:
+- Keep the heading line, heading level, structure and technical register of the previous section
+- Be exhaustively thorough - include all relevant data points, metrics, and technical details
+- Include specific numbers, percentages, ratios, and quantitative findings wherever available
+- Use heavy markdown formatting with tables, lists, and structured data presentation
+
+CRITICAL REQUIREMENTS:
+- Base every figure on the latest analyses; update every number, conclusion and recommendation affected by the changed analyses
+- Keep unaffected statements from the previous section unchanged
+- Do not write sections that were not requested; the rest of the report is kept as is
+"""
+
+comprehensive_report_update_agent = Agent(
+    name="Comprehensive Report Updater",
+    model=get_model(),
+    output_type=ComprehensiveReportUpdate,
+    instructions=SYSTEM_INSTRUCTIONS
+)
@@ -0,0 +1,204 @@
+"""Planning of incremental comprehensive report updates from changed analyses."""
+import math
+import os
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from src.lib.alpha_vantage_records import parse_number
+from src.lib.cached_stage import input_fingerprint
+from src.research.comprehensive_report.comprehensive_report_models import ReportSectionUpdate
+
+# Update the previous report's changed sections instead of regenerating the whole report
+COMPREHENSIVE_REPORT_INCREMENTAL = os.getenv("COMPREHENSIVE_REPORT_INCREMENTAL", "true").lower() != "false"
+# Above this share of sections to rewrite, a full regeneration is cheaper and more coherent
+COMPREHENSIVE_REPORT_MAX_CHANGED_FRACTION = float(os.getenv("COMPREHENSIVE_REPORT_MAX_CHANGED_FRACTION", "0.6"))
+# Price moves below this percentage do not make the price-dependent sections stale
+COMPREHENSIVE_REPORT_PRICE_TOLERANCE_PCT = float(os.getenv("COMPREHENSIVE_REPORT_PRICE_TOLERANCE_PCT", "2.0"))
+
+# all_analyses entries that describe the run rather than an analysis
+REPORT_CONTEXT_KEYS = ("symbol", "analysis_date")
+
+# Analyses each report section is written from, matched by keywords in the section title.
+# None means the section summarizes every analysis.
+SECTION_DEPENDENCIES: List[Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]] = [
+    (("executive summary", "recommendation", "thesis", "conclusion"), None),
+    (("company overview",), ("company_overview_analysis",)),
+    (("historical earnings",), ("historical_earnings_analysis",)),
+    (("financial statement",), ("financial_statements_analysis",)),
+    (("projection",), ("earnings_projections_analysis",)),
+    (("guidance",), ("management_guidance_analysis",)),
+    (("peer",), ("peer_group", "global_quote_data")),
+    (("valuation", "forward pe", "forward p/e"), ("forward_pe_valuation", "forward_pe_sanity_check", "global_quote_data")),
+    (("news", "sentiment"), ("news_sentiment_summary",)),
+    (("cross-reference", "cross reference"), ("cross_reference",)),
+    (("trade idea",), ("trade_idea", "global_quote_data")),
+]
+
+# Suffix split_report adds to the parts of a long section, e.g. "Valuation (2)"
+_PART_SUFFIX = re.compile(r" \(\d+\)$")
+
+
+def _quote_projection(quote: Any) -> Any:
+    """Global quote with the price replaced by its bucket of COMPREHENSIVE_REPORT_PRICE_TOLERANCE_PCT steps."""
+    if not isinstance(quote, dict) or COMPREHENSIVE_REPORT_PRICE_TOLERANCE_PCT <= 0:
+        return quote
+    price = parse_number(quote.get("price"))
+    if not price > 0:
+        return quote
+    return {**quote, "price": round(math.log(price) / math.log1p(COMPREHENSIVE_REPORT_PRICE_TOLERANCE_PCT / 100))}
+
+
+# Parts of an analysis that matter to the report, for analyses that change on every run
+ANALYSIS_PROJECTIONS = {
+    "global_quote_data": _quote_projection,
+}
+
+
+def analysis_fingerprints(all_analyses: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Fingerprint of each analysis in the report inputs.
+
+    Args:
+        all_analyses: Report inputs keyed by analysis name
+
+    Returns:
+        Dict mapping analysis name to its fingerprint
+    """
+    return {
+        key: input_fingerprint({key: ANALYSIS_PROJECTIONS.get(key, lambda value: value)(value)})
+        for key, value in all_analyses.items()
+        if key not in REPORT_CONTEXT_KEYS
+    }
+
+
+def changed_analyses(previous: Dict[str, str], current: Dict[str, str]) -> Set[str]:
+    """Names of analyses added, removed or changed between two sets of fingerprints."""
+    return {key for key in previous.keys() | current.keys() if previous.get(key) != current.get(key)}
+
+
+def section_dependencies(title: str) -> Optional[Tuple[str, ...]]:
+    """
+    Analyses a report section is written from.
+
+    Args:
+        title: Section title
+
+    Returns:
+        Analysis names, or None if the section depends on every analysis (including
+        sections that cannot be recognised)
+    """
+    normalized = title.lower()
+    for keywords, dependencies in SECTION_DEPENDENCIES:
+        if any(keyword in normalized for keyword in keywords):
+            return dependencies
+    return None
+
+
+def _normalize_title(title: str) -> str:
+    return " ".join(re.sub(r"[#*_`]", "", title).lower().split())
+
+
+def report_sections(chunks: Sequence[Dict[str, Any]]) -> "OrderedDict[str, str]":
+    """
+    Reassemble a stored report's top-level sections from its research_docs chunks.
+
+    Args:
+        chunks: Chunk documents of one report, in report order
+
+    Returns:
+        Ordered dict mapping section title to its markdown
+    """
+    paths = [_PART_SUFFIX.sub("", chunk["metadata"]["section"]).split(" > ") for chunk in chunks]
+    # Reports under a single title heading are split by the headings below it
+    depth = 1 if len({path[0] for path in paths}) == 1 and any(len(path) > 1 for path in paths) else 0
+
+    parts: "OrderedDict[str, List[str]]" = OrderedDict()
+    for path, chunk in zip(paths, chunks):
+        parts.setdefault(path[min(depth, len(path) - 1)], []).append(chunk["content"])
+    return OrderedDict((title, "\n\n".join(contents)) for title, contents in parts.items())
+
+
+def sections_to_update(sections: Sequence[str], changed: Set[str]) -> List[str]:
+    """
+    Sections affected by changed analyses.
+
+    Args:
+        sections: Section titles of the previous report
+        changed: Names of changed analyses
+
+    Returns:
+        Titles of the sections to rewrite, in report order
+    """
+    if not changed:
+        return []
+    titles = []
+    for title in sections:
+        dependencies = section_dependencies(title)
+        if dependencies is None or changed.intersection(dependencies):
+            titles.append(title)
+    return titles
+
+
+def exceeds_changed_fraction(sections: Sequence[str], titles: Sequence[str]) -> bool:
+    """
+    Whether too much of a report is stale for an incremental update.
+
+    Summary sections (those depending on every analysis) are rewritten whenever anything
+    changed, so only sections written from specific analyses are counted.
+
+    Args:
+        sections: Section titles of the previous report
+        titles: Titles of the sections to rewrite
+
+    Returns:
+        True if more than COMPREHENSIVE_REPORT_MAX_CHANGED_FRACTION of the specific sections
+        are to be rewritten
+    """
+    specific = [title for title in sections if section_dependencies(title) is not None]
+    stale = [title for title in titles if section_dependencies(title) is not None]
+    if not specific:
+        return bool(titles)
+    return len(stale) > COMPREHENSIVE_REPORT_MAX_CHANGED_FRACTION * len(specific)
+
+
+def update_inputs(all_analyses: Dict[str, Any], titles: Sequence[str]) -> Dict[str, Any]:
+    """
+    Analyses needed to rewrite the given sections.
+
+    Args:
+        all_analyses: Report inputs keyed by analysis name
+        titles: Titles of the sections to rewrite
+
+    Returns:
+        Subset of all_analyses (all of it if any section depends on every analysis)
+    """
+    needed: Set[str] = set(REPORT_CONTEXT_KEYS)
+    for title in titles:
+        dependencies = section_dependencies(title)
+        if dependencies is None:
+            return dict(all_analyses)
+        needed.update(dependencies)
+    return {key: value for key, value in all_analyses.items() if key in needed}
+
+
+def merge_sections(
+    sections: "OrderedDict[str, str]",
+    titles: Sequence[str],
+    updates: Sequence[ReportSectionUpdate]
+) -> Tuple[str, List[str]]:
+    """
+    Replace sections of a report with their rewritten versions.
+
+    Args:
+        sections: Previous report sections
+        titles: Titles of the sections that were to be rewritten
+        updates: Rewritten sections
+
+    Returns:
+        Merged report markdown, and the titles in titles that no update was returned for
+    """
+    updated = {_normalize_title(update.title): update.content.strip() for update in updates}
+    missing = [title for title in titles if _normalize_title(title) not in updated]
+    merged = [updated.get(_normalize_title(title), content) for title, content in sections.items()]
+    return "\n\n".join(merged), missing
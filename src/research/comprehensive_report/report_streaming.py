@@ -0,0 +1,160 @@
+"""Incremental parsing of a streamed comprehensive report into markdown sections."""
+import json
+import re
+from typing import Any, Dict, List
+
+_JSON_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SECTION_HEADING = re.compile(r"^(#{1,2})\s+(.+?)\s*#*\s*$")
+
+
+class JsonStringFieldDecoder:
+    """
+    Decodes the value of one string field from JSON text that arrives in fragments.
+
+    Structured agent output is streamed as raw JSON; feeding each fragment returns the
+    newly available characters of the field's value, with escapes decoded.
+    """
+
+    def __init__(self, field: str):
+        """
+        Initialize the decoder.
+
+        Args:
+            field: Name of the string field to decode
+        """
+        # An unescaped quoted key can only occur as an object key, never inside a string value
+        self._start = re.compile(re.escape(json.dumps(field)) + r'\s*:\s*"')
+        self._buffer = ""
+        self._state = "search"
+
+    @property
+    def complete(self) -> bool:
+        """Whether the field's closing quote has been seen."""
+        return self._state == "done"
+
+    def feed(self, fragment: str) -> str:
+        """
+        Add a fragment of JSON text.
+
+        Args:
+            fragment: Next piece of the streamed JSON
+
+        Returns:
+            Decoded characters of the field value made available by this fragment
+        """
+        if self._state == "done":
+            return ""
+        self._buffer += fragment
+        if self._state == "search":
+            match = self._start.search(self._buffer)
+            if match is None:
+                return ""
+            self._buffer = self._buffer[match.end():]
+            self._state = "string"
+
+        decoded = []
+        buffer = self._buffer
+        i = 0
+        while i < len(buffer):
+            special = _STRING_SPECIAL.search(buffer, i)
+            end = special.start() if special else len(buffer)
+            decoded.append(buffer[i:end])
+            i = end
+            if special is None:
+                break
+            if buffer[i] == '"':
+                self._state = "done"
+                i += 1
+                break
+            # Escape sequence; wait for the rest of it if it is split across fragments
+            if i + 1 >= len(buffer):
+                break
+            escape = buffer[i + 1]
+            if escape != "u":
+                decoded.append(_JSON_ESCAPES.get(escape, escape))
+                i += 2
+                continue
+            if i + 6 > len(buffer):
+                break
+            code = int(buffer[i + 2:i + 6], 16)
+            if 0xD800 <= code < 0xDC00:
+                # High surrogate; combine with the following \uXXXX low surrogate
+                if i + 12 > len(buffer):
+                    break
+                low = int(buffer[i + 8:i + 12], 16)
+                decoded.append(chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)))
+                i += 12
+            else:
+                decoded.append(chr(code))
+                i += 6
+
+        self._buffer = buffer[i:]
+        return "".join(decoded)
+
+
+class MarkdownSectionStream:
+    """
+    Splits streamed markdown into sections at level 1-2 headings.
+
+    A section is emitted once the next section's heading line is complete, so every
+    emitted section is final. Headings without a body of their own (e.g. the report title)
+    open the following section, as in research_docs chunks.
+    """
+
+    def __init__(self):
+        """Initialize an empty stream."""
+        self._partial_line = ""
+        self._lines: List[str] = []
+        self._title = ""
+        self._has_body = False
+        self._emitted: List[Dict[str, Any]] = []
+
+    @property
+    def text(self) -> str:
+        """All markdown fed so far."""
+        current = "\n".join(self._lines + [self._partial_line]).strip()
+        return "\n\n".join([section["markdown"] for section in self._emitted] + ([current] if current else []))
+
+    def _emit(self) -> List[Dict[str, Any]]:
+        """Close the current section, returning it unless it is empty."""
+        markdown = "\n".join(self._lines).strip()
+        sections = [{"index": len(self._emitted), "title": self._title, "markdown": markdown}] if markdown else []
+        self._emitted.extend(sections)
+        self._lines, self._title, self._has_body = [], "", False
+        return sections
+
+    def feed(self, markdown: str) -> List[Dict[str, Any]]:
+        """
+        Add streamed markdown.
+
+        Args:
+            markdown: Next piece of the report
+
+        Returns:
+            Sections completed by this piece, each with index, title and markdown
+        """
+        completed = []
+        *lines, self._partial_line = (self._partial_line + markdown).split("\n")
+        for line in lines:
+            heading = _SECTION_HEADING.match(line)
+            if heading and self._has_body:
+                completed.extend(self._emit())
+            if heading:
+                self._title = heading.group(2)
+            elif line.strip():
+                self._has_body = True
+            self._lines.append(line)
+        return completed
+
+    def finish(self) -> List[Dict[str, Any]]:
+        """
+        End the stream.
+
+        Returns:
+            The last section, if any markdown remains
+        """
+        if self._partial_line:
+            self._lines.append(self._partial_line)
+            self._partial_line = ""
+        return self._emit()
@@ -1,6 +1,7 @@
 from agents import Agent
 from src.research.earnings_projections.earnings_projections_models import EarningsProjectionAnalysis
 from src.lib.llm_model import get_model
+from src.lib.alpha_vantage_records import COMPACT_JSON_INSTRUCTIONS
 
 earnings_projections_analysis_agent = Agent(
             name="Independent Earnings Projections Analyst",      
@@ -21,5 +22,5 @@ earnings_projections_analysis_agent = Agent(
             - Compare independent EPS vs consensus to identify validation concerns
 
             Include critical_insights field with 2-3 key projection insights for cross-model calibration.
-        """,
+        """ + COMPACT_JSON_INSTRUCTIONS,
         )
\ No newline at end of file
@@ -24,13 +24,13 @@ def get_earnings_projection_data_for_symbol(
         EarningsProjectionData containing all necessary data for projections
     """
     try:
-        # Determine fiscal year timing and data selection strategy
-        fiscal_info = log_fiscal_decision(symbol)
-
         # Get income statements
         income_statement = call_alpha_vantage_income_statement(symbol)
         overview = call_alpha_vantage_overview(symbol)
 
+        # Determine fiscal year timing and data selection strategy (seeded from the overview above)
+        fiscal_info = log_fiscal_decision(symbol, overview=overview)
+
         # Select appropriate data based on fiscal timing
         if fiscal_info.use_annual_data:
             # Near fiscal year end - focus on annual data for stability
@@ -1,6 +1,7 @@
 from agents import Agent
 from src.research.financial_statements.financial_statements_models import FinancialStatementsAnalysis
 from src.lib.llm_model import get_model
+from src.lib.alpha_vantage_records import COMPACT_JSON_INSTRUCTIONS
 
 financial_statements_analysis_agent = Agent(
             name="Financial Statements Analyst",      
@@ -22,5 +23,5 @@ financial_statements_analysis_agent = Agent(
 
             Identify changes that could make consensus estimates too optimistic/pessimistic.
             Include critical_insights field with 2-3 key financial changes for cross-model calibration.
-        """,
+        """ + COMPACT_JSON_INSTRUCTIONS,
         )
\ No newline at end of file
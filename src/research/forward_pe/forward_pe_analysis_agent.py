@@ -1,6 +1,7 @@
 from agents import Agent
 from src.research.forward_pe.forward_pe_models import ForwardPeValuation
 from src.lib.llm_model import get_model
+from src.lib.alpha_vantage_records import COMPACT_JSON_INSTRUCTIONS
 
 forward_pe_analysis_agent = Agent(
             name="Forward P/E Analyst",      
@@ -9,11 +10,19 @@ forward_pe_analysis_agent = Agent(
             instructions="""
             Analyze forward P/E valuation for original symbol using peer group context.
 
+            INPUT DATA:
+            - forward_pe_metrics is a precomputed table, one row per symbol with the original symbol first,
+              followed by peer statistics (median and quartile forward P/E, premium, implied EPS and price)
+            - Use these figures as given; do not recompute them. NA means the value is undefined
+              (missing data or non-positive earnings)
+            - Use peer_median_forward_pe as sector_average_pe and pe_52_week_low/pe_52_week_high for
+              historical_pe_range when available
+
             ANALYSIS FOCUS:
-            - Calculate forward P/E ratio using current price and consensus EPS
+            - Use the forward P/E ratio from current price and consensus EPS
             - Compare to peer group forward P/E ratios for relative valuation
             - Assess earnings quality and sustainability for valuation reliability
             - Determine if valuation is attractive relative to fundamentals and peers
             - Provide confidence score (0-10) based on data quality and analysis reliability
-        """,
+        """ + COMPACT_JSON_INSTRUCTIONS,
         )
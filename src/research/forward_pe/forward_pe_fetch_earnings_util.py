@@ -1,6 +1,10 @@
-from typing import List, Dict, Any
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, List, Dict, Any, Optional
 from src.lib.alpha_vantage_api import call_alpha_vantage_earnings, call_alpha_vantage_earnings_estimates, call_alpha_vantage_global_quote, call_alpha_vantage_overview
-from src.lib.fiscal_year_utils import log_fiscal_decision
+from src.lib.alpha_vantage_records import parse_number
+from src.lib.fiscal_year_utils import log_fiscal_decision, seed_fiscal_year_info
+from src.lib.supabase_cache import get_supabase_cache
 from src.research.forward_pe.forward_pe_models import ForwardPEEarningsSummary
 from src.research.common.models.earnings import RawEarnings, RawGlobalQuote
 
@@ -17,19 +21,19 @@ def get_quarterly_eps_data_for_symbol(symbol: str) -> ForwardPEEarningsSummary:
     Returns:
         ForwardPEEarningsSummary containing the earnings data
     """
-    # Get fiscal year timing for proper data alignment
-    fiscal_info = log_fiscal_decision(symbol)
-
     raw_earnings: RawEarnings = call_alpha_vantage_earnings(symbol)
     raw_global_quote: RawGlobalQuote = call_alpha_vantage_global_quote(symbol)
     current_price = raw_global_quote['Global Quote']['05. price']
     overview = call_alpha_vantage_overview(symbol)
+
+    # Get fiscal year timing for proper data alignment (before cleaning drops FiscalYearEnd)
+    fiscal_info = log_fiscal_decision(symbol, overview=overview)
     clean_overview_of_useless_data(overview)
 
     # Adjust quarters based on fiscal timing
     if fiscal_info.use_annual_data:
         # Near fiscal year end - focus on annual consistency
-        quarters = 4  # Last 4 quarters for annual view
+        quarters = 5  # A trailing year and the quarter a year before the latest
         log.info(f"Using annual-focused earnings data for {symbol} (near fiscal year end)")
     else:
         # Mid-year - use more quarterly data for trends
@@ -37,10 +41,11 @@ def get_quarterly_eps_data_for_symbol(symbol: str) -> ForwardPEEarningsSummary:
         log.info(f"Using quarterly-focused earnings data for {symbol} (mid fiscal year)")
 
     if raw_earnings['quarterlyEarnings']:
-        raw_earnings['quarterlyEarnings'] = raw_earnings['quarterlyEarnings'][:quarters]
+        raw_earnings['quarterlyEarnings'] = latest_reported_quarters(raw_earnings['quarterlyEarnings'], quarters)
 
     # Get consensus EPS estimate using the Earnings Estimates API
     estimates_json = call_alpha_vantage_earnings_estimates(symbol)
+    record_earnings_calendar(symbol, raw_earnings, estimates_json)
     next_quarter_consensus_eps = extract_next_quarter_eps_from_estimates(estimates_json)
 
     earnings_summary = ForwardPEEarningsSummary(
@@ -50,10 +55,49 @@ def get_quarterly_eps_data_for_symbol(symbol: str) -> ForwardPEEarningsSummary:
         consensus_eps_next_quarter=str(next_quarter_consensus_eps),
         current_price=current_price
     )
+    # Parse the quarters here, in the fetch thread, for the metrics and sanity rules to share
+    earnings_summary.earnings_records()
 
     return earnings_summary
 
 
+def latest_reported_quarters(quarterly_earnings: List[Dict[str, Any]], quarters: int) -> List[Dict[str, Any]]:
+    """
+    Keep the latest reported quarters of an EARNINGS response, newest first.
+
+    Once a report date is scheduled Alpha Vantage lists that quarter first with reportedEPS
+    "None"; such upcoming quarters are kept but not counted, so truncation never leaves fewer
+    than the requested reported quarters.
+
+    Args:
+        quarterly_earnings: quarterlyEarnings of an EARNINGS response, newest first
+        quarters: Number of reported quarters to keep
+
+    Returns:
+        The upcoming quarters followed by up to quarters reported ones
+    """
+    upcoming = 0
+    while upcoming < len(quarterly_earnings) and math.isnan(parse_number(quarterly_earnings[upcoming].get("reportedEPS"))):
+        upcoming += 1
+    return quarterly_earnings[:upcoming + quarters]
+
+
+def record_earnings_calendar(symbol: str, earnings: Dict[str, Any], estimates: Dict[str, Any]) -> None:
+    """
+    Refresh the symbol's cached earnings calendar from responses fetched here anyway, so cache
+    lookups find it without calling EARNINGS and EARNINGS_ESTIMATES themselves.
+
+    Args:
+        symbol: Stock symbol
+        earnings: EARNINGS response
+        estimates: EARNINGS_ESTIMATES response
+    """
+    try:
+        get_supabase_cache().ttl_policy.record_earnings(symbol, earnings, estimates)
+    except Exception as e:
+        log.warning(f"Could not record earnings calendar for {symbol}: {e}")
+
+
 def extract_next_quarter_eps_from_estimates(estimates_json: Dict[str, Any]) -> str:
     """
     Extract the next quarter's consensus EPS estimate from the Earnings Estimates API response.
@@ -80,62 +124,131 @@ def extract_next_quarter_eps_from_estimates(estimates_json: Dict[str, Any]) -> s
 
 
 
-def get_quarterly_eps_data_for_symbols(symbols: List[str]) -> List[ForwardPEEarningsSummary]:
+def iter_quarterly_eps_data_for_symbols(symbols: List[str]) -> Iterator[ForwardPEEarningsSummary]:
     """
-    Calls Alpha Vantage APIs for the specified symbols and returns all necessary data for forward PE analysis.
-    Uses Earnings Estimates API for consensus EPS data.
+    Fetches forward PE data for all symbols concurrently and yields each summary as soon as
+    all of its endpoint responses have arrived.
+
+    Every (symbol, endpoint) request is submitted at once; the Alpha Vantage client caps how
+    many are actually in flight. OVERVIEW is requested once per symbol and reused.
 
     Args:
         symbols: List of stock symbols to get earnings for
 
-    Returns:
-        A list of ForwardPEEarningsSummary objects containing annual and quarterly earnings data,
-        as well as the next quarter's consensus EPS estimate, and the latest closing price.
+    Yields:
+        ForwardPEEarningsSummary objects in completion order. Symbols whose data could not be
+        fetched are logged and skipped.
     """
-    earnings_summaries = []
-
-    for symbol in symbols:
-        try:
-            # Get the overview data for the symbol
-            overview_json = call_alpha_vantage_overview(symbol)
-            # If the overview data is empty, skip this symbol
-            if not overview_json:
-                log.warning(f"Overview data is empty for symbol: {symbol}. Skipping.")
+    # Resolved at call time so the endpoint functions can be patched in tests
+    fetchers: Dict[str, Callable[[str], Dict[str, Any]]] = {
+        "overview": call_alpha_vantage_overview,
+        "earnings": call_alpha_vantage_earnings,
+        "estimates": call_alpha_vantage_earnings_estimates,
+        "global_quote": call_alpha_vantage_global_quote,
+    }
+    unique_symbols = list(dict.fromkeys(symbols))
+    if not unique_symbols:
+        return
+
+    responses: Dict[str, Dict[str, Any]] = {symbol: {} for symbol in unique_symbols}
+    errors: Dict[str, Exception] = {}
+
+    with ThreadPoolExecutor(max_workers=len(unique_symbols) * len(fetchers)) as executor:
+        pending = {
+            executor.submit(fetch, symbol): (symbol, endpoint)
+            for symbol in unique_symbols
+            for endpoint, fetch in fetchers.items()
+        }
+
+        for future in as_completed(pending):
+            symbol, endpoint = pending[future]
+            try:
+                responses[symbol][endpoint] = future.result()
+            except Exception as e:
+                errors.setdefault(symbol, e)
+                responses[symbol][endpoint] = None
+
+            if len(responses[symbol]) < len(fetchers):
                 continue
 
-            # Get the earnings data for the symbol
-            raw_earnings: RawEarnings = call_alpha_vantage_earnings(symbol)
+            if symbol in errors:
+                log.warning(f"Failed to get earnings data for symbol: {symbol}. Error: {errors[symbol]}. Skipping.")
+                continue
 
-            # Get consensus EPS estimate using the Earnings Estimates API
-            estimates_json = call_alpha_vantage_earnings_estimates(symbol)
-            next_quarter_consensus_eps = extract_next_quarter_eps_from_estimates(estimates_json)
+            earnings_summary = _build_earnings_summary(symbol, responses.pop(symbol))
+            if earnings_summary is not None:
+                yield earnings_summary
 
-            raw_global_quote: RawGlobalQuote = call_alpha_vantage_global_quote(symbol)
-            current_price = raw_global_quote['Global Quote']['05. price']
 
-            overview = call_alpha_vantage_overview(symbol)
-            clean_overview_of_useless_data(overview)
+def _build_earnings_summary(symbol: str, responses: Dict[str, Any]) -> Optional[ForwardPEEarningsSummary]:
+    """
+    Assembles a ForwardPEEarningsSummary from the raw endpoint responses for one symbol.
 
-            # Truncate quarterly earnings first
-            # Always return 9 quarters of data
-            quarters = 9
-            if raw_earnings['quarterlyEarnings']:
-                raw_earnings['quarterlyEarnings'] = raw_earnings['quarterlyEarnings'][:quarters]
+    Args:
+        symbol: Stock symbol the responses belong to
+        responses: Mapping of endpoint name to raw Alpha Vantage response
 
-            earnings_summary = ForwardPEEarningsSummary(
-                symbol=symbol,
-                overview=overview,
-                quarterly_earnings=raw_earnings['quarterlyEarnings'],
-                consensus_eps_next_quarter=str(next_quarter_consensus_eps),
-                current_price=current_price
-            )
+    Returns:
+        ForwardPEEarningsSummary, or None if the data is unusable
+    """
+    try:
+        overview = responses["overview"]
+        # If the overview data is empty, skip this symbol
+        if not overview:
+            log.warning(f"Overview data is empty for symbol: {symbol}. Skipping.")
+            return None
+
+        raw_earnings: RawEarnings = responses["earnings"]
+        record_earnings_calendar(symbol, raw_earnings, responses["estimates"])
+        next_quarter_consensus_eps = extract_next_quarter_eps_from_estimates(responses["estimates"])
+        raw_global_quote: RawGlobalQuote = responses["global_quote"]
+        current_price = raw_global_quote['Global Quote']['05. price']
+
+        # Seed the day's fiscal decision while FiscalYearEnd is still present; it is only
+        # written to the shared cache if something looks it up
+        seed_fiscal_year_info(symbol, overview)
+        clean_overview_of_useless_data(overview)
+
+        # Truncate quarterly earnings first
+        # Always return 9 reported quarters of data
+        quarters = 9
+        if raw_earnings['quarterlyEarnings']:
+            raw_earnings['quarterlyEarnings'] = latest_reported_quarters(raw_earnings['quarterlyEarnings'], quarters)
+
+        earnings_summary = ForwardPEEarningsSummary(
+            symbol=symbol,
+            overview=overview,
+            quarterly_earnings=raw_earnings['quarterlyEarnings'],
+            consensus_eps_next_quarter=str(next_quarter_consensus_eps),
+            current_price=current_price
+        )
+        # Parse the quarters here, in the fetch thread, for the metrics and sanity rules to share
+        earnings_summary.earnings_records()
+        return earnings_summary
 
-            earnings_summaries.append(earnings_summary)
+    except Exception as e:
+        log.warning(f"Failed to get earnings data for symbol: {symbol}. Error: {e}. Skipping.")
+        return None
 
-        except Exception as e:
-            log.warning(f"Failed to get earnings data for symbol: {symbol}. Error: {e}. Skipping.")
-            continue
 
+def get_quarterly_eps_data_for_symbols(symbols: List[str]) -> List[ForwardPEEarningsSummary]:
+    """
+    Calls Alpha Vantage APIs for the specified symbols and returns all necessary data for forward PE analysis.
+    Uses Earnings Estimates API for consensus EPS data.
+
+    All symbols are fetched concurrently (see iter_quarterly_eps_data_for_symbols); the result
+    keeps the order of the input symbols.
+
+    Args:
+        symbols: List of stock symbols to get earnings for
+
+    Returns:
+        A list of ForwardPEEarningsSummary objects containing annual and quarterly earnings data,
+        as well as the next quarter's consensus EPS estimate, and the latest closing price.
+    """
+    symbol_order = {symbol: index for index, symbol in enumerate(dict.fromkeys(symbols))}
+    earnings_summaries = list(iter_quarterly_eps_data_for_symbols(symbols))
+    earnings_summaries.sort(key=lambda summary: symbol_order[summary.symbol])
     return earnings_summaries
 
 
@@ -0,0 +1,209 @@
+"""Deterministic forward P/E metrics for a symbol and its peers, computed before the LLM step."""
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.lib.alpha_vantage_records import parse_number
+from src.research.forward_pe.forward_pe_models import ForwardPEEarningsSummary, ForwardPeMetrics, ForwardPeMetricsRow
+
+log = logging.getLogger(__name__)
+
+# Quarters of reported EPS in a trailing year
+TRAILING_QUARTERS = 4
+# Quarters used for the EPS dispersion statistics
+DISPERSION_QUARTERS = 8
+
+
+def earnings_matrices(summaries: Sequence[ForwardPEEarningsSummary]) -> Dict[str, np.ndarray]:
+    """
+    Stack the earnings summaries into NaN-padded arrays, one row per symbol.
+
+    Args:
+        summaries: Earnings summaries, quarterly earnings newest first
+
+    Returns:
+        Dict with 'price', 'consensus', 'week_52_low' and 'week_52_high' of shape (symbols,),
+        and 'reported' and 'estimated' EPS of shape (symbols, quarters)
+    """
+    quarters = max([len(summary.quarterly_earnings) for summary in summaries] + [TRAILING_QUARTERS])
+    reported = np.full((len(summaries), quarters), np.nan)
+    estimated = np.full((len(summaries), quarters), np.nan)
+    for i, summary in enumerate(summaries):
+        records = summary.earnings_records()
+        for name, matrix in (("reportedEPS", reported), ("estimatedEPS", estimated)):
+            if name in records.dtype.names:
+                matrix[i, :len(records)] = records[name]
+    return {
+        "price": np.array([parse_number(summary.current_price) for summary in summaries]),
+        "consensus": np.array([parse_number(summary.consensus_eps_next_quarter) for summary in summaries]),
+        "week_52_low": np.array([parse_number(summary.overview.get("52WeekLow")) for summary in summaries]),
+        "week_52_high": np.array([parse_number(summary.overview.get("52WeekHigh")) for summary in summaries]),
+        "reported": reported,
+        "estimated": estimated,
+    }
+
+
+def _positive_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise ratio, NaN where the denominator is not positive (a P/E of a loss is meaningless)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+def _row_stat(function, values: np.ndarray, min_count: int = 1) -> np.ndarray:
+    """Apply a NaN-aware reduction per row, NaN for rows with fewer than min_count values."""
+    counts = np.isfinite(values).sum(axis=1)
+    result = np.full(len(values), np.nan)
+    usable = counts >= max(min_count, 1)
+    if usable.any():
+        result[usable] = function(values[usable], axis=1)
+    return result
+
+
+def _align_on_latest_reported(*matrices: np.ndarray) -> List[np.ndarray]:
+    """
+    Shift each row left so column 0 is the latest quarter with a reported EPS.
+
+    Alpha Vantage lists upcoming quarters first, with reportedEPS "None", once their report date
+    is scheduled. Rows are aligned on the first finite value of the first matrix; the others
+    (e.g. estimated EPS) are shifted by the same amount, and vacated columns become NaN.
+    """
+    finite = np.isfinite(matrices[0])
+    offsets = np.where(finite.any(axis=1), finite.argmax(axis=1), 0)
+    quarters = matrices[0].shape[1]
+    index = offsets[:, None] + np.arange(quarters)
+    rows = np.arange(len(offsets))[:, None]
+    in_range = index < quarters
+    index = np.minimum(index, quarters - 1)
+    return [np.where(in_range, matrix[rows, index], np.nan) for matrix in matrices]
+
+
+def compute_metric_columns(matrices: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Compute the per-symbol metrics for every symbol at once.
+
+    Args:
+        matrices: Arrays from earnings_matrices
+
+    Returns:
+        Dict of metric name to array of shape (symbols,), NaN where a metric is undefined
+    """
+    price = matrices["price"]
+    consensus = matrices["consensus"]
+    reported, estimated = _align_on_latest_reported(matrices["reported"], matrices["estimated"])
+
+    # Sums are NaN unless every quarter is present
+    trailing_eps = reported[:, :TRAILING_QUARTERS].sum(axis=1)
+    forward_eps = reported[:, :TRAILING_QUARTERS - 1].sum(axis=1) + consensus
+    year_ago = reported[:, TRAILING_QUARTERS - 1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        surprise_pct = np.where(np.abs(estimated) > 0, (reported - estimated) / np.abs(estimated) * 100, np.nan)
+        consensus_growth_pct = np.where(np.abs(year_ago) > 0, (consensus - year_ago) / np.abs(year_ago) * 100, np.nan)
+    beats = np.where(np.isfinite(surprise_pct), (surprise_pct >= 0).astype(float), np.nan)
+
+    recent = reported[:, :DISPERSION_QUARTERS]
+    eps_std = _row_stat(np.nanstd, recent, min_count=2)
+    eps_mean = _row_stat(np.nanmean, recent, min_count=2)
+
+    return {
+        "current_price": price,
+        "trailing_eps": trailing_eps,
+        "forward_eps": forward_eps,
+        "trailing_pe": _positive_ratio(price, trailing_eps),
+        "forward_pe": _positive_ratio(price, forward_eps),
+        "consensus_eps_next_quarter": consensus,
+        "consensus_yoy_growth_pct": consensus_growth_pct,
+        "pe_52_week_low": _positive_ratio(matrices["week_52_low"], trailing_eps),
+        "pe_52_week_high": _positive_ratio(matrices["week_52_high"], trailing_eps),
+        "quarters_reported": np.isfinite(reported).sum(axis=1),
+        "eps_surprise_mean_pct": _row_stat(np.nanmean, surprise_pct),
+        "eps_surprise_std_pct": _row_stat(np.nanstd, surprise_pct, min_count=2),
+        "eps_beat_rate": _row_stat(np.nanmean, beats),
+        "eps_coefficient_of_variation": _positive_ratio(eps_std, np.abs(eps_mean)),
+    }
+
+
+def _optional(value: float, digits: int = 4) -> Optional[float]:
+    return round(float(value), digits) if np.isfinite(value) else None
+
+
+def compute_forward_pe_metrics(symbol: str, summaries: Sequence[ForwardPEEarningsSummary]) -> ForwardPeMetrics:
+    """
+    Compute forward P/E metrics of a symbol relative to its peers.
+
+    Args:
+        symbol: Symbol being valued
+        summaries: Earnings summaries of the symbol and its peers
+
+    Returns:
+        ForwardPeMetrics with one row per symbol (the valued symbol first) and the peer statistics
+
+    Raises:
+        ValueError: If the symbol has no earnings summary
+    """
+    ordered = sorted(summaries, key=lambda summary: summary.symbol != symbol)
+    if not ordered or ordered[0].symbol != symbol:
+        raise ValueError(f"No earnings summary for {symbol}")
+
+    columns = compute_metric_columns(earnings_matrices(ordered))
+    rows = [
+        ForwardPeMetricsRow(
+            symbol=summary.symbol,
+            **{
+                name: int(values[i]) if name == "quarters_reported" else _optional(values[i])
+                for name, values in columns.items()
+            }
+        )
+        for i, summary in enumerate(ordered)
+    ]
+
+    metrics = ForwardPeMetrics(symbol=symbol, rows=rows, peer_count=len(ordered) - 1)
+    peer_forward_pe = columns["forward_pe"][1:]
+    peer_forward_pe = peer_forward_pe[np.isfinite(peer_forward_pe)]
+    peer_trailing_pe = columns["trailing_pe"][1:]
+    peer_trailing_pe = peer_trailing_pe[np.isfinite(peer_trailing_pe)]
+    if len(peer_trailing_pe):
+        metrics.peer_median_trailing_pe = _optional(np.median(peer_trailing_pe))
+    if len(peer_forward_pe):
+        median, p25, p75 = np.median(peer_forward_pe), *np.percentile(peer_forward_pe, [25, 75])
+        metrics.peer_median_forward_pe = _optional(median)
+        metrics.peer_forward_pe_p25 = _optional(p25)
+        metrics.peer_forward_pe_p75 = _optional(p75)
+        metrics.implied_eps_at_peer_pe = _optional(columns["current_price"][0] / median)
+        metrics.implied_price_at_peer_pe = _optional(columns["forward_eps"][0] * median)
+        forward_pe = columns["forward_pe"][0]
+        if np.isfinite(forward_pe):
+            metrics.forward_pe_premium_pct = _optional((forward_pe / median - 1) * 100)
+            metrics.forward_pe_peer_percentile = _optional(np.mean(peer_forward_pe < forward_pe))
+
+    log.info(f"Computed forward P/E metrics for {symbol} and {metrics.peer_count} peers")
+    return metrics
+
+
+def _format_value(value: Any) -> str:
+    if value is None:
+        return "NA"
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+def format_metrics_table(metrics: ForwardPeMetrics) -> str:
+    """
+    Render the metrics as a compact pipe-separated table for an agent prompt.
+
+    Args:
+        metrics: Metrics from compute_forward_pe_metrics
+
+    Returns:
+        One header line and one line per symbol, followed by the peer statistics; missing
+        values are written as NA
+    """
+    fields = list(ForwardPeMetricsRow.model_fields)
+    lines = ["|".join(fields)]
+    for row in metrics.rows:
+        values = row.model_dump()
+        lines.append("|".join(_format_value(values[name]) for name in fields))
+    peer_stats = metrics.model_dump(exclude={"symbol", "rows"})
+    lines.append(", ".join(f"{name}={_format_value(value)}" for name, value in peer_stats.items()))
+    return "\n".join(lines)
+
@@ -1,7 +1,11 @@
-from typing import List, Dict, Any
-from pydantic import BaseModel
+from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, PrivateAttr
 import enum
 
+import numpy as np
+
+from src.lib.alpha_vantage_records import parse_reports
+
 
 class ValuationConfidence(str, enum.Enum):
     HIGH = "HIGH"
@@ -30,6 +34,14 @@ class ForwardPEEarningsSummary(BaseModel):
     quarterly_earnings: List
     consensus_eps_next_quarter: str
 
+    _earnings_records: Optional[np.ndarray] = PrivateAttr(default=None)
+
+    def earnings_records(self) -> np.ndarray:
+        """quarterly_earnings parsed by parse_reports, parsed on first use and kept with the summary."""
+        if self._earnings_records is None:
+            self._earnings_records = parse_reports(self.quarterly_earnings)
+        return self._earnings_records
+
 class ForwardPeValuation(BaseModel):
     symbol: str
     current_price: float
@@ -53,4 +65,45 @@ class ForwardPeSanityCheck(BaseModel):
     consensus_reliability: ValuationConfidence
     long_form_analysis: str
     is_realistic: ForwardPeSanityCheckRealistic
-    critical_insights: str
\ No newline at end of file
+    critical_insights: str
+
+class ForwardPeMetricsRow(BaseModel):
+    symbol: str
+    current_price: Optional[float] = None
+    # Sum of the last four reported quarters
+    trailing_eps: Optional[float] = None
+    # Last three reported quarters plus the next quarter's consensus
+    forward_eps: Optional[float] = None
+    trailing_pe: Optional[float] = None
+    forward_pe: Optional[float] = None
+    consensus_eps_next_quarter: Optional[float] = None
+    # Consensus versus the reported EPS of the same quarter a year earlier
+    consensus_yoy_growth_pct: Optional[float] = None
+    # Trailing P/E at the 52 week low and high
+    pe_52_week_low: Optional[float] = None
+    pe_52_week_high: Optional[float] = None
+    quarters_reported: int = 0
+    eps_surprise_mean_pct: Optional[float] = None
+    eps_surprise_std_pct: Optional[float] = None
+    # Share of quarters where reported EPS met or beat the estimate
+    eps_beat_rate: Optional[float] = None
+    # Standard deviation over absolute mean of quarterly reported EPS
+    eps_coefficient_of_variation: Optional[float] = None
+
+
+class ForwardPeMetrics(BaseModel):
+    symbol: str
+    rows: List[ForwardPeMetricsRow]
+    peer_count: int = 0
+    peer_median_trailing_pe: Optional[float] = None
+    peer_median_forward_pe: Optional[float] = None
+    peer_forward_pe_p25: Optional[float] = None
+    peer_forward_pe_p75: Optional[float] = None
+    # Forward P/E premium (positive) or discount (negative) to the peer median
+    forward_pe_premium_pct: Optional[float] = None
+    # Share of peers with a lower forward P/E
+    forward_pe_peer_percentile: Optional[float] = None
+    # Forward EPS the current price implies at the peer median forward P/E
+    implied_eps_at_peer_pe: Optional[float] = None
+    # Price of the forward EPS at the peer median forward P/E
+    implied_price_at_peer_pe: Optional[float] = None
@@ -1,6 +1,7 @@
 from agents import Agent
 from src.research.forward_pe.forward_pe_models import ForwardPeSanityCheck
 from src.lib.llm_model import get_model
+from src.lib.alpha_vantage_records import COMPACT_JSON_INSTRUCTIONS
 
 forward_pe_sanity_check_agent = Agent(
             name="Forward P/E Sanity Check Analyst",      
@@ -21,5 +22,5 @@ forward_pe_sanity_check_agent = Agent(
             - Evaluate data completeness and reliability for accurate analysis
 
             Include critical_insights field with 2-3 key data quality insights for cross-model calibration.
-        """,
+        """ + COMPACT_JSON_INSTRUCTIONS,
         )
@@ -0,0 +1,158 @@
+"""Rule-based forward P/E sanity check that settles clear-cut cases without the LLM."""
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.research.forward_pe.forward_pe_metrics import compute_metric_columns, earnings_matrices
+from src.research.forward_pe.forward_pe_models import (
+    EarningsQuality,
+    ForwardPEEarningsSummary,
+    ForwardPeSanityCheck,
+    ForwardPeSanityCheckRealistic,
+    ValuationConfidence,
+)
+
+FORWARD_PE_SANITY_RULES = os.getenv("FORWARD_PE_SANITY_RULES", "true").lower() != "false"
+
+# Reported quarters needed for a trailing year and a year-ago comparison of the consensus
+MIN_QUARTERS = 4
+# Consensus change against the same quarter a year earlier, in percent
+MAX_CONSENSUS_YOY_CHANGE_PCT = 25.0
+# Standard deviation of EPS surprises, in percent
+MAX_SURPRISE_STD_PCT = 15.0
+# Standard deviation over absolute mean of the recent quarterly EPS
+MAX_EPS_COEFFICIENT_OF_VARIATION = 0.35
+# Forward P/E range treated as ordinary
+MIN_FORWARD_PE = 5.0
+MAX_FORWARD_PE = 60.0
+
+
+@dataclass
+class SanityCheckMetrics:
+    """Counters of rule-based decisions and agent escalations."""
+
+    rule_based: int = 0
+    escalated: int = 0
+    agent_seconds: float = 0.0
+
+
+_metrics = SanityCheckMetrics()
+_metrics_lock = threading.Lock()
+
+
+def record_sanity_check(escalated: bool, agent_seconds: float = 0.0) -> None:
+    """
+    Count one sanity check.
+
+    Args:
+        escalated: Whether the check was sent to the agent
+        agent_seconds: Time the agent took, for escalated checks
+    """
+    with _metrics_lock:
+        if escalated:
+            _metrics.escalated += 1
+            _metrics.agent_seconds += agent_seconds
+        else:
+            _metrics.rule_based += 1
+
+
+def get_sanity_check_metrics() -> Dict[str, Any]:
+    """
+    Snapshot of forward P/E sanity check counters for this process.
+
+    Returns:
+        Dict with the counters, the escalation rate and the agent time the rules saved,
+        estimated from the mean time of escalated checks
+    """
+    with _metrics_lock:
+        snapshot = asdict(_metrics)
+    checks = snapshot["rule_based"] + snapshot["escalated"]
+    snapshot["escalation_rate"] = round(snapshot["escalated"] / checks, 4) if checks else None
+    mean_agent_seconds = snapshot["agent_seconds"] / snapshot["escalated"] if snapshot["escalated"] else None
+    snapshot["estimated_agent_seconds_saved"] = (
+        round(snapshot["rule_based"] * mean_agent_seconds, 1) if mean_agent_seconds is not None else None
+    )
+    return snapshot
+
+
+def reset_sanity_check_metrics() -> None:
+    """Clear the sanity check counters."""
+    global _metrics
+    with _metrics_lock:
+        _metrics = SanityCheckMetrics()
+
+
+def _insufficient(symbol: str, reason: str) -> ForwardPeSanityCheck:
+    return ForwardPeSanityCheck(
+        symbol=symbol,
+        earnings_data_quality=EarningsQuality.POOR_QUALITY,
+        consensus_reliability=ValuationConfidence.INSUFFICIENT_DATA,
+        long_form_analysis=f"Rule-based check: {reason}, so a forward P/E cannot be computed reliably.",
+        is_realistic=ForwardPeSanityCheckRealistic.NOT_REALISTIC,
+        critical_insights=f"{reason[0].upper()}{reason[1:]}; treat forward P/E conclusions as unsupported."
+    )
+
+
+def rule_based_sanity_check(earnings_summary: ForwardPEEarningsSummary) -> Tuple[Optional[ForwardPeSanityCheck], List[str]]:
+    """
+    Judge consensus EPS and price with explicit rules.
+
+    A check is decided without the agent when the data is clearly unusable (no price or no
+    consensus) or clearly ordinary (a complete EPS history with
+    stable earnings and surprises, consensus close to the year-ago quarter and an ordinary
+    forward P/E). Everything in between is left to the agent.
+
+    Args:
+        earnings_summary: Earnings summary for the symbol
+
+    Returns:
+        The sanity check, or None to escalate, and the reasons the rules could not decide
+    """
+    symbol = earnings_summary.symbol
+    columns = {name: values[0] for name, values in compute_metric_columns(earnings_matrices([earnings_summary])).items()}
+
+    if not columns["current_price"] > 0:
+        return _insufficient(symbol, "the current price is missing"), []
+    if not np.isfinite(columns["consensus_eps_next_quarter"]):
+        return _insufficient(symbol, "there is no consensus EPS estimate for the next quarter"), []
+    if columns["quarters_reported"] < MIN_QUARTERS:
+        # A short history may be a truncated fetch rather than missing data; let the agent judge it
+        return None, [f"only {int(columns['quarters_reported'])} quarters of reported EPS are available"]
+
+    reasons = []
+    if not columns["trailing_eps"] > 0 or not columns["forward_eps"] > 0:
+        reasons.append("missing or non-positive trailing or forward EPS")
+    elif not MIN_FORWARD_PE <= columns["forward_pe"] <= MAX_FORWARD_PE:
+        reasons.append(f"forward P/E of {columns['forward_pe']:.1f} outside {MIN_FORWARD_PE:g}-{MAX_FORWARD_PE:g}")
+    if not abs(columns["consensus_yoy_growth_pct"]) <= MAX_CONSENSUS_YOY_CHANGE_PCT:
+        reasons.append(f"consensus changes {columns['consensus_yoy_growth_pct']:.1f}% against the year-ago quarter")
+    if not columns["eps_coefficient_of_variation"] <= MAX_EPS_COEFFICIENT_OF_VARIATION:
+        reasons.append(f"volatile quarterly EPS (coefficient of variation {columns['eps_coefficient_of_variation']:.2f})")
+    if not np.isfinite(columns["eps_surprise_std_pct"]):
+        reasons.append("no EPS surprise history")
+    elif columns["eps_surprise_std_pct"] > MAX_SURPRISE_STD_PCT:
+        reasons.append(f"erratic EPS surprises (standard deviation {columns['eps_surprise_std_pct']:.1f}%)")
+    if reasons:
+        return None, reasons
+
+    return ForwardPeSanityCheck(
+        symbol=symbol,
+        earnings_data_quality=EarningsQuality.HIGH_QUALITY,
+        consensus_reliability=ValuationConfidence.HIGH,
+        long_form_analysis=(
+            f"Rule-based check: {int(columns['quarters_reported'])} quarters of reported EPS with a coefficient of "
+            f"variation of {columns['eps_coefficient_of_variation']:.2f} and EPS surprises averaging "
+            f"{columns['eps_surprise_mean_pct']:.1f}% (standard deviation {columns['eps_surprise_std_pct']:.1f}%). "
+            f"Next-quarter consensus of {columns['consensus_eps_next_quarter']:g} is "
+            f"{columns['consensus_yoy_growth_pct']:+.1f}% against the year-ago quarter, giving a forward P/E of "
+            f"{columns['forward_pe']:.1f} on trailing P/E {columns['trailing_pe']:.1f}."
+        ),
+        is_realistic=ForwardPeSanityCheckRealistic.REALISTIC,
+        critical_insights=(
+            f"Consensus is in line with reported history; forward P/E {columns['forward_pe']:.1f} "
+            f"versus trailing {columns['trailing_pe']:.1f}."
+        )
+    ), []
@@ -1,6 +1,7 @@
 from agents import Agent
 from src.research.historical_earnings.historical_earnings_models import HistoricalEarningsAnalysis
 from src.lib.llm_model import get_model
+from src.lib.alpha_vantage_records import COMPACT_JSON_INSTRUCTIONS
 
 historical_earnings_analysis_agent = Agent(
             name="Historical Earnings Analyst",      
@@ -21,5 +22,5 @@ historical_earnings_analysis_agent = Agent(
             - Earnings quality and predictability indicators
             
             Include critical_insights field with 2-3 key patterns for cross-model calibration.
-        """,
+        """ + COMPACT_JSON_INSTRUCTIONS,
         )
\ No newline at end of file
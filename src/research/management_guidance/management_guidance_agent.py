@@ -1,13 +1,43 @@
 """AI agent for analyzing management guidance from earnings calls."""
 
+import asyncio
+import json
 import logging
-from typing import Dict, Any, Optional
+import os
+from typing import Dict, Any, List, Optional
 from agents import Agent, Runner, RunResult
 from src.lib.llm_model import get_model
-from src.research.management_guidance.management_guidance_models import ManagementGuidanceData, ManagementGuidanceAnalysis, GuidanceTone, GuidanceConfidence, ConsensusValidationSignal
+from src.lib.transcript_chunk_cache import content_hash, get_transcript_chunk_cache
+from src.research.management_guidance.management_guidance_models import ManagementGuidanceData, ManagementGuidanceAnalysis, GuidanceTone, GuidanceConfidence, ConsensusValidationSignal, TranscriptChunkGuidance
 
 log = logging.getLogger(__name__)
 
+# Transcripts longer than one chunk are summarized map-reduce style: guidance is extracted from
+# each speaker-segment chunk in parallel and the merged extractions are analyzed once.
+TRANSCRIPT_CHUNK_MAX_CHARS = int(os.getenv("TRANSCRIPT_CHUNK_MAX_CHARS", "12000"))
+MAX_CONCURRENT_CHUNK_EXTRACTIONS = int(os.getenv("MANAGEMENT_GUIDANCE_MAX_CONCURRENT_CHUNKS", "4"))
+# Bump when the extraction prompt or output model changes so cached chunk results are not reused
+CHUNK_EXTRACTION_VERSION = "v1"
+
+guidance_chunk_extraction_agent = Agent(
+    name="Management Guidance Chunk Extractor",
+    model=get_model(),
+    output_type=TranscriptChunkGuidance,
+    instructions="""
+    Extract management guidance from one excerpt of an earnings call transcript.
+
+    ENUM REQUIREMENTS:
+    - tone: GuidanceTone (OPTIMISTIC, CAUTIOUS, NEUTRAL, PESSIMISTIC, MIXED_SIGNALS)
+    - guidance_indicators direction: GuidanceDirection (POSITIVE, NEGATIVE, NEUTRAL, UNCLEAR)
+
+    EXTRACTION RULES:
+    - Only report what is stated in this excerpt; do not infer from outside knowledge
+    - Capture forward-looking statements on revenue, margins, expenses and EPS with a short quote as context
+    - List vague terms, buzzwords without metrics and blame deflection under evasive_language
+    - Keep chunk_summary to 2-3 sentences; leave lists empty when the excerpt has no guidance
+    """
+)
+
 management_guidance_analysis_agent = Agent(
     name="Management Guidance Analyst",
     model=get_model(),
@@ -20,6 +50,10 @@ management_guidance_analysis_agent = Agent(
     - guidance_direction fields: GuidanceDirection (POSITIVE, NEGATIVE, NEUTRAL, UNCLEAR)
     - consensus_validation_signal: ConsensusValidationSignal (BULLISH, BEARISH, NEUTRAL, MIXED)
 
+    INPUT:
+    - Either the full transcript, or chunk_guidance: guidance already extracted from each part of a
+      long transcript (indicators, risks, opportunities, per-chunk tone counts and summaries)
+
     ANALYSIS APPROACH:
     - Extract forward-looking statements on revenue, margins, expenses, EPS
     - Flag evasive language: vague terms, buzzwords without metrics, blame deflection
@@ -66,15 +100,26 @@ async def management_guidance_agent(
         log.warning(f"No earnings transcript available for {symbol}")
         return _create_no_transcript_analysis(symbol)
     
-    # Extract transcript content
-    transcript_content = _extract_transcript_content(guidance_data.earnings_transcript)
-    if not transcript_content:
+    # Split the transcript into speaker segments
+    segments = _extract_transcript_segments(guidance_data.earnings_transcript)
+    if not segments:
         log.warning(f"Could not extract transcript content for {symbol}")
         return _create_no_transcript_analysis(symbol)
-    
+    chunks = _chunk_transcript(segments)
+
     try:
+        if len(chunks) == 1:
+            transcript_input = f"transcript: {chunks[0]}"
+        else:
+            # Map: extract guidance per chunk in parallel; reduce: merge before the final analysis
+            chunk_results = await _extract_chunk_guidance(symbol, chunks, content_hash("\n\n".join(segments)))
+            transcript_input = f"chunk_guidance: {json.dumps(_merge_chunk_guidance(chunk_results))}"
+
         # Build input with optional context
-        input_data = f"symbol: {symbol}, guidance_data: {guidance_data}"
+        input_data = (
+            f"symbol: {symbol}, quarter: {guidance_data.quarter}, "
+            f"earnings_estimates: {guidance_data.earnings_estimates}, {transcript_input}"
+        )
         if historical_earnings_analysis:
             input_data += f", historical_earnings_analysis: {historical_earnings_analysis}"
         if financial_statements_analysis:
@@ -97,8 +142,8 @@ async def management_guidance_agent(
 
 
 
-def _extract_transcript_content(transcript_data: Dict[str, Any]) -> str:
-    """Extracts the actual transcript content from API response."""
+def _extract_transcript_segments(transcript_data: Dict[str, Any]) -> List[str]:
+    """Extracts the transcript as a list of speaker segments (or paragraphs for plain text)."""
     try:
         # Alpha Vantage returns transcript as an array of speaker objects
         if 'transcript' in transcript_data and isinstance(transcript_data['transcript'], list):
@@ -117,9 +162,8 @@ def _extract_transcript_content(transcript_data: Dict[str, Any]) -> str:
                         transcript_parts.append(f"{speaker_info}: {content}")
             
             if transcript_parts:
-                full_transcript = "\n\n".join(transcript_parts)
-                log.info(f"Successfully extracted transcript with {len(transcript_parts)} segments, {len(full_transcript)} characters")
-                return full_transcript
+                log.info(f"Successfully extracted transcript with {len(transcript_parts)} segments, {sum(len(part) for part in transcript_parts)} characters")
+                return transcript_parts
         
         # Fallback: Try other possible keys for transcript content
         content_keys = ['transcript', 'content', 'text', 'body']
@@ -128,20 +172,147 @@ def _extract_transcript_content(transcript_data: Dict[str, Any]) -> str:
             if key in transcript_data and transcript_data[key]:
                 content = transcript_data[key]
                 if isinstance(content, str) and len(content) > 100:
-                    return content
+                    return _split_paragraphs(content)
         
         # If no direct content, try to extract from nested structures
         if isinstance(transcript_data, dict):
             for value in transcript_data.values():
                 if isinstance(value, str) and len(value) > 100:
-                    return value
+                    return _split_paragraphs(value)
         
         log.warning("Could not find transcript content in response")
-        return ""
+        return []
         
     except Exception as e:
         log.error(f"Error extracting transcript content: {e}")
-        return ""
+        return []
+
+
+def _split_paragraphs(content: str) -> List[str]:
+    return [paragraph.strip() for paragraph in content.split("\n\n") if paragraph.strip()]
+
+
+def _extract_transcript_content(transcript_data: Dict[str, Any]) -> str:
+    """Extracts the actual transcript content from API response."""
+    return "\n\n".join(_extract_transcript_segments(transcript_data))
+
+
+def _chunk_transcript(segments: List[str], max_chars: Optional[int] = None) -> List[str]:
+    """
+    Packs speaker segments into chunks of at most max_chars without splitting a segment.
+
+    A single segment longer than max_chars (default TRANSCRIPT_CHUNK_MAX_CHARS) is split on whitespace.
+    """
+    max_chars = max_chars or TRANSCRIPT_CHUNK_MAX_CHARS
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for segment in segments:
+        pieces = [segment]
+        if len(segment) > max_chars:
+            pieces = []
+            while len(segment) > max_chars:
+                cut = segment.rfind(" ", 0, max_chars)
+                cut = cut if cut > 0 else max_chars
+                pieces.append(segment[:cut])
+                segment = segment[cut:].lstrip()
+            if segment:
+                pieces.append(segment)
+
+        for piece in pieces:
+            # +2 for the blank line joining segments
+            if current and current_len + len(piece) + 2 > max_chars:
+                chunks.append("\n\n".join(current))
+                current, current_len = [], 0
+            current.append(piece)
+            current_len += len(piece) + (2 if current_len else 0)
+
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+async def _extract_chunk_guidance(symbol: str, chunks: List[str], transcript_hash: str) -> List[TranscriptChunkGuidance]:
+    """
+    Extracts guidance from each chunk concurrently, reusing cached results for the transcript.
+
+    Args:
+        symbol: Stock symbol being analyzed
+        chunks: Transcript chunks in call order
+        transcript_hash: content_hash of the full transcript, used as the cache key
+
+    Returns:
+        Extraction results in chunk order (chunks that failed are omitted)
+
+    Raises:
+        RuntimeError: If no chunk could be extracted
+    """
+    cache = get_transcript_chunk_cache()
+    cached = cache.get_chunks(transcript_hash)
+    chunk_keys = [f"{CHUNK_EXTRACTION_VERSION}:{content_hash(chunk)}" for chunk in chunks]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNK_EXTRACTIONS)
+
+    async def extract(index: int) -> Optional[TranscriptChunkGuidance]:
+        if chunk_keys[index] in cached:
+            try:
+                return TranscriptChunkGuidance(**cached[chunk_keys[index]])
+            except Exception as e:
+                log.warning(f"Ignoring unreadable cached chunk {index + 1} for {symbol}: {e}")
+        async with semaphore:
+            try:
+                result: RunResult = await Runner.run(
+                    guidance_chunk_extraction_agent,
+                    input=f"symbol: {symbol}, transcript excerpt {index + 1} of {len(chunks)}:\n{chunks[index]}"
+                )
+                return result.final_output
+            except Exception as e:
+                log.warning(f"Guidance extraction failed for {symbol} chunk {index + 1}/{len(chunks)}: {e}")
+                return None
+
+    results = await asyncio.gather(*(extract(index) for index in range(len(chunks))))
+
+    new_results = {
+        chunk_keys[index]: result.model_dump(mode="json")
+        for index, result in enumerate(results)
+        if result is not None and chunk_keys[index] not in cached
+    }
+    cache.put_chunks(transcript_hash, new_results)
+    log.info(f"Extracted guidance for {symbol} from {len(chunks)} transcript chunks ({len(chunks) - len(new_results)} cached or failed)")
+
+    extracted = [result for result in results if result is not None]
+    if not extracted:
+        raise RuntimeError("Guidance extraction failed for every transcript chunk")
+    return extracted
+
+
+def _merge_chunk_guidance(chunk_results: List[TranscriptChunkGuidance]) -> Dict[str, Any]:
+    """Reduces per-chunk extractions into one deduplicated summary for the final analysis."""
+    def unique(items: List[str]) -> List[str]:
+        seen = set()
+        merged = []
+        for item in items:
+            key = item.strip().lower()
+            if key and key not in seen:
+                seen.add(key)
+                merged.append(item.strip())
+        return merged
+
+    indicators: Dict[tuple, Dict[str, Any]] = {}
+    tone_counts: Dict[str, int] = {}
+    for result in chunk_results:
+        for indicator in result.guidance_indicators:
+            key = (indicator.type.lower(), indicator.direction.value, indicator.context.strip().lower())
+            indicators.setdefault(key, indicator.model_dump(mode="json"))
+        tone_counts[result.tone.value] = tone_counts.get(result.tone.value, 0) + 1
+
+    return {
+        "guidance_indicators": list(indicators.values()),
+        "risk_factors_mentioned": unique([item for result in chunk_results for item in result.risk_factors_mentioned]),
+        "opportunities_mentioned": unique([item for result in chunk_results for item in result.opportunities_mentioned]),
+        "evasive_language": unique([item for result in chunk_results for item in result.evasive_language]),
+        "chunk_tone_counts": tone_counts,
+        "chunk_summaries": [result.chunk_summary for result in chunk_results],
+    }
 
 
 def _create_no_transcript_analysis(symbol: str) -> ManagementGuidanceAnalysis:
@@ -78,4 +78,15 @@ class ManagementGuidanceAnalysis(BaseModel):
     
     # Metadata
     long_form_analysis: str = Field(description="Additional analysis notes and context")
-    critical_insights: str = Field(description="Critical insights for model calibration across all analyses")
\ No newline at end of file
+    critical_insights: str = Field(description="Critical insights for model calibration across all analyses")
+
+
+class TranscriptChunkGuidance(BaseModel):
+    """Guidance extracted from one speaker-segment chunk of an earnings call transcript."""
+
+    guidance_indicators: List[GuidanceIndicator] = Field(default_factory=list, description="Guidance indicators stated in this chunk")
+    risk_factors_mentioned: List[str] = Field(default_factory=list, description="Risk factors mentioned in this chunk")
+    opportunities_mentioned: List[str] = Field(default_factory=list, description="Opportunities mentioned in this chunk")
+    tone: GuidanceTone = Field(description="Management tone in this chunk")
+    evasive_language: List[str] = Field(default_factory=list, description="Vague or evasive statements in this chunk")
+    chunk_summary: str = Field(description="Short summary of forward-looking content in this chunk")
@@ -1,9 +1,11 @@
 """Utility functions for management guidance analysis."""
 
 import logging
-from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from src.lib.alpha_vantage_api import call_alpha_vantage_earnings_estimates, call_alpha_vantage_earnings_call_transcripts
+from src.lib.transcript_archive import TranscriptArchive, get_transcript_archive
 from src.research.management_guidance.management_guidance_models import ManagementGuidanceData
 
 log = logging.getLogger(__name__)
@@ -24,23 +26,7 @@ def get_management_guidance_data_for_symbol(symbol: str) -> ManagementGuidanceDa
         earnings_estimates = call_alpha_vantage_earnings_estimates(symbol)
         
         # Determine the most recent completed quarter for transcript lookup
-        quarter = _determine_latest_transcript_quarter()
-        
-        # Try to get the earnings call transcript for the recent quarter
-        earnings_transcript = None
-        try:
-            earnings_transcript = call_alpha_vantage_earnings_call_transcripts(symbol, quarter)
-            log.info(f"Retrieved earnings transcript for {symbol} Q{quarter}")
-        except Exception as transcript_error:
-            log.warning(f"Could not retrieve earnings transcript for {symbol} Q{quarter}: {transcript_error}")
-            # Try previous quarter as backup
-            try:
-                prev_quarter = _get_previous_quarter(quarter)
-                earnings_transcript = call_alpha_vantage_earnings_call_transcripts(symbol, prev_quarter)
-                quarter = prev_quarter
-                log.info(f"Retrieved earnings transcript for {symbol} Q{prev_quarter} (fallback)")
-            except Exception as prev_error:
-                log.warning(f"Could not retrieve earnings transcript for previous quarter either: {prev_error}")
+        quarter, earnings_transcript = get_latest_earnings_transcript(symbol, _determine_latest_transcript_quarter())
         
         guidance_data = ManagementGuidanceData(
             symbol=symbol,
@@ -62,6 +48,73 @@ def get_management_guidance_data_for_symbol(symbol: str) -> ManagementGuidanceDa
         )
 
 
+def get_latest_earnings_transcript(symbol: str, quarter: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Gets the transcript for a quarter, falling back to the previous quarter.
+
+    The transcript archive is checked first. Quarters recently found to be unpublished are
+    skipped until their negative TTL expires, and when both quarters have to be requested
+    the two EARNINGS_CALL_TRANSCRIPT calls are issued concurrently.
+
+    Args:
+        symbol: Stock symbol
+        quarter: Preferred quarter in YYYYQM format
+
+    Returns:
+        Tuple of (quarter, transcript) for the first available quarter, or (None, None)
+    """
+    archive = get_transcript_archive()
+    quarters = [quarter, _get_previous_quarter(quarter)]
+
+    transcripts: Dict[str, Optional[Dict[str, Any]]] = {}
+    to_fetch: List[str] = []
+    for candidate in quarters:
+        transcripts[candidate] = archive.get(symbol, candidate)
+        if transcripts[candidate] is not None:
+            # An archived preferred quarter makes the fallback irrelevant
+            if candidate == quarter:
+                break
+        elif archive.is_known_missing(symbol, candidate):
+            log.info(f"Skipping transcript request for {symbol} Q{candidate}: recently unavailable")
+        else:
+            to_fetch.append(candidate)
+
+    if to_fetch and transcripts.get(quarter) is None:
+        with ThreadPoolExecutor(max_workers=len(to_fetch)) as executor:
+            fetched = dict(zip(to_fetch, executor.map(lambda q: _fetch_transcript(symbol, q, archive), to_fetch)))
+        transcripts.update(fetched)
+
+    for candidate in quarters:
+        if transcripts.get(candidate):
+            if candidate != quarter:
+                log.info(f"Using earnings transcript for {symbol} Q{candidate} (fallback)")
+            return candidate, transcripts[candidate]
+
+    log.warning(f"No earnings transcript available for {symbol} in {quarters}")
+    return None, None
+
+
+def _fetch_transcript(symbol: str, quarter: str, archive: TranscriptArchive) -> Optional[Dict[str, Any]]:
+    """Requests one quarter's transcript and records the outcome in the archive."""
+    try:
+        transcript = call_alpha_vantage_earnings_call_transcripts(symbol, quarter)
+    except Exception as transcript_error:
+        # Transient failures are not recorded so the next run retries
+        log.warning(f"Could not retrieve earnings transcript for {symbol} Q{quarter}: {transcript_error}")
+        return None
+
+    if not isinstance(transcript, dict) or "Information" in transcript or "Note" in transcript:
+        log.warning(f"Earnings transcript request for {symbol} Q{quarter} was throttled or malformed")
+        return None
+    if not transcript.get("transcript"):
+        archive.record_missing(symbol, quarter)
+        return None
+
+    archive.put(symbol, quarter, transcript)
+    log.info(f"Retrieved earnings transcript for {symbol} Q{quarter}")
+    return transcript
+
+
 def _determine_latest_transcript_quarter() -> str:
     """
     Determines the most recent quarter that would have a transcript available.
@@ -9,6 +9,12 @@ ENUM REQUIREMENTS:
 - sentiment_trend: SentimentTrend (IMPROVING, DETERIORATING, STABLE_POSITIVE, STABLE_NEGATIVE, VOLATILE, INSUFFICIENT_DATA)
 - news_volume: NewsVolume (HIGH_VOLUME, MODERATE_VOLUME, LOW_VOLUME, SPARSE_COVERAGE)
 
+INPUT:
+- news_sentiment_features is a per-ticker table: article count, relevance-weighted sentiment,
+  dispersion (disagreement between articles), mean relevance, trend slope (score change per day),
+  bullish/bearish label shares and rolling 1d/7d/30d mean scores, followed by the most relevant articles
+- Use article count for news_volume and dispersion/trend slope for sentiment_trend and confidence
+
 ANALYSIS APPROACH:
 - Determine overall sentiment direction (bullish, bearish, neutral) and provide label
 - Cross-reference sentiment with earnings projections and management guidance when available
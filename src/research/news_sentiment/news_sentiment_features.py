@@ -0,0 +1,178 @@
+"""Numeric aggregation of raw news sentiment feeds into compact per-ticker features."""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.research.news_sentiment.news_sentiment_models import (
+    RawNewsSentimentFeed,
+    RawNewsSentimentSummary,
+    NewsSentimentExemplar,
+    NewsSentimentFeatures
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_K = 3
+
+
+def _to_float(value: Any, default: float = np.nan) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _published_days(time_published: Optional[str]) -> float:
+    """Publish time as fractional days since the epoch, NaN when missing or unparseable."""
+    if not time_published:
+        return np.nan
+    fmt = "%Y%m%dT%H%M%S" if len(time_published) > 13 else "%Y%m%dT%H%M"
+    try:
+        return datetime.strptime(time_published, fmt).timestamp() / 86400.0
+    except ValueError:
+        return np.nan
+
+
+def _ticker_view(news_item: RawNewsSentimentFeed, symbol: Optional[str]) -> Tuple[float, float, str]:
+    """
+    Sentiment score, relevance and label of one article for a ticker.
+
+    Uses the article's ticker_sentiment entry for the symbol (or its most relevant entry when
+    no symbol is known) and falls back to the overall article sentiment.
+    """
+    entries = news_item.ticker_sentiment
+    entry: Optional[Dict[str, Any]] = None
+    if symbol:
+        entry = next((e for e in entries if e.get("ticker") == symbol), None)
+    elif entries:
+        entry = max(entries, key=lambda e: _to_float(e.get("relevance_score"), 0.0))
+
+    if entry is not None:
+        score = _to_float(entry.get("ticker_sentiment_score"))
+        if not np.isnan(score):
+            return score, _to_float(entry.get("relevance_score"), 0.0), entry.get("ticker_sentiment_label", news_item.overall_sentiment_label)
+
+    return news_item.overall_sentiment_score, _to_float(entry.get("relevance_score"), 0.0) if entry else 0.0, news_item.overall_sentiment_label
+
+
+def compute_news_sentiment_features(summary: RawNewsSentimentSummary, top_k: int = DEFAULT_TOP_K) -> NewsSentimentFeatures:
+    """
+    Computes relevance-weighted sentiment statistics for one ticker's feed.
+
+    Args:
+        summary: Raw news sentiment summary for a ticker
+        top_k: Number of most relevant articles to keep as exemplars
+
+    Returns:
+        NewsSentimentFeatures with weighted sentiment, dispersion, volume, trend slope and exemplars
+    """
+    views = [_ticker_view(news_item, summary.symbol) for news_item in summary.feed]
+    if not views:
+        return NewsSentimentFeatures(symbol=summary.symbol, article_count=0, rolling_sentiment=summary.rolling_sentiment)
+
+    scores = np.array([view[0] for view in views], dtype=np.float64)
+    relevance = np.array([view[1] for view in views], dtype=np.float64)
+    labels = [view[2] or "" for view in views]
+    days = np.array([_published_days(news_item.time_published) for news_item in summary.feed], dtype=np.float64)
+
+    # Relevance-weighted mean and standard deviation; equal weights if no relevance is reported
+    weights = relevance if relevance.sum() > 0 else np.ones_like(scores)
+    weighted_sentiment = float(np.average(scores, weights=weights))
+    sentiment_dispersion = float(np.sqrt(np.average((scores - weighted_sentiment) ** 2, weights=weights)))
+
+    # Least-squares slope of sentiment over publish time, in score units per day
+    trend_slope = None
+    dated = ~np.isnan(days)
+    if np.unique(days[dated]).size >= 2:
+        trend_slope = float(np.polyfit(days[dated] - days[dated].min(), scores[dated], 1)[0])
+
+    bullish = np.array(["bullish" in label.lower() for label in labels])
+    bearish = np.array(["bearish" in label.lower() for label in labels])
+
+    # Most relevant first, stronger sentiment breaking ties
+    order = np.lexsort((-np.abs(scores), -relevance))[:top_k]
+    exemplars = [
+        NewsSentimentExemplar(
+            title=summary.feed[i].title,
+            source=summary.feed[i].source,
+            time_published=summary.feed[i].time_published,
+            sentiment_score=round(float(scores[i]), 4),
+            sentiment_label=labels[i],
+            relevance_score=round(float(relevance[i]), 4)
+        )
+        for i in order
+    ]
+
+    return NewsSentimentFeatures(
+        symbol=summary.symbol,
+        article_count=len(views),
+        weighted_sentiment=round(weighted_sentiment, 4),
+        sentiment_dispersion=round(sentiment_dispersion, 4),
+        mean_relevance=round(float(relevance.mean()), 4),
+        trend_slope_per_day=round(trend_slope, 5) if trend_slope is not None else None,
+        bullish_share=round(float(bullish.mean()), 4),
+        bearish_share=round(float(bearish.mean()), 4),
+        rolling_sentiment=summary.rolling_sentiment,
+        exemplars=exemplars
+    )
+
+
+def compute_news_sentiment_feature_table(
+    summaries: List[RawNewsSentimentSummary],
+    top_k: int = DEFAULT_TOP_K
+) -> List[NewsSentimentFeatures]:
+    """
+    Computes features for every ticker in the peer group.
+
+    Args:
+        summaries: Raw news sentiment summaries, one per ticker
+        top_k: Number of exemplars per ticker
+
+    Returns:
+        List of NewsSentimentFeatures in the same order as the summaries
+    """
+    return [compute_news_sentiment_features(summary, top_k) for summary in summaries]
+
+
+def format_news_sentiment_features(features: List[NewsSentimentFeatures]) -> str:
+    """
+    Renders the feature table and exemplars as compact text for the agent prompt.
+
+    Args:
+        features: Per-ticker news sentiment features
+
+    Returns:
+        Pipe-delimited feature table followed by exemplar headlines per ticker
+    """
+    def fmt(value: Optional[float]) -> str:
+        return "n/a" if value is None else f"{value:g}"
+
+    lines = ["ticker | articles | weighted_sentiment | dispersion | mean_relevance | trend_slope_per_day | bullish_share | bearish_share | mean_1d | mean_7d | mean_30d"]
+    for feature in features:
+        rolling = feature.rolling_sentiment or {}
+        lines.append(" | ".join([
+            feature.symbol or "?",
+            str(feature.article_count),
+            fmt(feature.weighted_sentiment),
+            fmt(feature.sentiment_dispersion),
+            fmt(feature.mean_relevance),
+            fmt(feature.trend_slope_per_day),
+            fmt(feature.bullish_share),
+            fmt(feature.bearish_share),
+            *(fmt(rolling.get(window, {}).get("mean_score")) for window in ("1d", "7d", "30d")),
+        ]))
+
+    for feature in features:
+        if not feature.exemplars:
+            continue
+        lines.append(f"\nTop articles for {feature.symbol or '?'}:")
+        for exemplar in feature.exemplars:
+            lines.append(
+                f"- [{exemplar.time_published or 'n/a'}] {exemplar.title or 'untitled'} ({exemplar.source or 'unknown'}) "
+                f"score={fmt(exemplar.sentiment_score)} label={exemplar.sentiment_label} relevance={fmt(exemplar.relevance_score)}"
+            )
+
+    return "\n".join(lines)
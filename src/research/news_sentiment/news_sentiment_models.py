@@ -26,13 +26,14 @@ class NewsVolume(str, enum.Enum):
     SPARSE_COVERAGE = "SPARSE_COVERAGE"
 
 class RawNewsSentimentFeed(BaseModel):
-    # title: str
+    # Kept for trend and exemplar selection in the feature stage; not sent to the agent raw
+    title: Optional[str] = None
+    time_published: Optional[str] = None
+    source: Optional[str] = None
     # url: str
-    # time_published: str
     # authors: List[str]
     # summary: str
     # banner_image: Optional[str]
-    # source: str
     # category_within_source: str
     # source_domain: str
     # topics: List[Dict[str, Any]]
@@ -41,12 +42,37 @@ class RawNewsSentimentFeed(BaseModel):
     ticker_sentiment: List[Dict[str, Any]]
 
 class RawNewsSentimentSummary(BaseModel):
+    symbol: Optional[str] = None
     # items: int
     # sentiment_score_definition: str
     # relevance_score_definition: str
     feed: List[RawNewsSentimentFeed]
+    # Rolling aggregates keyed by window ("1d", "7d", "30d"): count, mean_score, label_distribution
+    rolling_sentiment: Optional[Dict[str, Dict[str, Any]]] = None
     
 
+class NewsSentimentExemplar(BaseModel):
+    title: Optional[str] = None
+    source: Optional[str] = None
+    time_published: Optional[str] = None
+    sentiment_score: float
+    sentiment_label: str
+    relevance_score: float
+
+
+class NewsSentimentFeatures(BaseModel):
+    symbol: Optional[str]
+    article_count: int
+    weighted_sentiment: Optional[float] = None
+    sentiment_dispersion: Optional[float] = None
+    mean_relevance: Optional[float] = None
+    trend_slope_per_day: Optional[float] = None
+    bullish_share: Optional[float] = None
+    bearish_share: Optional[float] = None
+    rolling_sentiment: Optional[Dict[str, Dict[str, Any]]] = None
+    exemplars: List[NewsSentimentExemplar] = []
+
+
 class NewsSentimentSummary(BaseModel):
     symbol: Optional[str]
     sentiment_trend: SentimentTrend
@@ -1,35 +1,169 @@
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Dict, Any, Optional
 from src.lib.alpha_vantage_api import call_alpha_vantage_news_sentiment
+from src.lib.news_article_store import get_news_article_store
 from src.research.news_sentiment.news_sentiment_models import RawNewsSentimentSummary
 import logging
 
 logger = logging.getLogger(__name__)
 
-def get_news_sentiment_summary_for_peer_group(peer_group: List[str]) -> List[RawNewsSentimentSummary]:
+def get_news_sentiment_summary_for_peer_group(peer_group: List[str], symbol: Optional[str] = None) -> List[RawNewsSentimentSummary]:
+    """
+    Fetches news sentiment for every ticker in the peer group and returns one summary per ticker.
+
+    Each ticker's articles are kept in a local store (see NewsArticleStore), so a refresh only
+    requests articles published since the previous run and carries rolling 1d/7d/30d
+    sentiment aggregates alongside the feed.
+
+    NEWS_SENTIMENT treats comma-separated tickers as "mentions all of them", so the per-ticker
+    requests are issued in parallel instead of as one batched call. Articles returned for more
+    than one ticker are deduplicated and each article is attributed to the peer it is most
+    relevant to, with ticker_sentiment trimmed to the peer group. Articles that tag the
+    researched symbol always stay in its feed as well.
+
+    Args:
+        peer_group: Ticker symbols to fetch news for
+        symbol: Symbol being researched, if it is in peer_group
+
+    Returns:
+        List of RawNewsSentimentSummary, one per ticker that returned a feed
+    """
+    tickers = list(dict.fromkeys(peer_group))
+    feeds = _fetch_news_feeds(tickers)
+
+    articles = deduplicate_news_feed(
+        news_item for ticker in tickers for news_item in feeds.get(ticker) or []
+    )
+    feed_by_ticker = split_news_feed_by_ticker(articles, tickers, main_symbol=symbol)
+
     news_sentiment_summaries = []
-    for peer in peer_group:
-        news_sentiment_dict = call_alpha_vantage_news_sentiment(tickers=peer)
-        if "feed" not in news_sentiment_dict:
+    for peer in tickers:
+        if peer not in feeds:
             logger.warning(f"No news sentiment data found for {peer}. Skipping.")
             continue
-        clean_news_sentiment_dict = clean_news_sentiment_of_useless_data(news_sentiment_dict)
-        news_sentiment_summary = RawNewsSentimentSummary(symbol=peer, **clean_news_sentiment_dict)
+        clean_news_sentiment_dict = clean_news_sentiment_of_useless_data({"feed": feed_by_ticker[peer]})
+        news_sentiment_summary = RawNewsSentimentSummary(
+            symbol=peer,
+            rolling_sentiment=get_news_article_store().get_rolling_sentiment(peer),
+            **clean_news_sentiment_dict
+        )
         news_sentiment_summaries.append(news_sentiment_summary)
     return news_sentiment_summaries
-        
+
+
+def _fetch_news_feeds(tickers: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Refreshes each ticker's local article store concurrently and returns its latest feed.
+
+    Only articles newer than the last stored time_published are requested; tickers with
+    neither a stored nor a fetched feed are omitted.
+    """
+    if not tickers:
+        return {}
+
+    store = get_news_article_store()
+
+    def fetch(ticker: str) -> Optional[List[Dict[str, Any]]]:
+        feed = None
+        try:
+            news_sentiment_dict = call_alpha_vantage_news_sentiment(tickers=ticker, time_from=store.next_time_from(ticker))
+            if isinstance(news_sentiment_dict, dict) and "feed" in news_sentiment_dict:
+                feed = news_sentiment_dict["feed"]
+        except Exception as e:
+            logger.warning(f"Failed to fetch news sentiment for {ticker}: {e}")
+
+        stored_feed = store.update(ticker, feed or [])
+        if feed is None and not stored_feed:
+            return None
+        return stored_feed
+
+    with ThreadPoolExecutor(max_workers=len(tickers)) as executor:
+        results = list(executor.map(fetch, tickers))
+
+    return {ticker: feed for ticker, feed in zip(tickers, results) if feed is not None}
+
+
+def _news_item_key(news_item: Dict[str, Any]) -> str:
+    """Identity of a news article: its URL, falling back to title and publish time."""
+    return news_item.get("url") or f"{news_item.get('title', '')}|{news_item.get('time_published', '')}"
+
+
+def deduplicate_news_feed(news_items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Removes repeated articles from a news feed, keeping the first occurrence.
+
+    Args:
+        news_items: Raw NEWS_SENTIMENT feed items, possibly from several requests
+
+    Returns:
+        List of unique feed items in their original order
+    """
+    unique_items: Dict[str, Dict[str, Any]] = {}
+    for news_item in news_items:
+        unique_items.setdefault(_news_item_key(news_item), news_item)
+    return list(unique_items.values())
+
+
+def split_news_feed_by_ticker(
+    news_items: List[Dict[str, Any]],
+    tickers: List[str],
+    main_symbol: Optional[str] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Attributes each article to the ticker in ``tickers`` with the highest relevance score.
+
+    The article's ticker_sentiment is trimmed to the requested tickers so other companies
+    mentioned in passing do not reach the prompt. Articles that mention none of the tickers
+    are dropped. An article that tags main_symbol is also kept in main_symbol's feed when a
+    peer is more relevant, so the researched symbol never loses its own coverage.
+
+    Args:
+        news_items: Deduplicated NEWS_SENTIMENT feed items
+        tickers: Ticker symbols to split the feed across
+        main_symbol: Symbol being researched (one of tickers)
+
+    Returns:
+        Dict mapping every ticker to its (possibly empty) list of feed items
+    """
+    wanted = set(tickers)
+    feed_by_ticker: Dict[str, List[Dict[str, Any]]] = {ticker: [] for ticker in tickers}
+
+    for news_item in news_items:
+        ticker_sentiment = [
+            entry for entry in news_item.get("ticker_sentiment", [])
+            if entry.get("ticker") in wanted
+        ]
+        if not ticker_sentiment:
+            continue
+
+        most_relevant = max(ticker_sentiment, key=lambda entry: _to_float(entry.get("relevance_score")))
+        feed_by_ticker[most_relevant["ticker"]].append({**news_item, "ticker_sentiment": ticker_sentiment})
+        if main_symbol in feed_by_ticker and main_symbol != most_relevant["ticker"] and any(
+            entry.get("ticker") == main_symbol for entry in ticker_sentiment
+        ):
+            feed_by_ticker[main_symbol].append({**news_item, "ticker_sentiment": ticker_sentiment})
+
+    return feed_by_ticker
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
 def clean_news_sentiment_of_useless_data(news_sentiment_dict: Dict[str, Any]) -> Dict[str, Any]:
     news_sentiment_dict.pop("items", None)
     news_sentiment_dict.pop("sentiment_score_definition", None)
     news_sentiment_dict.pop("relevance_score_definition", None)
     for news_item in news_sentiment_dict["feed"]:
-            news_item.pop("title", None)
+            # title, time_published and source are kept for the feature stage
             news_item.pop("url", None)
-            news_item.pop("time_published", None)
             news_item.pop("authors", None)
             news_item.pop("summary", None)
             news_item.pop("banner_image", None)
-            news_item.pop("source", None)
             news_item.pop("category_within_source", None)
             news_item.pop("source_domain", None)
             news_item.pop("topics", None)
-    return news_sentiment_dict
\ No newline at end of file
+    return news_sentiment_dict
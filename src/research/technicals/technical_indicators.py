@@ -0,0 +1,377 @@
+"""Vectorized technical indicators over daily prices, with O(1) updates per new bar."""
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.research.technicals.technicals_models import TechnicalIndicators
+
+SMA_PERIODS = (20, 50, 200)
+EMA_PERIODS = (20, 50)
+RSI_PERIOD = 14
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+BOLLINGER_PERIOD = 20
+BOLLINGER_STDDEV = 2.0
+ATR_PERIOD = 14
+VOLATILITY_PERIOD = 20
+TRADING_DAYS_PER_YEAR = 252
+
+# Exponential averages kept by the incremental engine (the MACD ones included)
+_EMA_STATE_PERIODS = tuple(sorted(set(EMA_PERIODS) | {MACD_FAST, MACD_SLOW}))
+# Bars the engine keeps for its rolling windows: the longest SMA, and the closes of the
+# volatility window's returns
+_WINDOW = max(max(SMA_PERIODS), BOLLINGER_PERIOD, VOLATILITY_PERIOD + 1)
+# Powers of the decay factor stay well inside float64 range within a block
+_EWM_BLOCK = 64
+
+
+def _ewm(values: np.ndarray, alpha: float, initial: float) -> np.ndarray:
+    """
+    Exponential smoothing y[t] = (1 - alpha) * y[t-1] + alpha * x[t], with y[-1] = initial.
+
+    The recursion is evaluated in closed form over blocks of values, so it runs in NumPy
+    instead of a Python loop over every bar.
+    """
+    out = np.empty(len(values), dtype=np.float64)
+    decay = 1.0 - alpha
+    previous = initial
+    for start in range(0, len(values), _EWM_BLOCK):
+        block = values[start:start + _EWM_BLOCK]
+        powers = decay ** np.arange(1, len(block) + 1)
+        out[start:start + len(block)] = powers * (previous + alpha * np.cumsum(block / powers))
+        previous = out[start + len(block) - 1]
+    return out
+
+
+def _nan(length: int) -> np.ndarray:
+    return np.full(length, np.nan)
+
+
+def _seeded_average(values: np.ndarray, period: int, alpha: float) -> np.ndarray:
+    """Exponential average seeded with the simple average of the first period values."""
+    out = _nan(len(values))
+    if len(values) >= period:
+        seed = float(values[:period].mean())
+        out[period - 1] = seed
+        out[period:] = _ewm(values[period:], alpha, seed)
+    return out
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average (NaN until period values are available)."""
+    out = _nan(len(values))
+    if len(values) >= period:
+        out[period - 1:] = sliding_window_view(values, period).mean(axis=1)
+    return out
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average with smoothing 2 / (period + 1), seeded with the SMA."""
+    return _seeded_average(values, period, 2.0 / (period + 1))
+
+
+def _rsi_value(avg_gain: float, avg_loss: float) -> float:
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+def rsi(close: np.ndarray, period: int = RSI_PERIOD) -> Dict[str, np.ndarray]:
+    """
+    Wilder's relative strength index.
+
+    Returns:
+        Dict with 'rsi' and the smoothed 'avg_gain' and 'avg_loss' it is computed from
+    """
+    changes = np.diff(close, prepend=np.nan)[1:]
+    avg_gain, avg_loss = _nan(len(close)), _nan(len(close))
+    avg_gain[1:] = _seeded_average(np.maximum(changes, 0.0), period, 1.0 / period)
+    avg_loss[1:] = _seeded_average(np.maximum(-changes, 0.0), period, 1.0 / period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    values = np.where(avg_loss == 0, np.where(avg_gain > 0, 100.0, 50.0), values)
+    values[np.isnan(avg_gain)] = np.nan
+    return {"rsi": values, "avg_gain": avg_gain, "avg_loss": avg_loss}
+
+
+def macd(close: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Moving average convergence/divergence with its signal line and histogram.
+
+    Returns:
+        Dict with 'macd', 'signal' and 'histogram'
+    """
+    line = ema(close, MACD_FAST) - ema(close, MACD_SLOW)
+    signal = _nan(len(close))
+    signal[MACD_SLOW - 1:] = ema(line[MACD_SLOW - 1:], MACD_SIGNAL)
+    return {"macd": line, "signal": signal, "histogram": line - signal}
+
+
+def bollinger_bands(close: np.ndarray, period: int = BOLLINGER_PERIOD, stddev: float = BOLLINGER_STDDEV) -> Dict[str, np.ndarray]:
+    """
+    Bollinger bands around the SMA at stddev population standard deviations.
+
+    Returns:
+        Dict with 'upper', 'middle' and 'lower'
+    """
+    middle, width = _nan(len(close)), _nan(len(close))
+    if len(close) >= period:
+        windows = sliding_window_view(close, period)
+        middle[period - 1:] = windows.mean(axis=1)
+        width[period - 1:] = stddev * windows.std(axis=1)
+    return {"upper": middle + width, "middle": middle, "lower": middle - width}
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Daily true range; the first bar has no previous close and uses high - low."""
+    previous_close = np.concatenate(([np.nan], close[:-1]))
+    ranges = np.vstack([high - low, np.abs(high - previous_close), np.abs(low - previous_close)])
+    return np.nanmax(ranges, axis=0)
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = ATR_PERIOD) -> np.ndarray:
+    """Wilder's average true range."""
+    return _seeded_average(true_range(high, low, close), period, 1.0 / period)
+
+
+def realized_volatility(close: np.ndarray, period: int = VOLATILITY_PERIOD) -> np.ndarray:
+    """Annualized standard deviation of daily log returns over the last period returns."""
+    out = _nan(len(close))
+    if len(close) > period:
+        returns = np.diff(np.log(close))
+        out[period:] = sliding_window_view(returns, period).std(axis=1, ddof=1) * math.sqrt(TRADING_DAYS_PER_YEAR)
+    return out
+
+
+def compute_indicators(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Every indicator over a full price history.
+
+    Args:
+        high: Daily highs, oldest first
+        low: Daily lows
+        close: Daily closes
+
+    Returns:
+        Dict of indicator name to an array aligned with the input bars (NaN while warming up)
+    """
+    indicators: Dict[str, np.ndarray] = {}
+    for period in SMA_PERIODS:
+        indicators[f"sma_{period}"] = sma(close, period)
+    for period in _EMA_STATE_PERIODS:
+        indicators[f"ema_{period}"] = ema(close, period)
+    rsi_values = rsi(close)
+    indicators[f"rsi_{RSI_PERIOD}"] = rsi_values["rsi"]
+    indicators["rsi_avg_gain"], indicators["rsi_avg_loss"] = rsi_values["avg_gain"], rsi_values["avg_loss"]
+    macd_values = macd(close)
+    indicators["macd"], indicators["macd_signal"], indicators["macd_histogram"] = (
+        macd_values["macd"], macd_values["signal"], macd_values["histogram"]
+    )
+    bands = bollinger_bands(close)
+    indicators["bollinger_upper"], indicators["bollinger_middle"], indicators["bollinger_lower"] = (
+        bands["upper"], bands["middle"], bands["lower"]
+    )
+    indicators[f"atr_{ATR_PERIOD}"] = atr(high, low, close)
+    indicators[f"realized_volatility_{VOLATILITY_PERIOD}d"] = realized_volatility(close)
+    return indicators
+
+
+def _value(value: float) -> Optional[float]:
+    return None if value is None or math.isnan(value) else float(value)
+
+
+class TechnicalIndicatorEngine:
+    """
+    Latest technical indicators of one symbol, updated bar by bar.
+
+    The engine is built from a full history with the vectorized functions, then keeps the
+    state of each recursive average (EMAs, Wilder's RSI and ATR averages) and the last bars
+    of the rolling windows, so each new daily bar is an O(1) update. Until the history is
+    longer than the rolling windows it is simply recomputed, which keeps the results
+    identical to compute_indicators over the whole history.
+    """
+
+    def __init__(self):
+        """Initialize an empty engine."""
+        self.count = 0
+        self.dates: List[str] = []
+        self.high: List[float] = []
+        self.low: List[float] = []
+        self.close: List[float] = []
+        self.ema: Dict[int, Optional[float]] = {period: None for period in _EMA_STATE_PERIODS}
+        self.macd_signal: Optional[float] = None
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+        self.atr: Optional[float] = None
+
+    @property
+    def last_date(self) -> Optional[str]:
+        """Date of the latest bar (YYYY-MM-DD)."""
+        return self.dates[-1] if self.dates else None
+
+    @classmethod
+    def from_prices(
+        cls,
+        dates: Sequence[Any],
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray
+    ) -> "TechnicalIndicatorEngine":
+        """
+        Build the engine from a price history.
+
+        Args:
+            dates: Bar dates, oldest first
+            high: Daily highs
+            low: Daily lows
+            close: Daily closes
+
+        Returns:
+            Engine positioned at the last bar
+        """
+        engine = cls()
+        engine._load(
+            [str(day) for day in dates],
+            np.asarray(high, dtype=np.float64),
+            np.asarray(low, dtype=np.float64),
+            np.asarray(close, dtype=np.float64),
+            len(dates)
+        )
+        return engine
+
+    def _load(self, dates: List[str], high: np.ndarray, low: np.ndarray, close: np.ndarray, count: int) -> None:
+        indicators = compute_indicators(high, low, close)
+        self.count = count
+        self.dates = dates[-_WINDOW:]
+        self.high, self.low, self.close = high[-_WINDOW:].tolist(), low[-_WINDOW:].tolist(), close[-_WINDOW:].tolist()
+        self.ema = {period: _value(indicators[f"ema_{period}"][-1]) for period in _EMA_STATE_PERIODS}
+        self.macd_signal = _value(indicators["macd_signal"][-1])
+        self.avg_gain = _value(indicators["rsi_avg_gain"][-1])
+        self.avg_loss = _value(indicators["rsi_avg_loss"][-1])
+        self.atr = _value(indicators[f"atr_{ATR_PERIOD}"][-1])
+
+    def update(self, date: Any, high: float, low: float, close: float) -> None:
+        """
+        Add the next daily bar.
+
+        Args:
+            date: Bar date, after the latest one
+            high: Day high
+            low: Day low
+            close: Day close
+
+        Raises:
+            ValueError: If the bar is not newer than the latest bar
+        """
+        date = str(date)
+        if self.last_date is not None and date <= self.last_date:
+            raise ValueError(f"Bar {date} is not after the latest bar {self.last_date}")
+
+        if self.count < _WINDOW:
+            # The kept bars are still the whole history
+            self._load(
+                self.dates + [date],
+                np.array(self.high + [high]),
+                np.array(self.low + [low]),
+                np.array(self.close + [close]),
+                self.count + 1
+            )
+            return
+
+        previous_close = self.close[-1]
+        for period in _EMA_STATE_PERIODS:
+            alpha = 2.0 / (period + 1)
+            self.ema[period] = (1 - alpha) * self.ema[period] + alpha * close
+        signal_alpha = 2.0 / (MACD_SIGNAL + 1)
+        macd_line = self.ema[MACD_FAST] - self.ema[MACD_SLOW]
+        self.macd_signal = (1 - signal_alpha) * self.macd_signal + signal_alpha * macd_line
+        change = close - previous_close
+        self.avg_gain = (self.avg_gain * (RSI_PERIOD - 1) + max(change, 0.0)) / RSI_PERIOD
+        self.avg_loss = (self.avg_loss * (RSI_PERIOD - 1) + max(-change, 0.0)) / RSI_PERIOD
+        current_range = max(high - low, abs(high - previous_close), abs(low - previous_close))
+        self.atr = (self.atr * (ATR_PERIOD - 1) + current_range) / ATR_PERIOD
+
+        self.count += 1
+        for values, value in ((self.dates, date), (self.high, high), (self.low, low), (self.close, close)):
+            values.append(value)
+            del values[:-_WINDOW]
+
+    def snapshot(self, symbol: str) -> TechnicalIndicators:
+        """
+        Indicators as of the latest bar.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            TechnicalIndicators with None for indicators still warming up
+        """
+        close = np.array(self.close)
+        values: Dict[str, Optional[float]] = {}
+        for period in SMA_PERIODS:
+            values[f"sma_{period}"] = float(close[-period:].mean()) if self.count >= period else None
+        for period in EMA_PERIODS:
+            values[f"ema_{period}"] = self.ema[period]
+
+        if self.ema[MACD_SLOW] is not None:
+            values["macd"] = self.ema[MACD_FAST] - self.ema[MACD_SLOW]
+            if self.macd_signal is not None:
+                values["macd_signal"] = self.macd_signal
+                values["macd_histogram"] = values["macd"] - self.macd_signal
+        if self.avg_gain is not None:
+            values[f"rsi_{RSI_PERIOD}"] = _rsi_value(self.avg_gain, self.avg_loss)
+        if self.count >= BOLLINGER_PERIOD:
+            window = close[-BOLLINGER_PERIOD:]
+            middle, width = float(window.mean()), BOLLINGER_STDDEV * float(window.std())
+            values.update(bollinger_upper=middle + width, bollinger_middle=middle, bollinger_lower=middle - width)
+        values[f"atr_{ATR_PERIOD}"] = self.atr
+        if self.count > VOLATILITY_PERIOD:
+            returns = np.diff(np.log(close[-(VOLATILITY_PERIOD + 1):]))
+            values[f"realized_volatility_{VOLATILITY_PERIOD}d"] = float(returns.std(ddof=1) * math.sqrt(TRADING_DAYS_PER_YEAR))
+
+        return TechnicalIndicators(
+            symbol=symbol,
+            as_of=self.last_date,
+            close=self.close[-1] if self.close else None,
+            bars=self.count,
+            **values
+        )
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable engine state."""
+        return {
+            "count": self.count,
+            "dates": self.dates,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "ema": {str(period): value for period, value in self.ema.items()},
+            "macd_signal": self.macd_signal,
+            "avg_gain": self.avg_gain,
+            "avg_loss": self.avg_loss,
+            "atr": self.atr,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "TechnicalIndicatorEngine":
+        """
+        Restore an engine saved with to_state.
+
+        Args:
+            state: Engine state
+
+        Returns:
+            Restored engine
+        """
+        engine = cls()
+        engine.count = state["count"]
+        engine.dates, engine.high, engine.low, engine.close = (
+            list(state["dates"]), list(state["high"]), list(state["low"]), list(state["close"])
+        )
+        engine.ema = {period: state["ema"].get(str(period)) for period in _EMA_STATE_PERIODS}
+        engine.macd_signal = state["macd_signal"]
+        engine.avg_gain = state["avg_gain"]
+        engine.avg_loss = state["avg_loss"]
+        engine.atr = state["atr"]
+        return engine
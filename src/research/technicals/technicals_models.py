@@ -0,0 +1,33 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class TechnicalIndicators(BaseModel):
+    symbol: str
+    # Date of the latest daily bar (YYYY-MM-DD)
+    as_of: Optional[str] = None
+    # Split- and dividend-adjusted close of the latest bar
+    close: Optional[float] = None
+    # Number of daily bars the indicators were computed from
+    bars: int = 0
+
+    # Trend
+    sma_20: Optional[float] = None
+    sma_50: Optional[float] = None
+    sma_200: Optional[float] = None
+    ema_20: Optional[float] = None
+    ema_50: Optional[float] = None
+
+    # Momentum
+    rsi_14: Optional[float] = None
+    macd: Optional[float] = None
+    macd_signal: Optional[float] = None
+    macd_histogram: Optional[float] = None
+
+    # Volatility
+    bollinger_upper: Optional[float] = None
+    bollinger_middle: Optional[float] = None
+    bollinger_lower: Optional[float] = None
+    atr_14: Optional[float] = None
+    # Annualized, from daily log returns
+    realized_volatility_20d: Optional[float] = None
@@ -0,0 +1,95 @@
+import logging
+from datetime import date
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.lib.daily_prices import adjusted_prices
+from src.lib.market_calendar import market_date, previous_trading_day
+from src.lib.price_history_store import get_price_history_store
+from src.lib.supabase_cache import get_supabase_cache
+from src.research.technicals.technical_indicators import TechnicalIndicatorEngine
+from src.research.technicals.technicals_models import TechnicalIndicators
+
+log = logging.getLogger(__name__)
+
+TECHNICALS_STATE_CACHE_TYPE = "technical_indicators_state"
+# Engine states outlive their session so later sessions can extend them
+TECHNICALS_STATE_TTL_SECONDS = 7 * 24 * 3600
+# Previous sessions searched for an engine state to extend
+TECHNICALS_LOOKBACK_SESSIONS = 5
+
+
+def extend_engine(
+    symbol: str,
+    engine: TechnicalIndicatorEngine,
+    prices: Dict[str, np.ndarray]
+) -> Optional[TechnicalIndicatorEngine]:
+    """
+    Add the bars after an engine's latest bar.
+
+    Args:
+        symbol: Stock symbol
+        engine: Engine of an earlier session
+        prices: Adjusted prices from adjusted_prices
+
+    Returns:
+        The updated engine, or None if it must be rebuilt from the full history because its
+        latest bar is missing or its adjusted close changed (a split or dividend re-adjusts
+        the whole history, and intraday bars are revised)
+    """
+    dates = prices["date"].astype(str)
+    position = int(np.searchsorted(dates, engine.last_date))
+    if position == len(dates) or dates[position] != engine.last_date:
+        return None
+    if not np.isclose(prices["close"][position], engine.close[-1], rtol=1e-9):
+        return None
+
+    for i in range(position + 1, len(dates)):
+        engine.update(dates[i], prices["high"][i], prices["low"][i], prices["close"][i])
+    log.info(f"Extended technical indicators for {symbol} by {len(dates) - position - 1} bars")
+    return engine
+
+
+def get_technical_indicators(symbol: str, session: Optional[date] = None) -> TechnicalIndicators:
+    """
+    Technical indicators of a symbol as of the current market session.
+
+    Prices come from the local price history store. Each session's engine state is cached,
+    and a new session extends the latest earlier state with the bars added since, rebuilding
+    it from the full history only when there is no usable state.
+
+    Args:
+        symbol: Stock symbol
+        session: Market session (defaults to the current one)
+
+    Returns:
+        TechnicalIndicators as of the latest daily bar
+    """
+    cache = get_supabase_cache()
+    session = session or market_date()
+    state = cache.get_cached_analysis(TECHNICALS_STATE_CACHE_TYPE, symbol, key_date=session.strftime("%Y%m%d"))
+    if state:
+        return TechnicalIndicatorEngine.from_state(state).snapshot(symbol)
+
+    prices = adjusted_prices(get_price_history_store().history(symbol))
+    engine = None
+    previous = session
+    for _ in range(TECHNICALS_LOOKBACK_SESSIONS):
+        previous = previous_trading_day(previous)
+        state = cache.get_cached_analysis(TECHNICALS_STATE_CACHE_TYPE, symbol, key_date=previous.strftime("%Y%m%d"))
+        if state:
+            engine = extend_engine(symbol, TechnicalIndicatorEngine.from_state(state), prices)
+            break
+    if engine is None:
+        log.info(f"Computing technical indicators for {symbol} from {len(prices['date'])} daily bars")
+        engine = TechnicalIndicatorEngine.from_prices(prices["date"], prices["high"], prices["low"], prices["close"])
+
+    cache.cache_analysis(
+        TECHNICALS_STATE_CACHE_TYPE,
+        symbol,
+        engine.to_state(),
+        ttl=TECHNICALS_STATE_TTL_SECONDS,
+        key_date=session.strftime("%Y%m%d")
+    )
+    return engine.snapshot(symbol)
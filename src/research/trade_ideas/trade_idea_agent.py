@@ -19,6 +19,9 @@ trade_idea_agent = Agent(
             - Consider long positions, short positions, options, and option spreads
             - Provide confidence score (0-10) - if ≤6, recommend wait-and-see
             - Include entry targets, upside targets, stop-loss levels
+            - When technical_indicators are provided, use trend (SMAs/EMAs), momentum (RSI, MACD)
+              and volatility (Bollinger bands, ATR, realized volatility) to time entries and
+              size stop-loss distances
             - Suggest risk hedges appropriate for the position
             - Focus only on the given symbol, no other recommendations
 
@@ -0,0 +1,27 @@
+import asyncio
+import logging
+from typing import Optional
+
+from src.lib.cache_ttl_policy import EarningsDates
+from src.lib.supabase_cache import get_supabase_cache
+
+logger = logging.getLogger(__name__)
+
+async def earnings_calendar_task(symbol: str) -> Optional[EarningsDates]:
+    """
+    Make sure the symbol's earnings calendar is known before cached stages are looked up.
+
+    Cache lookups never fetch the calendar themselves; without it, fundamental reports are
+    keyed by session instead of by the last earnings report. The stored calendar is reused,
+    so Alpha Vantage is only called when none is stored.
+
+    Args:
+        symbol: Stock symbol
+
+    Returns:
+        EarningsDates, or None if they could not be determined
+    """
+    dates = await asyncio.to_thread(get_supabase_cache().ttl_policy.get_earnings_dates, symbol)
+    if dates is None:
+        logger.warning(f"Earnings calendar unknown for {symbol}; fundamental reports are keyed by session")
+    return dates
@@ -1,11 +1,48 @@
 import logging
-from typing import Optional, Dict
-from src.lib.supabase_job_tracker import get_job_tracker, JobStatus
+from typing import List, Optional
+from src.lib.supabase_job_tracker import get_async_job_tracker, JobStatus
+from src.lib.subjob_registry import get_subjob_registry
 
 logger = logging.getLogger(__name__)
 
-# Track created subjobs to avoid duplicates - keyed by main_job_id
-_created_subjobs: Dict[str, Dict[str, str]] = {}
+async def create_subjobs_task(main_job_id: Optional[str], symbol: str, flows: List[str]) -> bool:
+    """
+    Task to create the subjobs of every known flow of a main job up front, in one insert.
+
+    Args:
+        main_job_id: Main job UUID (if None, this is a no-op for backward compatibility)
+        symbol: Stock symbol
+        flows: Flow names (used as job_name for subjobs)
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if not main_job_id:
+        return True
+
+    try:
+        sub_job_ids = await get_async_job_tracker().create_sub_jobs(
+            main_job_id, symbol, flows, metadata={"parent_flow": "main_research_flow"}
+        )
+        get_subjob_registry().register(main_job_id, sub_job_ids)
+        return True
+
+    except Exception as e:
+        # Subjobs are created one at a time on their first status update instead
+        logger.error(f"Failed to create subjobs for {main_job_id}: {str(e)}")
+        return False
+
+async def release_subjobs_task(main_job_id: Optional[str]) -> None:
+    """
+    Task to close out a finished main job's subjobs: those still pending (flows that never ran,
+    e.g. after a failure) are marked cancelled, and the job is forgotten by the registry.
+
+    Args:
+        main_job_id: Main job UUID
+    """
+    if main_job_id:
+        await get_async_job_tracker().cancel_pending_sub_jobs(main_job_id)
+        get_subjob_registry().evict(main_job_id)
 
 async def update_job_status_task(
     main_job_id: Optional[str],
@@ -37,28 +74,24 @@ async def update_job_status_task(
         return True
 
     try:
-        job_tracker = get_job_tracker()
-
-        # Initialize subjobs dict for this main_job_id if needed
-        if main_job_id not in _created_subjobs:
-            _created_subjobs[main_job_id] = {}
+        job_tracker = get_async_job_tracker()
+        registry = get_subjob_registry()
 
         # Determine which job to update
         logger.debug(f"Processing flow='{flow}' for main_job_id={main_job_id}")
 
         if flow and flow != "main_research_flow":
-            # This is a subflow - create/update subjob
-            logger.debug(f"Flow '{flow}' is a subflow, checking if subjob exists...")
+            # This is a subflow - update its subjob, normally created at job start
+            sub_job_id = await registry.lookup(main_job_id, flow)
 
-            if flow not in _created_subjobs[main_job_id]:
-                # Create a new subjob for this flow
+            if sub_job_id is None:
+                # Flow not created up front - create its subjob now
                 if not symbol:
                     logger.error(f"Symbol required to create subjob for flow {flow}")
                     return False
 
-                print(f"🔵 DEBUG: Creating subjob for flow '{flow}' under main_job_id {main_job_id}, symbol={symbol}")
                 logger.info(f"🔵 Creating subjob for flow '{flow}' under main_job_id {main_job_id}, symbol={symbol}")
-                subjob_result = job_tracker.create_job(
+                subjob_result = await job_tracker.create_job(
                     job_type="research_subflow",
                     symbol=symbol,
                     metadata={"parent_flow": "main_research_flow"},
@@ -66,15 +99,12 @@ async def update_job_status_task(
                     is_sub_job=True,
                     job_name=flow
                 )
-                _created_subjobs[main_job_id][flow] = subjob_result["sub_job_id"]
-                print(f"✅ DEBUG: Created subjob '{flow}' with sub_job_id={subjob_result['sub_job_id']}")
-                logger.info(f"✅ Created subjob '{flow}' with sub_job_id={subjob_result['sub_job_id']}")
-            else:
-                logger.debug(f"Subjob for flow '{flow}' already exists, will update it")
+                sub_job_id = subjob_result["sub_job_id"]
+                registry.register(main_job_id, {flow: sub_job_id})
+                logger.info(f"✅ Created subjob '{flow}' with sub_job_id={sub_job_id}")
 
             # Update the subjob status by sub_job_id
-            sub_job_id = _created_subjobs[main_job_id][flow]
-            result = job_tracker.update_job_status(
+            result = await job_tracker.update_job_status(
                 sub_job_id,
                 status,
                 step=step,
@@ -83,7 +113,7 @@ async def update_job_status_task(
             )
         else:
             # This is the main flow - update main job
-            result = job_tracker.update_job_status(
+            result = await job_tracker.update_job_status(
                 main_job_id,
                 status,
                 step=step,
@@ -1,5 +1,4 @@
 from src.research.common.models.peer_group import PeerGroup
-from src.lib.supabase_cache import get_supabase_cache
 import json
 import logging
 from datetime import datetime
@@ -12,7 +11,7 @@ async def peer_group_reporting_task(
     peer_group: PeerGroup
 ) -> None:
     """
-    Reporting task to write JSON dump of peer group analysis results to file and cache to Redis.
+    Reporting task to write JSON dump of peer group analysis results to file.
     
     Args:
         symbol: Stock symbol being analyzed
@@ -20,10 +19,6 @@ async def peer_group_reporting_task(
     """
     logger.info(f"Peer Group Reporting for {symbol}")
     
-    # Cache the analysis in Redis (24 hour TTL for reports)
-    cache = get_supabase_cache()
-    cache.cache_report("peer_group", symbol, peer_group, ttl=86400)
-    
     # Create filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"peer_group_{symbol}_{timestamp}.json"
@@ -0,0 +1,36 @@
+from src.lib.report_stream import DONE_EVENT, ERROR_EVENT, get_report_stream_broker
+from src.research.comprehensive_report.comprehensive_report_models import ComprehensiveReport
+from src.research.comprehensive_report.report_streaming import MarkdownSectionStream
+import logging
+
+logger = logging.getLogger(__name__)
+
+async def finish_report_stream_task(stream_id: str, comprehensive_report: ComprehensiveReport) -> None:
+    """
+    Task to end a job's report stream with the final comprehensive report.
+
+    Reports that were not generated section by section (cached or incrementally updated)
+    have all their sections published first, so subscribers see the same events either way.
+
+    Args:
+        stream_id: Job ID the report stream belongs to
+        comprehensive_report: Final ComprehensiveReport
+    """
+    broker = get_report_stream_broker()
+    if not any(event.event == "section" for event in broker.events(stream_id)):
+        sections = MarkdownSectionStream()
+        for section in sections.feed(comprehensive_report.comprehensive_analysis) + sections.finish():
+            broker.publish(stream_id, "section", section)
+
+    broker.close(stream_id, DONE_EVENT, {"comprehensive_report": comprehensive_report.model_dump()})
+    logger.info(f"Finished report stream for job {stream_id}")
+
+async def fail_report_stream_task(stream_id: str, error: str) -> None:
+    """
+    Task to end a job's report stream with an error.
+
+    Args:
+        stream_id: Job ID the report stream belongs to
+        error: Error message
+    """
+    get_report_stream_broker().close(stream_id, ERROR_EVENT, {"message": error})
@@ -1,15 +1,20 @@
 import json
 from agents import Runner, RunResult
+from openai.types.responses import ResponseTextDeltaEvent
+from src.lib.report_stream import get_report_stream_broker
 from src.research.comprehensive_report.comprehensive_report_agent import comprehensive_report_agent
 from src.research.comprehensive_report.comprehensive_report_models import ComprehensiveReport
-from typing import Dict, Any
+from src.research.comprehensive_report.report_streaming import JsonStringFieldDecoder, MarkdownSectionStream
+from typing import Dict, Any, Optional
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 async def comprehensive_report_task(
     symbol: str,
-    all_analyses: Dict[str, Any]
+    all_analyses: Dict[str, Any],
+    stream_id: Optional[str] = None
 ) -> ComprehensiveReport:
     """
     Task to generate comprehensive investment research report by synthesizing all analyses.
@@ -17,6 +22,7 @@ async def comprehensive_report_task(
     Args:
         symbol: Stock symbol to research
         all_analyses: Dictionary containing all analysis results from the research pipeline
+        stream_id: Job ID to publish each report section to as it is generated (optional)
         
     Returns:
         ComprehensiveReport containing synthesized research findings
@@ -31,10 +37,40 @@ async def comprehensive_report_task(
         if analysis_data:
             input_data += f", {analysis_key}: {analysis_data}"
 
-    result: RunResult = await Runner.run(
+    if stream_id is None:
+        result: RunResult = await Runner.run(
+            comprehensive_report_agent,
+            input=input_data,
+        )
+        comprehensive_report: ComprehensiveReport = result.final_output
+        return comprehensive_report
+
+    return await _stream_comprehensive_report(symbol, input_data, stream_id)
+
+async def _stream_comprehensive_report(symbol: str, input_data: str, stream_id: str) -> ComprehensiveReport:
+    """Run the report agent streamed, publishing each markdown section once it is complete."""
+    broker = get_report_stream_broker()
+    decoder = JsonStringFieldDecoder("comprehensive_analysis")
+    sections = MarkdownSectionStream()
+    start_time = time.perf_counter()
+
+    def publish(completed):
+        for section in completed:
+            if section["index"] == 0:
+                logger.info(f"First comprehensive report section for {symbol} after {time.perf_counter() - start_time:.1f}s")
+            broker.publish(stream_id, "section", section)
+
+    result = Runner.run_streamed(
         comprehensive_report_agent,
         input=input_data,
     )
-    comprehensive_report: ComprehensiveReport = result.final_output
+    async for event in result.stream_events():
+        if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+            publish(sections.feed(decoder.feed(event.data.delta)))
+    publish(sections.finish())
 
-    return comprehensive_report
\ No newline at end of file
+    # The final output is validated against ComprehensiveReport by the SDK
+    comprehensive_report = result.final_output_as(ComprehensiveReport, raise_if_incorrect_type=True)
+    if sections.text != comprehensive_report.comprehensive_analysis.strip():
+        logger.warning(f"Streamed comprehensive report for {symbol} differs from the final output")
+    return comprehensive_report
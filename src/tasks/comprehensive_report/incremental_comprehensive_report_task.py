@@ -0,0 +1,80 @@
+import json
+from agents import Runner, RunResult
+from src.lib.supabase_rag import get_async_supabase_rag
+from src.research.comprehensive_report.comprehensive_report_update_agent import comprehensive_report_update_agent
+from src.research.comprehensive_report.comprehensive_report_models import ComprehensiveReport, ComprehensiveReportUpdate
+from src.research.comprehensive_report.incremental_report import (
+    changed_analyses,
+    exceeds_changed_fraction,
+    merge_sections,
+    report_sections,
+    sections_to_update,
+    update_inputs,
+)
+from datetime import datetime
+from typing import Dict, Any, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+async def incremental_comprehensive_report_task(
+    symbol: str,
+    all_analyses: Dict[str, Any],
+    fingerprints: Dict[str, str]
+) -> Optional[ComprehensiveReport]:
+    """
+    Task to update the previous comprehensive report, rewriting only the sections whose analyses changed.
+
+    Args:
+        symbol: Stock symbol to research
+        all_analyses: Dictionary containing all analysis results from the research pipeline
+        fingerprints: Fingerprint of each analysis in all_analyses
+
+    Returns:
+        Updated ComprehensiveReport, or None if the report must be generated in full (no
+        previous report, too many changes, or an incomplete update)
+    """
+    chunks = await get_async_supabase_rag().get_latest_report_chunks(symbol, "comprehensive_report")
+    previous_fingerprints = chunks[0]["metadata"].get("analysis_fingerprints") if chunks else None
+    if not previous_fingerprints:
+        logger.info(f"No previous comprehensive report to update for {symbol}")
+        return None
+
+    sections = report_sections(chunks)
+    changed = changed_analyses(previous_fingerprints, fingerprints)
+    titles = sections_to_update(list(sections), changed)
+    logger.info(
+        f"Comprehensive report for {symbol}: {len(changed)} analyses changed, "
+        f"{len(titles)} of {len(sections)} sections to update"
+    )
+    if exceeds_changed_fraction(list(sections), titles):
+        return None
+
+    comprehensive_analysis = "\n\n".join(sections.values())
+    if titles:
+        input_data = json.dumps({
+            "original_symbol": symbol,
+            "sections_to_update": titles,
+            "previous_sections": {title: sections[title] for title in titles},
+            "analyses": update_inputs(all_analyses, titles),
+            "changed_analyses": sorted(changed),
+        }, default=str)
+
+        result: RunResult = await Runner.run(
+            comprehensive_report_update_agent,
+            input=input_data,
+        )
+        update: ComprehensiveReportUpdate = result.final_output
+
+        comprehensive_analysis, missing = merge_sections(sections, titles, update.sections)
+        if missing:
+            logger.warning(f"Comprehensive report update for {symbol} is missing sections {missing}")
+            return None
+
+    company_overview = all_analyses.get("company_overview_analysis") or {}
+    return ComprehensiveReport(
+        symbol=symbol,
+        company_name=company_overview.get("company_name"),
+        report_date=all_analyses.get("analysis_date") or datetime.now().strftime("%Y-%m-%d"),
+        comprehensive_analysis=comprehensive_analysis
+    )
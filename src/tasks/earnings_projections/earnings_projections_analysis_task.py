@@ -1,6 +1,7 @@
 from src.research.earnings_projections.earnings_projections_models import EarningsProjectionData, EarningsProjectionAnalysis
 from src.research.earnings_projections.earnings_projections_agent import earnings_projections_analysis_agent
 from agents import Runner, RunResult
+from src.lib.alpha_vantage_records import to_compact_json
 import json
 import logging
 
@@ -25,7 +26,7 @@ async def earnings_projections_analysis_task(
     # Prepare the input for the agent
     input_data = f"""
     symbol: {symbol}
-    earnings_projection_data: {projection_data.model_dump_json()}
+    earnings_projection_data: {to_compact_json(projection_data)}
     """
 
     result: RunResult = await Runner.run(
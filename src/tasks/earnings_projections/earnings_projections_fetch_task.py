@@ -1,6 +1,7 @@
 from typing import Optional, Dict, Any
 from src.research.earnings_projections.earnings_projections_models import EarningsProjectionData
 from src.research.earnings_projections.earnings_projections_util import get_earnings_projection_data_for_symbol
+import asyncio
 import logging
 import json
 
@@ -24,9 +25,11 @@ async def earnings_projections_fetch_task(
     """
     logger.info(f"Fetching earnings projection data for {symbol}")
 
-    projection_data = get_earnings_projection_data_for_symbol(
-        symbol, 
-        historical_earnings_analysis, 
+    # Fetches and the fiscal year lookup are blocking; keep the event loop free meanwhile
+    projection_data = await asyncio.to_thread(
+        get_earnings_projection_data_for_symbol,
+        symbol,
+        historical_earnings_analysis,
         financial_statements_analysis
     )
     
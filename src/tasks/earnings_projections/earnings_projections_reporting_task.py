@@ -1,5 +1,4 @@
 from src.research.earnings_projections.earnings_projections_models import EarningsProjectionAnalysis
-from src.lib.supabase_cache import get_supabase_cache
 import json
 import logging
 from datetime import datetime
@@ -12,7 +11,7 @@ async def earnings_projections_reporting_task(
     earnings_projections_analysis: EarningsProjectionAnalysis
 ) -> None:
     """
-    Reporting task to write JSON dump of earnings projections analysis results to file and cache to Redis.
+    Reporting task to write JSON dump of earnings projections analysis results to file.
     
     Args:
         symbol: Stock symbol being analyzed
@@ -20,10 +19,6 @@ async def earnings_projections_reporting_task(
     """
     logger.info(f"Earnings Projections Reporting for {symbol}")
     
-    # Cache the analysis in Redis (24 hour TTL for reports)
-    cache = get_supabase_cache()
-    cache.cache_report("earnings_projections", symbol, earnings_projections_analysis, ttl=86400)
-    
     # Create filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"earnings_projections_{symbol}_{timestamp}.json"
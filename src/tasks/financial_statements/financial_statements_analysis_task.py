@@ -1,6 +1,7 @@
 from src.research.financial_statements.financial_statements_models import FinancialStatementsData, FinancialStatementsAnalysis
 from src.research.financial_statements.financial_statements_agent import financial_statements_analysis_agent
 from agents import Runner, RunResult
+from src.lib.alpha_vantage_records import to_compact_json
 import json
 import logging
 
@@ -25,7 +26,7 @@ async def financial_statements_analysis_task(
     # Prepare the input for the agent
     input_data = f"""
     symbol: {symbol}
-    financial_statements_data: {financial_data.model_dump_json()}
+    financial_statements_data: {to_compact_json(financial_data)}
     """
 
     result: RunResult = await Runner.run(
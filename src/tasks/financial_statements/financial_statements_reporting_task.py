@@ -1,5 +1,4 @@
 from src.research.financial_statements.financial_statements_models import FinancialStatementsAnalysis
-from src.lib.supabase_cache import get_supabase_cache
 import json
 import logging
 from datetime import datetime
@@ -12,7 +11,7 @@ async def financial_statements_reporting_task(
     financial_analysis: FinancialStatementsAnalysis
 ) -> None:
     """
-    Reporting task to write JSON dump of financial statements analysis results to file and cache to Redis.
+    Reporting task to write JSON dump of financial statements analysis results to file.
     
     Args:
         symbol: Stock symbol being analyzed
@@ -20,10 +19,6 @@ async def financial_statements_reporting_task(
     """
     logger.info(f"Financial Statements Reporting for {symbol}")
     
-    # Cache the analysis in Redis (24 hour TTL for reports)
-    cache = get_supabase_cache()
-    cache.cache_report("financial_statements", symbol, financial_analysis, ttl=86400)
-    
     # Create filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"financial_statements_{symbol}_{timestamp}.json"
@@ -2,15 +2,17 @@ from src.research.forward_pe.forward_pe_models import ForwardPeValuation
 from src.research.forward_pe.forward_pe_analysis_agent import forward_pe_analysis_agent
 from agents import Runner, RunResult
 from src.research.forward_pe.forward_pe_models import ForwardPEEarningsSummary
+from src.lib.alpha_vantage_records import to_compact_json
+from src.research.forward_pe.forward_pe_metrics import compute_forward_pe_metrics, format_metrics_table
 import json
 import logging
-from typing import Optional, Any
+from typing import List, Optional, Any, Union
 
 logger = logging.getLogger(__name__)
 
 async def forward_pe_analysis_task(
     symbol: str, 
-    earnings_summary: ForwardPEEarningsSummary,
+    earnings_summary: Union[ForwardPEEarningsSummary, List[ForwardPEEarningsSummary]],
     earnings_projections_analysis: Optional[Any] = None,
     management_guidance_analysis: Optional[Any] = None,
     forward_pe_sanity_check: Optional[Any] = None
@@ -20,7 +22,7 @@ async def forward_pe_analysis_task(
     
     Args:
         symbol: Stock symbol to research
-        earnings_summary: Earnings summary for the symbol
+        earnings_summary: Earnings summary for the symbol, or the summaries of the symbol and its peers
         earnings_projections_analysis: Optional independent earnings projections for validation
         management_guidance_analysis: Optional management guidance analysis for context
         forward_pe_sanity_check: Optional sanity check results for validation
@@ -30,7 +32,7 @@ async def forward_pe_analysis_task(
     logger.info(f"Performing forward PE analysis for {symbol}")
 
     # Build input with optional context
-    input_data = f"original_symbol: {symbol}, earnings_summary: {earnings_summary}"
+    input_data = f"original_symbol: {symbol}, {_earnings_input(symbol, earnings_summary)}"
     if earnings_projections_analysis:
         input_data += f", earnings_projections_analysis: {earnings_projections_analysis}"
     if management_guidance_analysis:
@@ -46,3 +48,22 @@ async def forward_pe_analysis_task(
     logger.debug(f"Forward PE analysis for {symbol}: {json.dumps(forward_pe_analysis.model_dump(), indent=2)}")
 
     return forward_pe_analysis
+
+
+def _earnings_input(
+    symbol: str,
+    earnings_summary: Union[ForwardPEEarningsSummary, List[ForwardPEEarningsSummary]]
+) -> str:
+    """
+    Earnings part of the agent input: the precomputed metrics table and the symbol's overview,
+    or the raw summaries if the metrics cannot be computed.
+    """
+    summaries = earnings_summary if isinstance(earnings_summary, list) else [earnings_summary]
+    try:
+        metrics = compute_forward_pe_metrics(symbol, summaries)
+    except Exception as e:
+        logger.warning(f"Could not compute forward PE metrics for {symbol}, passing raw earnings data: {e}")
+        return f"earnings_summary: {to_compact_json(summaries)}"
+
+    overview = next(summary.overview for summary in summaries if summary.symbol == symbol)
+    return f"forward_pe_metrics:\n{format_metrics_table(metrics)}\noverview: {to_compact_json(overview)}"
@@ -1,6 +1,7 @@
 from typing import List
 from src.research.forward_pe.forward_pe_models import ForwardPEEarningsSummary
 from src.research.forward_pe.forward_pe_fetch_earnings_util import get_quarterly_eps_data_for_symbol, get_quarterly_eps_data_for_symbols
+import asyncio
 import logging
 import json
 
@@ -18,7 +19,8 @@ async def forward_pe_fetch_earnings_for_symbols_task(symbol: str, peer_group: Li
     """
     logger.info(f"Fetching earnings data for {symbol} with peer group {peer_group}")
 
-    earnings_summary: list(ForwardPEEarningsSummary) = get_quarterly_eps_data_for_symbols([symbol] + peer_group)
+    # Peers are fetched concurrently in worker threads; keep the event loop free meanwhile
+    earnings_summary: list(ForwardPEEarningsSummary) = await asyncio.to_thread(get_quarterly_eps_data_for_symbols, [symbol] + peer_group)
 
     for earnings in earnings_summary:
         logger.debug(f"Earnings data fetched for {symbol}: {json.dumps(earnings.model_dump(), indent=2)}")
@@ -37,7 +39,7 @@ async def forward_pe_fetch_single_earnings_task(symbol: str) -> ForwardPEEarning
     """
     logger.info(f"Fetching earnings data for {symbol}")
 
-    earnings_summary: ForwardPEEarningsSummary = get_quarterly_eps_data_for_symbol(symbol)
+    earnings_summary: ForwardPEEarningsSummary = await asyncio.to_thread(get_quarterly_eps_data_for_symbol, symbol)
 
     logger.debug(f"Earnings data fetched for {symbol}: {json.dumps(earnings_summary.model_dump(), indent=2)}")
 
@@ -1,5 +1,4 @@
 from src.research.forward_pe.forward_pe_models import ForwardPeValuation, ForwardPeSanityCheck
-from src.lib.supabase_cache import get_supabase_cache
 import json
 import logging
 from datetime import datetime
@@ -12,7 +11,7 @@ async def forward_pe_valuation_reporting_task(
     forward_pe_valuation: ForwardPeValuation
 ) -> None:
     """
-    Reporting task to write JSON dump of forward PE valuation analysis results to file and cache to Redis.
+    Reporting task to write JSON dump of forward PE valuation analysis results to file.
     
     Args:
         symbol: Stock symbol being analyzed
@@ -20,10 +19,6 @@ async def forward_pe_valuation_reporting_task(
     """
     logger.info(f"Forward PE Valuation Reporting for {symbol}")
     
-    # Cache the analysis in Redis (24 hour TTL for reports)
-    cache = get_supabase_cache()
-    cache.cache_report("forward_pe_valuation", symbol, forward_pe_valuation, ttl=86400)
-    
     # Create filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"forward_pe_valuation_{symbol}_{timestamp}.json"
@@ -40,7 +35,7 @@ async def forward_pe_sanity_check_reporting_task(
     forward_pe_sanity_check: ForwardPeSanityCheck
 ) -> None:
     """
-    Reporting task to write JSON dump of forward PE sanity check results to file and cache to Redis.
+    Reporting task to write JSON dump of forward PE sanity check results to file.
     
     Args:
         symbol: Stock symbol being analyzed
@@ -48,10 +43,6 @@ async def forward_pe_sanity_check_reporting_task(
     """
     logger.info(f"Forward PE Sanity Check Reporting for {symbol}")
     
-    # Cache the analysis in Redis (24 hour TTL for reports)
-    cache = get_supabase_cache()
-    cache.cache_report("forward_pe_sanity_check", symbol, forward_pe_sanity_check, ttl=86400)
-    
     # Create filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"forward_pe_sanity_check_{symbol}_{timestamp}.json"
@@ -1,8 +1,15 @@
 import json
+import time
 from src.research.forward_pe.forward_pe_models import ForwardPeSanityCheck
 from src.research.forward_pe.forward_pe_sanity_check_agent import forward_pe_sanity_check_agent
+from src.research.forward_pe.forward_pe_sanity_check_rules import (
+    FORWARD_PE_SANITY_RULES,
+    record_sanity_check,
+    rule_based_sanity_check,
+)
 from agents import Runner, RunResult
 from src.research.forward_pe.forward_pe_models import ForwardPEEarningsSummary
+from src.lib.alpha_vantage_records import to_compact_json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,6 +17,9 @@ logger = logging.getLogger(__name__)
 async def forward_pe_sanity_check_task(earnings_summary: ForwardPEEarningsSummary) -> ForwardPeSanityCheck:
     """
     Task to perform forward PE sanity check for the forward PE research for a given symbol.
+
+    Clear-cut cases are decided by rule_based_sanity_check; the agent only sees the rest,
+    together with the reasons the rules escalated them.
     
     Args:
         earnings_summary: Earnings summary for the symbol
@@ -18,10 +28,22 @@ async def forward_pe_sanity_check_task(earnings_summary: ForwardPEEarningsSummar
     """
     logger.info(f"Performing forward PE sanity check for {earnings_summary.symbol}")
 
+    input_data = f"Forward PE Summary Data: {to_compact_json(earnings_summary)}"
+    if FORWARD_PE_SANITY_RULES:
+        forward_pe_sanity_check, reasons = rule_based_sanity_check(earnings_summary)
+        if forward_pe_sanity_check is not None:
+            record_sanity_check(escalated=False)
+            logger.info(f"Forward PE sanity check for {earnings_summary.symbol} decided by rules: {forward_pe_sanity_check.is_realistic.value}")
+            return forward_pe_sanity_check
+        logger.info(f"Escalating forward PE sanity check for {earnings_summary.symbol} to the agent: {'; '.join(reasons)}")
+        input_data += f", Rule-based check flags: {'; '.join(reasons)}"
+
+    start_time = time.perf_counter()
     result: RunResult = await Runner.run(
         forward_pe_sanity_check_agent,
-        input=f"Forward PE Summary Data: {earnings_summary}")
+        input=input_data)
     forward_pe_sanity_check: ForwardPeSanityCheck = result.final_output
+    record_sanity_check(escalated=True, agent_seconds=time.perf_counter() - start_time)
 
     logger.info(f"Forward PE sanity check completed for {earnings_summary.symbol}")
 
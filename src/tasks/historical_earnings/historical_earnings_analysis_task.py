@@ -1,6 +1,7 @@
 from src.research.historical_earnings.historical_earnings_models import HistoricalEarningsData, HistoricalEarningsAnalysis
 from src.research.historical_earnings.historical_earnings_agent import historical_earnings_analysis_agent
 from agents import Runner, RunResult
+from src.lib.alpha_vantage_records import to_compact_json
 import json
 import logging
 
@@ -24,7 +25,7 @@ async def historical_earnings_analysis_task(
     # Prepare the input for the agent
     input_data = f"""
     symbol: {symbol}
-    historical_earnings_data: {historical_data.model_dump_json()}
+    historical_earnings_data: {to_compact_json(historical_data)}
     """
 
     logger.debug(f"Input data for historical earnings analysis for {symbol}: {input_data}")
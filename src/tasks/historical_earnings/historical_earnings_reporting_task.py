@@ -1,5 +1,4 @@
 from src.research.historical_earnings.historical_earnings_models import HistoricalEarningsAnalysis
-from src.lib.supabase_cache import get_supabase_cache
 import json
 import logging
 from datetime import datetime
@@ -12,7 +11,7 @@ async def historical_earnings_reporting_task(
     historical_analysis: HistoricalEarningsAnalysis
 ) -> None:
     """
-    Reporting task to write JSON dump of historical earnings analysis results to file and cache to Redis.
+    Reporting task to write JSON dump of historical earnings analysis results to file.
     
     Args:
         symbol: Stock symbol being analyzed
@@ -20,10 +19,6 @@ async def historical_earnings_reporting_task(
     """
     logger.info(f"Historical Earnings Reporting for {symbol}")
     
-    # Cache the analysis in Redis (24 hour TTL for reports)
-    cache = get_supabase_cache()
-    cache.cache_report("historical_earnings", symbol, historical_analysis, ttl=86400)
-    
     # Create filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"historical_earnings_{symbol}_{timestamp}.json"
@@ -1,5 +1,6 @@
 from src.research.management_guidance.management_guidance_models import ManagementGuidanceData
 from src.research.management_guidance.management_guidance_util import get_management_guidance_data_for_symbol
+import asyncio
 import logging
 import json
 
@@ -17,7 +18,8 @@ async def management_guidance_fetch_task(symbol: str) -> ManagementGuidanceData:
     """
     logger.info(f"Fetching management guidance data for {symbol}")
 
-    guidance_data = get_management_guidance_data_for_symbol(symbol)
+    # Transcript archive reads and writes are file I/O; keep the event loop free meanwhile
+    guidance_data = await asyncio.to_thread(get_management_guidance_data_for_symbol, symbol)
     
     if guidance_data.earnings_transcript:
         logger.info(f"Management guidance data fetched for {symbol}: transcript available for Q{guidance_data.quarter}")
@@ -1,5 +1,4 @@
 from src.research.management_guidance.management_guidance_models import ManagementGuidanceAnalysis
-from src.lib.supabase_cache import get_supabase_cache
 import json
 import logging
 from datetime import datetime
@@ -12,7 +11,7 @@ async def management_guidance_reporting_task(
     management_guidance_analysis: ManagementGuidanceAnalysis
 ) -> None:
     """
-    Reporting task to write JSON dump of management guidance analysis results to file and cache to Redis.
+    Reporting task to write JSON dump of management guidance analysis results to file.
     
     Args:
         symbol: Stock symbol being analyzed
@@ -20,10 +19,6 @@ async def management_guidance_reporting_task(
     """
     logger.info(f"Management Guidance Reporting for {symbol}")
     
-    # Cache the analysis in Redis (24 hour TTL for reports)
-    cache = get_supabase_cache()
-    cache.cache_report("management_guidance", symbol, management_guidance_analysis, ttl=86400)
-    
     # Create filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"management_guidance_{symbol}_{timestamp}.json"
@@ -1,5 +1,6 @@
 from src.research.news_sentiment.news_sentiment_agent import news_sentiment_agent
 from src.research.news_sentiment.news_sentiment_models import RawNewsSentimentSummary, NewsSentimentSummary
+from src.research.news_sentiment.news_sentiment_features import compute_news_sentiment_feature_table, format_news_sentiment_features
 from agents import Runner
 from typing import List, Optional, Any
 import json
@@ -14,8 +15,12 @@ async def news_sentiment_analysis_task(
     management_guidance_analysis: Optional[Any] = None,
 ) -> NewsSentimentSummary:
     logger.info(f"Performing news sentiment analysis for {symbol}")
+    # Reduce raw feeds to a per-ticker feature table plus a few exemplar articles
+    news_sentiment_features = format_news_sentiment_features(
+        compute_news_sentiment_feature_table(raw_news_sentiment_summaries)
+    )
     # Build input with optional context
-    input_data = f"symbol: {symbol}, raw_news_sentiment_summaries: {raw_news_sentiment_summaries}"
+    input_data = f"symbol: {symbol}, news_sentiment_features:\n{news_sentiment_features}\n"
     if earnings_projections_analysis:
         input_data += f", earnings_projections_analysis: {earnings_projections_analysis}"
     if management_guidance_analysis:
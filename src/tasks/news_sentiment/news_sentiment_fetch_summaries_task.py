@@ -1,6 +1,7 @@
 from src.research.news_sentiment.news_sentiment_util import get_news_sentiment_summary_for_peer_group
 from src.research.news_sentiment.news_sentiment_models import RawNewsSentimentSummary
 from typing import List
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,6 +12,7 @@ async def news_sentiment_fetch_summaries_task(
 ) -> List[RawNewsSentimentSummary]:
     peer_group.append(symbol)
     logger.info(f"Fetching news sentiment summaries for peer group: {peer_group}")
-    summaries = get_news_sentiment_summary_for_peer_group(peer_group)
+    # Article store reads and writes are file I/O; keep the event loop free meanwhile
+    summaries = await asyncio.to_thread(get_news_sentiment_summary_for_peer_group, peer_group, symbol)
     logger.debug(f"News sentiment summaries fetched for peer group: {peer_group}")
     return summaries
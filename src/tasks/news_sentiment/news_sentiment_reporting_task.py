@@ -1,5 +1,4 @@
 from src.research.news_sentiment.news_sentiment_models import NewsSentimentSummary
-from src.lib.supabase_cache import get_supabase_cache
 import json
 import logging
 from datetime import datetime
@@ -12,7 +11,7 @@ async def news_sentiment_reporting_task(
     news_sentiment_summary: NewsSentimentSummary
 ) -> None:
     """
-    Reporting task to write JSON dump of news sentiment analysis results to file and cache to Redis.
+    Reporting task to write JSON dump of news sentiment analysis results to file.
     
     Args:
         symbol: Stock symbol being analyzed
@@ -20,10 +19,6 @@ async def news_sentiment_reporting_task(
     """
     logger.info(f"News Sentiment Reporting for {symbol}")
     
-    # Cache the analysis in Redis (24 hour TTL for reports)
-    cache = get_supabase_cache()
-    cache.cache_report("news_sentiment", symbol, news_sentiment_summary, ttl=86400)
-    
     # Create filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"news_sentiment_{symbol}_{timestamp}.json"
@@ -0,0 +1,32 @@
+from src.research.technicals.technicals_models import TechnicalIndicators
+from src.research.technicals.technicals_util import get_technical_indicators
+from typing import Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+async def technical_indicators_task(symbol: str) -> Optional[TechnicalIndicators]:
+    """
+    Task to compute technical indicators from the symbol's daily price history.
+
+    Args:
+        symbol: Stock symbol to research
+    Returns:
+        TechnicalIndicators as of the latest daily bar, or None if prices are unavailable
+    """
+    logger.info(f"Computing technical indicators for {symbol}")
+
+    try:
+        # Price fetch and indicator math are blocking; keep them off the event loop
+        technical_indicators = await asyncio.to_thread(get_technical_indicators, symbol)
+    except Exception as e:
+        # Technicals are supplementary context; research continues without them
+        logger.warning(f"Technical indicators unavailable for {symbol}: {e}")
+        return None
+
+    logger.info(
+        f"Technical indicators for {symbol} as of {technical_indicators.as_of}: "
+        f"RSI {technical_indicators.rsi_14}, ATR {technical_indicators.atr_14}"
+    )
+    return technical_indicators
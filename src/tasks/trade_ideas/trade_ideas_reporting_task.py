@@ -1,5 +1,4 @@
 from src.research.trade_ideas.trade_idea_models import TradeIdea
-from src.lib.supabase_cache import get_supabase_cache
 import json
 import logging
 from datetime import datetime
@@ -12,7 +11,7 @@ async def trade_ideas_reporting_task(
     trade_idea: TradeIdea
 ) -> None:
     """
-    Reporting task to write JSON dump of trade ideas analysis results to file and cache to Redis.
+    Reporting task to write JSON dump of trade ideas analysis results to file.
     
     Args:
         symbol: Stock symbol being analyzed
@@ -20,10 +19,6 @@ async def trade_ideas_reporting_task(
     """
     logger.info(f"Trade Ideas Reporting for {symbol}")
     
-    # Cache the analysis in Redis (24 hour TTL for reports)
-    cache = get_supabase_cache()
-    cache.cache_report("trade_ideas", symbol, trade_idea, ttl=86400)
-    
     # Create filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"trade_ideas_{symbol}_{timestamp}.json"
@@ -4,6 +4,7 @@ from agents import Runner, RunResult
 from src.research.trade_ideas.trade_idea_agent import trade_idea_agent
 from src.research.trade_ideas.trade_idea_models import TradeIdea
 from src.research.news_sentiment.news_sentiment_models import NewsSentimentSummary
+from src.research.technicals.technicals_models import TechnicalIndicators
 from typing import Optional, Any
 import logging
 
@@ -17,6 +18,7 @@ async def trade_ideas_task(
     financial_statements_analysis: Optional[Any] = None,
     earnings_projections_analysis: Optional[Any] = None,
     management_guidance_analysis: Optional[Any] = None,
+    technical_indicators: Optional[TechnicalIndicators] = None,
 ) -> TradeIdea:
     """
     Task to perform trade ideas for the forward PE research for a given symbol.
@@ -29,6 +31,7 @@ async def trade_ideas_task(
         financial_statements_analysis: Optional financial statements trends for context
         earnings_projections_analysis: Optional independent earnings projections for validation
         management_guidance_analysis: Optional management guidance insights for context
+        technical_indicators: Optional trend, momentum and volatility indicators for entry timing
     Returns:
         TradeIdea containing the trade ideas for users with no position
     """
@@ -45,6 +48,8 @@ async def trade_ideas_task(
         input_data += f", earnings_projections_analysis: {earnings_projections_analysis}"
     if management_guidance_analysis:
         input_data += f", management_guidance_analysis: {management_guidance_analysis}"
+    if technical_indicators:
+        input_data += f", technical_indicators: {technical_indicators}"
 
     result: RunResult = await Runner.run(
         trade_idea_agent,
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 @pytest.fixture(params=["asyncio"])
 def anyio_backend(request):
@@ -22,6 +22,7 @@ def mock_supabase_client():
     mock_table.upsert.return_value = mock_table
     mock_table.delete.return_value = mock_table
     mock_table.eq.return_value = mock_table
+    mock_table.neq.return_value = mock_table
     mock_table.lt.return_value = mock_table
     mock_table.gt.return_value = mock_table
     mock_table.in_.return_value = mock_table
@@ -36,6 +37,14 @@ def mock_supabase_client():
     return mock_client
 
 
+@pytest.fixture
+def mock_async_supabase_client(mock_supabase_client):
+    """Mock async Supabase client for testing (execute() must be awaited)."""
+    mock_table = mock_supabase_client.table.return_value
+    mock_table.execute = AsyncMock(return_value=mock_table.execute.return_value)
+    return mock_supabase_client
+
+
 @pytest.fixture
 def mock_supabase_cache(mock_supabase_client):
     """Mock SupabaseCache for testing."""
@@ -70,6 +79,7 @@ def mock_supabase_globally():
     mock_table.upsert.return_value = mock_table
     mock_table.delete.return_value = mock_table
     mock_table.eq.return_value = mock_table
+    mock_table.neq.return_value = mock_table
     mock_table.lt.return_value = mock_table
     mock_table.gt.return_value = mock_table
     mock_table.in_.return_value = mock_table
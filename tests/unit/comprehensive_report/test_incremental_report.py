@@ -0,0 +1,213 @@
+"""Tests for incremental comprehensive report updates."""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.lib.rag_ingestion import split_report
+from src.research.comprehensive_report.comprehensive_report_models import ComprehensiveReportUpdate, ReportSectionUpdate
+from src.research.comprehensive_report.incremental_report import (
+    analysis_fingerprints,
+    changed_analyses,
+    exceeds_changed_fraction,
+    merge_sections,
+    report_sections,
+    sections_to_update,
+    update_inputs,
+)
+from src.tasks.comprehensive_report.incremental_comprehensive_report_task import incremental_comprehensive_report_task
+
+
+REPORT = """# AAPL Comprehensive Research Report
+
+## Executive Summary
+
+Buy, with a target of $210.
+
+## Historical Earnings Analysis
+
+Beat estimates in 7 of the last 8 quarters.
+
+## News Sentiment Analysis
+
+Coverage is bullish.
+
+## Valuation Analysis (Forward PE)
+
+Forward P/E of 28x.
+
+## Company Overview
+
+Consumer electronics and services.
+"""
+
+ANALYSES = {
+    "symbol": "AAPL",
+    "analysis_date": "2026-10-19",
+    "company_overview_analysis": {"company_name": "Apple Inc."},
+    "global_quote_data": {"price": 200},
+    "historical_earnings_analysis": {"beats": 7},
+    "news_sentiment_summary": {"label": "Bullish"},
+    "forward_pe_valuation": {"pe": 28},
+}
+
+
+# Sections the comprehensive report agent is instructed to write
+FULL_REPORT = "# AAPL Comprehensive Research Report\n\n" + "\n\n".join(
+    f"## {i}. {title}\n\n{title} details."
+    for i, title in enumerate([
+        "Executive Summary", "Investment Recommendations", "Company Overview", "Historical Earnings Analysis",
+        "Financial Statements Analysis", "Earnings Projections Analysis", "Management Guidance Analysis",
+        "Peer Group Analysis", "Valuation Analysis (Forward PE)", "News Sentiment Analysis",
+        "Cross-Reference Validation", "Trade Ideas"
+    ], start=1)
+)
+
+FULL_ANALYSES = {
+    **ANALYSES,
+    "financial_statements_analysis": {"margin": 0.3},
+    "earnings_projections_analysis": {"eps": 2.1},
+    "management_guidance_analysis": {"tone": "OPTIMISTIC"},
+    "peer_group": {"original_symbol": "AAPL", "peer_group": ["MSFT", "GOOGL"]},
+    "forward_pe_sanity_check": {"is_realistic": "REALISTIC"},
+    "cross_reference": [{"signal": "Bullish"}],
+    "trade_idea": {"action": "BUY"},
+}
+
+
+def stored_chunks(report: str, fingerprints: dict) -> list:
+    return [
+        {"id": i, "content": chunk.content, "metadata": {"section": chunk.section, "section_index": i, "analysis_fingerprints": fingerprints}}
+        for i, chunk in enumerate(split_report(report))
+    ]
+
+
+class TestIncrementalReportPlanning:
+    """Test section planning and merging."""
+
+    def test_report_sections_group_under_title(self):
+        """Test that a report under one title heading is grouped by its second-level sections."""
+        sections = report_sections(stored_chunks(REPORT, {}))
+
+        assert list(sections) == [
+            "Executive Summary", "Historical Earnings Analysis", "News Sentiment Analysis",
+            "Valuation Analysis (Forward PE)", "Company Overview"
+        ]
+        assert sections["Executive Summary"].startswith("# AAPL Comprehensive Research Report\n\n## Executive Summary")
+        assert "\n\n".join(sections.values()) == REPORT.strip()
+
+    def test_only_dependent_sections_are_updated(self):
+        """Test that a changed analysis selects its sections and the summary sections."""
+        previous = analysis_fingerprints(ANALYSES)
+        current = analysis_fingerprints({**ANALYSES, "analysis_date": "2026-10-20", "news_sentiment_summary": {"label": "Bearish"}})
+
+        changed = changed_analyses(previous, current)
+        titles = sections_to_update(list(report_sections(stored_chunks(REPORT, {}))), changed)
+
+        assert changed == {"news_sentiment_summary"}
+        assert titles == ["Executive Summary", "News Sentiment Analysis"]
+        assert sections_to_update(["Executive Summary"], set()) == []
+
+    def test_small_price_moves_keep_price_sections(self):
+        """Test that the quote only counts as changed once the price moves past the tolerance."""
+        previous = analysis_fingerprints(ANALYSES)
+
+        assert changed_analyses(previous, analysis_fingerprints({**ANALYSES, "global_quote_data": {"price": "200.90"}})) == set()
+        assert changed_analyses(previous, analysis_fingerprints({**ANALYSES, "global_quote_data": {"price": "210.00"}})) == {"global_quote_data"}
+
+    def test_summary_sections_do_not_count_toward_the_changed_fraction(self):
+        """Test that only sections written from specific analyses are weighed against the limit."""
+        sections = ["Executive Summary", "Investment Recommendations", "News Sentiment Analysis", "Trade Ideas"]
+
+        assert not exceeds_changed_fraction(sections, ["Executive Summary", "Investment Recommendations", "News Sentiment Analysis"])
+        assert exceeds_changed_fraction(sections, sections)
+
+    def test_update_inputs_limits_analyses(self):
+        """Test that only the analyses of the rewritten sections are sent."""
+        assert set(update_inputs(ANALYSES, ["News Sentiment Analysis"])) == {"symbol", "analysis_date", "news_sentiment_summary"}
+        assert update_inputs(ANALYSES, ["Executive Summary"]) == ANALYSES
+
+    def test_merge_sections_reports_missing_updates(self):
+        """Test that rewritten sections replace the previous ones in place."""
+        sections = report_sections(stored_chunks(REPORT, {}))
+        updates = [ReportSectionUpdate(title="**News Sentiment Analysis**", content="## News Sentiment Analysis\n\nCoverage turned bearish.\n")]
+
+        merged, missing = merge_sections(sections, ["Executive Summary", "News Sentiment Analysis"], updates)
+
+        assert "Coverage turned bearish." in merged
+        assert "Coverage is bullish." not in merged
+        assert merged.index("Historical Earnings") < merged.index("bearish") < merged.index("Forward P/E")
+        assert missing == ["Executive Summary"]
+
+
+class TestIncrementalComprehensiveReportTask:
+    """Test incremental_comprehensive_report_task."""
+
+    @pytest.fixture
+    def mock_rag(self):
+        with patch('src.tasks.comprehensive_report.incremental_comprehensive_report_task.get_async_supabase_rag') as mock_get_rag:
+            rag = MagicMock()
+            rag.get_latest_report_chunks = AsyncMock(return_value=stored_chunks(REPORT, analysis_fingerprints(ANALYSES)))
+            mock_get_rag.return_value = rag
+            yield rag
+
+    @patch('src.tasks.comprehensive_report.incremental_comprehensive_report_task.Runner.run')
+    @pytest.mark.anyio
+    async def test_rewrites_only_changed_sections(self, mock_runner, mock_rag):
+        """Test that the agent is asked for the affected sections only and the rest is kept."""
+        analyses = {**ANALYSES, "historical_earnings_analysis": {"beats": 8}}
+        mock_runner.return_value = MagicMock(final_output=ComprehensiveReportUpdate(symbol="AAPL", sections=[
+            ReportSectionUpdate(title="Executive Summary", content="# AAPL Comprehensive Research Report\n\n## Executive Summary\n\nStrong buy."),
+            ReportSectionUpdate(title="Historical Earnings Analysis", content="## Historical Earnings Analysis\n\nBeat estimates in 8 of 8 quarters."),
+        ]))
+
+        report = await incremental_comprehensive_report_task("AAPL", analyses, analysis_fingerprints(analyses))
+
+        assert report.company_name == "Apple Inc."
+        assert "8 of 8 quarters" in report.comprehensive_analysis
+        assert "Coverage is bullish." in report.comprehensive_analysis
+        agent_input = mock_runner.call_args.kwargs["input"]
+        assert '"sections_to_update": ["Executive Summary", "Historical Earnings Analysis"]' in agent_input
+
+    @patch('src.tasks.comprehensive_report.incremental_comprehensive_report_task.Runner.run')
+    @pytest.mark.anyio
+    async def test_unchanged_analyses_reuse_report(self, mock_runner, mock_rag):
+        """Test that no agent call is made when no analysis changed."""
+        report = await incremental_comprehensive_report_task("AAPL", ANALYSES, analysis_fingerprints(ANALYSES))
+
+        mock_runner.assert_not_called()
+        assert report.comprehensive_analysis == REPORT.strip()
+
+    @pytest.mark.anyio
+    async def test_falls_back_without_previous_report(self, mock_rag):
+        """Test that a full regeneration is requested when nothing is stored or too much changed."""
+        mock_rag.get_latest_report_chunks.return_value = []
+        assert await incremental_comprehensive_report_task("AAPL", ANALYSES, analysis_fingerprints(ANALYSES)) is None
+
+        mock_rag.get_latest_report_chunks.return_value = stored_chunks(REPORT, analysis_fingerprints(ANALYSES))
+        changed = {**ANALYSES, "global_quote_data": {"price": 150}, "historical_earnings_analysis": {"beats": 6}, "news_sentiment_summary": {"label": "Bearish"}}
+        assert await incremental_comprehensive_report_task("AAPL", changed, analysis_fingerprints(changed)) is None
+
+    @patch('src.tasks.comprehensive_report.incremental_comprehensive_report_task.Runner.run')
+    @pytest.mark.anyio
+    async def test_next_day_run_of_full_report_is_incremental(self, mock_runner, mock_rag):
+        """Test that a typical next-day run (news moved, price within tolerance) updates the full report in place."""
+        mock_rag.get_latest_report_chunks.return_value = stored_chunks(FULL_REPORT, analysis_fingerprints(FULL_ANALYSES))
+        analyses = {
+            **FULL_ANALYSES,
+            "analysis_date": "2026-10-20",
+            "global_quote_data": {"price": "201.50"},
+            "news_sentiment_summary": {"label": "Bearish"},
+            "cross_reference": [{"signal": "Mixed"}],
+            "trade_idea": {"action": "HOLD"},
+        }
+        titles = ["1. Executive Summary", "2. Investment Recommendations", "10. News Sentiment Analysis", "11. Cross-Reference Validation", "12. Trade Ideas"]
+        mock_runner.return_value = MagicMock(final_output=ComprehensiveReportUpdate(symbol="AAPL", sections=[
+            ReportSectionUpdate(title=title, content=f"## {title}\n\nUpdated {title}.") for title in titles
+        ]))
+
+        report = await incremental_comprehensive_report_task("AAPL", analyses, analysis_fingerprints(analyses))
+
+        assert report is not None
+        assert "Updated 12. Trade Ideas." in report.comprehensive_analysis
+        assert "Valuation Analysis (Forward PE) details." in report.comprehensive_analysis
+        assert f'"sections_to_update": {json.dumps(titles)}' in mock_runner.call_args.kwargs["input"]
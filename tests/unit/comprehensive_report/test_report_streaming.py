@@ -0,0 +1,113 @@
+"""Tests for streaming comprehensive report sections."""
+
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from openai.types.responses import ResponseTextDeltaEvent
+from src.lib.report_stream import DONE_EVENT, ReportStreamBroker
+from src.research.comprehensive_report.comprehensive_report_models import ComprehensiveReport
+from src.research.comprehensive_report.report_streaming import JsonStringFieldDecoder, MarkdownSectionStream
+from src.tasks.comprehensive_report.comprehensive_report_stream_task import finish_report_stream_task
+from src.tasks.comprehensive_report.comprehensive_report_task import comprehensive_report_task
+
+
+REPORT = """# AAPL Comprehensive Research Report
+
+## Executive Summary
+
+Buy, with a "target" of $210 — see notes \U0001F4C8.
+
+## Valuation Analysis
+
+Forward P/E of 28x.
+"""
+
+REPORT_JSON = json.dumps({"symbol": "AAPL", "report_date": "2026-10-19", "comprehensive_analysis": REPORT})
+
+
+def fragments(text: str, size: int) -> list:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def delta_event(delta: str):
+    data = ResponseTextDeltaEvent(
+        type="response.output_text.delta", delta=delta, content_index=0, item_id="item",
+        output_index=0, sequence_number=0, logprobs=[]
+    )
+    return SimpleNamespace(type="raw_response_event", data=data)
+
+
+class TestReportStreaming:
+    """Test incremental decoding and section splitting."""
+
+    @pytest.mark.parametrize("size", [1, 2, 5, 7, 64])
+    def test_decoder_handles_any_fragmentation(self, size):
+        """Test that escapes and surrogate pairs split across fragments are decoded."""
+        decoder = JsonStringFieldDecoder("comprehensive_analysis")
+
+        decoded = "".join(decoder.feed(fragment) for fragment in fragments(REPORT_JSON, size))
+
+        assert decoded == REPORT
+        assert decoder.complete
+
+    def test_sections_are_emitted_when_complete(self):
+        """Test that a section is emitted once the next heading arrives and the title opens the first one."""
+        stream = MarkdownSectionStream()
+
+        assert stream.feed("# AAPL Report\n\n## Executive Summary\n\nBuy.\n\n## Valua") == []
+        completed = stream.feed("tion\n\nForward P/E of 28x.")
+        last = stream.finish()
+
+        assert completed == [{"index": 0, "title": "Executive Summary", "markdown": "# AAPL Report\n\n## Executive Summary\n\nBuy."}]
+        assert last == [{"index": 1, "title": "Valuation", "markdown": "## Valuation\n\nForward P/E of 28x."}]
+        assert stream.text == "# AAPL Report\n\n## Executive Summary\n\nBuy.\n\n## Valuation\n\nForward P/E of 28x."
+
+
+class TestComprehensiveReportStreamTasks:
+    """Test the streamed comprehensive report task and stream completion."""
+
+    @pytest.fixture
+    def broker(self):
+        broker = ReportStreamBroker()
+        with patch('src.tasks.comprehensive_report.comprehensive_report_task.get_report_stream_broker', return_value=broker), \
+             patch('src.tasks.comprehensive_report.comprehensive_report_stream_task.get_report_stream_broker', return_value=broker):
+            yield broker
+
+    @patch('src.tasks.comprehensive_report.comprehensive_report_task.Runner.run_streamed')
+    @pytest.mark.anyio
+    async def test_sections_are_published_while_generating(self, mock_run_streamed, broker):
+        """Test that sections are published from the raw output deltas and the final output is returned."""
+        report = ComprehensiveReport.model_validate_json(REPORT_JSON)
+        published_before_final = []
+
+        async def stream_events():
+            for fragment in fragments(REPORT_JSON, 9):
+                yield delta_event(fragment)
+            published_before_final.extend(broker.events("job-1"))
+
+        result = MagicMock()
+        result.stream_events = stream_events
+        result.final_output_as.return_value = report
+        mock_run_streamed.return_value = result
+
+        returned = await comprehensive_report_task("AAPL", {"symbol": "AAPL"}, stream_id="job-1")
+        await finish_report_stream_task("job-1", returned)
+
+        assert returned is report
+        assert [event.data["title"] for event in published_before_final] == ["Executive Summary"]
+        events = broker.events("job-1")
+        assert [event.event for event in events] == ["section", "section", DONE_EVENT]
+        assert events[1].data["markdown"] == "## Valuation Analysis\n\nForward P/E of 28x."
+        assert events[-1].data["comprehensive_report"]["comprehensive_analysis"] == REPORT
+
+    @pytest.mark.anyio
+    async def test_finish_publishes_sections_of_unstreamed_report(self, broker):
+        """Test that a cached report's sections are published before the done event."""
+        report = ComprehensiveReport.model_validate_json(REPORT_JSON)
+
+        await finish_report_stream_task("job-2", report)
+
+        events = broker.events("job-2")
+        assert [event.data.get("title") for event in events[:-1]] == ["Executive Summary", "Valuation Analysis"]
+        assert events[-1].event == DONE_EVENT
@@ -28,14 +28,14 @@ class TestHistoricalEarningsFlow:
     @patch('src.flows.subflows.historical_earnings_flow.historical_earnings_reporting_task')
     @patch('src.flows.subflows.historical_earnings_flow.historical_earnings_analysis_task')
     @patch('src.flows.subflows.historical_earnings_flow.historical_earnings_fetch_task')
-    @patch('src.flows.subflows.historical_earnings_flow.historical_earnings_cache_retrieval_task')
+    @patch('src.lib.cached_stage.get_async_supabase_cache')
     @pytest.mark.anyio
     async def test_historical_earnings_flow_success(
         self, 
         mock_fetch_task,
         mock_analysis_task,
         mock_reporting_task,
-        mock_cache_task
+        mock_get_cache
     ):
         """Test successful historical earnings flow execution."""
         
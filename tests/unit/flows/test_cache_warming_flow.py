@@ -0,0 +1,118 @@
+import pytest
+from datetime import datetime
+from unittest.mock import patch, AsyncMock, MagicMock
+from src.flows.cache_warming_flow import cache_warming_flow, warm_symbol_cache_flow
+from src.lib.cache_warming import STAGE_COSTS, WarmingBudget
+
+FLOW = 'src.flows.cache_warming_flow'
+STAGES = [
+    "company_overview",
+    "historical_earnings",
+    "financial_statements",
+    "earnings_projections",
+    "management_guidance",
+    "forward_pe_sanity_check",
+]
+FLOWS = {
+    "company_overview": "company_overview_flow",
+    "historical_earnings": "historical_earnings_flow",
+    "financial_statements": "financial_statements_flow",
+    "earnings_projections": "earnings_projections_flow",
+    "management_guidance": "management_guidance_flow",
+    "forward_pe_sanity_check": "forward_pe_sanity_check_flow",
+}
+
+
+@pytest.fixture
+def stage_mocks():
+    """Patch every stage's flow and cache lookup."""
+    patchers = [
+        patch(f'{FLOW}.get_supabase_cache'),
+        patch(f'{FLOW}.company_overview_cache_retrieval_task', new_callable=AsyncMock),
+    ]
+    patchers += [patch(f'{FLOW}.{FLOWS[stage]}', new_callable=AsyncMock) for stage in STAGES]
+    mocks = [p.start() for p in patchers]
+    flows = dict(zip(STAGES, mocks[2:]))
+    cached = {"company_overview": mocks[1]}
+    for stage in STAGES:
+        flows[stage].return_value = MagicMock(name=stage)
+        if stage != "company_overview":
+            flows[stage].get_cached = AsyncMock()
+            cached[stage] = flows[stage].get_cached
+        cached[stage].return_value = None
+    yield cached, flows
+    for p in patchers:
+        p.stop()
+
+
+class TestWarmSymbolCacheFlow:
+
+    @pytest.mark.anyio
+    async def test_runs_only_uncached_stages(self, stage_mocks):
+        """Test that cached stages are reused and only cold stages are charged."""
+        cached, flows = stage_mocks
+        cached["historical_earnings"].return_value = MagicMock(name="cached_historical")
+        budget = WarmingBudget(alpha_vantage_calls=100, llm_calls=100)
+
+        assert await warm_symbol_cache_flow("AAPL", budget)
+
+        flows["historical_earnings"].assert_not_called()
+        for stage in STAGES:
+            if stage != "historical_earnings":
+                flows[stage].assert_awaited_once()
+        expected_llm = sum(STAGE_COSTS[stage].llm_calls for stage in STAGES if stage != "historical_earnings")
+        assert budget.spent_llm_calls == expected_llm
+
+    @pytest.mark.anyio
+    async def test_earnings_calendar_is_charged_only_when_fetched(self, stage_mocks):
+        """Test that a stored earnings calendar costs nothing and a missing one is fetched on budget."""
+        cached, _ = stage_mocks
+        for stage in STAGES:
+            cached[stage].return_value = MagicMock(name=f"cached_{stage}")
+        with patch(f'{FLOW}.get_supabase_cache') as mock_get_cache:
+            get_earnings_dates = mock_get_cache.return_value.ttl_policy.get_earnings_dates
+            budget = WarmingBudget(alpha_vantage_calls=100, llm_calls=100)
+
+            assert await warm_symbol_cache_flow("AAPL", budget)
+            assert budget.spent_alpha_vantage_calls == 0
+            get_earnings_dates.assert_called_once_with("AAPL", fetch=False)
+
+            get_earnings_dates.side_effect = lambda symbol, fetch=True: MagicMock() if fetch else None
+            assert await warm_symbol_cache_flow("AAPL", budget)
+            assert budget.spent_alpha_vantage_calls == STAGE_COSTS["earnings_calendar"].alpha_vantage_calls
+            get_earnings_dates.assert_called_with("AAPL")
+
+    @pytest.mark.anyio
+    async def test_stops_when_budget_runs_out(self, stage_mocks):
+        """Test that dependent stages are skipped once the budget is exhausted."""
+        _, flows = stage_mocks
+        budget = WarmingBudget(alpha_vantage_calls=100, llm_calls=1)
+
+        assert not await warm_symbol_cache_flow("AAPL", budget)
+
+        flows["company_overview"].assert_awaited_once()
+        flows["historical_earnings"].assert_not_called()
+        flows["earnings_projections"].assert_not_called()
+
+
+class TestCacheWarmingFlow:
+
+    @patch(f'{FLOW}.ensure_reporting_directory_exists', new_callable=AsyncMock)
+    @patch(f'{FLOW}.warm_symbol_cache_flow', new_callable=AsyncMock)
+    @patch(f'{FLOW}.get_job_tracker')
+    @pytest.mark.anyio
+    async def test_warms_hottest_tickers_until_budget_runs_out(self, mock_get_tracker, mock_warm_symbol, _):
+        """Test that tickers are warmed in rank order and the run stops when out of budget."""
+        mock_get_tracker.return_value.get_recent_symbol_requests.return_value = [
+            {"symbol": "MSFT", "created_at": "2024-05-07T12:00:00"},
+            {"symbol": "AAPL", "created_at": "2024-05-07T12:00:00"},
+            {"symbol": "AAPL", "created_at": "2024-05-07T13:00:00"},
+            {"symbol": "NVDA", "created_at": "2024-05-01T12:00:00"},
+        ]
+        mock_warm_symbol.side_effect = [True, False]
+
+        result = await cache_warming_flow(budget=WarmingBudget(), now=datetime(2024, 5, 8, 5, 0))
+
+        assert result["symbols"] == ["AAPL", "MSFT", "NVDA"]
+        assert result["warmed"] == ["AAPL"]
+        assert [c.args[0] for c in mock_warm_symbol.await_args_list] == ["AAPL", "MSFT"]
@@ -0,0 +1,62 @@
+import pytest
+from unittest.mock import patch, AsyncMock
+from src.flows.subflows.peer_group_flow import peer_group_flow, peer_group_symbols
+from src.flows.subflows.news_sentiment_flow import news_sentiment_flow
+from src.research.common.models.peer_group import PeerGroup
+from src.research.news_sentiment.news_sentiment_models import NewsSentimentSummary
+
+
+class FakeCache:
+    """In-memory stand-in for the research cache, keyed like the real one."""
+
+    def __init__(self):
+        self.reports = {}
+
+    async def get_cached_model(self, report_type, symbol, model, input_fingerprint=None):
+        return self.reports.get((report_type, symbol, input_fingerprint))
+
+    async def cache_report(self, report_type, symbol, data, ttl=None, schema=None, input_fingerprint=None):
+        self.reports[(report_type, symbol, input_fingerprint)] = data
+        return True
+
+
+class TestPeerGroupFlow:
+
+    def test_peer_group_symbols_ignores_order_and_case(self):
+        """Test that the cache key projection only depends on the peer symbols."""
+        first = PeerGroup(original_symbol="AAPL", peer_group=["MSFT", "GOOGL", "AMZN"])
+        second = PeerGroup(original_symbol="AAPL", peer_group=["amzn", " GOOGL", "MSFT"])
+
+        assert peer_group_symbols(first) == peer_group_symbols(second) == ["AMZN", "GOOGL", "MSFT"]
+
+    @patch('src.flows.subflows.peer_group_flow.peer_group_reporting_task')
+    @patch('src.flows.subflows.peer_group_flow.peer_group_agent')
+    @patch('src.lib.cached_stage.get_async_supabase_cache')
+    @pytest.mark.anyio
+    async def test_second_run_reuses_peer_group_and_dependent_stage(
+        self,
+        mock_get_cache,
+        mock_peer_group_agent,
+        mock_peer_group_reporting_task
+    ):
+        """Test that a second run reuses the peer group and a stage keyed on it, even if the agent reorders the peers."""
+        mock_get_cache.return_value = FakeCache()
+        mock_peer_group_agent.side_effect = [
+            PeerGroup(original_symbol="AAPL", peer_group=["MSFT", "GOOGL"]),
+            PeerGroup(original_symbol="AAPL", peer_group=["GOOGL", "MSFT"]),
+        ]
+        summary = NewsSentimentSummary.model_construct(symbol="AAPL", critical_insights="No material news")
+
+        with patch('src.flows.subflows.news_sentiment_flow.news_sentiment_fetch_summaries_task', AsyncMock(return_value=[])), \
+             patch('src.flows.subflows.news_sentiment_flow.news_sentiment_analysis_task', AsyncMock(return_value=summary)) as mock_analysis, \
+             patch('src.flows.subflows.news_sentiment_flow.news_sentiment_reporting_task', AsyncMock()):
+            for _ in range(2):
+                peer_group = await peer_group_flow("AAPL")
+                result = await news_sentiment_flow("AAPL", peer_group)
+            # The agent ran again for a forced refresh, but listed the same peers in another order
+            peer_group = await peer_group_flow("AAPL", force_recompute=True)
+            result = await news_sentiment_flow("AAPL", peer_group)
+
+        assert result == summary
+        assert mock_peer_group_agent.call_count == 2
+        assert mock_analysis.call_count == 1
@@ -18,6 +18,7 @@ from src.research.comprehensive_report.comprehensive_report_models import Compre
 
 class TestMainResearchFlow:
     
+    @patch('src.flows.research_flow.earnings_calendar_task')
     @patch('src.flows.research_flow.key_insights_flow')
     @patch('src.flows.research_flow.comprehensive_report_flow')
     @patch('src.flows.research_flow.ensure_reporting_directory_exists')
@@ -26,8 +27,7 @@ class TestMainResearchFlow:
     @patch('src.flows.research_flow.news_sentiment_flow')
     @patch('src.flows.research_flow.forward_pe_flow')
     @patch('src.flows.research_flow.forward_pe_sanity_check_flow')
-    @patch('src.flows.research_flow.peer_group_reporting_task')
-    @patch('src.flows.research_flow.peer_group_agent')
+    @patch('src.flows.research_flow.peer_group_flow')
     @patch('src.flows.research_flow.management_guidance_flow')
     @patch('src.flows.research_flow.earnings_projections_flow')
     @patch('src.flows.research_flow.financial_statements_flow')
@@ -39,8 +39,7 @@ class TestMainResearchFlow:
         mock_financial_statements_flow,
         mock_earnings_projections_flow,
         mock_management_guidance_flow,
-        mock_peer_group_agent,
-        mock_peer_group_reporting_task,
+        mock_peer_group_flow,
         mock_forward_pe_sanity_check_flow,
         mock_forward_pe_flow,
         mock_news_sentiment_flow,
@@ -48,7 +47,8 @@ class TestMainResearchFlow:
         mock_trade_ideas_flow,
         mock_ensure_reporting_directory_exists,
         mock_comprehensive_report_flow,
-        mock_key_insights_flow
+        mock_key_insights_flow,
+        mock_earnings_calendar_task
     ):
         """Test successful execution of the complete main research flow."""
         
@@ -160,7 +160,7 @@ class TestMainResearchFlow:
             original_symbol="AAPL",
             peer_group=["MSFT", "GOOGL", "AMZN"]
         )
-        mock_peer_group_agent.return_value = mock_peers
+        mock_peer_group_flow.return_value = mock_peers
         
         # Mock forward PE sanity check
         mock_sanity = ForwardPeSanityCheck(
@@ -254,7 +254,6 @@ class TestMainResearchFlow:
         
         # Mock additional tasks
         mock_ensure_reporting_directory_exists.return_value = None
-        mock_peer_group_reporting_task.return_value = None
         
         # Execute the main research flow
         result = await main_research_flow("AAPL")
@@ -282,7 +281,7 @@ class TestMainResearchFlow:
             mock_financial,
             force_recompute=False
         )
-        mock_peer_group_agent.assert_called_once_with("AAPL", mock_financial)
+        mock_peer_group_flow.assert_called_once_with("AAPL", mock_financial, force_recompute=False)
         mock_forward_pe_sanity_check_flow.assert_called_once_with("AAPL", force_recompute=False)
         mock_forward_pe_flow.assert_called_once_with(
             "AAPL",
@@ -312,7 +311,8 @@ class TestMainResearchFlow:
         mock_comprehensive_report_flow.assert_called_once_with(
             "AAPL",
             ANY,
-            force_recompute=False
+            force_recompute=False,
+            stream_id=None
         )
         mock_key_insights_flow.assert_called_once_with(
             "AAPL",
@@ -28,19 +28,20 @@ class TestHistoricalEarningsFlow:
     @patch('src.flows.subflows.historical_earnings_flow.historical_earnings_reporting_task')
     @patch('src.flows.subflows.historical_earnings_flow.historical_earnings_analysis_task')
     @patch('src.flows.subflows.historical_earnings_flow.historical_earnings_fetch_task')
-    @patch('src.flows.subflows.historical_earnings_flow.historical_earnings_cache_retrieval_task')
+    @patch('src.lib.cached_stage.get_async_supabase_cache')
     @pytest.mark.anyio
     async def test_historical_earnings_flow_success(
         self, 
-        mock_cache_task,
+        mock_get_cache,
         mock_fetch_task,
         mock_analysis_task,
         mock_reporting_task
     ):
         """Test successful historical earnings flow execution."""
         
-        # Mock cache task to return None (no cached data)
-        mock_cache_task.return_value = None
+        # Mock cache lookup to return None (no cached data)
+        mock_get_cache.return_value.get_cached_model = AsyncMock(return_value=None)
+        mock_get_cache.return_value.cache_report = AsyncMock(return_value=True)
         
         # Mock fetch task result
         mock_data = HistoricalEarningsData(
@@ -90,19 +91,20 @@ class TestEarningsProjectionsFlow:
     @patch('src.flows.subflows.earnings_projections_flow.earnings_projections_reporting_task')
     @patch('src.flows.subflows.earnings_projections_flow.earnings_projections_analysis_task')
     @patch('src.flows.subflows.earnings_projections_flow.earnings_projections_fetch_task')
-    @patch('src.flows.subflows.earnings_projections_flow.earnings_projections_cache_retrieval_task')
+    @patch('src.lib.cached_stage.get_async_supabase_cache')
     @pytest.mark.anyio
     async def test_earnings_projections_flow_success(
         self,
-        mock_cache_task,
+        mock_get_cache,
         mock_fetch_task,
         mock_analysis_task,
         mock_reporting_task
     ):
         """Test successful earnings projections flow execution."""
         
-        # Mock cache task to return None (no cached data)
-        mock_cache_task.return_value = None
+        # Mock cache lookup to return None (no cached data)
+        mock_get_cache.return_value.get_cached_model = AsyncMock(return_value=None)
+        mock_get_cache.return_value.cache_report = AsyncMock(return_value=True)
         
         # Mock fetch task result
         mock_data = EarningsProjectionData(
@@ -185,19 +187,20 @@ class TestEarningsProjectionsFlow:
     @patch('src.flows.subflows.earnings_projections_flow.earnings_projections_reporting_task')
     @patch('src.flows.subflows.earnings_projections_flow.earnings_projections_analysis_task')
     @patch('src.flows.subflows.earnings_projections_flow.earnings_projections_fetch_task')
-    @patch('src.flows.subflows.earnings_projections_flow.earnings_projections_cache_retrieval_task')
+    @patch('src.lib.cached_stage.get_async_supabase_cache')
     @pytest.mark.anyio
     async def test_earnings_projections_flow_no_context(
         self,
-        mock_cache_task,
+        mock_get_cache,
         mock_fetch_task,
         mock_analysis_task,
         mock_reporting_task
     ):
         """Test earnings projections flow without historical context."""
         
-        # Mock cache task to return None (no cached data)
-        mock_cache_task.return_value = None
+        # Mock cache lookup to return None (no cached data)
+        mock_get_cache.return_value.get_cached_model = AsyncMock(return_value=None)
+        mock_get_cache.return_value.cache_report = AsyncMock(return_value=True)
         
         # Mock minimal fetch task result
         mock_data = EarningsProjectionData(
@@ -281,19 +284,20 @@ class TestFinancialStatementsFlow:
     @patch('src.flows.subflows.financial_statements_flow.financial_statements_reporting_task')
     @patch('src.flows.subflows.financial_statements_flow.financial_statements_analysis_task')
     @patch('src.flows.subflows.financial_statements_flow.financial_statements_fetch_task')
-    @patch('src.flows.subflows.financial_statements_flow.financial_statements_cache_retrieval_task')
+    @patch('src.lib.cached_stage.get_async_supabase_cache')
     @pytest.mark.anyio
     async def test_financial_statements_flow_success(
         self,
-        mock_cache_task,
+        mock_get_cache,
         mock_fetch_task,
         mock_analysis_task,
         mock_reporting_task
     ):
         """Test successful financial statements flow execution."""
         
-        # Mock cache task to return None (no cached data)
-        mock_cache_task.return_value = None
+        # Mock cache lookup to return None (no cached data)
+        mock_get_cache.return_value.get_cached_model = AsyncMock(return_value=None)
+        mock_get_cache.return_value.cache_report = AsyncMock(return_value=True)
         
         # Mock fetch task result
         mock_data = FinancialStatementsData(
@@ -344,19 +348,20 @@ class TestManagementGuidanceFlow:
     @patch('src.flows.subflows.management_guidance_flow.management_guidance_reporting_task')
     @patch('src.flows.subflows.management_guidance_flow.management_guidance_analysis_task')
     @patch('src.flows.subflows.management_guidance_flow.management_guidance_fetch_task')
-    @patch('src.flows.subflows.management_guidance_flow.management_guidance_cache_retrieval_task')
+    @patch('src.lib.cached_stage.get_async_supabase_cache')
     @pytest.mark.anyio
     async def test_management_guidance_flow_success(
         self,
-        mock_cache_task,
+        mock_get_cache,
         mock_fetch_task,
         mock_analysis_task,
         mock_reporting_task
     ):
         """Test successful management guidance flow execution."""
         
-        # Mock cache task to return None (no cached data)
-        mock_cache_task.return_value = None
+        # Mock cache lookup to return None (no cached data)
+        mock_get_cache.return_value.get_cached_model = AsyncMock(return_value=None)
+        mock_get_cache.return_value.cache_report = AsyncMock(return_value=True)
         
         # Mock fetch task result
         mock_data = ManagementGuidanceData(
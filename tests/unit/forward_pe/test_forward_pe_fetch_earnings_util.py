@@ -0,0 +1,119 @@
+"""Tests for forward PE earnings fetch utility functions."""
+
+import pytest
+from unittest.mock import patch
+from src.research.forward_pe.forward_pe_fetch_earnings_util import (
+    get_quarterly_eps_data_for_symbols,
+    iter_quarterly_eps_data_for_symbols,
+    extract_next_quarter_eps_from_estimates,
+    latest_reported_quarters
+)
+from src.research.forward_pe.forward_pe_models import ForwardPEEarningsSummary
+
+
+def _overview(symbol):
+    return {"Symbol": symbol, "Name": f"{symbol} Inc", "PERatio": "25.0", "FiscalYearEnd": "December"}
+
+
+def _earnings(symbol):
+    return {"symbol": symbol, "quarterlyEarnings": [{"fiscalDateEnding": f"2024-0{i}-30", "reportedEPS": "1.00"} for i in range(1, 10)] + [{"fiscalDateEnding": "2021-12-31", "reportedEPS": "0.50"}]}
+
+
+def _estimates(symbol):
+    return {"estimates": [{"horizon": "next fiscal quarter", "eps_estimate_average": "1.25"}]}
+
+
+def _quote(symbol):
+    return {"Global Quote": {"01. symbol": symbol, "05. price": "100.00"}}
+
+
+PATCH_PREFIX = 'src.research.forward_pe.forward_pe_fetch_earnings_util'
+
+
+class TestForwardPEFetchEarningsUtil:
+
+    @pytest.fixture(autouse=True)
+    def mock_record_calendar(self):
+        with patch(f'{PATCH_PREFIX}.get_supabase_cache') as mock_get_cache:
+            yield mock_get_cache.return_value.ttl_policy.record_earnings
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_global_quote', side_effect=_quote)
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings_estimates', side_effect=_estimates)
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings', side_effect=_earnings)
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_overview', side_effect=_overview)
+    def test_get_quarterly_eps_data_for_symbols_fetches_overview_once(self, mock_overview, mock_earnings, mock_estimates, mock_quote):
+        """Test that each endpoint is called once per symbol and input order is kept."""
+        result = get_quarterly_eps_data_for_symbols(["AAPL", "MSFT", "GOOGL"])
+
+        assert [summary.symbol for summary in result] == ["AAPL", "MSFT", "GOOGL"]
+        assert mock_overview.call_count == 3
+        assert mock_earnings.call_count == 3
+        assert mock_estimates.call_count == 3
+        assert mock_quote.call_count == 3
+
+        summary = result[0]
+        assert isinstance(summary, ForwardPEEarningsSummary)
+        assert summary.current_price == "100.00"
+        assert summary.consensus_eps_next_quarter == "1.25"
+        assert len(summary.quarterly_earnings) == 9
+        assert "Name" not in summary.overview
+        assert summary.overview["PERatio"] == "25.0"
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_global_quote', side_effect=_quote)
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings_estimates', side_effect=_estimates)
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings', side_effect=_earnings)
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_overview', side_effect=_overview)
+    def test_fetch_records_earnings_calendars(self, mock_overview, mock_earnings, mock_estimates, mock_quote, mock_record_calendar):
+        """Test that the downloaded EARNINGS responses refresh each symbol's earnings calendar."""
+        get_quarterly_eps_data_for_symbols(["AAPL", "MSFT"])
+
+        recorded = sorted(call.args[0] for call in mock_record_calendar.call_args_list)
+        assert recorded == ["AAPL", "MSFT"]
+        assert mock_record_calendar.call_args.args[2] == _estimates("MSFT")
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_global_quote', side_effect=_quote)
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings_estimates', side_effect=_estimates)
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings', side_effect=_earnings)
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_overview')
+    def test_get_quarterly_eps_data_for_symbols_skips_failures(self, mock_overview, mock_earnings, mock_estimates, mock_quote):
+        """Test that empty overviews and endpoint errors skip only the affected symbol."""
+        def overview(symbol):
+            if symbol == "BAD":
+                raise Exception("API error")
+            if symbol == "EMPTY":
+                return {}
+            return _overview(symbol)
+        mock_overview.side_effect = overview
+
+        result = get_quarterly_eps_data_for_symbols(["AAPL", "BAD", "EMPTY", "MSFT"])
+
+        assert [summary.symbol for summary in result] == ["AAPL", "MSFT"]
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_global_quote', side_effect=_quote)
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings_estimates', side_effect=_estimates)
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings', side_effect=_earnings)
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_overview', side_effect=_overview)
+    def test_iter_quarterly_eps_data_for_symbols_deduplicates(self, mock_overview, mock_earnings, mock_estimates, mock_quote):
+        """Test that repeated symbols are only fetched once."""
+        result = list(iter_quarterly_eps_data_for_symbols(["AAPL", "AAPL"]))
+
+        assert len(result) == 1
+        mock_overview.assert_called_once_with("AAPL")
+
+    def test_iter_quarterly_eps_data_for_symbols_empty(self):
+        """Test that no symbols yields nothing."""
+        assert list(iter_quarterly_eps_data_for_symbols([])) == []
+
+    def test_extract_next_quarter_eps_from_estimates_missing(self):
+        """Test consensus extraction without estimates."""
+        assert extract_next_quarter_eps_from_estimates({}) == "Not enough consensus"
+
+    def test_latest_reported_quarters_skips_upcoming_quarter(self):
+        """Test that a scheduled quarter listed first does not count toward the kept quarters."""
+        quarters = [{"fiscalDateEnding": "2024-12-31", "reportedEPS": "None"}] + _earnings("AAPL")["quarterlyEarnings"]
+
+        kept = latest_reported_quarters(quarters, 5)
+
+        assert len(kept) == 6
+        assert kept[0]["reportedEPS"] == "None"
+        assert all(quarter["reportedEPS"] != "None" for quarter in kept[1:])
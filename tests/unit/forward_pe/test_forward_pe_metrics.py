@@ -0,0 +1,112 @@
+"""Tests for the deterministic forward PE metrics."""
+
+import pytest
+from unittest.mock import patch
+from src.lib.alpha_vantage_records import parse_reports
+from src.research.forward_pe.forward_pe_metrics import compute_forward_pe_metrics, format_metrics_table
+from src.research.forward_pe.forward_pe_models import ForwardPEEarningsSummary
+from src.research.forward_pe.forward_pe_sanity_check_rules import rule_based_sanity_check
+
+
+def _summary(symbol, price, reported, estimated=None, consensus="1.25", overview=None):
+    estimated = estimated or reported
+    return ForwardPEEarningsSummary(
+        symbol=symbol,
+        overview=overview or {},
+        current_price=price,
+        quarterly_earnings=[
+            {"fiscalDateEnding": f"{2024 - i // 4}-{12 - 3 * (i % 4):02d}-30", "reportedEPS": r, "estimatedEPS": e}
+            for i, (r, e) in enumerate(zip(reported, estimated))
+        ],
+        consensus_eps_next_quarter=consensus
+    )
+
+
+class TestForwardPEMetrics:
+
+    def test_trailing_and_forward_pe(self):
+        """Test P/E, consensus growth, surprise and 52 week P/E range of the valued symbol."""
+        summary = _summary(
+            "AAPL", "100.00",
+            reported=["1.10", "1.00", "1.00", "1.00", "0.90"],
+            estimated=["1.00", "1.00", "0.80", "1.25", "None"],
+            overview={"52WeekLow": "82.0", "52WeekHigh": "123.0"}
+        )
+
+        row = compute_forward_pe_metrics("AAPL", [summary]).rows[0]
+
+        assert row.trailing_eps == pytest.approx(4.1)
+        assert row.forward_eps == pytest.approx(4.35)
+        assert row.trailing_pe == pytest.approx(100 / 4.1, abs=1e-4)
+        assert row.forward_pe == pytest.approx(100 / 4.35, abs=1e-4)
+        assert row.consensus_yoy_growth_pct == pytest.approx(25.0)
+        assert (row.pe_52_week_low, row.pe_52_week_high) == (20.0, 30.0)
+        assert row.quarters_reported == 5
+        assert row.eps_surprise_mean_pct == pytest.approx((10 + 0 + 25 - 20) / 4)
+        assert row.eps_beat_rate == 0.75
+
+    def test_upcoming_quarter_is_skipped(self):
+        """Test that metrics start at the latest reported quarter when an upcoming quarter is listed first."""
+        summary = _summary(
+            "AAPL", "100.00",
+            reported=["None", "1.10", "1.00", "1.00", "1.00"],
+            estimated=["1.20", "1.00", "1.00", "1.00", "1.00"],
+            consensus="1.20"
+        )
+
+        row = compute_forward_pe_metrics("AAPL", [summary]).rows[0]
+
+        assert row.trailing_eps == pytest.approx(4.1)
+        assert row.forward_eps == pytest.approx(4.3)
+        assert row.consensus_yoy_growth_pct == pytest.approx(20.0)
+        assert row.quarters_reported == 4
+        assert row.eps_surprise_mean_pct == pytest.approx(2.5)
+
+    def test_peer_statistics(self):
+        """Test peer medians, quartiles, premium and implied EPS, with loss-making peers excluded."""
+        summaries = [
+            _summary("MSFT", "200.00", ["2.00"] * 4, consensus="2.00"),
+            _summary("AAPL", "100.00", ["1.00"] * 4, consensus="1.00"),
+            _summary("GOOGL", "150.00", ["1.00"] * 4, consensus="1.00"),
+            _summary("LOSS", "10.00", ["-1.00"] * 4, consensus="-1.00"),
+            _summary("AMZN", "300.00", ["1.00"] * 4, consensus="1.00"),
+        ]
+
+        metrics = compute_forward_pe_metrics("AAPL", summaries)
+
+        assert [row.symbol for row in metrics.rows] == ["AAPL", "MSFT", "GOOGL", "LOSS", "AMZN"]
+        assert metrics.rows[3].forward_pe is None
+        assert metrics.peer_count == 4
+        assert metrics.peer_median_forward_pe == 37.5
+        assert metrics.peer_forward_pe_p25 == 31.25
+        assert metrics.forward_pe_premium_pct == pytest.approx(-33.3333)
+        assert metrics.forward_pe_peer_percentile == 0.0
+        assert metrics.implied_eps_at_peer_pe == pytest.approx(100 / 37.5, abs=1e-4)
+        assert metrics.implied_price_at_peer_pe == 150.0
+
+    def test_missing_data_leaves_metrics_empty(self):
+        """Test that missing consensus or quarters give NA instead of partial sums."""
+        summary = _summary("AAPL", "100.00", ["1.00", "None", "1.00", "1.00"], consensus="Not enough consensus")
+
+        metrics = compute_forward_pe_metrics("AAPL", [summary])
+        table = format_metrics_table(metrics)
+
+        assert metrics.rows[0].trailing_pe is None and metrics.rows[0].forward_pe is None
+        assert metrics.peer_median_forward_pe is None
+        assert table.splitlines()[1].startswith("AAPL|100|NA|NA|NA|NA|NA")
+        assert "peer_count=0" in table
+
+    def test_unknown_symbol_raises(self):
+        """Test that the valued symbol must have a summary."""
+        with pytest.raises(ValueError):
+            compute_forward_pe_metrics("AAPL", [_summary("MSFT", "100.00", ["1.00"] * 4)])
+
+    def test_quarters_are_parsed_once_per_summary(self):
+        """Test that the metrics and the sanity rules share one parse of a summary's quarters."""
+        summary = _summary("AAPL", "100.00", ["1.00"] * 4)
+
+        with patch('src.research.forward_pe.forward_pe_models.parse_reports', side_effect=parse_reports) as mock_parse:
+            compute_forward_pe_metrics("AAPL", [summary])
+            rule_based_sanity_check(summary)
+
+        mock_parse.assert_called_once_with(summary.quarterly_earnings)
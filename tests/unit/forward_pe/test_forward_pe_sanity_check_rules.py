@@ -0,0 +1,85 @@
+"""Tests for the rule-based forward PE sanity check."""
+
+import pytest
+from src.research.forward_pe.forward_pe_models import ForwardPEEarningsSummary
+from src.research.forward_pe.forward_pe_sanity_check_rules import (
+    get_sanity_check_metrics,
+    record_sanity_check,
+    reset_sanity_check_metrics,
+    rule_based_sanity_check,
+)
+
+
+def _summary(reported, estimated=None, consensus="1.05", price="100.00"):
+    estimated = estimated or reported
+    return ForwardPEEarningsSummary(
+        symbol="AAPL",
+        overview={},
+        current_price=price,
+        quarterly_earnings=[{"reportedEPS": r, "estimatedEPS": e} for r, e in zip(reported, estimated)],
+        consensus_eps_next_quarter=consensus
+    )
+
+
+STEADY_EPS = ["1.10", "1.05", "1.00", "1.00", "0.95", "0.95", "0.90", "0.90", "0.85"]
+
+
+class TestForwardPESanityCheckRules:
+
+    def test_steady_history_is_realistic(self):
+        """Test that consistent EPS and an in-line consensus are decided without the agent."""
+        estimated = ["1.05", "1.02", "1.00", "0.98", "0.93", "0.95", "0.88", "0.90", "0.84"]
+
+        result, reasons = rule_based_sanity_check(_summary(STEADY_EPS, estimated))
+
+        assert reasons == []
+        assert result.is_realistic == "REALISTIC"
+        assert result.earnings_data_quality == "HIGH_QUALITY"
+        assert result.consensus_reliability == "HIGH"
+        assert "forward P/E of 23.8" in result.long_form_analysis
+
+    @pytest.mark.parametrize("summary_kwargs, reason", [
+        ({"consensus": "Not enough consensus"}, "no consensus EPS"),
+        ({"consensus": "None"}, "no consensus EPS"),
+        ({"price": "0"}, "current price is missing"),
+    ])
+    def test_unusable_data_is_not_realistic(self, summary_kwargs, reason):
+        """Test that missing consensus or price is decided as insufficient data."""
+        result, reasons = rule_based_sanity_check(_summary(**{"reported": STEADY_EPS, **summary_kwargs}))
+
+        assert reasons == []
+        assert result.is_realistic == "NOT_REALISTIC"
+        assert result.consensus_reliability == "INSUFFICIENT_DATA"
+        assert reason in result.long_form_analysis
+
+    @pytest.mark.parametrize("summary_kwargs, reason", [
+        ({"consensus": "2.00"}, "consensus changes 100.0%"),
+        ({"reported": ["2.00", "0.20", "1.50", "0.10", "1.00", "1.00", "1.00", "1.00"]}, "volatile quarterly EPS"),
+        ({"reported": ["0.50", "-0.30", "-0.10", "0.90"], "consensus": "-0.50"}, "non-positive trailing or forward EPS"),
+        ({"price": "900.00"}, "forward P/E of 214.3"),
+        ({"estimated": ["1.50", "0.80"] * 5}, "erratic EPS surprises"),
+        ({"estimated": ["None"] * 9}, "no EPS surprise history"),
+        ({"reported": ["1.00", "1.00", "1.00"]}, "only 3 quarters"),
+        ({"reported": ["None", "1.00", "1.00", "1.00"], "estimated": ["1.05", "1.00", "1.00", "1.00"]}, "only 3 quarters"),
+    ])
+    def test_edge_cases_are_escalated(self, summary_kwargs, reason):
+        """Test that ambiguous data is left to the agent with the reasons."""
+        result, reasons = rule_based_sanity_check(_summary(**{"reported": STEADY_EPS, **summary_kwargs}))
+
+        assert result is None
+        assert any(reason in flag for flag in reasons), reasons
+
+    def test_escalation_metrics(self):
+        """Test the escalation rate and the estimated agent time saved."""
+        reset_sanity_check_metrics()
+        assert get_sanity_check_metrics()["escalation_rate"] is None
+
+        record_sanity_check(escalated=False)
+        record_sanity_check(escalated=False)
+        record_sanity_check(escalated=False)
+        record_sanity_check(escalated=True, agent_seconds=12.0)
+
+        metrics = get_sanity_check_metrics()
+        assert metrics["escalation_rate"] == 0.25
+        assert metrics["estimated_agent_seconds_saved"] == 36.0
+        reset_sanity_check_metrics()
@@ -0,0 +1,60 @@
+"""Tests for parsed Alpha Vantage records and compact prompt JSON."""
+
+import json
+import numpy as np
+from src.lib.alpha_vantage_records import compact_payload, parse_number, parse_reports, to_compact_json
+from src.research.financial_statements.financial_statements_models import FinancialStatementsData
+
+
+INCOME_STATEMENTS = [
+    {"fiscalDateEnding": "2024-09-30", "reportedCurrency": "USD", "totalRevenue": "391035000000", "researchAndDevelopment": "None", "grossMargin": "0.462"},
+    {"fiscalDateEnding": "2023-09-30", "reportedCurrency": "USD", "totalRevenue": "383285000000", "researchAndDevelopment": "None"},
+]
+
+
+class TestAlphaVantageRecords:
+    """Test parse_number, parse_reports and the compact JSON form."""
+
+    def test_parse_number_treats_placeholders_as_nan(self):
+        """Test that Alpha Vantage's missing value placeholders all parse to NaN."""
+        assert parse_number("1.5") == 1.5
+        assert parse_number(" 2.75% ") == 2.75
+        assert parse_number(3) == 3.0
+        for value in ("None", "-", "", "Not enough consensus", None, "inf", {}):
+            assert np.isnan(parse_number(value))
+
+    def test_parse_reports_builds_typed_columns(self):
+        """Test that reports become date and float columns with uniform missing values."""
+        records = parse_reports(INCOME_STATEMENTS + [{"fiscalDateEnding": "None"}])
+
+        assert records.dtype.names == ("fiscalDateEnding", "totalRevenue", "researchAndDevelopment", "grossMargin")
+        assert records["fiscalDateEnding"].dtype == np.dtype("datetime64[D]")
+        assert str(records["fiscalDateEnding"][0]) == "2024-09-30" and np.isnat(records["fiscalDateEnding"][2])
+        np.testing.assert_array_equal(records["totalRevenue"], [391035000000.0, 383285000000.0, np.nan])
+        assert np.isnan(records["researchAndDevelopment"]).all()
+        assert len(parse_reports([])) == 0
+
+    def test_compact_payload_is_columnar(self):
+        """Test that report lists become one list per field, with numbers and placeholders normalized."""
+        compact = compact_payload({"symbol": "AAPL", "annualReports": INCOME_STATEMENTS, "note": "None", "change": "1.2%"})
+
+        assert compact == {
+            "symbol": "AAPL",
+            "annualReports": {
+                "fiscalDateEnding": ["2024-09-30", "2023-09-30"],
+                "reportedCurrency": ["USD", "USD"],
+                "totalRevenue": [391035000000, 383285000000],
+                "grossMargin": [0.462, None],
+            },
+            "change": "1.2%",
+        }
+
+    def test_compact_json_of_model_is_smaller(self):
+        """Test that a data model serializes to equivalent, smaller JSON."""
+        data = FinancialStatementsData(symbol="AAPL", income_statements=INCOME_STATEMENTS * 3, balance_sheets=[], cash_flow_statements=[])
+
+        compact = to_compact_json(data)
+
+        assert len(compact) < len(data.model_dump_json()) * 0.7
+        assert json.loads(compact)["income_statements"]["totalRevenue"][1] == 383285000000
+        assert json.loads(compact)["balance_sheets"] == []
@@ -0,0 +1,65 @@
+"""Tests for research_cache payload encoding."""
+
+from typing import List
+from unittest.mock import patch
+from pydantic import BaseModel
+from src.lib.cache_codec import decode_model, decode_payload, encode_payload, schema_version
+
+
+class Item(BaseModel):
+    name: str
+    value: float
+
+
+class ItemV2(BaseModel):
+    name: str
+    value: float
+    weight: float
+
+
+class TestCacheCodec:
+    """Test cache payload encoding and decoding."""
+
+    def test_model_round_trip_is_versioned(self):
+        """Test that models are stored with their schema version and decode to the model."""
+        envelope = encode_payload(Item(name="a", value=1.5))
+
+        assert envelope["schema"] == "Item"
+        assert envelope["schema_version"] == schema_version(Item)
+        assert decode_model(envelope, Item) == Item(name="a", value=1.5)
+        assert decode_payload(envelope) == {"name": "a", "value": 1.5}
+
+    def test_large_payloads_are_compressed(self):
+        """Test that payloads above the threshold are gzip-compressed."""
+        items = [Item(name="item", value=i) for i in range(200)]
+        with patch("src.lib.cache_codec.CACHE_COMPRESSION_MIN_BYTES", 1024):
+            envelope = encode_payload(items, schema=List[Item])
+
+        assert envelope["encoding"] == "gzip+base64"
+        assert len(envelope["payload"]) < envelope["raw_bytes"]
+        assert decode_model(envelope, List[Item]) == items
+
+    def test_stale_schema_is_a_miss(self):
+        """Test that entries written by another schema version are misses without validation."""
+        envelope = encode_payload(ItemV2(name="a", value=1.0, weight=2.0))
+
+        with patch("src.lib.cache_codec._payload_bytes") as mock_payload_bytes:
+            assert decode_model(envelope, Item) is None
+            mock_payload_bytes.assert_not_called()
+
+    def test_legacy_entries_are_migrated(self):
+        """Test that pre-codec entries are validated once with their metadata stripped."""
+        legacy = {"name": "a", "value": 1.0, "_cache_metadata": {"cached_at": "2024-01-01"}}
+        legacy_list = {"data": [{"name": "a", "value": 1.0}], "_cache_metadata": {}}
+
+        assert decode_model(legacy, Item) == Item(name="a", value=1.0)
+        assert decode_model(legacy_list, List[Item]) == [Item(name="a", value=1.0)]
+        assert decode_model({"name": "a"}, Item) is None
+        assert decode_payload(legacy) is legacy
+
+    def test_plain_data_round_trip(self):
+        """Test that non-model data round-trips without a schema."""
+        envelope = encode_payload({"last_report_date": "2024-05-02"})
+
+        assert envelope["schema_version"] is None
+        assert decode_payload(envelope) == {"last_report_date": "2024-05-02"}
@@ -0,0 +1,186 @@
+"""Tests for the market-calendar-aware cache TTL policy."""
+
+import pytest
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock, patch
+from src.lib.cache_ttl_policy import CacheTTLPolicy, EarningsDates, estimate_earnings_dates
+from src.lib.market_calendar import MARKET_TIMEZONE
+
+PATCH_PREFIX = 'src.lib.cache_ttl_policy'
+
+
+@pytest.fixture
+def cache():
+    cache = MagicMock()
+    cache.get_cached_analysis.return_value = None
+    cache.invalidate_cache.return_value = 0
+    return cache
+
+
+def _policy_with_dates(cache, last_report_date, next_report_date):
+    policy = CacheTTLPolicy(cache)
+    policy.get_earnings_dates = MagicMock(return_value=EarningsDates("AAPL", last_report_date, next_report_date))
+    return policy
+
+
+class TestEstimateEarningsDates:
+
+    def test_uses_upcoming_reported_date(self):
+        """Test that an expected reportedDate in the estimates is preferred."""
+        dates = estimate_earnings_dates(
+            "AAPL",
+            {"quarterlyEarnings": [{"fiscalDateEnding": "2024-03-31", "reportedDate": "2024-05-02"}]},
+            {"estimates": [{"reportedDate": "2024-08-01"}, {"reportedDate": "2024-05-02"}]},
+            today=date(2024, 5, 10)
+        )
+
+        assert dates.last_report_date == date(2024, 5, 2)
+        assert dates.next_report_date == date(2024, 8, 1)
+
+    def test_projects_from_reporting_lag(self):
+        """Test the next fiscal quarter end plus the last reporting lag as a fallback."""
+        dates = estimate_earnings_dates(
+            "AAPL",
+            {"quarterlyEarnings": [{"fiscalDateEnding": "2024-03-31", "reportedDate": "2024-05-02"}]},
+            {"estimates": [{"horizon": "next fiscal quarter", "date": "2024-06-30"}]},
+            today=date(2024, 5, 10)
+        )
+
+        assert dates.next_report_date == date(2024, 8, 1)
+
+
+class TestCacheTTLPolicy:
+
+    def test_market_report_survives_weekend(self, cache):
+        """Test that a Friday afternoon report expires at Monday's open."""
+        policy = _policy_with_dates(cache, date(2024, 5, 2), date(2024, 8, 1))
+
+        ttl = policy.report_ttl("news_sentiment", "AAPL", now=datetime(2024, 5, 10, 15))
+
+        assert ttl == int((datetime(2024, 5, 13, 9, 30) - datetime(2024, 5, 10, 15)).total_seconds())
+
+    def test_report_day_expires_at_release_checkpoint(self, cache):
+        """Test that a report computed the morning of an earnings release expires after the close."""
+        policy = _policy_with_dates(cache, date(2024, 5, 2), date(2024, 8, 1))
+
+        ttl = policy.report_ttl("historical_earnings", "AAPL", now=datetime(2024, 8, 1, 10))
+
+        assert ttl == int((datetime(2024, 8, 1, 16, 30) - datetime(2024, 8, 1, 10)).total_seconds())
+
+    def test_utc_now_uses_eastern_checkpoints(self, cache):
+        """Test that TTLs computed from UTC times expire at the Eastern open and post-close checkpoint."""
+        policy = _policy_with_dates(cache, date(2024, 5, 2), date(2024, 8, 1))
+
+        # 20:00 UTC is 16:00 EDT: the next open is 13:30 UTC on Monday
+        friday_close = datetime(2024, 5, 10, 20, tzinfo=timezone.utc)
+        assert policy.report_ttl("news_sentiment", "AAPL", now=friday_close) == int(
+            (datetime(2024, 5, 13, 13, 30, tzinfo=timezone.utc) - friday_close).total_seconds()
+        )
+        # 14:00 UTC on the report day expires at 16:30 EDT, 20:30 UTC
+        report_morning = datetime(2024, 8, 1, 14, tzinfo=timezone.utc)
+        assert policy.report_ttl("historical_earnings", "AAPL", now=report_morning) == int(
+            (datetime(2024, 8, 1, 20, 30, tzinfo=timezone.utc) - report_morning).total_seconds()
+        )
+
+    def test_unknown_report_type_is_unmanaged(self, cache):
+        """Test that unknown report types fall back to the cache default."""
+        assert CacheTTLPolicy(cache).report_ttl("test_report", "AAPL") is None
+
+    def test_cache_key_dates(self, cache):
+        """Test fundamental keys follow the earnings epoch and market keys the session."""
+        policy = _policy_with_dates(cache, date(2024, 5, 2), date(2024, 8, 1))
+        saturday = datetime(2024, 5, 11, 12)
+
+        assert policy.cache_key_date("financial_statements", "AAPL", now=saturday) == "20240502"
+        assert policy.cache_key_date("trade_ideas", "AAPL", now=saturday) == "20240510"
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings_estimates', return_value={"estimates": []})
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings')
+    def test_new_earnings_invalidate_reports(self, mock_earnings, mock_estimates, cache):
+        """Test that a report landing since the previous session invalidates older reports."""
+        mock_earnings.return_value = {"quarterlyEarnings": [
+            {"fiscalDateEnding": "2024-03-31", "reportedDate": "2024-05-02", "reportTime": "pre-market"}
+        ]}
+        policy = CacheTTLPolicy(cache)
+
+        policy.get_earnings_dates("AAPL", now=datetime(2024, 5, 3, 8))
+        policy.get_earnings_dates("AAPL", now=datetime(2024, 5, 3, 12))
+
+        mock_earnings.assert_called_once()
+        # Reports cached after the pre-market release on the 2nd already reflect it
+        cache.invalidate_cache.assert_called_once_with("report:*:AAPL:*", cached_before=datetime(2024, 5, 2, 9, 30, tzinfo=MARKET_TIMEZONE))
+        cache.cache_analysis.assert_called_once()
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings_estimates', return_value={"estimates": []})
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings')
+    def test_utc_evening_belongs_to_eastern_session(self, mock_earnings, mock_estimates, cache):
+        """Test that a post-market report is new on the UTC day after it, which is still the same Eastern session."""
+        mock_earnings.return_value = {"quarterlyEarnings": [
+            {"fiscalDateEnding": "2024-03-31", "reportedDate": "2024-05-02", "reportTime": "post-market"}
+        ]}
+
+        # 00:30 UTC on the 3rd is 20:30 EDT on the 2nd
+        CacheTTLPolicy(cache).get_earnings_dates("AAPL", now=datetime(2024, 5, 3, 0, 30, tzinfo=timezone.utc))
+
+        cache.invalidate_cache.assert_called_once_with(
+            "report:*:AAPL:*", cached_before=datetime(2024, 5, 2, 20, 30, tzinfo=timezone.utc)
+        )
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings_estimates', return_value={"estimates": []})
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings')
+    def test_old_earnings_do_not_invalidate(self, mock_earnings, mock_estimates, cache):
+        """Test that a calendar refresh without new earnings keeps cached reports."""
+        mock_earnings.return_value = {"quarterlyEarnings": [{"fiscalDateEnding": "2024-03-31", "reportedDate": "2024-05-02"}]}
+
+        CacheTTLPolicy(cache).get_earnings_dates("AAPL", now=datetime(2024, 6, 3, 12))
+
+        cache.invalidate_cache.assert_not_called()
+
+    def test_cached_calendar_skips_api(self, cache):
+        """Test that a calendar cached by another worker is reused."""
+        cache.get_cached_analysis.return_value = {"last_report_date": "2024-05-02", "next_report_date": "2024-08-01", "_cache_metadata": {}}
+
+        with patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings') as mock_earnings:
+            dates = CacheTTLPolicy(cache).get_earnings_dates("AAPL")
+
+        assert dates.next_report_date == date(2024, 8, 1)
+        mock_earnings.assert_not_called()
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings_estimates', return_value={"estimates": []})
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings')
+    def test_failed_fetch_is_retried_later(self, mock_earnings, mock_estimates, cache):
+        """Test that a failed calendar fetch is not remembered for the rest of the session."""
+        mock_earnings.side_effect = [Exception("rate limited"), {"quarterlyEarnings": [{"reportedDate": "2024-05-02"}]}]
+        policy = CacheTTLPolicy(cache)
+
+        assert policy.get_earnings_dates("AAPL", now=datetime(2024, 6, 3, 10)) is None
+        assert policy.get_earnings_dates("AAPL", now=datetime(2024, 6, 3, 10, 1)) is None
+        dates = policy.get_earnings_dates("AAPL", now=datetime(2024, 6, 3, 10, 10))
+
+        assert dates.last_report_date == date(2024, 5, 2)
+        assert mock_earnings.call_count == 2
+
+    def test_lookups_do_not_fetch_the_calendar(self, cache):
+        """Test that cache keys and TTLs fall back to the session instead of calling Alpha Vantage."""
+        policy = CacheTTLPolicy(cache)
+        now = datetime(2024, 5, 11, 12)
+
+        with patch(f'{PATCH_PREFIX}.call_alpha_vantage_earnings') as mock_earnings:
+            assert policy.cache_key_date("financial_statements", "AAPL", now=now) == "20240510"
+            assert policy.report_ttl("news_sentiment", "AAPL", now=now) == int((datetime(2024, 5, 13, 9, 30) - now).total_seconds())
+
+        mock_earnings.assert_not_called()
+
+    def test_record_earnings_populates_calendar(self, cache):
+        """Test that responses fetched elsewhere set the calendar once per change."""
+        policy = CacheTTLPolicy(cache)
+        earnings = {"quarterlyEarnings": [{"fiscalDateEnding": "2024-03-31", "reportedDate": "2024-05-02"}]}
+        estimates = {"estimates": [{"reportedDate": "2024-08-01"}]}
+        now = datetime(2024, 5, 10, 12)
+
+        policy.record_earnings("aapl", earnings, estimates, now=now)
+        policy.record_earnings("AAPL", earnings, estimates, now=now)
+
+        assert policy.cache_key_date("historical_earnings", "AAPL", now=now) == "20240502"
+        cache.cache_analysis.assert_called_once()
+        assert cache.cache_analysis.call_args.kwargs["ttl"] == int((datetime(2024, 5, 17, 12) - now).total_seconds())
@@ -0,0 +1,71 @@
+"""Tests for cache warmer ranking, budgets and scheduling."""
+
+from datetime import datetime, time, timezone
+from src.lib.cache_warming import STAGE_COSTS, WarmingBudget, next_warming_run, rank_hot_tickers
+from src.lib.market_calendar import MARKET_TIMEZONE
+
+NOW = datetime(2024, 5, 8, 4, 0)
+
+
+class TestRankHotTickers:
+    """Test rank_hot_tickers function."""
+
+    def test_recent_requests_outrank_older_bursts(self):
+        """Test that requests decay with age so recent demand wins."""
+        requests = (
+            [{"symbol": "aapl", "created_at": "2024-05-07T12:00:00"}] * 2
+            + [{"symbol": "MSFT", "created_at": "2024-04-27T12:00:00"}] * 4
+            + [{"symbol": "NVDA", "created_at": "2024-05-06T12:00:00"}]
+        )
+
+        assert rank_hot_tickers(requests, NOW, half_life_days=3) == ["AAPL", "NVDA", "MSFT"]
+
+    def test_limit_and_invalid_rows(self):
+        """Test that the result is capped and rows without a symbol or time are ignored."""
+        requests = [
+            {"symbol": "AAPL", "created_at": "2024-05-07T12:00:00+00:00"},
+            {"symbol": "MSFT", "created_at": "2024-05-06T12:00:00"},
+            {"symbol": None, "created_at": "2024-05-07T12:00:00"},
+            {"symbol": "NVDA", "created_at": None},
+        ]
+
+        assert rank_hot_tickers(requests, NOW, limit=1) == ["AAPL"]
+
+
+class TestWarmingBudget:
+    """Test WarmingBudget class."""
+
+    def test_reserve_stops_when_budget_exceeded(self):
+        """Test that stages are charged until either allowance would be exceeded."""
+        cost = STAGE_COSTS["management_guidance"]
+        budget = WarmingBudget(alpha_vantage_calls=100, llm_calls=cost.llm_calls * 2)
+
+        assert budget.try_reserve("management_guidance")
+        assert budget.try_reserve("management_guidance")
+        assert not budget.try_reserve("management_guidance")
+        assert budget.spent_llm_calls == cost.llm_calls * 2
+        assert budget.try_reserve("earnings_calendar")
+
+
+class TestNextWarmingRun:
+    """Test next_warming_run function."""
+
+    def test_runs_before_the_open_on_trading_days(self):
+        """Test that runs land before the open on the next trading day."""
+        run_at = time(5, 0)
+
+        assert next_warming_run(datetime(2024, 5, 8, 4, 0), run_at) == datetime(2024, 5, 8, 5, 0, tzinfo=MARKET_TIMEZONE)
+        assert next_warming_run(datetime(2024, 5, 8, 6, 0), run_at) == datetime(2024, 5, 9, 5, 0, tzinfo=MARKET_TIMEZONE)
+        # Friday evening skips the weekend
+        assert next_warming_run(datetime(2024, 5, 10, 20, 0), run_at) == datetime(2024, 5, 13, 5, 0, tzinfo=MARKET_TIMEZONE)
+
+    def test_run_time_is_eastern_on_utc_hosts(self):
+        """Test that the run hour is Eastern time when now is given in UTC."""
+        # 08:00 UTC is 04:00 EDT, before a 05:00 run at 09:00 UTC
+        assert next_warming_run(datetime(2024, 5, 8, 8, 0, tzinfo=timezone.utc), time(5, 0)) == datetime(
+            2024, 5, 8, 9, 0, tzinfo=timezone.utc
+        )
+        # 02:00 UTC on Saturday is still Friday evening in New York
+        assert next_warming_run(datetime(2024, 5, 11, 2, 0, tzinfo=timezone.utc), time(5, 0)) == datetime(
+            2024, 5, 13, 9, 0, tzinfo=timezone.utc
+        )
@@ -0,0 +1,151 @@
+"""Tests for the cached_stage decorator."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from pydantic import BaseModel
+from src.lib.cached_stage import cached_stage, get_stage_metrics, input_fingerprint, reset_stage_metrics
+
+
+class StageResult(BaseModel):
+    symbol: str
+    value: int
+
+
+@pytest.fixture
+def mock_cache():
+    reset_stage_metrics()
+    with patch('src.lib.cached_stage.get_async_supabase_cache') as mock_get_cache:
+        cache = mock_get_cache.return_value
+        cache.get_cached_model = AsyncMock(return_value=None)
+        cache.cache_report = AsyncMock(return_value=True)
+        yield cache
+    reset_stage_metrics()
+
+
+class TestCachedStage:
+    """Test cached_stage decorator."""
+
+    @pytest.mark.anyio
+    async def test_hit_skips_stage(self, mock_cache):
+        """Test that a cached result is returned without running the stage."""
+        calls = []
+
+        @cached_stage("test_stage", StageResult)
+        async def stage(symbol: str, force_recompute: bool = False) -> StageResult:
+            calls.append(symbol)
+            return StageResult(symbol=symbol, value=1)
+
+        mock_cache.get_cached_model.return_value = StageResult(symbol="AAPL", value=7)
+
+        result = await stage("AAPL")
+
+        assert result.value == 7
+        assert calls == []
+        mock_cache.get_cached_model.assert_called_once_with("test_stage", "AAPL", StageResult)
+        mock_cache.cache_report.assert_not_called()
+        assert get_stage_metrics()["test_stage"]["hits"] == 1
+
+    @pytest.mark.anyio
+    async def test_miss_runs_and_caches_with_schema(self, mock_cache):
+        """Test that a miss runs the stage and caches the result with its schema."""
+        @cached_stage("test_stage", StageResult, ttl=60)
+        async def stage(symbol: str, force_recompute: bool = False) -> StageResult:
+            return StageResult(symbol=symbol, value=1)
+
+        result = await stage("AAPL")
+
+        assert result.value == 1
+        mock_cache.cache_report.assert_called_once_with("test_stage", "AAPL", result, ttl=60, schema=StageResult)
+        metrics = get_stage_metrics()["test_stage"]
+        assert metrics["misses"] == 1
+        assert metrics["hit_rate"] == 0.0
+
+    @pytest.mark.anyio
+    async def test_force_recompute_skips_lookup(self, mock_cache):
+        """Test that force_recompute bypasses the lookup but still caches the result."""
+        @cached_stage("test_stage", StageResult)
+        async def stage(symbol: str, force_recompute: bool = False) -> StageResult:
+            return StageResult(symbol=symbol, value=2)
+
+        await stage("AAPL", force_recompute=True)
+
+        mock_cache.get_cached_model.assert_not_called()
+        mock_cache.cache_report.assert_called_once()
+        assert get_stage_metrics()["test_stage"]["forced"] == 1
+
+    @pytest.mark.anyio
+    async def test_key_inputs_fingerprint_cache_key(self, mock_cache):
+        """Test that key inputs are fingerprinted into the cache key."""
+        @cached_stage("test_stage", StageResult, key_inputs=("upstream",))
+        async def stage(symbol: str, upstream: dict, force_recompute: bool = False) -> StageResult:
+            return StageResult(symbol=symbol, value=upstream["value"])
+
+        await stage("AAPL", {"value": 1})
+        await stage("AAPL", {"value": 2})
+
+        keys = [c.kwargs["input_fingerprint"] for c in mock_cache.get_cached_model.call_args_list]
+        assert keys == [input_fingerprint({"upstream": {"value": 1}}), input_fingerprint({"upstream": {"value": 2}})]
+        assert keys[0] != keys[1]
+        assert mock_cache.cache_report.call_args.kwargs["input_fingerprint"] == keys[1]
+
+    @pytest.mark.anyio
+    async def test_key_projections_fingerprint_only_the_projection(self, mock_cache):
+        """Test that a projected key input only changes the cache key when its projection does."""
+        @cached_stage(
+            "test_stage", StageResult, key_inputs=("upstream",), key_projections={"upstream": lambda u: sorted(u["peers"])}
+        )
+        async def stage(symbol: str, upstream: dict, force_recompute: bool = False) -> StageResult:
+            return StageResult(symbol=symbol, value=len(upstream["peers"]))
+
+        await stage("AAPL", {"peers": ["MSFT", "GOOGL"], "note": "first"})
+        await stage("AAPL", {"peers": ["GOOGL", "MSFT"], "note": "second"})
+        await stage("AAPL", {"peers": ["GOOGL", "AMZN"], "note": "first"})
+
+        keys = [c.kwargs["input_fingerprint"] for c in mock_cache.get_cached_model.call_args_list]
+        assert keys[0] == keys[1] == input_fingerprint({"upstream": ["GOOGL", "MSFT"]})
+        assert keys[2] != keys[0]
+
+    @pytest.mark.anyio
+    async def test_concurrent_calls_share_one_run(self, mock_cache):
+        """Test that concurrent misses for the same key run the stage once."""
+        calls = []
+
+        @cached_stage("test_stage", StageResult)
+        async def stage(symbol: str, force_recompute: bool = False) -> StageResult:
+            calls.append(symbol)
+            await asyncio.sleep(0.05)
+            return StageResult(symbol=symbol, value=3)
+
+        results = await asyncio.gather(stage("AAPL"), stage("AAPL"), stage("MSFT"))
+
+        assert [r.value for r in results] == [3, 3, 3]
+        assert sorted(calls) == ["AAPL", "MSFT"]
+        assert get_stage_metrics()["test_stage"]["coalesced"] == 1
+
+    @pytest.mark.anyio
+    async def test_errors_propagate_and_are_not_cached(self, mock_cache):
+        """Test that a failing stage raises and writes nothing to the cache."""
+        @cached_stage("test_stage", StageResult)
+        async def stage(symbol: str, force_recompute: bool = False) -> StageResult:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await stage("AAPL")
+
+        mock_cache.cache_report.assert_not_called()
+        assert get_stage_metrics()["test_stage"]["errors"] == 1
+
+    @pytest.mark.anyio
+    async def test_get_cached_looks_up_without_running(self, mock_cache):
+        """Test that get_cached only performs the lookup."""
+        calls = []
+
+        @cached_stage("test_stage", StageResult)
+        async def stage(symbol: str, force_recompute: bool = False) -> StageResult:
+            calls.append(symbol)
+            return StageResult(symbol=symbol, value=1)
+
+        assert await stage.get_cached("AAPL") is None
+        assert calls == []
+        mock_cache.get_cached_model.assert_called_once_with("test_stage", "AAPL", StageResult)
@@ -0,0 +1,116 @@
+"""Tests for embeddings and the research_docs embedding backfill."""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from src.lib.embedding_backfill import BackfillCheckpoint, EmbeddingBackfill
+from src.lib.embeddings import HashingEmbedder, chunk_text, pool_embeddings
+
+
+class TestEmbeddings:
+    """Test embedders and chunking."""
+
+    def test_hashing_embedder_is_deterministic_and_normalized(self):
+        """Test that the local embedder is stable and similar texts score higher."""
+        embedder = HashingEmbedder(dim=256)
+
+        a, b, c = embedder.embed([
+            "Apple revenue grew on strong iPhone sales",
+            "Apple revenue grew on iPhone sales",
+            "Crude oil inventories fell sharply",
+        ])
+
+        assert a == HashingEmbedder(dim=256).embed(["Apple revenue grew on strong iPhone sales"])[0]
+        assert len(a) == 256
+        assert np.linalg.norm(a) == pytest.approx(1.0)
+        assert np.dot(a, b) > np.dot(a, c)
+
+    def test_chunk_text_breaks_between_paragraphs(self):
+        """Test that chunks respect the size limit and keep paragraphs together."""
+        text = "## One\n\n" + "a" * 40 + "\n\n## Two\n\n" + "b" * 40 + "\n\n" + "c" * 130
+
+        chunks = chunk_text(text, max_chars=60)
+
+        assert chunks == ["## One\n\n" + "a" * 40 + "\n\n## Two", "b" * 40, "c" * 60, "c" * 60, "c" * 10]
+
+    def test_pool_embeddings_weights_and_normalizes(self):
+        """Test that chunk vectors are combined into a unit vector."""
+        pooled = pool_embeddings([[1.0, 0.0], [0.0, 1.0]], weights=[3, 1])
+
+        assert np.linalg.norm(pooled) == pytest.approx(1.0)
+        assert pooled[0] == pytest.approx(3 * pooled[1])
+
+
+class TestEmbeddingBackfill:
+    """Test EmbeddingBackfill class."""
+
+    @pytest.fixture
+    def rag(self):
+        rag = MagicMock()
+        rows = [
+            {"id": 1, "content": "First report", "metadata": {}},
+            {"id": 2, "content": "", "metadata": {}},
+            {"id": 3, "content": "Third report\n\nwith two sections", "metadata": {}},
+            {"id": 5, "content": "Fifth report", "metadata": {}},
+        ]
+        rag.get_unembedded_documents.side_effect = lambda after_id, limit: [
+            row for row in rows if row["id"] > after_id
+        ][:limit]
+        return rag
+
+    @pytest.fixture
+    def embedder(self):
+        embedder = MagicMock(wraps=HashingEmbedder(dim=8))
+        embedder.name = "local-hashing-8"
+        return embedder
+
+    def test_pages_embeds_and_writes_in_bulk(self, rag, embedder, tmp_path):
+        """Test that each page is embedded in batches and written with one upsert."""
+        checkpoint = BackfillCheckpoint(tmp_path / "checkpoint.json")
+        backfill = EmbeddingBackfill(rag, embedder, checkpoint, page_size=3, batch_size=2)
+
+        metrics = backfill.run()
+
+        assert metrics.pages == 2
+        assert metrics.documents == 3
+        assert metrics.skipped == 1
+        assert metrics.chunks == 3
+        assert metrics.embed_requests == 2
+        written = [call.args[0] for call in rag.update_embeddings.call_args_list]
+        assert [sorted(batch) for batch in written] == [[1, 3], [5]]
+        assert all(len(vector) == 8 for batch in written for vector in batch.values())
+        assert checkpoint.load()["last_id"] == 5
+        assert checkpoint.load()["total_documents"] == 3
+
+    def test_resumes_from_checkpoint(self, rag, embedder, tmp_path):
+        """Test that a run continues after the last written page."""
+        checkpoint = BackfillCheckpoint(tmp_path / "checkpoint.json")
+        checkpoint.save(3, "local-hashing-8", 2)
+
+        metrics = EmbeddingBackfill(rag, embedder, checkpoint, page_size=3).run()
+
+        assert metrics.documents == 1
+        rag.get_unembedded_documents.assert_any_call(after_id=3, limit=3)
+        assert checkpoint.load()["total_documents"] == 3
+
+    def test_write_failure_does_not_advance_checkpoint(self, rag, embedder, tmp_path):
+        """Test that a failed page is retried by the next run."""
+        checkpoint = BackfillCheckpoint(tmp_path / "checkpoint.json")
+        rag.update_embeddings.side_effect = Exception("connection reset")
+
+        with pytest.raises(Exception):
+            EmbeddingBackfill(rag, embedder, checkpoint, page_size=3).run()
+
+        assert checkpoint.load()["last_id"] == 0
+
+    def test_embedder_change_requires_reset(self, rag, embedder, tmp_path):
+        """Test that a checkpoint from another embedder is refused until it is reset."""
+        checkpoint = BackfillCheckpoint(tmp_path / "checkpoint.json")
+        checkpoint.save(3, "openai-text-embedding-3-small", 2)
+
+        with pytest.raises(ValueError, match="--reset"):
+            EmbeddingBackfill(rag, embedder, checkpoint, page_size=3).run()
+        rag.get_unembedded_documents.assert_not_called()
+
+        checkpoint.reset()
+        assert EmbeddingBackfill(rag, embedder, checkpoint, page_size=3).run().documents == 3
@@ -0,0 +1,98 @@
+"""Tests for fiscal year decision memoization."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from src.lib.fiscal_year_utils import (
+    FiscalYearInfo,
+    clear_fiscal_year_info_memo,
+    get_fiscal_year_info,
+    seed_fiscal_year_info,
+    _fiscal_info_to_dict
+)
+
+PATCH_PREFIX = 'src.lib.fiscal_year_utils'
+
+
+@pytest.fixture(autouse=True)
+def shared_cache():
+    clear_fiscal_year_info_memo()
+    cache = MagicMock()
+    cache.get_cached_analysis.return_value = None
+    with patch(f'{PATCH_PREFIX}.get_supabase_cache', return_value=cache):
+        yield cache
+    clear_fiscal_year_info_memo()
+
+
+class TestFiscalYearInfoMemo:
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_overview')
+    def test_decision_memoized_per_day(self, mock_overview, shared_cache):
+        """Test that OVERVIEW is fetched once and the decision is shared."""
+        mock_overview.return_value = {"FiscalYearEnd": "September"}
+
+        first = get_fiscal_year_info("AAPL")
+        second = get_fiscal_year_info("aapl")
+
+        assert first is second
+        mock_overview.assert_called_once_with("AAPL")
+        shared_cache.cache_analysis.assert_called_once()
+        assert shared_cache.cache_analysis.call_args.kwargs["threshold_days"] == 90
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_overview')
+    def test_seeded_from_overview(self, mock_overview):
+        """Test that an already-fetched overview avoids the OVERVIEW call."""
+        fiscal_info = get_fiscal_year_info("AAPL", overview={"FiscalYearEnd": "December"})
+
+        assert fiscal_info.fiscal_year_end_month == "December"
+        mock_overview.assert_not_called()
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_overview')
+    def test_threshold_is_part_of_key(self, mock_overview):
+        """Test that different thresholds are decided separately."""
+        mock_overview.return_value = {"FiscalYearEnd": "September"}
+
+        get_fiscal_year_info("AAPL", threshold_days=90)
+        get_fiscal_year_info("AAPL", threshold_days=30)
+
+        assert mock_overview.call_count == 2
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_overview')
+    def test_shared_cache_hit(self, mock_overview, shared_cache):
+        """Test that a decision cached by another worker is reused."""
+        cached = FiscalYearInfo(
+            symbol="AAPL",
+            fiscal_year_end_month="September",
+            fiscal_year_end_date=None,
+            use_annual_data=True,
+            days_to_fiscal_end=10,
+            decision_reason="cached"
+        )
+        shared_cache.get_cached_analysis.return_value = {**_fiscal_info_to_dict(cached), "_cache_metadata": {}}
+
+        fiscal_info = get_fiscal_year_info("AAPL")
+
+        assert fiscal_info == cached
+        mock_overview.assert_not_called()
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_overview')
+    def test_errors_are_not_memoized(self, mock_overview, shared_cache):
+        """Test that a failed lookup is retried on the next call."""
+        mock_overview.side_effect = [Exception("API error"), {"FiscalYearEnd": "September"}]
+
+        assert get_fiscal_year_info("AAPL").fiscal_year_end_month == "Error"
+        assert get_fiscal_year_info("AAPL").fiscal_year_end_month == "September"
+        shared_cache.cache_analysis.assert_called_once()
+
+    @patch(f'{PATCH_PREFIX}.call_alpha_vantage_overview')
+    def test_seeding_defers_the_shared_cache(self, mock_overview, shared_cache):
+        """Test that a seeded decision skips the shared cache until it is first looked up."""
+        seed_fiscal_year_info("MSFT", {"FiscalYearEnd": "June"})
+
+        shared_cache.get_cached_analysis.assert_not_called()
+        shared_cache.cache_analysis.assert_not_called()
+
+        assert get_fiscal_year_info("MSFT").fiscal_year_end_month == "June"
+        assert get_fiscal_year_info("MSFT").fiscal_year_end_month == "June"
+        mock_overview.assert_not_called()
+        shared_cache.get_cached_analysis.assert_not_called()
+        shared_cache.cache_analysis.assert_called_once()
@@ -0,0 +1,54 @@
+"""Tests for the market trading calendar."""
+
+from datetime import date, datetime, timezone
+from src.lib.market_calendar import (
+    MARKET_TIMEZONE,
+    is_trading_day,
+    market_date,
+    market_holidays,
+    next_market_open,
+    next_trading_day,
+    previous_trading_day
+)
+
+
+class TestMarketCalendar:
+
+    def test_holidays_2024(self):
+        """Test the rule-based NYSE holidays against the published 2024 calendar."""
+        assert market_holidays(2024) == {
+            date(2024, 1, 1), date(2024, 1, 15), date(2024, 2, 19), date(2024, 3, 29),
+            date(2024, 5, 27), date(2024, 6, 19), date(2024, 7, 4), date(2024, 9, 2),
+            date(2024, 11, 28), date(2024, 12, 25),
+        }
+
+    def test_observed_holidays(self):
+        """Test weekend holidays move to the nearest weekday, except Saturday New Year's Day."""
+        assert not is_trading_day(date(2026, 7, 3))    # July 4th on a Saturday
+        assert not is_trading_day(date(2022, 12, 26))  # Christmas on a Sunday
+        assert is_trading_day(date(2021, 12, 31))      # New Year's 2022 on a Saturday
+
+    def test_trading_day_navigation(self):
+        """Test stepping over weekends and holidays."""
+        assert next_trading_day(date(2024, 3, 28)) == date(2024, 4, 1)  # Good Friday weekend
+        assert previous_trading_day(date(2024, 1, 16)) == date(2024, 1, 12)  # MLK Day
+
+    def test_market_date_maps_weekend_to_friday(self):
+        """Test that weekends belong to the preceding session."""
+        assert market_date(datetime(2024, 5, 11, 12)) == date(2024, 5, 10)
+        assert market_date(datetime(2024, 5, 13, 8)) == date(2024, 5, 13)
+
+    def test_next_market_open(self):
+        """Test the next open before, during and after a session."""
+        assert next_market_open(datetime(2024, 5, 13, 8)) == datetime(2024, 5, 13, 9, 30, tzinfo=MARKET_TIMEZONE)
+        assert next_market_open(datetime(2024, 5, 13, 12)) == datetime(2024, 5, 14, 9, 30, tzinfo=MARKET_TIMEZONE)
+        assert next_market_open(datetime(2024, 5, 10, 17)) == datetime(2024, 5, 13, 9, 30, tzinfo=MARKET_TIMEZONE)
+
+    def test_utc_moments_use_eastern_session(self):
+        """Test that UTC moments are placed in the US Eastern session, not the UTC calendar day."""
+        # 01:00 UTC on Saturday is still Friday evening in New York
+        assert market_date(datetime(2024, 5, 11, 1, tzinfo=timezone.utc)) == date(2024, 5, 10)
+        # 13:00 UTC is 09:00 EDT, before the open
+        assert next_market_open(datetime(2024, 5, 13, 13, tzinfo=timezone.utc)) == datetime(2024, 5, 13, 13, 30, tzinfo=timezone.utc)
+        # 14:00 UTC is 09:00 EST in winter
+        assert next_market_open(datetime(2024, 1, 8, 14, tzinfo=timezone.utc)) == datetime(2024, 1, 8, 14, 30, tzinfo=timezone.utc)
@@ -0,0 +1,103 @@
+"""Tests for the local news article store."""
+
+import pytest
+from datetime import datetime
+from src.lib.news_article_store import NewsArticleStore
+
+
+def _article(url, time_published, score, label):
+    return {
+        "url": url,
+        "title": f"Headline {url}",
+        "time_published": time_published,
+        "overall_sentiment_score": 0.0,
+        "overall_sentiment_label": "Neutral",
+        "ticker_sentiment": [
+            {"ticker": "AAPL", "relevance_score": "0.9", "ticker_sentiment_score": str(score), "ticker_sentiment_label": label}
+        ]
+    }
+
+
+class TestNewsArticleStore:
+    """Test NewsArticleStore class."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return NewsArticleStore(base_dir=str(tmp_path), feed_limit=3)
+
+    def test_next_time_from_empty(self, store):
+        """Test that an empty store requests the full feed."""
+        assert store.next_time_from("AAPL") == ""
+
+    def test_update_tracks_last_published(self, store):
+        """Test that time_from advances to the newest stored article."""
+        store.update("AAPL", [
+            _article("https://a", "20240510T093000", 0.2, "Somewhat-Bullish"),
+            _article("https://b", "20240512T150000", 0.4, "Bullish"),
+        ], now=datetime(2024, 5, 12, 16))
+
+        assert store.next_time_from("AAPL") == "20240512T1500"
+
+    def test_update_deduplicates_and_returns_newest_first(self, store):
+        """Test that refetched articles are not stored twice."""
+        now = datetime(2024, 5, 12, 16)
+        store.update("AAPL", [_article("https://a", "20240510T093000", 0.2, "Somewhat-Bullish")], now=now)
+        feed = store.update("AAPL", [
+            _article("https://a", "20240510T093000", 0.2, "Somewhat-Bullish"),
+            _article("https://b", "20240512T150000", 0.4, "Bullish"),
+        ], now=now)
+
+        assert [article["url"] for article in feed] == ["https://b", "https://a"]
+
+    def test_rolling_sentiment_windows(self, store):
+        """Test that each window only counts articles inside it."""
+        store.update("AAPL", [
+            _article("https://old", "20240420T100000", -0.5, "Bearish"),
+            _article("https://week", "20240508T100000", 0.1, "Neutral"),
+            _article("https://day", "20240512T100000", 0.3, "Somewhat-Bullish"),
+        ], now=datetime(2024, 5, 12, 16))
+
+        rolling = store.get_rolling_sentiment("AAPL")
+
+        assert rolling["1d"]["count"] == 1
+        assert rolling["1d"]["mean_score"] == 0.3
+        assert rolling["7d"]["count"] == 2
+        assert rolling["7d"]["mean_score"] == 0.2
+        assert rolling["30d"]["count"] == 3
+        assert rolling["30d"]["label_distribution"] == {"Bearish": 1, "Neutral": 1, "Somewhat-Bullish": 1}
+
+    def test_rolling_sentiment_evicts_as_time_passes(self, store):
+        """Test that a later refresh with no new articles rolls the windows forward."""
+        store.update("AAPL", [_article("https://day", "20240512T100000", 0.3, "Somewhat-Bullish")], now=datetime(2024, 5, 12, 16))
+        store.update("AAPL", [], now=datetime(2024, 5, 14, 16))
+
+        rolling = store.get_rolling_sentiment("AAPL")
+
+        assert rolling["1d"] == {"count": 0, "mean_score": None, "label_distribution": {}}
+        assert rolling["7d"]["count"] == 1
+
+    def test_late_article_is_merged_by_time(self, store):
+        """Test that an article older than the newest stored one is placed and evicted by its own time."""
+        store.update("AAPL", [
+            _article("https://week", "20240508T100000", 0.1, "Neutral"),
+            _article("https://day", "20240512T100000", 0.3, "Somewhat-Bullish"),
+        ], now=datetime(2024, 5, 12, 16))
+        feed = store.update("AAPL", [_article("https://late", "20240505T100000", -0.5, "Bearish")], now=datetime(2024, 5, 12, 16))
+
+        assert [article["url"] for article in feed] == ["https://day", "https://week", "https://late"]
+        assert store.get_rolling_sentiment("AAPL")["7d"]["count"] == 2
+        assert store.get_rolling_sentiment("AAPL")["30d"]["count"] == 3
+
+        store.update("AAPL", [], now=datetime(2024, 5, 14, 16))
+        rolling = store.get_rolling_sentiment("AAPL")
+        assert rolling["7d"]["label_distribution"] == {"Neutral": 1, "Somewhat-Bullish": 1}
+        assert rolling["30d"]["count"] == 3
+
+    def test_prune_keeps_latest_feed(self, store):
+        """Test that expired articles are dropped but the latest feed_limit are retained."""
+        feed = store.update("AAPL", [
+            _article(f"https://{i}", f"2024010{i}T100000", 0.1, "Neutral") for i in range(1, 6)
+        ], now=datetime(2024, 5, 12, 16))
+
+        assert len(feed) == 3
+        assert store.get_rolling_sentiment("AAPL")["30d"]["count"] == 0
@@ -0,0 +1,96 @@
+"""Tests for the columnar price history store."""
+
+from datetime import date, datetime, timedelta, timezone
+import numpy as np
+import pytest
+from unittest.mock import patch
+from src.lib.price_history_store import PriceHistoryStore
+
+
+def daily_response(first_day: int, last_day: int, adjustment: float = 1.0, last_close: float = None) -> dict:
+    series = {}
+    for i in range(first_day, last_day):
+        close = 100.0 + i if last_close is None or i < last_day - 1 else last_close
+        series[str(date(2024, 1, 1) + timedelta(days=i))] = {
+            "1. open": f"{close}", "2. high": f"{close + 1}", "3. low": f"{close - 1}", "4. close": f"{close}",
+            "5. adjusted close": f"{close * adjustment}", "6. volume": "1000",
+            "7. dividend amount": "0.0000", "8. split coefficient": "1.0"
+        }
+    return {"Time Series (Daily)": series}
+
+
+class TestPriceHistoryStore:
+    """Test PriceHistoryStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return PriceHistoryStore(tmp_path)
+
+    @pytest.fixture
+    def mock_daily(self):
+        with patch('src.lib.price_history_store.call_alpha_vantage_time_series_daily_adjusted') as mock_daily:
+            yield mock_daily
+
+    def test_full_history_is_stored_and_sliced_by_date(self, store, mock_daily):
+        """Test that date ranges are zero-copy slices of the memory-mapped columns."""
+        mock_daily.return_value = daily_response(0, 300)
+
+        assert store.refresh("aapl") == 300
+        columns = store.load("AAPL", "2024-02-01", date(2024, 2, 10))
+
+        mock_daily.assert_called_once_with("aapl", outputsize="full")
+        assert [str(day) for day in columns["date"][[0, -1]]] == ["2024-02-01", "2024-02-10"]
+        assert isinstance(columns["close"], np.memmap)
+        np.testing.assert_array_equal(columns["close"], 100.0 + np.arange(31, 41))
+        assert store.load("MSFT") is None
+
+    def test_compact_refresh_appends_new_bars(self, store, mock_daily):
+        """Test that only bars after the stored history are appended, and a revised last bar is replaced."""
+        mock_daily.return_value = daily_response(0, 300, last_close=50.0)
+        store.refresh("AAPL")
+
+        mock_daily.return_value = daily_response(205, 305)
+        appended = store.refresh("AAPL")
+
+        columns = store.load("AAPL")
+        assert mock_daily.call_args.kwargs == {"outputsize": "compact"}
+        assert appended == 6
+        assert len(columns["date"]) == 305
+        np.testing.assert_array_equal(columns["close"], 100.0 + np.arange(305))
+
+    def test_readjusted_history_is_downloaded_again(self, store, mock_daily):
+        """Test that changed adjusted closes trigger a full download."""
+        mock_daily.return_value = daily_response(0, 300)
+        store.refresh("AAPL")
+
+        mock_daily.side_effect = [daily_response(205, 305, adjustment=0.5), daily_response(0, 305, adjustment=0.5)]
+        store.refresh("AAPL")
+
+        assert [call.kwargs for call in mock_daily.call_args_list] == [{"outputsize": "full"}, {"outputsize": "compact"}, {"outputsize": "full"}]
+        np.testing.assert_allclose(store.load("AAPL")["adjusted_close"], (100.0 + np.arange(305)) * 0.5)
+
+    def test_staleness_follows_market_sessions(self, store, mock_daily):
+        """Test that a refresh is needed after the close and in each new session."""
+        mock_daily.return_value = daily_response(0, 10)
+        store.refresh("AAPL", now=datetime(2024, 12, 27, 12, 0))
+
+        assert not store.is_stale("AAPL", now=datetime(2024, 12, 27, 15, 0))
+        assert store.is_stale("AAPL", now=datetime(2024, 12, 27, 16, 30))
+        assert store.is_stale("AAPL", now=datetime(2024, 12, 30, 9, 0))
+
+        store.refresh("AAPL", now=datetime(2024, 12, 28, 10, 0))
+        assert not store.is_stale("AAPL", now=datetime(2024, 12, 29, 10, 0))
+
+    def test_staleness_uses_eastern_close_for_utc_times(self, store, mock_daily):
+        """Test that the session close is 16:00 in New York when times are given in UTC."""
+        mock_daily.return_value = daily_response(0, 10)
+        # 15:00 EST
+        store.refresh("AAPL", now=datetime(2024, 12, 27, 20, 0, tzinfo=timezone.utc))
+
+        # 20:45 UTC is 15:45 EST, before the close
+        assert not store.is_stale("AAPL", now=datetime(2024, 12, 27, 20, 45, tzinfo=timezone.utc))
+        # 21:30 UTC is 16:30 EST, after the close
+        assert store.is_stale("AAPL", now=datetime(2024, 12, 27, 21, 30, tzinfo=timezone.utc))
+        # 01:00 UTC on Saturday is still Friday evening in New York: refreshed after the close
+        store.refresh("AAPL", now=datetime(2024, 12, 27, 22, 0, tzinfo=timezone.utc))
+        assert not store.is_stale("AAPL", now=datetime(2024, 12, 28, 1, 0, tzinfo=timezone.utc))
@@ -0,0 +1,138 @@
+"""Tests for section-chunked RAG ingestion."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.lib.rag_ingestion import RagIngestor, content_hash, count_tokens, split_report
+from src.lib.supabase_rag import SupabaseRAG
+
+
+REPORT = """Comprehensive view of the company.
+
+# Executive Summary
+
+Revenue grew 12% year over year.
+
+## Risks
+
+Supply chain concentration.
+
+# Valuation
+
+Forward P/E of 28x.
+"""
+
+
+class TestSplitReport:
+    """Test markdown report splitting."""
+
+    def test_splits_by_heading_path(self):
+        """Test that sections are named by their heading path and keep their heading."""
+        chunks = split_report(REPORT)
+
+        assert [chunk.section for chunk in chunks] == [
+            "Overview", "Executive Summary", "Executive Summary > Risks", "Valuation"
+        ]
+        assert chunks[2].content == "## Risks\n\nSupply chain concentration."
+        assert chunks[1].token_count == count_tokens(chunks[1].content)
+
+    def test_long_sections_are_split_by_tokens(self):
+        """Test that sections over the token limit are split between paragraphs."""
+        paragraphs = "\n\n".join(f"Paragraph {i} discusses margins and guidance in detail." for i in range(40))
+
+        chunks = split_report(f"# Analysis\n\n{paragraphs}", max_tokens=100)
+
+        assert len(chunks) > 1
+        assert chunks[0].section == "Analysis (1)"
+        assert all(chunk.token_count <= 110 for chunk in chunks)
+
+    def test_content_hash_ignores_whitespace(self):
+        """Test that reflowed text keeps its hash."""
+        assert content_hash("Revenue grew\n12%.") == content_hash("Revenue  grew 12%. ")
+        assert content_hash("Revenue grew 12%.") != content_hash("Revenue grew 13%.")
+
+
+class TestRagIngestor:
+    """Test RagIngestor class."""
+
+    @pytest.fixture
+    def rag(self):
+        rag = MagicMock()
+        rag.get_documents_by_hash = AsyncMock(return_value=[])
+        rag.update_documents_metadata = AsyncMock(return_value=True)
+        rag.add_documents = AsyncMock(side_effect=lambda rows: [{"id": i, **row} for i, row in enumerate(rows)])
+        return rag
+
+    @pytest.mark.anyio
+    async def test_first_ingestion_inserts_every_section(self, rag):
+        """Test that a new report is stored as one row per section in one insert."""
+        result = await RagIngestor(rag).ingest_report("aapl", "comprehensive_report", "Report", REPORT, {"report_date": "2026-10-19"})
+
+        assert (result.chunks, result.inserted, result.unchanged) == (4, 4, 0)
+        rows = rag.add_documents.call_args[0][0]
+        assert rows[3]["title"] == "Report - Valuation"
+        metadata = rows[3]["metadata"]
+        assert metadata["symbol"] == "AAPL"
+        assert metadata["report_type"] == "comprehensive_report"
+        assert metadata["section_index"] == 3
+        assert metadata["last_report_id"] == result.report_id
+        assert metadata["report_date"] == "2026-10-19"
+        assert rows[3]["embedding"] is None
+
+    @pytest.mark.anyio
+    async def test_unchanged_sections_are_not_reinserted(self, rag):
+        """Test that sections already stored are only re-stamped with the new report."""
+        stored = {chunk.content_hash: chunk for chunk in split_report(REPORT)}
+        rag.get_documents_by_hash.return_value = [
+            {"id": 10 + i, "metadata": {"content_hash": h, "symbol": "AAPL", "first_report_id": "old"}}
+            for i, h in enumerate(stored)
+            if stored[h].section != "Valuation"
+        ]
+        updated = REPORT.replace("28x", "26x")
+
+        result = await RagIngestor(rag).ingest_report("AAPL", "comprehensive_report", "Report", updated)
+
+        assert (result.chunks, result.inserted, result.unchanged) == (4, 1, 3)
+        assert [row["metadata"]["section"] for row in rag.add_documents.call_args[0][0]] == ["Valuation"]
+        restamped = rag.update_documents_metadata.call_args[0][0]
+        assert restamped[11]["last_report_id"] == result.report_id
+        assert restamped[11]["first_report_id"] == "old"
+        assert restamped[11]["section_index"] == 1
+
+    @pytest.mark.anyio
+    async def test_repeated_sections_reassemble_losslessly(self, rag):
+        """Test that a section repeated in a report is stored once and reassembled at every position."""
+        report = "# Q1\n\nRevenue rose.\n\n## Notes\n\nNo change.\n\n# Q2\n\nMargins rose.\n\n## Notes\n\nNo change.\n"
+
+        result = await RagIngestor(rag).ingest_report("AAPL", "comprehensive_report", "Report", report)
+
+        rows = rag.add_documents.call_args[0][0]
+        assert (result.chunks, result.inserted, result.distinct) == (4, 3, 3)
+        stored = [{"id": i, "content": row["content"], "metadata": row["metadata"]} for i, row in enumerate(rows)]
+        ordered = SupabaseRAG._report_order(stored)
+        assert [doc["metadata"]["section"] for doc in ordered] == ["Q1", "Q1 > Notes", "Q2", "Q2 > Notes"]
+        assert "\n\n".join(doc["content"] for doc in ordered) == "\n\n".join(chunk.content for chunk in split_report(report))
+
+    @pytest.mark.anyio
+    async def test_failed_insert_does_not_restamp_unchanged_sections(self, rag):
+        """Test that unchanged sections stay on the previous report when new sections cannot be stored."""
+        stored = split_report(REPORT)
+        rag.get_documents_by_hash.return_value = [
+            {"id": 10, "metadata": {"content_hash": stored[0].content_hash, "symbol": "AAPL"}}
+        ]
+        rag.add_documents.side_effect = RuntimeError("Added 0 of 3 documents to research_docs")
+
+        with pytest.raises(RuntimeError):
+            await RagIngestor(rag).ingest_report("AAPL", "comprehensive_report", "Report", REPORT)
+
+        rag.update_documents_metadata.assert_not_called()
+
+    def test_partly_written_report_is_not_reassembled(self):
+        """Test that a report with missing positions is rejected instead of returned truncated."""
+        docs = [
+            {"id": 1, "content": "a", "metadata": {"section": "A", "section_index": 0, "section_count": 3}},
+            {"id": 2, "content": "c", "metadata": {"section": "C", "section_index": 2, "section_count": 3}},
+        ]
+
+        assert SupabaseRAG._report_order(docs) is None
+        docs.append({"id": 3, "content": "b", "metadata": {"section": "B", "section_index": 1, "section_count": 3}})
+        assert [doc["content"] for doc in SupabaseRAG._report_order(docs)] == ["a", "b", "c"]
@@ -0,0 +1,78 @@
+"""Tests for the latest report snapshot store."""
+
+import time
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from src.lib.report_snapshot_store import ReportSnapshotStore
+
+RESULT = {"symbol": "AAPL", "comprehensive_report": {"comprehensive_analysis": "Report"}, "key_insights": {}}
+
+
+class TestReportSnapshotStore:
+    """Test ReportSnapshotStore class."""
+
+    @pytest.fixture
+    def store_with_mock(self, mock_supabase_client):
+        store = ReportSnapshotStore()
+        store._client = mock_supabase_client
+        response = MagicMock()
+        response.data = []
+        mock_supabase_client.table.return_value.execute.return_value = response
+        return store, mock_supabase_client, response
+
+    def test_swap_latest_upserts_single_row(self, store_with_mock):
+        """Test that a completed result replaces the snapshot row in one upsert."""
+        store, mock_client, _ = store_with_mock
+
+        assert store.swap_latest("aapl", "job-1", RESULT, completed_at=datetime(2024, 5, 3, 17, 0))
+
+        upserted, kwargs = mock_client.table.return_value.upsert.call_args
+        assert upserted[0]["cache_key"] == "report_latest:AAPL"
+        assert upserted[0]["expires_at"] is None
+        assert upserted[0]["data"] == {"main_job_id": "job-1", "completed_at": "2024-05-03T17:00:00", "result": RESULT}
+        assert kwargs == {"on_conflict": "cache_key"}
+
+    def test_swap_latest_keeps_newer_snapshot(self, store_with_mock):
+        """Test that an older result cannot overwrite a newer snapshot."""
+        store, mock_client, response = store_with_mock
+        response.data = [{"data": {"main_job_id": "job-2", "completed_at": "2024-05-06T10:00:00", "result": RESULT}}]
+
+        assert not store.swap_latest("AAPL", "job-1", RESULT, completed_at=datetime(2024, 5, 3, 17, 0))
+        assert not mock_client.table.return_value.upsert.called
+
+    def test_staleness_follows_market_sessions(self):
+        """Test that a Friday report stays fresh over the weekend and goes stale on Monday."""
+        snapshot = {"completed_at": "2024-05-03T17:00:00"}
+
+        assert not ReportSnapshotStore.is_stale(snapshot, datetime(2024, 5, 5, 12, 0))
+        assert ReportSnapshotStore.is_stale(snapshot, datetime(2024, 5, 6, 8, 0))
+        assert ReportSnapshotStore.age_seconds(snapshot, datetime(2024, 5, 3, 18, 0)) == 3600
+
+    def test_staleness_on_utc_host(self, monkeypatch):
+        """Test that a Monday evening report is fresh at 00:30 UTC, still Monday in New York."""
+        monkeypatch.setenv("TZ", "UTC")
+        time.tzset()
+        try:
+            # Written at 19:00 EDT by a UTC host
+            snapshot = {"completed_at": "2024-05-06T23:00:00"}
+            now = datetime(2024, 5, 7, 0, 30, tzinfo=timezone.utc)
+
+            assert not ReportSnapshotStore.is_stale(snapshot, now)
+            assert ReportSnapshotStore.age_seconds(snapshot, now) == 5400
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+    def test_refresh_is_single_flight_per_symbol(self):
+        """Test that only one background refresh can be claimed per symbol."""
+        store = ReportSnapshotStore()
+
+        assert store.claim_refresh("aapl")
+        assert not store.claim_refresh("AAPL")
+        assert store.claim_refresh("MSFT")
+        assert store.is_refreshing("AAPL")
+
+        store.release_refresh("AAPL")
+        assert not store.is_refreshing("AAPL")
+        assert store.claim_refresh("AAPL")
@@ -0,0 +1,113 @@
+"""Tests for the report stream broker and server-sent events encoding."""
+
+import asyncio
+import pytest
+from src.lib.report_stream import DONE_EVENT, ERROR_EVENT, ReportStreamBroker, sse_stream
+
+
+async def collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+class TestReportStreamBroker:
+    """Test ReportStreamBroker."""
+
+    @pytest.mark.anyio
+    async def test_late_subscriber_replays_events(self):
+        """Test that a subscriber connecting after the stream ended receives every event."""
+        broker = ReportStreamBroker()
+        broker.publish("job-1", "section", {"index": 0})
+        broker.publish("job-1", "section", {"index": 1})
+        broker.close("job-1", DONE_EVENT, {"ok": True})
+
+        events = await collect(broker.subscribe("job-1"))
+
+        assert [(event.id, event.event) for event in events] == [(0, "section"), (1, "section"), (2, DONE_EVENT)]
+        assert broker.is_closed("job-1")
+
+    @pytest.mark.anyio
+    async def test_live_subscriber_resumes_after_last_event_id(self):
+        """Test that a reconnecting subscriber skips seen events and then follows live ones."""
+        broker = ReportStreamBroker()
+        broker.publish("job-1", "section", {"index": 0})
+        broker.publish("job-1", "section", {"index": 1})
+
+        subscriber = asyncio.ensure_future(collect(broker.subscribe("job-1", last_event_id=0)))
+        await asyncio.sleep(0)
+        broker.publish("job-1", "section", {"index": 2})
+        broker.close("job-1", ERROR_EVENT, {"message": "failed"})
+        broker.publish("job-1", "section", {"index": 3})
+
+        events = await asyncio.wait_for(subscriber, timeout=1)
+
+        assert [event.data.get("index") for event in events] == [1, 2, None]
+        assert events[-1].event == ERROR_EVENT
+
+    def test_closed_streams_expire_and_lru_streams_are_evicted(self):
+        """Test that streams are bounded by TTL and max_jobs."""
+        now = [0.0]
+        broker = ReportStreamBroker(max_jobs=2, ttl_seconds=10, clock=lambda: now[0])
+        broker.close("done-job")
+        broker.publish("job-1", "section", {})
+        now[0] = 11.0
+        broker.publish("job-2", "section", {})
+        broker.publish("job-3", "section", {})
+
+        assert broker.events("done-job") == []
+        assert broker.events("job-1") == []
+        assert len(broker.events("job-3")) == 1
+
+    @pytest.mark.anyio
+    async def test_subscribing_does_not_create_streams(self):
+        """Test that a job without a stream in this process yields nothing instead of waiting forever."""
+        broker = ReportStreamBroker()
+
+        assert await collect(broker.subscribe("elsewhere")) == []
+        assert not broker.has_stream("elsewhere")
+
+    @pytest.mark.anyio
+    async def test_opened_stream_accepts_subscribers_before_events(self):
+        """Test that an opened stream delivers events to a subscriber that connected first."""
+        broker = ReportStreamBroker()
+        broker.open("job-1")
+
+        subscriber = asyncio.ensure_future(collect(broker.subscribe("job-1")))
+        await asyncio.sleep(0)
+        broker.publish("job-1", "section", {"index": 0})
+        broker.close("job-1")
+
+        events = await asyncio.wait_for(subscriber, timeout=1)
+        assert [event.event for event in events] == ["section", DONE_EVENT]
+
+
+class TestSseStream:
+    """Test sse_stream."""
+
+    @pytest.mark.anyio
+    async def test_encodes_events_and_keep_alives(self):
+        """Test the wire format of events and the keep-alive comment while idle."""
+        broker = ReportStreamBroker()
+        broker.publish("job-1", "section", {"title": "Summary"})
+
+        stream = sse_stream("job-1", broker=broker, heartbeat_seconds=0.01)
+        first = await anext(stream)
+        keep_alive = await anext(stream)
+        broker.close("job-1")
+        rest = await collect(stream)
+
+        assert first == 'id: 0\nevent: section\ndata: {"title": "Summary"}\n\n'
+        assert keep_alive == ": keep-alive\n\n"
+        assert rest[-1] == "id: 1\nevent: done\ndata: {}\n\n"
+
+    @pytest.mark.anyio
+    async def test_idle_stream_ends_with_error(self):
+        """Test that a stream without events ends after the idle timeout."""
+        broker = ReportStreamBroker()
+        broker.open("job-1")
+
+        chunks = await asyncio.wait_for(
+            collect(sse_stream("job-1", broker=broker, heartbeat_seconds=0.01, idle_timeout_seconds=0.05)), timeout=1
+        )
+
+        assert chunks[0] == ": keep-alive\n\n"
+        assert chunks[-1].startswith("event: error\n")
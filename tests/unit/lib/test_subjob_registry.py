@@ -0,0 +1,79 @@
+"""Tests for the subjob registry."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.lib.subjob_registry import SubjobRegistry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSubjobRegistry:
+    """Test SubjobRegistry class."""
+
+    def test_register_and_get(self):
+        """Test that registered subjobs are returned by flow."""
+        registry = SubjobRegistry(shared=False)
+        registry.register("main-1", {"historical_earnings_flow": "sub-1"})
+        registry.register("main-1", {"forward_pe_flow": "sub-2"})
+
+        assert registry.get("main-1", "historical_earnings_flow") == "sub-1"
+        assert registry.get("main-1", "forward_pe_flow") == "sub-2"
+        assert registry.get("main-1", "trade_ideas_flow") is None
+
+    def test_evict_on_completion(self):
+        """Test that a finished job is forgotten."""
+        registry = SubjobRegistry(shared=False)
+        registry.register("main-1", {"historical_earnings_flow": "sub-1"})
+
+        registry.evict("main-1")
+
+        assert len(registry) == 0
+        assert registry.get("main-1", "historical_earnings_flow") is None
+
+    def test_entries_expire_after_ttl(self):
+        """Test that unused entries are purged once their TTL has passed."""
+        clock = FakeClock()
+        registry = SubjobRegistry(ttl_seconds=60, shared=False, clock=clock)
+        registry.register("main-1", {"flow": "sub-1"})
+        clock.now = 30
+        registry.register("main-2", {"flow": "sub-2"})
+
+        clock.now = 70
+        assert registry.get("main-1", "flow") is None
+        assert registry.get("main-2", "flow") == "sub-2"
+
+        clock.now = 200
+        assert registry.cleanup() == 1
+        assert len(registry) == 0
+
+    def test_capacity_evicts_least_recently_used(self):
+        """Test that the registry stays within max_jobs."""
+        registry = SubjobRegistry(max_jobs=2, shared=False)
+        registry.register("main-1", {"flow": "sub-1"})
+        registry.register("main-2", {"flow": "sub-2"})
+        registry.get("main-1", "flow")
+
+        registry.register("main-3", {"flow": "sub-3"})
+
+        assert len(registry) == 2
+        assert registry.get("main-2", "flow") is None
+        assert registry.get("main-1", "flow") == "sub-1"
+
+    @patch('src.lib.subjob_registry.get_async_job_tracker')
+    @pytest.mark.anyio
+    async def test_lookup_falls_back_to_shared_backend(self, mock_get_tracker):
+        """Test that a local miss is resolved from research_jobs and remembered."""
+        mock_get_tracker.return_value.get_sub_job_ids = AsyncMock(
+            return_value={"historical_earnings_flow": "sub-1", "forward_pe_flow": "sub-2"}
+        )
+        registry = SubjobRegistry(shared=True)
+
+        assert await registry.lookup("main-1", "forward_pe_flow") == "sub-2"
+        assert await registry.lookup("main-1", "historical_earnings_flow") == "sub-1"
+        mock_get_tracker.return_value.get_sub_job_ids.assert_awaited_once_with("main-1")
@@ -1,9 +1,14 @@
 """Tests for Supabase cache functionality."""
 
+import asyncio
+import time
 import pytest
 from unittest.mock import MagicMock
 from datetime import datetime, timedelta
-from src.lib.supabase_cache import SupabaseCache
+from src.lib.supabase_cache import AsyncSupabaseCache, SupabaseCache
+from src.lib.cache_codec import encode_payload
+from src.lib.market_calendar import MARKET_TIMEZONE
+from src.research.comprehensive_report.comprehensive_report_models import KeyInsights
 
 
 class TestSupabaseCache:
@@ -93,6 +98,30 @@ class TestSupabaseCache:
         assert result is True
         mock_model.model_dump.assert_called_once()
 
+    def test_cache_report_encodes_model(self, cache_with_mock):
+        """Test that cached models round-trip through the versioned payload."""
+        cache, mock_client, mock_response = cache_with_mock
+        report = KeyInsights(symbol="AAPL", report_date="2024-05-03", critical_insights="Margins expanding")
+
+        assert cache.cache_report("test_report", "AAPL", report, ttl=3600)
+
+        stored = mock_client.table.return_value.upsert.call_args[0][0]
+        assert "_codec" in stored["data"]
+        assert stored["metadata"]["schema"] == "KeyInsights"
+
+        mock_response.data = [{"data": stored["data"], "expires_at": stored["expires_at"]}]
+        assert cache.get_cached_model("test_report", "AAPL", KeyInsights) == report
+        assert cache.get_cached_report("test_report", "AAPL")["critical_insights"] == "Margins expanding"
+
+    def test_get_cached_model_stale_schema_is_miss(self, cache_with_mock):
+        """Test that an entry written with another schema version is a miss."""
+        cache, mock_client, mock_response = cache_with_mock
+        stored = encode_payload(KeyInsights(symbol="AAPL", report_date="2024-05-03", critical_insights="Old"))
+        stored["schema_version"] = "0000000000000000"
+        mock_response.data = [{"data": stored, "expires_at": (datetime.now() + timedelta(hours=1)).isoformat()}]
+
+        assert cache.get_cached_model("test_report", "AAPL", KeyInsights) is None
+
     def test_invalidate_cache_pattern(self, cache_with_mock):
         """Test invalidating cache entries by pattern."""
         cache, mock_client, mock_response = cache_with_mock
@@ -106,6 +135,22 @@ class TestSupabaseCache:
         # Verify pattern was converted from Redis wildcard to SQL LIKE
         assert mock_client.table.return_value.like.called
 
+    def test_invalidate_cache_cutoff_in_host_time(self, cache_with_mock, monkeypatch):
+        """Test that an aware cutoff is compared in the host-local time cached_at is written in."""
+        cache, mock_client, mock_response = cache_with_mock
+        mock_response.data = []
+        monkeypatch.setenv("TZ", "UTC")
+        time.tzset()
+        try:
+            cache.invalidate_cache("report:*:AAPL:*", cached_before=datetime(2024, 5, 2, 9, 30, tzinfo=MARKET_TIMEZONE))
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        mock_client.table.return_value.like.return_value.lt.assert_called_once_with(
+            "metadata->>cached_at", "2024-05-02T13:30:00"
+        )
+
     def test_get_cache_info_with_symbol(self, cache_with_mock):
         """Test getting cache info filtered by symbol."""
         cache, mock_client, mock_response = cache_with_mock
@@ -149,3 +194,73 @@ class TestSupabaseCache:
         result = cache.get_cached_report("test_report", "AAPL")
 
         assert result is None
+
+
+class TestAsyncSupabaseCache:
+    """Test AsyncSupabaseCache class."""
+
+    @pytest.fixture
+    def async_cache_with_mock(self, mock_async_supabase_client):
+        """Create an AsyncSupabaseCache instance with mocked async client."""
+        cache = AsyncSupabaseCache(SupabaseCache())
+        cache._client = mock_async_supabase_client
+        return cache, mock_async_supabase_client, mock_async_supabase_client.table.return_value.execute.return_value
+
+    @pytest.mark.anyio
+    async def test_cache_report_writes_same_row_as_sync_cache(self, async_cache_with_mock):
+        """Test that the async cache writes the same key and envelope as the sync cache."""
+        cache, mock_client, _ = async_cache_with_mock
+        insights = KeyInsights(symbol="AAPL", report_date="2024-05-03", critical_insights="Margins expanding")
+
+        assert await cache.cache_report("test_report", "AAPL", insights, ttl=3600)
+
+        row = mock_client.table.return_value.upsert.call_args[0][0]
+        assert row["cache_key"] == cache.cache._report_cache_key("test_report", "AAPL")
+        assert row["data"] == encode_payload(insights)
+        mock_client.table.return_value.execute.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_get_cached_model_hit(self, async_cache_with_mock):
+        """Test that a cached entry is decoded into its model."""
+        cache, _, mock_response = async_cache_with_mock
+        insights = KeyInsights(symbol="AAPL", report_date="2024-05-03", critical_insights="Margins expanding")
+        mock_response.data = [{
+            "data": encode_payload(insights),
+            "expires_at": (datetime.now() + timedelta(hours=1)).isoformat()
+        }]
+
+        assert await cache.get_cached_model("test_report", "AAPL", KeyInsights) == insights
+
+    @pytest.mark.anyio
+    async def test_lookups_do_not_block_each_other(self, async_cache_with_mock):
+        """Test that concurrent lookups wait on the database concurrently."""
+        cache, mock_client, mock_response = async_cache_with_mock
+
+        symbols = ["AAPL", "MSFT", "NVDA"]
+        in_flight = 0
+        all_started = asyncio.Event()
+
+        async def execute_when_all_started():
+            # Each query waits until every lookup has started one, which only happens if none blocks the others
+            nonlocal in_flight
+            in_flight += 1
+            if in_flight == len(symbols):
+                all_started.set()
+            await all_started.wait()
+            return mock_response
+        mock_client.table.return_value.execute.side_effect = execute_when_all_started
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(cache.get_cached_report("test_report", symbol) for symbol in symbols)), timeout=5
+        )
+
+        assert results == [None, None, None]
+        assert in_flight == len(symbols)
+
+    @pytest.mark.anyio
+    async def test_get_cached_report_exception_handling(self, async_cache_with_mock):
+        """Test that query errors are cache misses."""
+        cache, mock_client, _ = async_cache_with_mock
+        mock_client.table.return_value.execute.side_effect = Exception("Query error")
+
+        assert await cache.get_cached_report("test_report", "AAPL") is None
@@ -0,0 +1,43 @@
+"""Tests for Supabase client management."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.lib.supabase_client import AsyncSupabaseClient
+
+
+class TestAsyncSupabaseClient:
+    """Test AsyncSupabaseClient class."""
+
+    @patch('src.lib.supabase_client.acreate_client', new_callable=AsyncMock)
+    @pytest.mark.anyio
+    async def test_client_is_shared_within_event_loop(self, mock_acreate_client):
+        """Test that concurrent callers on one loop share a single pooled client."""
+        wrapper = AsyncSupabaseClient(url="http://localhost:54321", key="key", pool_size=5)
+
+        clients = await asyncio.gather(*(wrapper.get_client() for _ in range(3)))
+
+        assert all(client is clients[0] for client in clients)
+        assert await wrapper.get_client() is clients[0]
+        options = mock_acreate_client.call_args[0][2]
+        assert options.httpx_client is wrapper._http_client
+        await wrapper.close()
+
+    @patch('src.lib.supabase_client.acreate_client', new_callable=AsyncMock)
+    def test_new_event_loop_gets_new_client(self, mock_acreate_client):
+        """Test that a client is not reused across event loops."""
+        wrapper = AsyncSupabaseClient(url="http://localhost:54321", key="key")
+        mock_acreate_client.side_effect = [object(), object()]
+
+        first = asyncio.run(wrapper.get_client())
+        second = asyncio.run(wrapper.get_client())
+
+        assert first is not second
+        assert mock_acreate_client.await_count == 2
+
+    def test_requires_url(self, monkeypatch):
+        """Test that a missing SUPABASE_URL is reported."""
+        monkeypatch.delenv("SUPABASE_URL", raising=False)
+
+        with pytest.raises(ValueError):
+            AsyncSupabaseClient(key="key")
@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import MagicMock
 from datetime import datetime
-from src.lib.supabase_job_tracker import JobTracker, JobStatus
+from src.lib.supabase_job_tracker import AsyncJobTracker, JobTracker, JobStatus
 
 
 class TestJobTracker:
@@ -205,3 +205,87 @@ class TestJobTracker:
         result = tracker.update_job_status("invalid", JobStatus.RUNNING)
 
         assert result is False
+
+
+class TestAsyncJobTracker:
+    """Test AsyncJobTracker class."""
+
+    @pytest.fixture
+    def async_tracker_with_mock(self, mock_async_supabase_client):
+        """Create an AsyncJobTracker instance with mocked async client."""
+        tracker = AsyncJobTracker()
+        tracker._client = mock_async_supabase_client
+        return tracker, mock_async_supabase_client
+
+    @pytest.mark.anyio
+    async def test_create_sub_job(self, async_tracker_with_mock):
+        """Test creating a sub job under an existing main job."""
+        tracker, mock_client = async_tracker_with_mock
+        mock_client.table.return_value.execute.return_value.data = [
+            {"id": 7, "main_job_id": "main-1", "sub_job_id": "sub-1", "job_name": "historical_earnings_flow"}
+        ]
+
+        result = await tracker.create_job(
+            "research_subflow", "aapl", main_job_id="main-1", is_sub_job=True, job_name="historical_earnings_flow"
+        )
+
+        assert result == {"main_job_id": "main-1", "sub_job_id": "sub-1", "id": "7", "job_name": "historical_earnings_flow"}
+        inserted = mock_client.table.return_value.insert.call_args[0][0]
+        assert inserted["symbol"] == "AAPL"
+        assert inserted["main_job_id"] == "main-1"
+        assert inserted["sub_job_id"]
+
+    @pytest.mark.anyio
+    async def test_update_job_status_appends_step_to_main_job(self, async_tracker_with_mock):
+        """Test that a status update appends a step and only touches the main flow row."""
+        tracker, mock_client = async_tracker_with_mock
+        current = MagicMock()
+        current.data = [{"metadata": {"steps": [{"step": "Queued"}], "job_type": "research"}}]
+        mock_client.table.return_value.execute.side_effect = [current, MagicMock()]
+
+        assert await tracker.update_job_status("main-1", JobStatus.COMPLETED, step="Done", result={"ok": True})
+
+        update_data = mock_client.table.return_value.update.call_args[0][0]
+        assert [s["step"] for s in update_data["metadata"]["steps"]] == ["Queued", "Done"]
+        assert update_data["metadata"]["result"] == {"ok": True}
+        assert "completed_at" in update_data
+        mock_client.table.return_value.eq.assert_any_call("job_name", "main_flow")
+
+    @pytest.mark.anyio
+    async def test_update_job_status_not_found(self, async_tracker_with_mock):
+        """Test updating a job that does not exist."""
+        tracker, mock_client = async_tracker_with_mock
+
+        assert not await tracker.update_job_status("missing", JobStatus.RUNNING, use_sub_job_id=True)
+        mock_client.table.return_value.update.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_create_sub_jobs_single_insert(self, async_tracker_with_mock):
+        """Test that all subjobs of a main job are created with one insert."""
+        tracker, mock_client = async_tracker_with_mock
+        mock_client.table.return_value.execute.return_value.data = [
+            {"id": 1, "main_job_id": "main-1", "sub_job_id": "sub-1", "job_name": "historical_earnings_flow"},
+            {"id": 2, "main_job_id": "main-1", "sub_job_id": "sub-2", "job_name": "forward_pe_flow"},
+        ]
+
+        result = await tracker.create_sub_jobs("main-1", "AAPL", ["historical_earnings_flow", "forward_pe_flow"])
+
+        assert result == {"historical_earnings_flow": "sub-1", "forward_pe_flow": "sub-2"}
+        mock_client.table.return_value.insert.assert_called_once()
+        rows = mock_client.table.return_value.insert.call_args[0][0]
+        assert [row["job_name"] for row in rows] == ["historical_earnings_flow", "forward_pe_flow"]
+        assert all(row["main_job_id"] == "main-1" and row["sub_job_id"] for row in rows)
+
+    @pytest.mark.anyio
+    async def test_cancel_pending_sub_jobs(self, async_tracker_with_mock):
+        """Test that only the pending subjobs of a main job are cancelled, with one update."""
+        tracker, mock_client = async_tracker_with_mock
+        mock_client.table.return_value.execute.return_value.data = [{"id": 1}, {"id": 2}]
+
+        assert await tracker.cancel_pending_sub_jobs("main-1") == 2
+
+        update_data = mock_client.table.return_value.update.call_args[0][0]
+        assert update_data["status"] == JobStatus.CANCELLED
+        mock_client.table.return_value.eq.assert_any_call("main_job_id", "main-1")
+        mock_client.table.return_value.eq.assert_any_call("status", JobStatus.PENDING)
+        mock_client.table.return_value.neq.assert_any_call("job_name", "main_flow")
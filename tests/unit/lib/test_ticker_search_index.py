@@ -0,0 +1,100 @@
+"""Tests for the local ticker search index."""
+
+import os
+import time
+import pytest
+from unittest.mock import patch
+from src.lib.ticker_search_index import TickerSearch, TickerSearchIndex, parse_listings
+
+
+LISTING_CSV = """symbol,name,exchange,assetType,ipoDate,delistingDate,status
+A,Agilent Technologies Inc,NYSE,Stock,1999-11-18,null,Active
+AA,Alcoa Corp,NYSE,Stock,2016-10-18,null,Active
+AAPL,Apple Inc,NASDAQ,Stock,1980-12-12,null,Active
+AAPU,Direxion Daily AAPL Bull 2X Shares,NASDAQ,ETF,2023-08-10,null,Active
+APLE,Apple Hospitality REIT Inc,NYSE,Stock,2015-05-18,null,Active
+BRK-B,Berkshire Hathaway Inc,NYSE,Stock,1996-05-09,null,Active
+MSFT,Microsoft Corporation,NASDAQ,Stock,1986-03-13,null,Active
+"""
+
+
+def symbols(matches: list) -> list:
+    return [match["1. symbol"] for match in matches]
+
+
+class TestTickerSearchIndex:
+    """Test TickerSearchIndex."""
+
+    @pytest.fixture
+    def index(self):
+        return TickerSearchIndex(parse_listings(LISTING_CSV))
+
+    def test_symbol_prefix_ranks_exact_match_first(self, index):
+        """Test that an exact ticker ranks first and longer completions follow."""
+        matches = index.search("aa")
+
+        assert symbols(matches)[:3] == ["AA", "AAPL", "AAPU"]
+        assert matches[0]["9. matchScore"] == "1.0000"
+        assert matches[0]["3. type"] == "Equity"
+        assert index.search("brk.b")[0]["1. symbol"] == "BRK-B"
+
+    def test_partial_and_misspelled_names_match(self, index):
+        """Test that partially typed and misspelled company names are matched."""
+        assert symbols(index.search("appl"))[:2] == ["AAPL", "APLE"]
+        assert symbols(index.search("mircosoft"))[0] == "MSFT"
+        assert symbols(index.search("berkshire hath")) == ["BRK-B"]
+
+    def test_unrelated_query_is_a_miss(self, index):
+        """Test that nothing is returned for a query no listing resembles."""
+        assert index.search("zzqx") == []
+
+    def test_parse_listings_rejects_error_responses(self):
+        """Test that rate limit responses are not mistaken for a listing snapshot."""
+        with pytest.raises(ValueError):
+            parse_listings({"Information": "rate limit"})
+
+
+class TestTickerSearch:
+    """Test TickerSearch."""
+
+    @pytest.fixture
+    def search(self, tmp_path):
+        (tmp_path / "listing_status.csv").write_text(LISTING_CSV)
+        return TickerSearch(base_dir=str(tmp_path))
+
+    @patch('src.lib.ticker_search_index.call_alpha_vantage_symbol_search')
+    def test_hits_are_served_locally(self, mock_symbol_search, search):
+        """Test that indexed symbols are answered without calling Alpha Vantage."""
+        assert search.search("AAPL")["bestMatches"][0]["2. name"] == "Apple Inc"
+        mock_symbol_search.assert_not_called()
+
+    @patch('src.lib.ticker_search_index.call_alpha_vantage_symbol_search')
+    def test_misses_fall_back_and_are_cached(self, mock_symbol_search, search):
+        """Test that misses are sent to Alpha Vantage once and errors are not cached."""
+        mock_symbol_search.return_value = {"bestMatches": [{"1. symbol": "TSCO.LON"}]}
+
+        assert search.search("Tesco PLC") == search.search("tesco  plc")
+        assert mock_symbol_search.call_count == 1
+
+        mock_symbol_search.return_value = {"Information": "rate limit"}
+        search.search("zzqx")
+        search.search("zzqx")
+        assert mock_symbol_search.call_count == 3
+
+    @patch('src.lib.ticker_search_index.call_alpha_vantage_symbol_search', return_value={"bestMatches": []})
+    @patch('src.lib.ticker_search_index.call_alpha_vantage_listing_status')
+    def test_stale_snapshot_is_refreshed(self, mock_listing_status, mock_symbol_search, search):
+        """Test that a stale snapshot is downloaded again and the new index swapped in."""
+        old = time.time() - 2 * search.max_age_seconds
+        os.utime(search.path, (old, old))
+        mock_listing_status.return_value = LISTING_CSV + "NVDA,NVIDIA Corp,NASDAQ,Stock,1999-01-22,null,Active\n"
+
+        with patch('src.lib.ticker_search_index.threading.Thread') as mock_thread:
+            assert search.refresh_if_stale()
+            assert not search.refresh_if_stale()
+        assert search.search("nvd") == {"bestMatches": []}
+
+        mock_thread.call_args.kwargs["target"]()
+
+        assert symbols(search.search("nvd")["bestMatches"]) == ["NVDA"]
+        assert not search.refresh_if_stale()
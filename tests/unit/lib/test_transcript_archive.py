@@ -0,0 +1,62 @@
+"""Tests for the earnings call transcript archive."""
+
+import gzip
+import json
+import pytest
+from datetime import timedelta
+from unittest.mock import MagicMock
+from src.lib.transcript_archive import TranscriptArchive
+
+TRANSCRIPT = {"symbol": "AAPL", "quarter": "2024Q1", "transcript": [{"speaker": "CEO", "content": "Record quarter"}]}
+
+
+class TestTranscriptArchive:
+    """Test TranscriptArchive class."""
+
+    @pytest.fixture
+    def archive(self, tmp_path):
+        return TranscriptArchive(base_dir=str(tmp_path), use_supabase=False)
+
+    def test_put_and_get_round_trip(self, archive, tmp_path):
+        """Test that archived transcripts are stored compressed and read back."""
+        archive.put("aapl", "2024Q1", TRANSCRIPT)
+
+        assert (tmp_path / "AAPL" / "2024Q1.json.gz").exists()
+        assert archive.get("AAPL", "2024Q1") == TRANSCRIPT
+        assert archive.get("AAPL", "2023Q4") is None
+
+    def test_hash_mismatch_is_discarded(self, archive, tmp_path):
+        """Test that a corrupted entry is treated as a miss."""
+        archive.put("AAPL", "2024Q1", TRANSCRIPT)
+        path = tmp_path / "AAPL" / "2024Q1.json.gz"
+        entry = json.loads(gzip.decompress(path.read_bytes()))
+        entry["transcript"]["quarter"] = "tampered"
+        path.write_bytes(gzip.compress(json.dumps(entry).encode()))
+
+        assert archive.get("AAPL", "2024Q1") is None
+
+    def test_negative_lookup_expires(self, tmp_path):
+        """Test that missing quarters are only remembered for the negative TTL."""
+        archive = TranscriptArchive(base_dir=str(tmp_path), use_supabase=False, negative_ttl=timedelta(hours=1))
+        archive.record_missing("AAPL", "2024Q2")
+        assert archive.is_known_missing("AAPL", "2024Q2")
+
+        expired = TranscriptArchive(base_dir=str(tmp_path), use_supabase=False, negative_ttl=timedelta(seconds=-1))
+        expired.record_missing("AAPL", "2024Q2")
+        assert not expired.is_known_missing("AAPL", "2024Q2")
+
+    def test_supabase_mirror_fills_local_archive(self, tmp_path, mock_supabase_client):
+        """Test that an entry archived by another worker is restored from Supabase."""
+        writer = TranscriptArchive(base_dir=str(tmp_path / "writer"))
+        writer._client = mock_supabase_client
+        writer.put("AAPL", "2024Q1", TRANSCRIPT)
+        upserted = mock_supabase_client.table.return_value.upsert.call_args.args[0]
+        assert upserted["cache_key"] == "transcript:AAPL:2024Q1"
+        assert upserted["expires_at"] is None
+
+        reader = TranscriptArchive(base_dir=str(tmp_path / "reader"))
+        reader._client = MagicMock()
+        reader._client.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [{"data": upserted["data"]}]
+
+        assert reader.get("AAPL", "2024Q1") == TRANSCRIPT
+        assert (tmp_path / "reader" / "AAPL" / "2024Q1.json.gz").exists()
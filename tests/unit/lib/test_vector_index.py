@@ -0,0 +1,164 @@
+"""Tests for the local vector index and RAG similarity search."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from postgrest.exceptions import APIError
+from src.lib.supabase_rag import SupabaseRAG
+from src.lib.vector_index import LocalVectorIndex, parse_embedding
+
+
+@pytest.fixture
+def index(tmp_path):
+    return LocalVectorIndex(tmp_path / "index", batch_rows=2)
+
+
+class TestLocalVectorIndex:
+    """Test LocalVectorIndex class."""
+
+    def test_search_ranks_by_cosine_similarity(self, index):
+        """Test that results are ordered by similarity and limited."""
+        index.add_many([
+            (1, [1.0, 0.0, 0.0], "AAPL", "comprehensive_report"),
+            (2, [0.0, 1.0, 0.0], "AAPL", "comprehensive_report"),
+            (3, [2.0, 2.0, 0.0], "MSFT", "comprehensive_report"),
+            (4, [0.0, 0.0, 5.0], "MSFT", "news_analysis"),
+            (5, [0.9, 0.1, 0.0], "MSFT", "news_analysis"),
+        ])
+
+        results = index.search([1.0, 0.0, 0.0], limit=3)
+
+        assert [doc_id for doc_id, _ in results] == [1, 5, 3]
+        assert results[0][1] == pytest.approx(1.0)
+        assert results[2][1] == pytest.approx(2 ** -0.5)
+
+    def test_search_filters_symbol_and_report_type(self, index):
+        """Test that symbol and report type filters restrict candidates."""
+        index.add_many([
+            (1, [1.0, 0.0], "AAPL", "comprehensive_report"),
+            (2, [0.9, 0.1], "MSFT", "comprehensive_report"),
+            (3, [0.8, 0.2], "msft", "news_analysis"),
+        ])
+
+        assert [d for d, _ in index.search([1.0, 0.0], symbol_filter="msft")] == [2, 3]
+        assert [d for d, _ in index.search([1.0, 0.0], symbol_filter="MSFT", report_type_filter="news_analysis")] == [3]
+        assert index.search([1.0, 0.0], symbol_filter="TSLA") == []
+
+    def test_add_replaces_existing_document(self, index):
+        """Test that re-adding a document overwrites its row instead of appending."""
+        index.add(1, [1.0, 0.0], "AAPL", "comprehensive_report")
+        index.add(2, [0.0, 1.0], "AAPL", "comprehensive_report")
+
+        index.add(1, [0.0, 1.0])
+
+        assert len(index) == 2
+        assert index.search([1.0, 0.0], limit=2) == [(1, pytest.approx(0.0)), (2, pytest.approx(0.0))]
+        assert index.search([0.0, 1.0], symbol_filter="AAPL") == [(1, pytest.approx(1.0)), (2, pytest.approx(1.0))]
+
+    def test_index_persists_across_instances(self, index, tmp_path):
+        """Test that appended rows are visible to a new instance on the same directory."""
+        index.add(1, [1.0, 0.0], "AAPL", "comprehensive_report")
+        index.add(2, [0.0, 1.0], "MSFT", "comprehensive_report")
+
+        reloaded = LocalVectorIndex(tmp_path / "index")
+
+        assert len(reloaded) == 2
+        assert reloaded.search([0.0, 1.0], limit=1) == [(2, pytest.approx(1.0))]
+
+    def test_running_instance_sees_rows_written_by_another(self, index, tmp_path):
+        """Test that instances on one directory see each other's writes without corrupting rows."""
+        other = LocalVectorIndex(tmp_path / "index")
+        index.add(1, [1.0, 0.0], "AAPL", "comprehensive_report")
+
+        other.add(2, [0.0, 1.0], "MSFT", "comprehensive_report")
+        index.add(3, [0.6, 0.8], "AAPL", "comprehensive_report")
+
+        assert len(other) == 3
+        assert other.search([0.0, 1.0], limit=3) == [(2, pytest.approx(1.0)), (3, pytest.approx(0.8)), (1, pytest.approx(0.0))]
+        assert index.search([1.0, 0.0], symbol_filter="MSFT") == [(2, pytest.approx(0.0))]
+
+        other.rebuild([{"id": 4, "embedding": [1.0, 0.0], "metadata": {"symbol": "TSLA"}}])
+        assert index.search([1.0, 0.0], limit=5) == [(4, pytest.approx(1.0))]
+
+    def test_dimension_mismatch_raises(self, index):
+        """Test that embeddings of a different dimension are rejected."""
+        index.add(1, [1.0, 0.0], "AAPL", "comprehensive_report")
+
+        with pytest.raises(ValueError):
+            index.add(2, [1.0, 0.0, 0.0], "AAPL", "comprehensive_report")
+        with pytest.raises(ValueError):
+            index.search([1.0, 0.0, 0.0])
+
+    def test_rebuild_parses_postgrest_embeddings(self, index):
+        """Test that rebuild replaces the index with research_docs rows."""
+        index.add(99, [1.0, 0.0], "OLD", "comprehensive_report")
+
+        count = index.rebuild([
+            {"id": 1, "embedding": "[1,0]", "metadata": {"symbol": "AAPL", "report_type": "comprehensive_report"}},
+            {"id": 2, "embedding": [0.0, 1.0], "metadata": {"symbol": "MSFT"}},
+            {"id": 3, "embedding": None, "metadata": {}},
+        ])
+
+        assert count == 2
+        assert [d for d, _ in index.search([1.0, 0.0], limit=5)] == [1, 2]
+        assert parse_embedding("[0.5,0.25]") == [0.5, 0.25]
+
+
+class TestSupabaseRAGSearch:
+    """Test SupabaseRAG similarity search backends."""
+
+    @pytest.fixture
+    def rag(self, index):
+        with patch('src.lib.supabase_rag.get_local_vector_index', return_value=index):
+            rag = SupabaseRAG()
+            rag._client = MagicMock()
+            yield rag
+
+    def test_uses_pgvector_rpc_when_available(self, rag):
+        """Test that search goes through the match_research_docs RPC."""
+        rag.client.rpc.return_value.execute.return_value.data = [{"id": 1, "similarity": 0.9}]
+
+        results = rag.search_documents([1.0, 0.0], limit=5, symbol_filter="aapl")
+
+        assert results == [{"id": 1, "similarity": 0.9}]
+        rag.client.rpc.assert_called_once_with("match_research_docs", {
+            "query_embedding": [1.0, 0.0],
+            "match_count": 5,
+            "symbol_filter": "AAPL",
+            "report_type_filter": None
+        })
+
+    def test_falls_back_to_local_index(self, rag, index):
+        """Test that a missing RPC function falls back to the local index from then on."""
+        index.add(1, [1.0, 0.0], "AAPL", "comprehensive_report")
+        index.add(2, [0.6, 0.8], "AAPL", "comprehensive_report")
+        rag.client.rpc.return_value.execute.side_effect = APIError({"code": "PGRST202", "message": "Could not find the function"})
+        rag.client.table.return_value.select.return_value.in_.return_value.execute.return_value.data = [
+            {"id": 2, "title": "second"},
+            {"id": 1, "title": "first"},
+        ]
+
+        results = rag.search_documents([1.0, 0.0])
+        rag.search_documents([1.0, 0.0])
+
+        assert [r["title"] for r in results] == ["first", "second"]
+        assert results[1]["similarity"] == pytest.approx(0.6)
+        assert rag.client.rpc.call_count == 1
+
+    def test_transient_rpc_error_does_not_switch_backend(self, rag):
+        """Test that a failed call of an installed function keeps using pgvector."""
+        rag.client.rpc.return_value.execute.side_effect = [
+            APIError({"code": "57014", "message": "canceling statement due to statement timeout"}),
+            MagicMock(data=[{"id": 1, "similarity": 0.9}]),
+        ]
+
+        assert rag.search_documents([1.0, 0.0]) == []
+        assert rag.search_documents([1.0, 0.0]) == [{"id": 1, "similarity": 0.9}]
+        assert rag._pgvector_available is True
+
+    def test_add_document_indexes_embedding(self, rag, index):
+        """Test that inserted documents with an embedding are added to the local index."""
+        rag.client.table.return_value.insert.return_value.execute.return_value.data = [{"id": 7}]
+
+        assert rag.add_document("content", "title", "aapl", "comprehensive_report", embedding=[0.0, 1.0])
+
+        assert index.search([0.0, 1.0], symbol_filter="AAPL") == [(7, pytest.approx(1.0))]
@@ -2,19 +2,49 @@
 
 import pytest
 from unittest.mock import patch, AsyncMock
+from src.lib.transcript_chunk_cache import TranscriptChunkCache
 from src.research.management_guidance.management_guidance_agent import (
     management_guidance_agent,
+    guidance_chunk_extraction_agent,
     _extract_transcript_content,
+    _chunk_transcript,
+    _merge_chunk_guidance,
     _create_no_transcript_analysis,
     _create_error_analysis
 )
 from src.research.management_guidance.management_guidance_models import (
     ManagementGuidanceData,
     ManagementGuidanceAnalysis,
-    GuidanceIndicator
+    GuidanceIndicator,
+    TranscriptChunkGuidance
 )
 
 
+def _chunk_result(risk, tone="OPTIMISTIC"):
+    return TranscriptChunkGuidance(
+        guidance_indicators=[
+            GuidanceIndicator(type="revenue", direction="POSITIVE", context="Revenue up", impact_assessment="Positive")
+        ],
+        risk_factors_mentioned=[risk],
+        opportunities_mentioned=["AI demand"],
+        tone=tone,
+        chunk_summary=f"Summary mentioning {risk}"
+    )
+
+
+def _analysis():
+    return ManagementGuidanceAnalysis(
+        symbol="AAPL",
+        quarter_analyzed="2024Q1",
+        transcript_available=True,
+        overall_guidance_tone="OPTIMISTIC",
+        consensus_validation_signal="BULLISH",
+        key_guidance_summary="Positive guidance",
+        long_form_analysis="Analysis",
+        critical_insights="Insights"
+    )
+
+
 class TestManagementGuidanceAgent:
     
     def test_extract_transcript_content_direct_key(self):
@@ -199,4 +229,68 @@ class TestManagementGuidanceAgent:
         assert isinstance(result, ManagementGuidanceAnalysis)
         assert result.symbol == "AAPL"
         assert result.transcript_available == False
-        assert "LLM API error" in result.key_guidance_summary
\ No newline at end of file
+        assert "LLM API error" in result.key_guidance_summary
+
+class TestTranscriptMapReduce:
+
+    def test_chunk_transcript_keeps_segments_whole(self):
+        """Test that segments are packed into chunks without being split."""
+        segments = ["A" * 40, "B" * 40, "C" * 40]
+
+        chunks = _chunk_transcript(segments, max_chars=100)
+
+        assert chunks == ["A" * 40 + "\n\n" + "B" * 40, "C" * 40]
+
+    def test_chunk_transcript_splits_oversized_segment(self):
+        """Test that a segment longer than a chunk is split on whitespace."""
+        chunks = _chunk_transcript(["word " * 50], max_chars=60)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 60 for chunk in chunks)
+
+    def test_merge_chunk_guidance_deduplicates(self):
+        """Test that the reduce step merges repeated indicators and risks."""
+        merged = _merge_chunk_guidance([
+            _chunk_result("Supply chain"),
+            _chunk_result("supply chain ", tone="CAUTIOUS"),
+        ])
+
+        assert len(merged["guidance_indicators"]) == 1
+        assert merged["risk_factors_mentioned"] == ["Supply chain"]
+        assert merged["opportunities_mentioned"] == ["AI demand"]
+        assert merged["chunk_tone_counts"] == {"OPTIMISTIC": 1, "CAUTIOUS": 1}
+        assert len(merged["chunk_summaries"]) == 2
+
+    @pytest.mark.anyio
+    @patch('src.research.management_guidance.management_guidance_agent.TRANSCRIPT_CHUNK_MAX_CHARS', 120)
+    @patch('src.research.management_guidance.management_guidance_agent.Runner.run')
+    async def test_long_transcript_map_reduce_with_cache(self, mock_runner, tmp_path):
+        """Test that long transcripts are extracted per chunk and cached by transcript hash."""
+        async def run(agent, input):
+            if agent is guidance_chunk_extraction_agent:
+                return type('MockResult', (), {'final_output': _chunk_result("Risk")})()
+            assert "chunk_guidance" in input
+            return type('MockResult', (), {'final_output': _analysis()})()
+        mock_runner.side_effect = run
+
+        guidance_data = ManagementGuidanceData(
+            symbol="AAPL",
+            earnings_estimates={},
+            earnings_transcript={"transcript": [
+                {"speaker": "CEO", "content": "Revenue will grow next quarter. " * 3},
+                {"speaker": "CFO", "content": "Margins should expand modestly. " * 3},
+            ]},
+            quarter="2024Q1"
+        )
+
+        with patch('src.research.management_guidance.management_guidance_agent.get_transcript_chunk_cache',
+                   return_value=TranscriptChunkCache(base_dir=str(tmp_path))):
+            result = await management_guidance_agent("AAPL", guidance_data)
+            assert result.transcript_available is True
+            assert mock_runner.call_count == 3
+
+            mock_runner.reset_mock()
+            await management_guidance_agent("AAPL", guidance_data)
+
+        # Second run reuses both cached chunk extractions and only runs the reduce step
+        assert mock_runner.call_count == 1
@@ -2,8 +2,10 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
+from src.lib.transcript_archive import TranscriptArchive
 from src.research.management_guidance.management_guidance_util import (
     get_management_guidance_data_for_symbol,
+    get_latest_earnings_transcript,
     extract_latest_earnings_estimate,
     _determine_latest_transcript_quarter,
     _get_previous_quarter
@@ -11,6 +13,13 @@ from src.research.management_guidance.management_guidance_util import (
 from src.research.management_guidance.management_guidance_models import ManagementGuidanceData
 
 
+@pytest.fixture(autouse=True)
+def transcript_archive(tmp_path):
+    archive = TranscriptArchive(base_dir=str(tmp_path), use_supabase=False)
+    with patch('src.research.management_guidance.management_guidance_util.get_transcript_archive', return_value=archive):
+        yield archive
+
+
 class TestManagementGuidanceUtil:
     
     def test_get_previous_quarter(self):
@@ -122,11 +131,12 @@ class TestManagementGuidanceUtil:
         mock_quarter.return_value = "2024Q2"
         mock_estimates.return_value = {"quarterlyEstimates": []}
         
-        # First call fails, second call (previous quarter) succeeds
-        mock_transcripts.side_effect = [
-            Exception("Current quarter not available"),
-            {"transcript": "Previous quarter transcript..."}
-        ]
+        # Current quarter fails, previous quarter succeeds (requested concurrently)
+        def transcripts(symbol, quarter):
+            if quarter == "2024Q2":
+                raise Exception("Current quarter not available")
+            return {"transcript": "Previous quarter transcript..."}
+        mock_transcripts.side_effect = transcripts
         
         result = get_management_guidance_data_for_symbol("AAPL")
         
@@ -146,4 +156,51 @@ class TestManagementGuidanceUtil:
         assert result.symbol == "AAPL"
         assert result.quarter is None
         assert result.earnings_transcript is None
-        assert result.earnings_estimates == {}
\ No newline at end of file
+        assert result.earnings_estimates == {}
+
+
+class TestEarningsTranscriptArchive:
+
+    @patch('src.research.management_guidance.management_guidance_util.call_alpha_vantage_earnings_call_transcripts')
+    def test_archived_transcript_is_not_refetched(self, mock_transcripts, transcript_archive):
+        """Test that an archived quarter is served without an API call."""
+        transcript_archive.put("AAPL", "2024Q1", {"transcript": [{"speaker": "CEO", "content": "Hello"}]})
+
+        quarter, transcript = get_latest_earnings_transcript("AAPL", "2024Q1")
+
+        assert quarter == "2024Q1"
+        assert transcript["transcript"][0]["content"] == "Hello"
+        mock_transcripts.assert_not_called()
+
+    @patch('src.research.management_guidance.management_guidance_util.call_alpha_vantage_earnings_call_transcripts')
+    def test_both_quarters_requested_and_archived(self, mock_transcripts, transcript_archive):
+        """Test that both quarters are requested and published ones are archived."""
+        mock_transcripts.side_effect = lambda symbol, quarter: (
+            {"transcript": []} if quarter == "2024Q2" else {"transcript": [{"speaker": "CFO", "content": "Q1"}]}
+        )
+
+        quarter, _ = get_latest_earnings_transcript("AAPL", "2024Q2")
+
+        assert quarter == "2024Q1"
+        assert sorted(call.args[1] for call in mock_transcripts.call_args_list) == ["2024Q1", "2024Q2"]
+        assert transcript_archive.get("AAPL", "2024Q1") is not None
+        assert transcript_archive.is_known_missing("AAPL", "2024Q2")
+
+    @patch('src.research.management_guidance.management_guidance_util.call_alpha_vantage_earnings_call_transcripts')
+    def test_negative_lookup_skips_request(self, mock_transcripts, transcript_archive):
+        """Test that a recently unpublished quarter is not requested again."""
+        transcript_archive.record_missing("AAPL", "2024Q2")
+        transcript_archive.put("AAPL", "2024Q1", {"transcript": [{"speaker": "CEO", "content": "Q1"}]})
+
+        quarter, _ = get_latest_earnings_transcript("AAPL", "2024Q2")
+
+        assert quarter == "2024Q1"
+        mock_transcripts.assert_not_called()
+
+    @patch('src.research.management_guidance.management_guidance_util.call_alpha_vantage_earnings_call_transcripts')
+    def test_throttled_response_is_not_recorded(self, mock_transcripts, transcript_archive):
+        """Test that rate-limit responses are neither archived nor negatively cached."""
+        mock_transcripts.return_value = {"Information": "rate limit"}
+
+        assert get_latest_earnings_transcript("AAPL", "2024Q2") == (None, None)
+        assert not transcript_archive.is_known_missing("AAPL", "2024Q2")
@@ -0,0 +1,98 @@
+"""Tests for news sentiment feature aggregation."""
+
+import pytest
+from src.research.news_sentiment.news_sentiment_features import (
+    compute_news_sentiment_features,
+    format_news_sentiment_features
+)
+from src.research.news_sentiment.news_sentiment_models import RawNewsSentimentFeed, RawNewsSentimentSummary
+
+
+def _feed(title, time_published, score, relevance, label, ticker="AAPL"):
+    return RawNewsSentimentFeed(
+        title=title,
+        time_published=time_published,
+        source="Wire",
+        overall_sentiment_score=0.0,
+        overall_sentiment_label="Neutral",
+        ticker_sentiment=[
+            {"ticker": ticker, "relevance_score": str(relevance), "ticker_sentiment_score": str(score), "ticker_sentiment_label": label}
+        ]
+    )
+
+
+class TestNewsSentimentFeatures:
+
+    def test_weighted_sentiment_and_dispersion(self):
+        """Test that sentiment is weighted by ticker relevance."""
+        summary = RawNewsSentimentSummary(symbol="AAPL", feed=[
+            _feed("a", "20240501T120000", 0.4, 0.75, "Bullish"),
+            _feed("b", "20240502T120000", -0.4, 0.25, "Bearish"),
+        ])
+
+        features = compute_news_sentiment_features(summary)
+
+        assert features.article_count == 2
+        assert features.weighted_sentiment == pytest.approx(0.2)
+        assert features.sentiment_dispersion == pytest.approx(0.3464, abs=1e-4)
+        assert features.mean_relevance == pytest.approx(0.5)
+        assert features.bullish_share == 0.5
+        assert features.bearish_share == 0.5
+
+    def test_trend_slope_per_day(self):
+        """Test that the trend slope is expressed in score units per day."""
+        summary = RawNewsSentimentSummary(symbol="AAPL", feed=[
+            _feed("a", "20240501T000000", 0.0, 0.5, "Neutral"),
+            _feed("b", "20240502T000000", 0.1, 0.5, "Neutral"),
+            _feed("c", "20240503T000000", 0.2, 0.5, "Somewhat-Bullish"),
+        ])
+
+        features = compute_news_sentiment_features(summary)
+
+        assert features.trend_slope_per_day == pytest.approx(0.1)
+
+    def test_trend_slope_requires_two_publish_times(self):
+        """Test that feeds without publish times have no trend."""
+        summary = RawNewsSentimentSummary(feed=[
+            RawNewsSentimentFeed(overall_sentiment_score=0.8, overall_sentiment_label="Bullish", ticker_sentiment=[])
+        ])
+
+        features = compute_news_sentiment_features(summary)
+
+        assert features.trend_slope_per_day is None
+        assert features.weighted_sentiment == pytest.approx(0.8)
+
+    def test_exemplars_are_most_relevant_articles(self):
+        """Test that exemplars are the top-k articles by relevance."""
+        summary = RawNewsSentimentSummary(symbol="AAPL", feed=[
+            _feed("low", "20240501T120000", 0.1, 0.1, "Neutral"),
+            _feed("high", "20240502T120000", 0.3, 0.9, "Somewhat-Bullish"),
+            _feed("mid", "20240503T120000", -0.2, 0.5, "Somewhat-Bearish"),
+        ])
+
+        features = compute_news_sentiment_features(summary, top_k=2)
+
+        assert [exemplar.title for exemplar in features.exemplars] == ["high", "mid"]
+
+    def test_empty_feed(self):
+        """Test that an empty feed yields zero volume and no statistics."""
+        features = compute_news_sentiment_features(RawNewsSentimentSummary(symbol="AAPL", feed=[]))
+
+        assert features.article_count == 0
+        assert features.weighted_sentiment is None
+        assert features.exemplars == []
+
+    def test_format_news_sentiment_features(self):
+        """Test that the formatted table has one row per ticker plus exemplar lines."""
+        summary = RawNewsSentimentSummary(
+            symbol="AAPL",
+            feed=[_feed("Apple beats", "20240501T120000", 0.4, 0.9, "Bullish")],
+            rolling_sentiment={"7d": {"count": 1, "mean_score": 0.4, "label_distribution": {"Bullish": 1}}}
+        )
+
+        text = format_news_sentiment_features([compute_news_sentiment_features(summary)])
+
+        rows = text.splitlines()
+        assert rows[1].startswith("AAPL | 1 | 0.4")
+        assert rows[1].endswith("n/a | 0.4 | n/a")
+        assert "Apple beats (Wire)" in text
@@ -0,0 +1,124 @@
+"""Tests for news sentiment utility functions."""
+
+import pytest
+from unittest.mock import patch
+from src.research.news_sentiment.news_sentiment_util import (
+    get_news_sentiment_summary_for_peer_group,
+    deduplicate_news_feed,
+    split_news_feed_by_ticker
+)
+from src.research.news_sentiment.news_sentiment_models import RawNewsSentimentSummary
+from src.lib.news_article_store import NewsArticleStore
+
+
+@pytest.fixture(autouse=True)
+def article_store(tmp_path):
+    store = NewsArticleStore(base_dir=str(tmp_path))
+    with patch('src.research.news_sentiment.news_sentiment_util.get_news_article_store', return_value=store):
+        yield store
+
+
+def _article(url, ticker_scores, score=0.2, label="Somewhat-Bullish"):
+    return {
+        "title": f"Headline {url}",
+        "url": url,
+        "time_published": "20240501T120000",
+        "summary": "Summary text",
+        "source": "Wire",
+        "topics": [{"topic": "Earnings"}],
+        "overall_sentiment_score": score,
+        "overall_sentiment_label": label,
+        "ticker_sentiment": [
+            {"ticker": ticker, "relevance_score": str(relevance), "ticker_sentiment_score": "0.1", "ticker_sentiment_label": "Neutral"}
+            for ticker, relevance in ticker_scores
+        ]
+    }
+
+
+class TestNewsSentimentUtil:
+
+    def test_deduplicate_news_feed_by_url(self):
+        """Test that repeated articles are collapsed to their first occurrence."""
+        items = [
+            _article("https://a", [("AAPL", 0.9)]),
+            _article("https://b", [("MSFT", 0.9)]),
+            _article("https://a", [("AAPL", 0.9), ("MSFT", 0.4)]),
+        ]
+
+        result = deduplicate_news_feed(items)
+
+        assert [item["url"] for item in result] == ["https://a", "https://b"]
+        assert len(result[0]["ticker_sentiment"]) == 1
+
+    def test_split_news_feed_by_ticker_uses_most_relevant_peer(self):
+        """Test that each article is attributed to one peer and trimmed to the peer group."""
+        items = [
+            _article("https://a", [("AAPL", 0.3), ("MSFT", 0.8), ("TSLA", 0.99)]),
+            _article("https://b", [("TSLA", 0.9)]),
+        ]
+
+        result = split_news_feed_by_ticker(items, ["AAPL", "MSFT"])
+
+        assert result["AAPL"] == []
+        assert len(result["MSFT"]) == 1
+        assert {entry["ticker"] for entry in result["MSFT"][0]["ticker_sentiment"]} == {"AAPL", "MSFT"}
+
+    def test_split_news_feed_by_ticker_keeps_main_symbol_coverage(self):
+        """Test that articles tagging the researched symbol stay in its feed even when a peer is more relevant."""
+        items = [
+            _article("https://a", [("AAPL", 0.3), ("MSFT", 0.8)]),
+            _article("https://b", [("MSFT", 0.9)]),
+            _article("https://c", [("AAPL", 0.9), ("MSFT", 0.2)]),
+        ]
+
+        result = split_news_feed_by_ticker(items, ["MSFT", "AAPL"], main_symbol="AAPL")
+
+        assert [item["url"] for item in result["AAPL"]] == ["https://a", "https://c"]
+        assert [item["url"] for item in result["MSFT"]] == ["https://a", "https://b"]
+
+    @patch('src.research.news_sentiment.news_sentiment_util.call_alpha_vantage_news_sentiment')
+    def test_get_news_sentiment_summary_for_peer_group_deduplicates(self, mock_news):
+        """Test that an article returned for several peers reaches the agent once."""
+        shared = _article("https://shared", [("AAPL", 0.9), ("MSFT", 0.5)])
+        responses = {
+            "AAPL": {"items": "2", "feed": [dict(shared), _article("https://aapl", [("AAPL", 0.7)])]},
+            "MSFT": {"items": "2", "feed": [dict(shared), _article("https://msft", [("MSFT", 0.6)])]},
+            "GOOGL": {"Information": "rate limited"},
+        }
+        mock_news.side_effect = lambda tickers, **kwargs: responses[tickers]
+
+        result = get_news_sentiment_summary_for_peer_group(["AAPL", "MSFT", "GOOGL"])
+
+        assert mock_news.call_count == 3
+        assert [summary.symbol for summary in result] == ["AAPL", "MSFT"]
+        assert all(isinstance(summary, RawNewsSentimentSummary) for summary in result)
+        assert len(result[0].feed) == 2
+        assert len(result[1].feed) == 1
+        assert result[0].feed[0].overall_sentiment_label == "Somewhat-Bullish"
+
+    @patch('src.research.news_sentiment.news_sentiment_util.call_alpha_vantage_news_sentiment')
+    def test_get_news_sentiment_summary_for_peer_group_api_error(self, mock_news):
+        """Test that a failing request only drops that ticker."""
+        def news(tickers, **kwargs):
+            if tickers == "MSFT":
+                raise Exception("API error")
+            return {"feed": [_article("https://aapl", [("AAPL", 0.7)])]}
+        mock_news.side_effect = news
+
+        result = get_news_sentiment_summary_for_peer_group(["AAPL", "MSFT"])
+
+        assert [summary.symbol for summary in result] == ["AAPL"]
+
+    @patch('src.research.news_sentiment.news_sentiment_util.call_alpha_vantage_news_sentiment')
+    def test_get_news_sentiment_summary_for_peer_group_incremental(self, mock_news, article_store):
+        """Test that a second run only requests newer articles and reuses stored ones."""
+        mock_news.return_value = {"feed": [_article("https://a", [("AAPL", 0.7)])]}
+        get_news_sentiment_summary_for_peer_group(["AAPL"])
+
+        mock_news.reset_mock()
+        mock_news.return_value = {"items": "0", "feed": []}
+        result = get_news_sentiment_summary_for_peer_group(["AAPL"])
+
+        mock_news.assert_called_once_with(tickers="AAPL", time_from="20240501T1200")
+        assert len(result[0].feed) == 1
+        assert result[0].rolling_sentiment is not None
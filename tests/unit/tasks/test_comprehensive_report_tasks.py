@@ -0,0 +1,46 @@
+import logging
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.lib.rag_ingestion import IngestionResult
+from src.research.comprehensive_report.comprehensive_report_models import ComprehensiveReport
+from src.tasks.comprehensive_report.comprehensive_report_reporting_task import comprehensive_report_reporting_task
+
+
+REPORT = ComprehensiveReport(symbol="AAPL", report_date="2026-10-19", comprehensive_analysis="# Summary\n\nSteady quarter.")
+
+
+class TestComprehensiveReportReportingTask:
+
+    @patch('src.tasks.comprehensive_report.comprehensive_report_reporting_task.get_rag_ingestor')
+    @pytest.mark.anyio
+    async def test_stored_report_logs_success(self, mock_get_ingestor, caplog):
+        """Test that a fully stored report is logged as stored."""
+        mock_get_ingestor.return_value = MagicMock(ingest_report=AsyncMock(return_value=IngestionResult("r1", 3, 1, 2, 3)))
+
+        with caplog.at_level(logging.INFO):
+            await comprehensive_report_reporting_task("AAPL", REPORT)
+
+        assert "Successfully stored comprehensive report" in caplog.text
+        assert not [record for record in caplog.records if record.levelno >= logging.WARNING]
+
+    @patch('src.tasks.comprehensive_report.comprehensive_report_reporting_task.get_rag_ingestor')
+    @pytest.mark.anyio
+    async def test_shortfall_is_a_warning(self, mock_get_ingestor, caplog):
+        """Test that a report with sections missing from research_docs is not logged as stored."""
+        mock_get_ingestor.return_value = MagicMock(ingest_report=AsyncMock(return_value=IngestionResult("r1", 3, 1, 0, 3)))
+
+        with caplog.at_level(logging.INFO):
+            await comprehensive_report_reporting_task("AAPL", REPORT)
+
+        assert "Stored only 1 of 3 comprehensive report sections" in caplog.text
+        assert "Successfully stored" not in caplog.text
+
+    @patch('src.tasks.comprehensive_report.comprehensive_report_reporting_task.get_rag_ingestor')
+    @pytest.mark.anyio
+    async def test_failed_ingestion_does_not_raise(self, mock_get_ingestor, caplog):
+        """Test that a storage failure is logged without breaking the flow."""
+        mock_get_ingestor.return_value = MagicMock(ingest_report=AsyncMock(side_effect=RuntimeError("Added 0 of 3 documents")))
+
+        await comprehensive_report_reporting_task("AAPL", REPORT)
+
+        assert "Failed to store comprehensive report" in caplog.text
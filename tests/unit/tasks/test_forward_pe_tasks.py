@@ -5,6 +5,7 @@ from src.tasks.forward_pe.forward_pe_fetch_earnings_task import (
     forward_pe_fetch_single_earnings_task
 )
 from src.tasks.forward_pe.forward_pe_sanity_check_task import forward_pe_sanity_check_task
+from src.research.forward_pe.forward_pe_sanity_check_rules import get_sanity_check_metrics, reset_sanity_check_metrics
 from src.tasks.forward_pe.forward_pe_peer_group_task import forward_pe_peer_group_task
 from src.tasks.forward_pe.forward_pe_analysis_task import forward_pe_analysis_task
 from src.research.forward_pe.forward_pe_models import (
@@ -73,10 +74,11 @@ class TestForwardPEFetchEarningsTask:
 
 class TestForwardPESanityCheckTask:
     
+    @patch('src.tasks.forward_pe.forward_pe_sanity_check_task.rule_based_sanity_check', return_value=(None, ["volatile quarterly EPS"]))
     @patch('src.tasks.forward_pe.forward_pe_sanity_check_task.Runner.run')
     @pytest.mark.anyio
-    async def test_forward_pe_sanity_check_task_success(self, mock_runner):
-        """Test successful forward PE sanity check."""
+    async def test_forward_pe_sanity_check_task_success(self, mock_runner, mock_rules):
+        """Test successful forward PE sanity check escalated to the agent."""
         # Mock earnings summary
         earnings_summary = ForwardPEEarningsSummary(
             symbol="AAPL",
@@ -106,6 +108,27 @@ class TestForwardPESanityCheckTask:
         assert result.is_realistic == "REALISTIC"
         assert "consistent earnings" in result.long_form_analysis
         mock_runner.assert_called_once()
+        assert "Rule-based check flags: volatile quarterly EPS" in mock_runner.call_args.kwargs["input"]
+
+    @patch('src.tasks.forward_pe.forward_pe_sanity_check_task.Runner.run')
+    @pytest.mark.anyio
+    async def test_forward_pe_sanity_check_task_skips_agent_for_clear_cases(self, mock_runner):
+        """Test that the rules decide a summary without consensus and the agent is not called."""
+        reset_sanity_check_metrics()
+        earnings_summary = ForwardPEEarningsSummary(
+            symbol="AAPL",
+            overview={},
+            current_price="150.00",
+            quarterly_earnings=[{"fiscalDateEnding": "2023-12-31", "reportedEPS": "2.50"}] * 4,
+            consensus_eps_next_quarter="Not enough consensus"
+        )
+
+        result = await forward_pe_sanity_check_task(earnings_summary)
+
+        assert result.is_realistic == "NOT_REALISTIC"
+        assert result.consensus_reliability == "INSUFFICIENT_DATA"
+        mock_runner.assert_not_called()
+        assert get_sanity_check_metrics()["rule_based"] == 1
 
 
 class TestForwardPEPeerGroupTask:
@@ -208,4 +231,38 @@ class TestForwardPEAnalysisTask:
         assert isinstance(result, ForwardPeValuation)
         assert result.confidence == "MEDIUM"
         assert "Limited context" in result.long_form_analysis
-        mock_runner.assert_called_once()
\ No newline at end of file
+        mock_runner.assert_called_once()
+    @patch('src.tasks.forward_pe.forward_pe_analysis_task.Runner.run')
+    @pytest.mark.anyio
+    async def test_forward_pe_analysis_task_sends_metrics_table(self, mock_runner):
+        """Test that the agent gets the computed metrics table instead of raw quarterly earnings."""
+        earnings_summaries = [
+            ForwardPEEarningsSummary(
+                symbol=symbol,
+                overview={"PERatio": "25.0"},
+                current_price="100.00",
+                quarterly_earnings=[{"fiscalDateEnding": "2023-12-31", "reportedEPS": "1.00"}] * 4,
+                consensus_eps_next_quarter="1.00"
+            )
+            for symbol in ("MSFT", "AAPL")
+        ]
+        mock_runner.return_value = type('MockResult', (), {'final_output': ForwardPeValuation(
+            symbol="AAPL",
+            current_price=100.0,
+            forward_pe_ratio=25.0,
+            sector_average_pe=25.0,
+            historical_pe_range="20-30",
+            valuation_attractiveness="FAIRLY_VALUED",
+            earnings_quality="HIGH_QUALITY",
+            confidence="HIGH",
+            long_form_analysis="In line with peers.",
+            critical_insights="In line with peers"
+        )})()
+
+        await forward_pe_analysis_task("AAPL", earnings_summaries)
+
+        input_data = mock_runner.call_args.kwargs["input"]
+        assert "forward_pe_metrics:\nsymbol|current_price" in input_data
+        assert "\nAAPL|100|4|4|25|25|" in input_data
+        assert "peer_median_forward_pe=25" in input_data
+        assert "reportedEPS" not in input_data
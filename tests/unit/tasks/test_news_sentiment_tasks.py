@@ -48,7 +48,7 @@ class TestNewsSentimentFetchSummariesTask:
         assert len(result[1].feed) == 1
         assert result[1].feed[0].overall_sentiment_label == "Bullish"
         # Note: the task appends the symbol to peer_group, so final call includes AAPL
-        mock_get_summaries.assert_called_once_with(["MSFT", "GOOGL", "AAPL"])
+        mock_get_summaries.assert_called_once_with(["MSFT", "GOOGL", "AAPL"], "AAPL")
 
     @patch('src.tasks.news_sentiment.news_sentiment_fetch_summaries_task.get_news_sentiment_summary_for_peer_group')
     @pytest.mark.anyio
@@ -74,7 +74,7 @@ class TestNewsSentimentFetchSummariesTask:
         assert len(result[0].feed) == 1
         assert result[0].feed[0].overall_sentiment_label == "Neutral"
         # Even with empty peer group, symbol should be added
-        mock_get_summaries.assert_called_once_with(["AAPL"])
+        mock_get_summaries.assert_called_once_with(["AAPL"], "AAPL")
 
 
 class TestNewsSentimentAnalysisTask:
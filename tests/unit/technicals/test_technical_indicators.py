@@ -0,0 +1,152 @@
+"""Tests for locally computed technical indicators."""
+
+from datetime import date, timedelta
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+from src.lib.daily_prices import adjusted_prices, parse_daily_adjusted
+from src.lib.price_history_store import PriceHistoryStore
+from src.research.technicals.technical_indicators import (
+    TechnicalIndicatorEngine,
+    compute_indicators,
+    ema,
+    rsi,
+)
+from src.research.technicals.technicals_util import TECHNICALS_STATE_CACHE_TYPE, get_technical_indicators
+
+
+def price_history(bars: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+    high = close * (1 + rng.uniform(0, 0.02, bars))
+    low = close * (1 - rng.uniform(0, 0.02, bars))
+    dates = [str(date(2024, 1, 1) + timedelta(days=i)) for i in range(bars)]
+    return dates, high, low, close
+
+
+def daily_response(dates, high, low, close, adjustment: float = 1.0) -> dict:
+    return {"Time Series (Daily)": {
+        day: {
+            "1. open": f"{c}", "2. high": f"{h}", "3. low": f"{l}", "4. close": f"{c}",
+            "5. adjusted close": f"{c * adjustment}", "6. volume": "1000",
+            "7. dividend amount": "0.0000", "8. split coefficient": "1.0"
+        }
+        for day, h, l, c in zip(dates, high, low, close)
+    }}
+
+
+class TestTechnicalIndicators:
+    """Test the vectorized indicators and the incremental engine."""
+
+    def test_ema_matches_recursive_definition(self):
+        """Test that the blockwise EMA equals the bar-by-bar recursion."""
+        _, _, _, close = price_history(500)
+        expected = [close[:26].mean()]
+        for value in close[26:]:
+            expected.append(expected[-1] + 2 / 27 * (value - expected[-1]))
+
+        values = ema(close, 26)
+
+        assert np.isnan(values[:25]).all()
+        np.testing.assert_allclose(values[25:], expected, rtol=1e-12)
+
+    def test_rsi_of_rising_prices_is_100(self):
+        """Test Wilder's RSI bounds on one-directional prices."""
+        assert rsi(np.arange(1.0, 40.0))["rsi"][-1] == 100.0
+        assert rsi(np.arange(40.0, 1.0, -1))["rsi"][-1] == 0.0
+
+    @pytest.mark.parametrize("initial_bars", [5, 60, 250])
+    def test_incremental_updates_match_full_recompute(self, initial_bars):
+        """Test that bar-by-bar updates give the same indicators as the whole history."""
+        dates, high, low, close = price_history(400)
+        full = compute_indicators(high, low, close)
+
+        engine = TechnicalIndicatorEngine.from_prices(dates[:initial_bars], high[:initial_bars], low[:initial_bars], close[:initial_bars])
+        engine = TechnicalIndicatorEngine.from_state(engine.to_state())
+        for i in range(initial_bars, len(dates)):
+            engine.update(dates[i], high[i], low[i], close[i])
+        snapshot = engine.snapshot("AAPL").model_dump()
+
+        assert snapshot["as_of"] == dates[-1] and snapshot["bars"] == 400
+        for name, values in full.items():
+            if name in snapshot:
+                assert snapshot[name] == pytest.approx(values[-1], rel=1e-9), name
+
+    def test_short_history_leaves_long_indicators_empty(self):
+        """Test that indicators needing more bars than available are None."""
+        dates, high, low, close = price_history(30)
+        snapshot = TechnicalIndicatorEngine.from_prices(dates, high, low, close).snapshot("AAPL")
+
+        assert snapshot.sma_20 is not None and snapshot.rsi_14 is not None
+        assert snapshot.sma_50 is None and snapshot.sma_200 is None and snapshot.macd_signal is None
+
+    def test_stale_bars_are_rejected(self):
+        """Test that bars must be newer than the latest one."""
+        dates, high, low, close = price_history(30)
+        engine = TechnicalIndicatorEngine.from_prices(dates, high, low, close)
+        with pytest.raises(ValueError):
+            engine.update(dates[-1], 1.0, 1.0, 1.0)
+
+    def test_adjusted_prices_scale_high_and_low(self):
+        """Test that highs and lows are scaled by the adjusted close ratio."""
+        dates, high, low, close = price_history(3)
+        prices = adjusted_prices(parse_daily_adjusted(daily_response(dates[::-1], high[::-1], low[::-1], close[::-1], adjustment=0.5)))
+
+        assert [str(day) for day in prices["date"]] == dates
+        np.testing.assert_allclose(prices["high"], high * 0.5)
+        np.testing.assert_allclose(prices["close"], close * 0.5)
+
+
+class TestGetTechnicalIndicators:
+    """Test the cached, incrementally extended indicator state."""
+
+    SESSION = date(2024, 12, 31)
+
+    @pytest.fixture
+    def cache(self):
+        with patch('src.research.technicals.technicals_util.get_supabase_cache') as mock_get_cache:
+            cache = MagicMock()
+            stored = {}
+            cache.get_cached_analysis.side_effect = lambda kind, symbol, key_date: stored.get((kind, key_date))
+            cache.cache_analysis.side_effect = lambda kind, symbol, data, ttl, key_date: stored.__setitem__((kind, key_date), data)
+            mock_get_cache.return_value = cache
+            cache.stored = stored
+            yield cache
+
+    @pytest.fixture
+    def mock_daily(self, tmp_path):
+        with patch('src.research.technicals.technicals_util.get_price_history_store', return_value=PriceHistoryStore(tmp_path)), \
+             patch.object(PriceHistoryStore, 'is_stale', return_value=True), \
+             patch('src.lib.price_history_store.call_alpha_vantage_time_series_daily_adjusted') as mock_daily:
+            yield mock_daily
+
+    def test_new_session_extends_previous_state(self, mock_daily, cache):
+        """Test that the previous session's state is extended with the newly stored bars."""
+        dates, high, low, close = price_history(300)
+        mock_daily.return_value = daily_response(dates[:299], high[:299], low[:299], close[:299])
+        get_technical_indicators("AAPL", date(2024, 12, 30))
+
+        mock_daily.return_value = daily_response(dates[-100:], high[-100:], low[-100:], close[-100:])
+        with patch('src.research.technicals.technicals_util.TechnicalIndicatorEngine.from_prices') as mock_from_prices:
+            snapshot = get_technical_indicators("AAPL", self.SESSION)
+
+        mock_from_prices.assert_not_called()
+        assert [call.kwargs for call in mock_daily.call_args_list] == [{"outputsize": "full"}, {"outputsize": "compact"}]
+        assert snapshot.as_of == dates[-1]
+        assert snapshot.rsi_14 == pytest.approx(compute_indicators(high, low, close)["rsi_14"][-1])
+        assert (TECHNICALS_STATE_CACHE_TYPE, "20241231") in cache.stored
+
+        get_technical_indicators("AAPL", self.SESSION)
+        assert mock_daily.call_count == 2
+
+    def test_readjusted_history_is_recomputed(self, mock_daily, cache):
+        """Test that a dividend or split adjustment since the last state rebuilds the engine."""
+        dates, high, low, close = price_history(300)
+        mock_daily.return_value = daily_response(dates[:299], high[:299], low[:299], close[:299])
+        get_technical_indicators("AAPL", date(2024, 12, 30))
+
+        mock_daily.return_value = daily_response(dates, high, low, close, adjustment=0.98)
+        snapshot = get_technical_indicators("AAPL", self.SESSION)
+
+        assert snapshot.close == pytest.approx(close[-1] * 0.98)
+        assert snapshot.sma_200 == pytest.approx(close[-200:].mean() * 0.98)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Off-peak cache warmer for the most requested tickers.
+Runs once with --once, otherwise sleeps until each scheduled pre-market run.
+"""
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+from dotenv import load_dotenv
+import logging
+logging.basicConfig(level=logging.INFO)
+logging.getLogger('LiteLLM').setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.absolute()
+sys.path.append(str(project_root))
+
+# Load environment variables
+load_dotenv()
+
+# Import the flow after setting up the path
+from src.flows.cache_warming_flow import cache_warming_flow
+from src.lib.cache_warming import next_warming_run
+
+async def main(once: bool, model: str):
+    """Run the cache warming flow now or on its schedule."""
+    while True:
+        if not once:
+            run_at = next_warming_run()
+            logger.info(f"Next cache warming run at {run_at.isoformat()}")
+            await asyncio.sleep(max(0.0, (run_at - datetime.now()).total_seconds()))
+
+        try:
+            await cache_warming_flow(model=model)
+        except Exception as e:
+            logger.error(f"Error running cache warmer: {e}")
+            if once:
+                return 1
+
+        if once:
+            return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--once", action="store_true", help="Run a single warming pass immediately")
+    parser.add_argument("--model", default="o4_mini", help="Model for analyses that need to run")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.once, args.model)))